@@ -17,12 +17,13 @@ Author: Elias Bakken
  You should have received a copy of the GNU General Public License
  along with Redeem.  If not, see <http://www.gnu.org/licenses/>.
 """
-from threading import Thread
+from threading import Thread, Condition
+from collections import deque
 import time
 import logging
 
-from multiprocessing import JoinableQueue
-import Queue
+from Latency import Histogram, TIME_EDGES, clock
+
 
 class Alarm:
     THERMISTOR_ERROR    = 0 # Thermistor error. 
@@ -39,33 +40,36 @@ class Alarm:
     printer = None
     executor = None
 
-    def __init__(self, alarm_type, message, short_message=None):
+    def __init__(self, alarm_type, message, short_message=None, source=None):
+        self.time = clock()     # When the error was detected
         self.type = alarm_type
+        self.source = source    # The heater, stepper or sensor, if known
         self.message = message
         self.short_message = message if short_message is None else short_message
+        self.latency = None     # From self.time until the heaters were off
         if Alarm.executor:
-            Alarm.executor.queue.put(self)
+            Alarm.executor.sound(self)
         else:
-            logging.error("Enable to enqueue alarm!")
-        
+            logging.error("Unable to sound alarm: " + message)
+
     def execute(self):
         """ Execute the alarm """
-        if self.type == Alarm.THERMISTOR_ERROR:
-            self.stop_print()
-            self.inform_listeners()
-        elif self.type == Alarm.HEATER_TOO_COLD:
-            self.stop_print()
-            self.inform_listeners()
-        elif self.type == Alarm.HEATER_TOO_HOT:
-            self.stop_print()
-            self.inform_listeners()
-        elif self.type == Alarm.HEATER_RISING_FAST:
+        self.act()
+        self.notify()
+
+    def act(self):
+        """ The safety action, taken in the thread that found the error """
+        if self.type in (Alarm.THERMISTOR_ERROR, Alarm.HEATER_TOO_COLD,
+                         Alarm.HEATER_TOO_HOT, Alarm.HEATER_RISING_FAST):
             self.stop_print()
-            self.inform_listeners()
         elif self.type == Alarm.HEATER_FALLING_FAST:
             self.disable_heaters()
-            self.inform_listeners()
-        elif self.type == Alarm.STEPPER_FAULT:
+
+    def notify(self):
+        """ Tell about the alarm, this can wait """
+        if self.type in (Alarm.THERMISTOR_ERROR, Alarm.HEATER_TOO_COLD,
+                         Alarm.HEATER_TOO_HOT, Alarm.HEATER_RISING_FAST,
+                         Alarm.HEATER_FALLING_FAST, Alarm.STEPPER_FAULT):
             self.inform_listeners()
         elif self.type == Alarm.ALARM_TEST:
             logging.info("Alarm: Operational")
@@ -75,22 +79,26 @@ class Alarm:
     # These are the different actions that can be 
     # done once an alarm is sounded. 
     def stop_print(self):
-        """ Stop the print """
+        """ Stop the print, the heaters first """
+        self.disable_heaters()
         logging.warning("Stopping print")
         self.printer.path_planner.emergency_interrupt()
-        self.disable_heaters()
 
     def disable_heaters(self):
-        logging.warning("Disabling heaters")
         for _, heater in self.printer.heaters.iteritems():
             heater.extruder_error = True
+            heater.mosfet.set_power(0)
+        self.latency = clock() - self.time
+        logging.warning("Heaters disabled %.0f us after the alarm", self.latency*1e6)
 
     def inform_listeners(self):
         """ Inform all listeners (comm channels) of the occured error """
         logging.error("Alarm: "+self.message)
+        if Alarm.printer and getattr(Alarm.printer, "telemetry", None):
+            Alarm.printer.telemetry.set_alarm(self)
         if Alarm.printer and hasattr(Alarm.printer, "comms"):
-            for name, comm in Alarm.printer.comms.iteritems():
-                if name == "toggle":
+            for name, comm in Alarm.printer.comms.items():
+                if name == "toggle" or name.startswith("toggle#"):
                     comm.send_message(self.short_message)                    
                 else:    
                     comm.send_message("Alarm: "+self.message)
@@ -114,19 +122,77 @@ class Alarm:
 
 
 class AlarmExecutor:
-    def __init__(self):
-        self.queue = JoinableQueue(10)
-        self.t = Thread(target=self._run)
+    """ Sounds the alarms without making the caller wait for the hosts.
+    The safety action is taken right away, in the thread that raised the
+    alarm, and the hosts are told from the executor thread. An alarm of
+    the same type and source as one told less than window seconds ago is
+    only counted, but its safety action is still taken, in case a heater
+    was turned on again with M562. """
+
+    def __init__(self, window=5.0, size=100):
+        self.window = window
+        self.last = {}                  # (type, source) -> time told
+        self.pending = deque()          # Alarms to tell about
+        self.size = size
+        self.cond = Condition()
+        self.raised = 0
+        self.told = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.latency = Histogram(TIME_EDGES)    # Error to heaters off
+        self.max_latency = 0.0
+        self.running = False
+        self.t = Thread(target=self._run, name="AlarmExecutor")
+        self.t.daemon = True
+
+    def sound(self, alarm):
+        """ Take the safety action and queue the alarm to be told """
+        try:
+            alarm.act()
+        except Exception:
+            logging.exception("Alarm action failed")
+        with self.cond:
+            self.raised += 1
+            if alarm.latency is not None:
+                self.latency.add(alarm.latency)
+                self.max_latency = max(self.max_latency, alarm.latency)
+            key = (alarm.type, alarm.source)
+            last = self.last.get(key)
+            if last is not None and alarm.time - last < self.window:
+                self.coalesced += 1
+                return
+            self.last[key] = alarm.time
+            if len(self.pending) >= self.size:
+                self.pending.popleft()
+                self.dropped += 1
+            self.pending.append(alarm)
+            self.cond.notify()
+
+    def report(self):
+        with self.cond:
+            report = "Alarms: {} raised, {} told, {} coalesced, {} dropped, {} waiting".format(
+                self.raised, self.told, self.coalesced, self.dropped, len(self.pending))
+            if len(self.latency):
+                report += ". Heaters off after p50 {:.0f} us, p99 {:.0f} us, max {:.0f} us".format(
+                    self.latency.percentile(50)*1e6, self.latency.percentile(99)*1e6,
+                    self.max_latency*1e6)
+            return report
 
     def _run(self):
         while self.running:
+            with self.cond:
+                if not self.pending:
+                    self.cond.wait(1)
+                if not self.pending:
+                    continue
+                alarm = self.pending.popleft()
             try:
-                alarm = self.queue.get(block=True, timeout=1)
-                alarm.execute() 
-                logging.debug("Alarm executed")
-                self.queue.task_done()       
-            except Queue.Empty:
-                continue
+                alarm.notify()
+            except Exception:
+                logging.exception("Unable to tell about alarm")
+            with self.cond:
+                self.told += 1
+            logging.debug("Alarm executed")
             
     def start(self):
         logging.debug("Starting alarm executor")
@@ -136,6 +202,8 @@ class AlarmExecutor:
     def stop(self):
         logging.debug("Stoppping alarm executor")
         self.running = False
+        with self.cond:
+            self.cond.notify()
         self.t.join()
     
 
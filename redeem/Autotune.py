@@ -20,24 +20,30 @@ License: GNU GPL v3: http://www.gnu.org/copyleft/gpl.html
  along with Redeem.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+
 from __future__ import division, print_function
 from threading import Thread
 import time
 import logging
 import numpy as np
 try:
-    from Gcode import Gcode
+    from RingBuffer import RingBuffer
 except ImportError:
-    from redeem.Gcode import Gcode
+    from redeem.RingBuffer import RingBuffer
 
 
 class Autotune:
 
-    def __init__(self, heater, temp=100.0, cycles=3, g=None, printer=None):        
+    # Tuning methods
+    RELAY = 0           # Relay oscillation around the set point
+    STEP_RESPONSE = 1   # Open loop step, fitted to a FOPDT model
+
+    def __init__(self, heater, temp=100.0, cycles=8, g=None, printer=None):
         self.heater = heater
         self.noise_band = 0.5
         # Steady state starting temperture
         self.steady_temperature = temp
+        # Maximum number of cycles, tuning stops earlier if the oscillation settles
         self.cycles = cycles
         self.g = g
         self.printer = printer
@@ -45,25 +51,44 @@ class Autotune:
         self.output_step = 10.0
         self.stable_start_seconds = 10
         self.sleep = 0.1
-        
+        # Samples in the Hanning window the peaks and valleys are found with
+        self.smooth_window = 100
+        self.method = Autotune.RELAY
+        # Max difference in amplitude (deg. C) between the last two oscillations
+        self.tolerance = 0.5
+        # Max relative difference between the peak and valley periods
+        self.period_tolerance = 0.1
+        # Open loop power and time limit for the step response
+        self.step_power = 0.3
+        self.step_timeout = 1200
+        # Enough room for 10 minutes of samples
+        self.temps = RingBuffer(int(600/self.sleep))
+        self.times = RingBuffer(int(600/self.sleep))
+        self.peaks = []
+        self.valleys = []
+        self.converged = False
+
     def cancel(self):
         self.running = False
         self.t.join()
 
 
     def send_temperature(self):
-        m105 = Gcode({"message": "M105", "prot": self.g.prot})
-        self.printer.processor.execute(m105)
-        answer = m105.get_answer()
-        m105.set_answer(answer[2:])  # strip away the "ok"
-        self.printer.reply(m105)
+        self.printer.send_message(self.g.prot, self.printer.telemetry.temperature_report())
 
     def run(self):
         """ Start the PID autotune loop """
-        # Reset found peaks
         self.running = True
-        self.temps = []
-        
+        self.converged = False
+        self.peaks = []
+        self.valleys = []
+        self.temps.clear()
+        self.times.clear()
+
+        if self.method == Autotune.STEP_RESPONSE:
+            self._step_response()
+            return
+
         # Wait for temperature to stabilize
         self.heater.set_target_temperature(self.steady_temperature)
         while not self.heater.is_temperature_stable(self.stable_start_seconds):
@@ -71,6 +96,9 @@ class Autotune:
             time.sleep(1)
 
         # Set the standard parameters
+        self.old_P = self.heater.P
+        self.old_I = self.heater.I
+        self.old_D = self.heater.D
         self.old_ok_range = self.heater.ok_range
         self.heater.P = 0.5
         self.heater.I = 0.0
@@ -81,87 +109,123 @@ class Autotune:
 
         # Start stepping temperatures
         self._tune()
-        logging.debug("Tuning data: "+str(self.temps))
-
-        # Smooth the data using hanning window
-        self.smooth_temps = self.smooth(np.array(self.temps))
-
-        # Discover peaks
-        peaks = self.detect_peaks(self.smooth_temps)
-        valleys = self.detect_peaks(self.smooth_temps, valley=True)
-        logging.debug("Found peaks: "+str(peaks))
-        logging.debug("Found valleys: "+str(valleys))
+        logging.debug("Tuning data: %s", self.temps.get())
+        logging.debug("Found peaks: %s", self.peaks)
+        logging.debug("Found valleys: %s", self.valleys)
 
-        # Calculate the new PID values
-        self.calculate_PID(self.smooth_temps, peaks, valleys)
-
-        # Set the new PID settings
         self.heater.ok_range = self.old_ok_range
-        self.heater.P = self.Kp
-        self.heater.I = self.Ki
-        self.heater.D = self.Kd
+        if self.peaks:
+            # Calculate and set the new PID values
+            self.calculate_PID()
+            self.heater.P = self.Kp
+            self.heater.I = self.Ki
+            self.heater.D = self.Kd
+        else:
+            logging.warning("Autotune did not complete a single oscillation")
+            self.heater.P = self.old_P
+            self.heater.I = self.old_I
+            self.heater.D = self.old_D
         self.heater.set_target_temperature(0)
 
     def _tune(self):
-        for peak in range(self.cycles):
-            # Set upper temperature step
+        """ Step the set point up and down around the steady temperature.
+        Valleys and peaks are picked up while sampling, and the tuning
+        stops as soon as the last two oscillations agree. """
+        self.start_time = time.time()
+        for cycle in range(self.cycles):
+            # Set upper temperature step. The valley occurs while
+            # the heater is catching up with the new set point
             new_temp = self.steady_temperature + self.output_step
-            self.heater.set_target_temperature(new_temp)            
-            logging.debug("Setting temp to "+str(new_temp))
-
-            # Wait for target temperature to be reached
-            while self.heater.get_temperature() < self.steady_temperature + self.noise_band:
-                temp = self.heater.get_temperature()
-                self.temps.append(temp)
-                if not self.running: 
-                    return
-
-                time.sleep(self.sleep)
+            self.heater.set_target_temperature(new_temp)
+            logging.debug("Setting temp to %s", new_temp)
+            valley = self._sample_until(self.steady_temperature + self.noise_band, False)
+            if valley is None:
+                return
 
             # Set lower temperature step
             new_temp = self.steady_temperature - self.output_step
             self.heater.set_target_temperature(new_temp)
-            logging.debug("Setting temp to "+str(new_temp))
+            logging.debug("Setting temp to %s", new_temp)
+            peak = self._sample_until(self.steady_temperature - self.noise_band, True)
+            if peak is None:
+                return
 
-            # Wait for target temperature to be reached
-            while self.heater.get_temperature() > self.steady_temperature - self.noise_band:
-                temp = self.heater.get_temperature()
-                self.temps.append(temp)
-                if not self.running: 
-                    return
-                self.send_temperature()
-                time.sleep(self.sleep)
-
-            if peak == 0:
-                self.temps = []
+            # The first cycle starts from steady state, so it is skewed
+            if cycle == 0:
                 continue
-            if peak >= 2:
-                smooth = self.smooth(np.array(self.temps))
-                peaks = self.detect_peaks(smooth)
-                diff = np.diff(smooth[peaks[-2:]])
-                logging.debug("Difference between last two peaks: "+str(diff)+" deg. C.")
-                print("Difference between last two peaks: "+str(diff)+" deg. C.")
-
-                # TODO: Adjust Power based on diff. 
-                #self.heater.P = ??
-                logging.debug("Setting heater P: "+str(self.heater.P))
-                            
-    def calculate_PID(self, temps, peaks, valleys):
-        abs_max = temps[peaks[-1]]
-        abs_min = temps[valleys[-1]]
-
-        logging.debug("Temperature Gain: "+str(abs_max-abs_min)+" deg. C")
-        print("Gain: "+str(abs_max-abs_min))
-
-        # Calculate the oscillation period of the peaks
-        Pu = (peaks[-1]-peaks[-2])*self.heater.sleep
+            self.valleys.append(valley)
+            self.peaks.append(peak)
+            if self._has_converged():
+                self.converged = True
+                logging.info("Autotune converged after %d cycles", cycle + 1)
+                return
+
+    def _sample_until(self, limit, falling):
+        """ Sample the temperature until it crosses the limit. Returns
+        the (time, temp) extreme seen on the way, the peak when falling
+        and the valley when rising, or None if cancelled. """
+        n = 0
+        while True:
+            temp = self.heater.get_temperature()
+            self.temps.append(temp)
+            self.times.append(time.time() - self.start_time)
+            n += 1
+            if (temp <= limit) if falling else (temp >= limit):
+                return self._extreme(min(n, len(self.temps)), falling)
+            if not self.running:
+                return None
+            # Keep the host updated once a second
+            if n % int(1.0/self.sleep) == 0:
+                self.send_temperature()
+            time.sleep(self.sleep)
+
+    def _extreme(self, n, falling):
+        """ The (time, temp) peak, or valley, of the newest n samples.
+        It is found in the smoothed temperatures, so ADC noise is not
+        taken for one. The samples before them are smoothed along. """
+        context = min(len(self.temps) - n, self.smooth_window)
+        temps = self.temps.get(n + context)
+        times = self.times.get(n + context)
+        window = min(self.smooth_window, temps.size)
+        # smooth() pads both ends, so the output is window-1 longer
+        start = (window - 1)//2 if window >= 3 else 0
+        smooth = self.smooth(temps, window_len=window)[start:start + temps.size]
+        part = smooth[context:]
+        i = context + (np.argmax(part) if falling else np.argmin(part))
+        return (times[i], smooth[i])
+
+    def _has_converged(self):
+        """ True if the amplitudes and periods of the last two
+        oscillations agree within the tolerance """
+        if len(self.peaks) < 2:
+            return False
+        amp_0 = self.peaks[-2][1] - self.valleys[-2][1]
+        amp_1 = self.peaks[-1][1] - self.valleys[-1][1]
+        peak_period = self.peaks[-1][0] - self.peaks[-2][0]
+        valley_period = self.valleys[-1][0] - self.valleys[-2][0]
+        logging.debug("Difference between last two amplitudes: %s deg. C.", amp_1 - amp_0)
+        if abs(amp_1 - amp_0) > self.tolerance:
+            return False
+        return abs(peak_period - valley_period) <= self.period_tolerance*max(peak_period, valley_period)
+
+    def calculate_PID(self):
+        """ Calculate the PID values from the last oscillation """
+        abs_max = self.peaks[-1][1]
+        abs_min = self.valleys[-1][1]
+
+        logging.debug("Temperature Gain: %s deg. C", abs_max-abs_min)
+
+        # Calculate the oscillation period from the peaks and valleys
+        if len(self.peaks) > 1:
+            Pu = ((self.peaks[-1][0]-self.peaks[-2][0]) +
+                  (self.valleys[-1][0]-self.valleys[-2][0]))/2.0
+        else:
+            Pu = 2.0*(self.peaks[-1][0]-self.valleys[-1][0])
         # Calculate the ultimate gain 
         Ku = 4.0*self.output_step/(np.pi*(abs_max-abs_min)/2.0)
 
-        logging.debug("Oscillation period: "+str(Pu)+" seconds")
-        logging.debug("Ultimate gain: "+str(Ku))
-        print("Oscillation period: "+str(Pu))
-        print("Ultimate gain: "+str(Ku))
+        logging.debug("Oscillation period: %s seconds", Pu)
+        logging.debug("Ultimate gain: %s", Ku)
 
         # Redeem uses 0..1 instead of 0..255
         # TODO: This is probably not right...
@@ -175,6 +239,85 @@ class Autotune:
         self.max_temp = abs_max
         self.min_temp = abs_min
 
+    def _step_response(self):
+        """ Apply a fixed power step and record the temperature until
+        the target is reached, then fit a FOPDT model to it """
+        logging.info("Applying %s power step to %s", self.step_power, self.heater.name)
+        start = time.time()
+        self.heater.open_loop_power = self.step_power
+        try:
+            while self.running:
+                temp = self.heater.get_temperature()
+                now = time.time() - start
+                self.temps.append(temp)
+                self.times.append(now)
+                if temp >= self.steady_temperature or now > self.step_timeout:
+                    break
+                if len(self.temps) % int(1.0/self.sleep) == 0:
+                    self.send_temperature()
+                time.sleep(self.sleep)
+        finally:
+            self.heater.open_loop_power = None
+            self.heater.set_target_temperature(0)
+
+        if len(self.temps) < 10:
+            logging.warning("Autotune: too few samples for a step response fit")
+            return
+        self.fit_fopdt(self.times.get(), self.temps.get(), self.step_power)
+        self.calculate_PID_from_model()
+        self.heater.P = self.Kp
+        self.heater.I = self.Ki
+        self.heater.D = self.Kd
+        self.converged = True
+
+    def fit_fopdt(self, times, temps, power, samples=200):
+        """ Fit a first order plus dead time model,
+        T(t) = T0 + K*power*(1-exp(-(t-theta)/tau)) for t > theta,
+        to a recorded step response. Theta is searched on a coarse grid
+        and then refined around the best one. All taus are evaluated at
+        once for each theta, the gain has a closed form for each pair. """
+        times = np.asarray(times, dtype=float)
+        temps = np.asarray(temps, dtype=float)
+        duration = times[-1] - times[0]
+        # Resample to a fixed size to bound the memory
+        t = np.linspace(0, duration, samples)
+        y = np.interp(t, times - times[0], temps) - temps[0]
+
+        thetas = np.linspace(0, duration/2.0, 25)
+        taus = np.logspace(np.log10(duration/50.0), np.log10(duration*20.0), 60)
+        best = min(self._fit_taus(t, y, theta, taus) for theta in thetas)
+
+        # Refine between the neighbours of the best theta and tau
+        step = thetas[1] - thetas[0]
+        ratio = taus[1]/taus[0]
+        thetas = np.linspace(max(best[1] - step, 0), min(best[1] + step, duration/2.0), 21)
+        taus = best[2]*np.logspace(-np.log10(ratio), np.log10(ratio), 21)
+        best = min([best] + [self._fit_taus(t, y, theta, taus) for theta in thetas])
+
+        _, self.theta, self.tau, gain = best
+        self.K = gain/power
+        logging.debug("FOPDT fit: K=%s, tau=%s, theta=%s", self.K, self.tau, self.theta)
+        return self.K, self.tau, self.theta
+
+    def _fit_taus(self, t, y, theta, taus):
+        """ (residual, theta, tau, gain) of the best tau for one theta """
+        shifted = np.maximum(t - theta, 0)
+        basis = 1.0 - np.exp(-shifted[np.newaxis, :]/taus[:, np.newaxis])
+        gain = basis.dot(y)/np.maximum((basis*basis).sum(axis=1), 1e-12)
+        residual = ((basis*gain[:, np.newaxis] - y)**2).sum(axis=1)
+        j = np.argmin(residual)
+        return (residual[j], theta, taus[j], gain[j])
+
+    def calculate_PID_from_model(self):
+        """ Ziegler-Nichols open loop tuning from the FOPDT model.
+        Redeem's heater computes P*(e + D*de/dt + I*int(e)), so
+        I is 1/Ti and D is Td """
+        theta = max(self.theta, self.sleep)
+        self.Kp = 1.2*self.tau/(self.K*theta)
+        self.Ki = 1.0/(2.0*theta)
+        self.Kd = 0.5*theta
+
+
     def smooth(self, x,window_len=100,window='hanning'):
         """
         smooth the data using a window with requested size.
@@ -365,18 +508,25 @@ if __name__ == '__main__':
     class MyClass:
         def __init__(self):
             self.sleep = 0.1
+            self.name = "E"
 
     tune = Autotune(MyClass())
-    tune.temps = data
-    print()
-    print(tune.get_periods())
-    peaks = tune.detect_peaks(data, show=True)
     data = tune.smooth(data)
     peaks = tune.detect_peaks(data, show=True)
     valleys = tune.detect_peaks(data, valley=True, show=True)
-    tune.calculate_PID(data, peaks, valleys)
+    t = np.arange(data.size)*tune.sleep
+    tune.peaks = list(zip(t[peaks], data[peaks]))
+    tune.valleys = list(zip(t[valleys], data[valleys]))
+    tune.calculate_PID()
     print(tune.Kp)
     print(tune.Ki)
     print(tune.Kd)
 
-
+    # Step response of a known model
+    t = np.arange(0, 300, tune.sleep)
+    step = 25 + 200*0.3*(1-np.exp(-np.maximum(t-8.0, 0)/60.0))
+    print(tune.fit_fopdt(t, step + np.random.normal(0, 0.1, t.size), 0.3))
+    tune.calculate_PID_from_model()
+    print(tune.Kp)
+    print(tune.Ki)
+    print(tune.Kd)
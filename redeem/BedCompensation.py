@@ -51,6 +51,13 @@ class BedCompensation:
         plane = np.array([cross[0], cross[1], np.abs(cross[2])])
         return BedCompensation.create_look_at(plane)
 
+    @staticmethod
+    def create_matrix_from_plane(coeffs):
+        """ The matrix create_rotation_matrix makes for probe heights on
+        the plane z = a + b*x + c*y, with x and y in meters """
+        a, b, c = coeffs
+        return BedCompensation.create_look_at(BedCompensation.normalize(np.array([-b, -c, 1.0])))
+
     @staticmethod
     def create_look_at(target):
         """ This method was based on code from Marlin, vector_3.cpp
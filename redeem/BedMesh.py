@@ -0,0 +1,171 @@
+"""
+Mesh bed compensation. The bed height is probed on a grid (G29 M) and
+bilinearly interpolated between the points. The interpolation is done
+with coefficients that are computed once per cell when the mesh is
+loaded, so a height is a lookup and a few multiplications, and a whole
+batch of segment end points can be done in one numpy call.
+
+All coordinates are in meters.
+
+Author: Elias Bakken
+email: elias(dot)bakken(at)gmail(dot)com
+Website: http://www.thing-printer.com
+License: GNU GPL v3: http://www.gnu.org/copyleft/gpl.html
+
+ Redeem is free software: you can redistribute it and/or modify
+ it under the terms of the GNU General Public License as published by
+ the Free Software Foundation, either version 3 of the License, or
+ (at your option) any later version.
+
+ Redeem is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU General Public License for more details.
+
+ You should have received a copy of the GNU General Public License
+ along with Redeem.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import numpy as np
+
+
+class BedMesh:
+
+    def __init__(self, x_min, x_max, y_min, y_max, heights, tolerance=0.00002):
+        """ heights has one row per Y, from y_min to y_max,
+        with one column per X, from x_min to x_max """
+        self.heights = np.array(heights, dtype=np.float64)
+        ny, nx = self.heights.shape
+        if nx < 2 or ny < 2:
+            raise ValueError("A bed mesh needs at least 2x2 points")
+        self.x_min, self.x_max = float(x_min), float(x_max)
+        self.y_min, self.y_max = float(y_min), float(y_max)
+        self.nx, self.ny = nx, ny
+        self.dx = (self.x_max - self.x_min)/(nx - 1)
+        self.dy = (self.y_max - self.y_min)/(ny - 1)
+        self.tolerance = tolerance
+
+        # Per cell, z = a + b*u + c*v + d*u*v with u, v in [0, 1]
+        h = self.heights
+        self.coeffs = np.dstack((
+            h[:-1, :-1],
+            h[:-1, 1:] - h[:-1, :-1],
+            h[1:, :-1] - h[:-1, :-1],
+            h[1:, 1:] - h[1:, :-1] - h[:-1, 1:] + h[:-1, :-1]))
+        # Plain nested lists for the scalar lookup, indexing
+        # them is much faster than indexing a numpy array
+        self.cells = self.coeffs.tolist()
+
+    def _cell(self, x, y):
+        """ Cell index and position inside it, for scalars """
+        fx = min(max((x - self.x_min)/self.dx, 0.0), self.nx - 1)
+        fy = min(max((y - self.y_min)/self.dy, 0.0), self.ny - 1)
+        i = min(int(fx), self.nx - 2)
+        j = min(int(fy), self.ny - 2)
+        return i, j, fx - i, fy - j
+
+    def height_at(self, x, y):
+        """ Height at a single point. Outside the mesh,
+        the height at the nearest edge is used. """
+        i, j, u, v = self._cell(x, y)
+        a, b, c, d = self.cells[j][i]
+        return a + b*u + c*v + d*u*v
+
+    def height(self, x, y):
+        """ Heights at arrays of points """
+        fx = np.clip((np.asarray(x, dtype=np.float64) - self.x_min)/self.dx, 0, self.nx - 1)
+        fy = np.clip((np.asarray(y, dtype=np.float64) - self.y_min)/self.dy, 0, self.ny - 1)
+        i = np.minimum(fx.astype(int), self.nx - 2)
+        j = np.minimum(fy.astype(int), self.ny - 2)
+        u = fx - i
+        v = fy - j
+        c = self.coeffs[j, i]
+        return c[..., 0] + c[..., 1]*u + c[..., 2]*v + c[..., 3]*u*v
+
+    def split(self, start, end):
+        """ Fractions (0..1) of the move from start to end (x, y) where
+        it has to be split so that following the mesh with straight
+        lines is off by no more than the tolerance. The slope changes
+        where the move crosses a grid line, and inside a twisted cell
+        the height is quadratic along the move, so such a cell is
+        sampled closely enough that straight lines between the samples
+        are within the tolerance. Returns an empty list if no split is
+        needed. """
+        x0, y0 = start[0], start[1]
+        x1, y1 = end[0], end[1]
+        ts = [np.array([0.0, 1.0])]
+        for p0, p1, low, step, n in ((x0, x1, self.x_min, self.dx, self.nx),
+                                     (y0, y1, self.y_min, self.dy, self.ny)):
+            if p0 == p1:
+                continue
+            # Grid lines strictly between the two ends
+            lines = low + step*np.arange(n)
+            inside = lines[(lines > min(p0, p1)) & (lines < max(p0, p1))]
+            ts.append((inside - p0)/(p1 - p0))
+        t = np.unique(np.concatenate(ts))
+
+        # In a cell, z = ... + d*u*v with u and v linear in t, so the
+        # curvature along the move is d*u'*v'. Outside the mesh the
+        # height does not change across it, and there is none.
+        mid = (t[:-1] + t[1:])/2
+        fx = (x0 + mid*(x1 - x0) - self.x_min)/self.dx
+        fy = (y0 + mid*(y1 - y0) - self.y_min)/self.dy
+        i = np.clip(fx.astype(int), 0, self.nx - 2)
+        j = np.clip(fy.astype(int), 0, self.ny - 2)
+        du = np.where((fx >= 0) & (fx <= self.nx - 1), (x1 - x0)/self.dx, 0.0)
+        dv = np.where((fy >= 0) & (fy <= self.ny - 1), (y1 - y0)/self.dy, 0.0)
+        curve = np.abs(self.coeffs[j, i, 3]*du*dv)
+        # A chord h long is off by curve*h**2/4 in the middle
+        pieces = np.ceil((t[1:] - t[:-1])*np.sqrt(curve/self.tolerance)/2).astype(int)
+        samples = [t[k] + (t[k + 1] - t[k])*np.arange(1, n)/float(n)
+                   for k, n in enumerate(pieces) if n > 1]
+        if samples:
+            t = np.unique(np.concatenate([t] + samples))
+        if len(t) == 2:
+            return []
+        z = self.height(x0 + t*(x1 - x0), y0 + t*(y1 - y0))
+        keep = self._simplify(t, z)
+        return [t[k] for k in keep[1:-1]]
+
+    def _simplify(self, t, z):
+        """ Douglas-Peucker on (t, z): the indices of the points to keep """
+        keep = [0, len(t) - 1]
+        stack = [(0, len(t) - 1)]
+        while stack:
+            first, last = stack.pop()
+            if last - first < 2:
+                continue
+            inner = np.arange(first + 1, last)
+            chord = z[first] + (z[last] - z[first])*(t[inner] - t[first])/(t[last] - t[first])
+            errors = np.abs(z[inner] - chord)
+            worst = int(np.argmax(errors))
+            if errors[worst] > self.tolerance:
+                index = first + 1 + worst
+                keep.append(index)
+                stack.append((first, index))
+                stack.append((index, last))
+        return sorted(keep)
+
+    def points(self):
+        """ The (x, y) of the grid points, in probing order:
+        row by row, every other row reversed to save travel """
+        order = []
+        for j in range(self.ny):
+            columns = range(self.nx) if j % 2 == 0 else reversed(range(self.nx))
+            for i in columns:
+                order.append((i, j, self.x_min + i*self.dx, self.y_min + j*self.dy))
+        return order
+
+    @staticmethod
+    def parse_heights(text):
+        """ Heights from the config, one row of comma separated values per line """
+        rows = []
+        for line in text.strip().split("\n"):
+            values = [float(v) for v in line.replace("\t", "").split(",") if v.strip()]
+            if values:
+                rows.append(values)
+        return rows
+
+    def format_heights(self):
+        return "\n" + "\n".join(
+            ", ".join(repr(h) for h in row) for row in self.heights.tolist())
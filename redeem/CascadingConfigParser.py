@@ -21,6 +21,7 @@ License: GNU GPL v3: http://www.gnu.org/copyleft/gpl.html
 import ConfigParser
 import os
 import logging
+from ConfigSnapshot import build_snapshot
 
 
 class CascadingConfigParser(ConfigParser.SafeConfigParser):
@@ -28,10 +29,18 @@ class CascadingConfigParser(ConfigParser.SafeConfigParser):
 
         ConfigParser.SafeConfigParser.__init__(self)
 
+        # Typed values for the hot paths, see build_snapshot()
+        self.snapshot = None
+
+        # (section, option) pairs changed with set() since the last save
+        self.dirty = set()
+
         # Write options in the case it was read. 
         # self.optionxform = str
 
-        # Parse to real path
+        # Parse to real path, but remember the given names
+        # so that replaced symlinks are noticed as well
+        self.config_names = list(config_files)
         self.config_files = []
         for config_file in config_files:
             self.config_files.append(os.path.realpath(config_file))
@@ -40,11 +49,26 @@ class CascadingConfigParser(ConfigParser.SafeConfigParser):
         for config_file in self.config_files:
             if os.path.isfile(config_file):
                 logging.info("Using config file " + config_file)
-                self.readfp(open(config_file))
+                with open(config_file) as f:
+                    self.readfp(f)
             else:
                 logging.warning("Missing config file " + config_file)
                 # Might also add command line options for overriding stuff
 
+    def set(self, section, option, value=None):
+        """ Set an option, and remember it for save() if it changed """
+        option = self.optionxform(option)
+        changed = not self.has_option(section, option) or \
+            self.get(section, option, raw=True) != value
+        ConfigParser.SafeConfigParser.set(self, section, option, value)
+        if changed:
+            self.dirty.add((section, option))
+
+    def build_snapshot(self):
+        """ (Re)build the typed snapshot of the options used while printing """
+        self.snapshot = build_snapshot(self)
+        return self.snapshot
+
     def timestamp(self):
         """ Get the largest (newest) timestamp for all the config files. """
         ts = 0
@@ -52,8 +76,9 @@ class CascadingConfigParser(ConfigParser.SafeConfigParser):
             if os.path.isfile(config_file):
                 ts = max(ts, os.path.getmtime(config_file))
         
-        if os.path.islink("/etc/redeem/printer.cfg"):
-            ts = max(ts, os.lstat("/etc/redeem/printer.cfg").st_mtime)
+        for config_name in self.config_names:
+            if os.path.islink(config_name):
+                ts = max(ts, os.lstat(config_name).st_mtime)
         return ts
 
     def parse_capes(self):
@@ -81,31 +106,32 @@ class CascadingConfigParser(ConfigParser.SafeConfigParser):
         return 
     
     def save(self, filename):
-        """ Save the changed settings to local.cfg """
-        current = CascadingConfigParser(self.config_files)
-
-        # Get list of changed values
-        to_save = []
-        for section in self.sections():
-            logging.debug(section)
-            for option in self.options(section):                
-                if self.get(section, option) != current.get(section, option):
-                    old = current.get(section, option)
-                    val = self.get(section, option)
-                    to_save.append((section, option, val, old))
-
-        # Update local config with changed values
+        """ Save the changed settings to local.cfg. Only the options
+        changed with set() are written, and the file is replaced
+        atomically so a power loss never leaves it half written. """
+        if not self.dirty:
+            logging.info("No settings changed, nothing to save")
+            return
+        filename = os.path.realpath(filename)
         local = ConfigParser.SafeConfigParser()
-        local.readfp(open(filename, "r"))
-        for opt in to_save:         
-            (section, option, value, old) = opt
+        if os.path.isfile(filename):
+            with open(filename, "r") as f:
+                local.readfp(f)
+
+        for section, option in sorted(self.dirty):
             if not local.has_section(section):
                 local.add_section(section)
+            value = self.get(section, option, raw=True)
             local.set(section, option, value)
-            logging.info("Update setting: {} from {} to {} ".format(option, old, value))
-
-                    
-        # Save changed values to file
-        local.write(open(filename, "w+"))
-
-    
+            logging.info("Update setting: [{}] {} to {}".format(section, option, value))
+
+        # Save changed values to a temp file, then swap it in
+        tmp_filename = filename + ".tmp"
+        with open(tmp_filename, "w") as f:
+            local.write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.rename(tmp_filename, filename)
+        self.dirty.clear()
+
+        self.build_snapshot()
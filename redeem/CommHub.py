@@ -0,0 +1,406 @@
+#!/usr/bin/env python
+"""
+CommHub - one thread that does the reading and writing for all the
+communication channels (USB, Ethernet and the virtual ttys).
+
+Channels register a file descriptor and a callback that is called from
+the hub thread when there is something to read. Replies are put on a
+bounded write queue per channel and written as the descriptor can take
+them, as many as fit in one write, so a slow host never blocks the
+thread sending the reply. When a host stops reading and its queue is
+full, messages are dropped by the overflow policy, but never the "ok"
+replies and alarms a host needs to keep going. The hub sleeps in
+select() until a descriptor is ready, or until another thread wakes it
+through a pipe, so idle channels cost nothing and closing down does not
+wait for a timeout.
+
+The hub never waits for the command queues either. When one is full,
+the G-codes read from a channel wait in a backlog of that channel and
+are handed over as the queue drains, while the other channels are
+still read. Real-time G-codes (M112, M24, M25) skip the backlog.
+
+Author: Elias Bakken
+email: elias(dot)bakken(at)gmail(dot)com
+Website: http://www.thing-printer.com
+License: GNU GPL v3: http://www.gnu.org/copyleft/gpl.html
+
+ Redeem is free software: you can redistribute it and/or modify
+ it under the terms of the GNU General Public License as published by
+ the Free Software Foundation, either version 3 of the License, or
+ (at your option) any later version.
+
+ Redeem is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU General Public License for more details.
+
+ You should have received a copy of the GNU General Public License
+ along with Redeem.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from threading import Thread, Lock
+from collections import deque
+import errno
+import fcntl
+import heapq
+import itertools
+import logging
+import os
+import select
+import time
+
+from Gcode import Gcode
+
+# Errors that mean "try again later" on a non-blocking descriptor
+RETRY = (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR)
+
+# Messages that are never dropped when a queue is full
+KEEP = ("ok", "!!", "Alarm", "Error")
+
+# G-codes a channel holds before the hub stops reading from it
+BACKLOG_SIZE = 1000
+
+# Seconds between attempts to hand a backlog over
+BACKLOG_RETRY = 0.01
+
+# Seconds between attempts to reopen a channel that could not be read
+REOPEN_DELAY = 1.0
+
+
+def set_nonblocking(fd):
+    flags = fcntl.fcntl(fd, fcntl.F_GETFL)
+    fcntl.fcntl(fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+
+
+class LineReader:
+    """ Splits what is read from a channel into lines, keeping
+    the part of a line that has not been terminated yet """
+
+    def __init__(self):
+        self.partial = ""
+
+    def feed(self, data):
+        """ Returns the complete lines in data, without line endings """
+        lines = (self.partial + data).split("\n")
+        self.partial = lines.pop()
+        return [line.rstrip("\r") for line in lines]
+
+
+class WriteQueue:
+    """ The messages waiting to be written to one channel, and its
+    counters. On overflow, "drop_new" drops the message that does not
+    fit and "drop_oldest" drops the oldest message that may be dropped.
+    Messages starting with one of KEEP are always queued. """
+
+    POLICIES = ("drop_new", "drop_oldest")
+
+    def __init__(self, name, size=1000, policy="drop_new"):
+        if policy not in WriteQueue.POLICIES:
+            raise ValueError("Unknown overflow policy " + policy)
+        self.name = name
+        self.size = size              # Messages
+        self.policy = policy
+        self.lines = deque()          # (message, may be dropped)
+        self.partial = ""             # What a write did not take
+        self.queued = 0
+        self.dropped = 0
+        self.writes = 0
+        self.written = 0              # Bytes
+        self.errors = 0
+        self.max_depth = 0
+
+    def __len__(self):
+        return len(self.lines) + (1 if self.partial else 0)
+
+    def put(self, message):
+        """ Queue a message. Returns False if it was dropped. """
+        droppable = not message.startswith(KEEP)
+        if len(self.lines) >= self.size:
+            if self.policy == "drop_oldest":
+                for index, (_, may_drop) in enumerate(self.lines):
+                    if may_drop:
+                        del self.lines[index]
+                        self.dropped += 1
+                        break
+            if len(self.lines) >= self.size and droppable:
+                self.dropped += 1
+                return False
+        self.lines.append((message, droppable))
+        self.queued += 1
+        self.max_depth = max(self.max_depth, len(self.lines))
+        return True
+
+    def take(self):
+        """ All that is waiting, as one string """
+        data = self.partial + "".join(message for message, _ in self.lines)
+        self.lines.clear()
+        self.partial = ""
+        return data
+
+    def report(self):
+        return ("{}: {} queued, {} dropped, {} waiting, {} max, {} writes, "
+                "{} bytes, {} errors".format(
+                    self.name, self.queued, self.dropped, len(self),
+                    self.max_depth, self.writes, self.written, self.errors))
+
+
+class Channel:
+    """ The part the USB, Pipe and Ethernet channels have in common:
+    reading lines from a file descriptor and writing replies to one """
+
+    def __init__(self, printer, prot):
+        self.printer = printer
+        self.prot = prot
+        self.hub = printer.comm_hub
+        self.reader = LineReader()
+        self.queue = self.hub.queue(prot)
+        self.backlog = deque()        # G-codes waiting for room in a queue
+        self.send_response = True
+        self.rd = None
+        self.wr = None
+
+    def read(self, fd):
+        """ Read what is there. Returns False at end of file
+        or on an error, True otherwise """
+        try:
+            data = os.read(fd, 4096)
+        except OSError, e:
+            if e.errno in RETRY:
+                return True
+            logging.warning("%s: could not read: %s", self.prot, e.strerror)
+            return False
+        if data == "":
+            return False
+        for line in self.reader.feed(data):
+            self.on_line(line)
+        return True
+
+    def on_line(self, line):
+        """ Hand a line to the G-code processor, or keep it in
+        the backlog if it would have to wait for room in a queue """
+        message = line.strip()
+        if len(message) > 0:
+            gcode = Gcode({"message": message, "prot": self.prot})
+            processor = self.printer.processor
+            if self.backlog and not processor.is_realtime(gcode):
+                self.backlog.append(gcode)    # Behind the ones waiting
+            elif not processor.enqueue(gcode, block=False):
+                self.backlog.append(gcode)
+                self.hub.add_backlog(self)
+
+    def drain(self):
+        """ Hand over the backlog while there is room. Returns
+        True when it is empty. """
+        processor = self.printer.processor
+        while self.backlog:
+            if not processor.enqueue(self.backlog[0], block=False):
+                return False
+            self.backlog.popleft()
+        return True
+
+    def send_message(self, message):
+        # Read once, the hub thread clears it when the host goes away
+        wr = self.wr
+        if self.send_response and wr is not None:
+            if message[-1] != "\n":
+                message += "\n"
+            self.hub.write(wr, self.queue, message)
+
+
+class CommHub:
+
+    def __init__(self, printer, queue_size=1000, policy="drop_new"):
+        self.printer = printer
+        self.printer.comm_hub = self
+        self.queue_size = queue_size  # Messages per channel
+        self.policy = policy          # See WriteQueue
+        self.queues = {}              # name -> WriteQueue
+        self.readers = {}             # fd -> callback(fd)
+        self.outgoing = {}            # fd -> WriteQueue with something to write
+        self.backlogged = set()       # Channels with a backlog
+        self.timers = []              # Heap of (time, number, callback)
+        self.numbers = itertools.count()
+        self.lock = Lock()
+        self.wake_rd, self.wake_wr = os.pipe()
+        set_nonblocking(self.wake_rd)
+        set_nonblocking(self.wake_wr)
+        self.running = False
+        self.t = None
+
+    def add_reader(self, fd, callback):
+        """ Call callback(fd) from the hub thread when fd can be read """
+        with self.lock:
+            self.readers[fd] = callback
+        self.wake()
+
+    def queue(self, name):
+        """ A new write queue for the channel name """
+        queue = WriteQueue(name, self.queue_size, self.policy)
+        with self.lock:
+            self.queues[name] = queue
+        return queue
+
+    def forget(self, name):
+        """ Drop the queue, counters and backlog of a channel that is gone """
+        with self.lock:
+            self.queues.pop(name, None)
+            for channel in list(self.backlogged):
+                if channel.prot == name:
+                    self.backlogged.discard(channel)
+
+    def add_backlog(self, channel):
+        """ Hand the backlog of channel over as the queues drain """
+        with self.lock:
+            self.backlogged.add(channel)
+        self.wake()
+
+    def call_later(self, delay, callback):
+        """ Call callback() from the hub thread in delay seconds """
+        with self.lock:
+            heapq.heappush(self.timers, (time.time() + delay, next(self.numbers), callback))
+        self.wake()
+
+    def report(self):
+        """ The counters of each channel, one line each """
+        with self.lock:
+            return [queue.report() for name, queue in sorted(self.queues.iteritems())]
+
+    def remove(self, fd):
+        """ Stop reading from fd and drop what is waiting to be written
+        to it. The caller closes it. """
+        with self.lock:
+            self.readers.pop(fd, None)
+            queue = self.outgoing.pop(fd, None)
+            if queue is not None:
+                queue.take()
+        self.wake()
+
+    def write(self, fd, queue, message):
+        """ Queue message for fd. Safe to call from any thread, and never
+        waits for the host. Written right away if nothing is waiting and
+        fd can take it, the rest is written by the hub thread. """
+        with self.lock:
+            if not queue.put(message) or fd in self.outgoing:
+                return
+            if self._flush(fd, queue):
+                return
+            self.outgoing[fd] = queue
+        self.wake()
+
+    def _flush(self, fd, queue):
+        """ Write what fd takes of the queue. Returns
+        True if the queue is empty afterwards. """
+        data = queue.take()
+        try:
+            written = os.write(fd, data)
+        except OSError, e:
+            if e.errno in RETRY:
+                queue.partial = data
+                return False
+            queue.errors += 1
+            logging.warning("Unable to write to %s: %s", queue.name, e.strerror)
+            return True
+        except (TypeError, ValueError), e:
+            # The channel was closed under us
+            queue.errors += 1
+            logging.warning("Unable to write to %s: %s", queue.name, e)
+            return True
+        queue.writes += 1
+        queue.written += written
+        queue.partial = data[written:]
+        return not queue.partial
+
+    def wake(self):
+        """ Make the hub thread look at the descriptors again """
+        try:
+            os.write(self.wake_wr, "x")
+        except OSError:
+            pass    # Full, so the hub is woken already
+
+    def start(self):
+        self.running = True
+        self.t = Thread(target=self._loop, name="CommHub")
+        self.t.daemon = True
+        self.t.start()
+
+    def stop(self):
+        self.running = False
+        self.wake()
+        if self.t is not None:
+            self.t.join()
+        os.close(self.wake_rd)
+        os.close(self.wake_wr)
+
+    def _loop(self):
+        while self.running:
+            with self.lock:
+                # Channels with a full backlog are not read until it drains
+                full = set(channel.rd for channel in self.backlogged
+                           if len(channel.backlog) >= BACKLOG_SIZE)
+                readers = [fd for fd in self.readers.keys() if fd not in full]
+                writers = self.outgoing.keys()
+                timeout = BACKLOG_RETRY if self.backlogged else None
+                if self.timers:
+                    wait = max(self.timers[0][0] - time.time(), 0)
+                    timeout = wait if timeout is None else min(timeout, wait)
+            try:
+                r, w, x = select.select(readers + [self.wake_rd], writers, [], timeout)
+            except (select.error, ValueError), e:
+                # A descriptor was closed before it was removed
+                logging.warning("CommHub: %s", e)
+                self._drop_closed()
+                continue
+            if self.wake_rd in r:
+                try:
+                    while os.read(self.wake_rd, 1024):
+                        pass
+                except OSError:
+                    pass
+                r.remove(self.wake_rd)
+            with self.lock:
+                for fd in w:
+                    queue = self.outgoing.get(fd)
+                    if queue is not None and self._flush(fd, queue):
+                        del self.outgoing[fd]
+            for fd in r:
+                callback = self.readers.get(fd)
+                if callback is None:
+                    continue
+                try:
+                    callback(fd)
+                except Exception:
+                    logging.exception("Exception reading from channel")
+            self._drain()
+            self._run_timers()
+
+    def _drain(self):
+        with self.lock:
+            channels = list(self.backlogged)
+        for channel in channels:
+            try:
+                if channel.drain():
+                    with self.lock:
+                        self.backlogged.discard(channel)
+            except Exception:
+                logging.exception("Exception handing over the backlog of %s", channel.prot)
+
+    def _run_timers(self):
+        now = time.time()
+        while True:
+            with self.lock:
+                if not self.timers or self.timers[0][0] > now:
+                    return
+                _, _, callback = heapq.heappop(self.timers)
+            try:
+                callback()
+            except Exception:
+                logging.exception("Exception in CommHub timer")
+
+    def _drop_closed(self):
+        with self.lock:
+            for fd in self.readers.keys() + self.outgoing.keys():
+                try:
+                    os.fstat(fd)
+                except OSError:
+                    self.readers.pop(fd, None)
+                    self.outgoing.pop(fd, None)
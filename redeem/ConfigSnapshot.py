@@ -0,0 +1,74 @@
+"""
+Typed, read only snapshot of the config options that are used while
+printing. Values are converted once, when the config is loaded or
+saved, so G-code handlers read plain attributes instead of going
+through ConfigParser interpolation and string conversion.
+
+Author: Elias Bakken
+email: elias(dot)bakken(at)gmail(dot)com
+Website: http://www.thing-printer.com
+License: GNU GPL v3: http://www.gnu.org/copyleft/gpl.html
+
+ Redeem is free software: you can redistribute it and/or modify
+ it under the terms of the GNU General Public License as published by
+ the Free Software Foundation, either version 3 of the License, or
+ (at your option) any later version.
+
+ Redeem is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU General Public License for more details.
+
+ You should have received a copy of the GNU General Public License
+ along with Redeem.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from collections import namedtuple
+import ConfigParser
+
+AXES = ["x", "y", "z", "e", "h", "a", "b", "c"]
+
+# Multi line value, stored as a tuple of the non-empty lines
+LINES = "lines"
+
+# Section -> list of (option, type). Plugins can add their own sections
+# before the snapshot is built.
+SCHEMA = {
+    "System": [("machine_type", str)],
+    "Probe": [("length", float), ("speed", float), ("accel", float),
+              ("offset_x", float), ("offset_y", float),
+              ("samples", int), ("retries", int), ("tolerance", float)],
+    "Delta": [("calibration_factors", int), ("calibration_points", int),
+              ("calibration_radius", float)],
+    "Endstops": [("has_" + a, bool) for a in AXES],
+    "Steppers": [("in_use_" + a, bool) for a in AXES],
+    "Macros": [("G29", LINES), ("G31", LINES), ("G32", LINES)],
+}
+
+
+def _convert(config, section, option, kind):
+    """ Read and convert a single option, naming it if it fails """
+    try:
+        if kind is float:
+            return config.getfloat(section, option)
+        if kind is int:
+            return config.getint(section, option)
+        if kind is bool:
+            return config.getboolean(section, option)
+        if kind == LINES:
+            lines = [line.strip() for line in config.get(section, option).split("\n")]
+            return tuple(line for line in lines if line)
+        return config.get(section, option)
+    except ValueError, e:
+        raise ValueError("Invalid value for [{}] {}: {}".format(section, option, e))
+
+
+def build_snapshot(config):
+    """ Make a snapshot from a config parser. Missing sections or
+    options and values of the wrong type raise here, not mid-print """
+    sections = {}
+    for section, options in SCHEMA.iteritems():
+        names = [option for option, _ in options]
+        values = [_convert(config, section, option, kind) for option, kind in options]
+        sections[section] = namedtuple(section + "Section", names)(*values)
+    return namedtuple("ConfigSnapshot", sections.keys())(**sections)
@@ -0,0 +1,205 @@
+"""
+Least squares calibration of a delta, for G33. The bed is probed at a
+pattern of points, and the geometry (endstop offsets, radius, rod
+length and column errors) that puts all the probed points on the bed
+is found with Levenberg-Marquardt. The kinematics here work on all the
+points at once, so each step of the fit is a handful of numpy calls.
+
+The carriage heights the printer had when the probe triggered are known
+from the geometry it believes. The fit looks for the geometry that
+turns those carriage heights into points with Z = 0.
+
+All lengths are in meters.
+
+Author: Elias Bakken
+email: elias(dot)bakken(at)gmail(dot)com
+Website: http://www.thing-printer.com
+License: GNU GPL v3: http://www.gnu.org/copyleft/gpl.html
+
+ Redeem is free software: you can redistribute it and/or modify
+ it under the terms of the GNU General Public License as published by
+ the Free Software Foundation, either version 3 of the License, or
+ (at your option) any later version.
+
+ Redeem is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU General Public License for more details.
+
+ You should have received a copy of the GNU General Public License
+ along with Redeem.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import numpy as np
+
+from Delta import Delta
+
+# The Delta attributes the geometry is made of
+GEOMETRY = ["Hez", "L", "r", "Ae", "Be", "Ce",
+            "A_radial", "B_radial", "C_radial",
+            "A_tangential", "B_tangential", "C_tangential"]
+
+# Number of factors -> the parameters that are fitted. The endstop
+# offsets are the corrections to add to the carriage heights. Column C
+# is the reference for the column errors, fitting it as well would only
+# turn or move the whole printer.
+FACTORS = {
+    3: ["endstop_X", "endstop_Y", "endstop_Z"],
+    4: ["endstop_X", "endstop_Y", "endstop_Z", "r"],
+    6: ["endstop_X", "endstop_Y", "endstop_Z", "r",
+        "A_tangential", "B_tangential"],
+    7: ["endstop_X", "endstop_Y", "endstop_Z", "r",
+        "A_tangential", "B_tangential", "L"],
+    9: ["endstop_X", "endstop_Y", "endstop_Z", "r",
+        "A_tangential", "B_tangential", "L", "A_radial", "B_radial"],
+}
+
+# Column angles, as in Delta.recalculate
+THETA = np.array([np.pi/2.0, 7.0*np.pi/6.0, 11.0*np.pi/6.0])
+
+
+def current_geometry():
+    """ The geometry in use, as a dict """
+    geometry = dict((name, getattr(Delta, name)) for name in GEOMETRY)
+    for axis in "XYZ":
+        geometry["endstop_" + axis] = 0.0
+    return geometry
+
+
+def columns(g):
+    """ Virtual column positions (x, y), one row per column.
+    The same sums as Delta.recalculate. """
+    radial = np.array([g["A_radial"], g["B_radial"], g["C_radial"]]) + g["r"]
+    tangential = np.array([
+        [g["A_tangential"], 0.0],
+        [g["B_tangential"]/2, np.sqrt(3)*(-g["B_tangential"]/2)],
+        [np.sqrt(3)*(g["C_tangential"]/2), g["C_tangential"]/2]])
+    effector = np.array([g["Ae"], g["Be"], g["Ce"]])
+    direction = np.column_stack((np.cos(THETA), np.sin(THETA)))
+    return (radial - effector)[:, None]*direction + tangential
+
+
+def inverse(g, points):
+    """ Carriage heights (N x 3) of the points (N x 3) """
+    cols = columns(g)
+    dx = points[:, 0, None] - cols[None, :, 0]
+    dy = points[:, 1, None] - cols[None, :, 1]
+    return points[:, 2, None] + np.sqrt(g["L"]**2 - dx**2 - dy**2) + g["Hez"]
+
+
+def forward(g, carriages):
+    """ Points (N x 3) of the carriage heights (N x 3), the inverse of
+    inverse() for each row. Trilateration, as in Delta.forward_kinematics. """
+    cols = columns(g)
+    n = len(carriages)
+    p1 = np.column_stack((np.repeat(cols[0, 0], n), np.repeat(cols[0, 1], n), carriages[:, 0]))
+    p2 = np.column_stack((np.repeat(cols[1, 0], n), np.repeat(cols[1, 1], n), carriages[:, 1]))
+    p3 = np.column_stack((np.repeat(cols[2, 0], n), np.repeat(cols[2, 1], n), carriages[:, 2]))
+
+    p12 = p2 - p1
+    d = np.sqrt((p12**2).sum(axis=1))
+    ex = p12/d[:, None]
+    p13 = p3 - p1
+    i = (ex*p13).sum(axis=1)
+    ey = p13 - i[:, None]*ex
+    ey /= np.sqrt((ey**2).sum(axis=1))[:, None]
+    ez = np.cross(ex, ey)
+    j = (ey*p13).sum(axis=1)
+
+    x = d/2
+    y = ((i**2 + j**2)/2 - i*x)/j
+    z = np.sqrt(g["L"]**2 - x**2 - y**2)
+    xyz = p1 + x[:, None]*ex + y[:, None]*ey - z[:, None]*ez
+    xyz[:, 2] -= g["Hez"]
+    return xyz
+
+
+def residuals(g, carriages):
+    """ Height above the bed of each probed point, if the geometry is g """
+    endstops = np.array([g["endstop_X"], g["endstop_Y"], g["endstop_Z"]])
+    return forward(g, carriages + endstops)[:, 2]
+
+
+def pattern(radius, count):
+    """ The center and count - 1 points on two rings, in meters. Two
+    thirds of the points are on the outer ring, starting at column A.
+    The inner ring, at half the radius, is turned half a step. """
+    points = [(0.0, 0.0)]
+    rest = count - 1
+    outer = rest if rest <= 6 else int(np.ceil(rest*2/3.0))
+    inner = rest - outer
+    for k in range(outer):
+        a = np.pi/2 + 2*np.pi*k/outer
+        points.append((radius*np.cos(a), radius*np.sin(a)))
+    for k in range(inner):
+        a = np.pi/2 + 2*np.pi*(k + 0.5)/inner
+        points.append((radius/2*np.cos(a), radius/2*np.sin(a)))
+    return points
+
+
+class DeltaCalibration:
+
+    def __init__(self, factors=6, geometry=None):
+        if factors not in FACTORS:
+            raise ValueError("Number of factors must be one of {}".format(sorted(FACTORS)))
+        self.names = FACTORS[factors]
+        self.geometry = geometry or current_geometry()
+        self.iterations = 0
+        self.rms_before = None
+        self.rms_after = None
+
+    def _with(self, values):
+        g = dict(self.geometry)
+        g.update(zip(self.names, values))
+        return g
+
+    def _jacobian(self, values, carriages, r, step=1e-7):
+        """ Forward differences, one batched residual call per parameter """
+        J = np.empty((len(r), len(values)))
+        for k in range(len(values)):
+            moved = values.copy()
+            moved[k] += step
+            J[:, k] = (residuals(self._with(moved), carriages) - r)/step
+        return J
+
+    def solve(self, points, max_iterations=50, tolerance=1e-9):
+        """ Fit the geometry to the probed points (N x 3): the (x, y) of the
+        effector and the Z the printer believed it was at when the probe
+        triggered. Returns the new geometry, a dict with the Delta
+        attributes and the endstop corrections. """
+        points = np.asarray(points, dtype=np.float64)
+        if len(points) <= len(self.names):
+            raise ValueError("{} factors need more than {} points".format(
+                len(self.names), len(self.names)))
+        carriages = inverse(self.geometry, points)
+        values = np.array([self.geometry[name] for name in self.names], dtype=np.float64)
+
+        r = residuals(self.geometry, carriages)
+        cost = np.dot(r, r)
+        self.rms_before = np.sqrt(cost/len(r))
+        damping = 1e-3
+        self.iterations = 0
+        while self.iterations < max_iterations:
+            self.iterations += 1
+            J = self._jacobian(values, carriages, r)
+            A = np.dot(J.T, J)
+            b = -np.dot(J.T, r)
+            while True:
+                step = np.linalg.solve(A + damping*np.diag(np.diag(A) + 1e-12), b)
+                trial = values + step
+                r_trial = residuals(self._with(trial), carriages)
+                cost_trial = np.dot(r_trial, r_trial)
+                if np.isfinite(cost_trial) and cost_trial <= cost:
+                    damping = max(damping/10, 1e-9)
+                    break
+                damping *= 10
+                if damping > 1e9:
+                    step = np.zeros_like(values)
+                    trial, r_trial, cost_trial = values, r, cost
+                    break
+            values, r, cost = trial, r_trial, cost_trial
+            if np.max(np.abs(step)) < tolerance:
+                break
+
+        self.rms_after = np.sqrt(cost/len(r))
+        return self._with(values)
@@ -24,6 +24,7 @@ License: GNU GPL v3: http://www.gnu.org/copyleft/gpl.html
 
 from threading import Thread
 import re
+import time
 from PruInterface import *
 from evdev import InputDevice, ecodes
 
@@ -34,6 +35,7 @@ class EndStop:
         self.key_code = key_code
         self.name = name
         self.invert = invert
+        self.hit_time = None      # time.time() of the last hit
         self.dev = InputDevice(EndStop.inputdev)
         self.t = Thread(target=self._wait_for_event)
 
@@ -63,12 +65,14 @@ class EndStop:
                     if self.invert: 
                         if int(event.value):
                             self.hit = True 
+                            self.hit_time = time.time()
                             self.callback()
                         else:
                             self.hit = False
                     elif not self.invert:
                         if not int(event.value):
                             self.hit = True 
+                            self.hit_time = time.time()
                             self.callback()
                         else:
                             self.hit = False
@@ -96,9 +100,7 @@ class EndStop:
     def callback(self):
         """ An endStop has been hit """
         logging.info("End Stop " + self.name + " hit!")
-        if "toggle" in self.printer.comms:
-            self.printer.comms["toggle"].send_message("End stop {} hit!".format(self.name))
-        if "octoprint" in self.printer.comms:
-            self.printer.comms["octoprint"].send_message("End stop {} hit!".format(self.name))
+        self.printer.broadcast("toggle", "End stop {} hit!".format(self.name))
+        self.printer.broadcast("octoprint", "End stop {} hit!".format(self.name))
     
 
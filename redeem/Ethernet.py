@@ -21,17 +21,14 @@ License: GNU GPL v3: http://www.gnu.org/copyleft/gpl.html
  along with Redeem.  If not, see <http://www.gnu.org/licenses/>.
 """
 
-from threading import Thread
 import socket
 import logging
-from Gcode import Gcode
+from CommHub import Channel
 
-size = 1024 
 
-
-class Ethernet:
+class Ethernet(Channel):
     def __init__(self, printer):
-        self.printer = printer
+        Channel.__init__(self, printer, "Eth")
         self.s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         host = ''
         port = 50000
@@ -43,67 +40,50 @@ class Ethernet:
             except socket.error:
                 port += 1    
 
+        self.port = port
         logging.info("Ethernet bound to port " + str(port))
         self.s.listen(backlog)
+        self.s.setblocking(0)
         self.client = None
-        self.running = True
-        self.t = Thread(target=self.get_message)
-        self.t.start()
-
-    def get_message(self):
-        """Loop that gets messages and pushes them on the queue"""
-        while self.running:
-            #logging.info("Ethernet listening")
-            self.s.settimeout(1.0)
-            try:
-                self.client, self.address = self.s.accept()
-            except IOError as e:
-                continue
-            logging.info("Ethernet connection accepted")
-            self.s.settimeout(1.0)
-            while self.running:
-                line = self.read_line()
-                if line is None:
-                    break
-                message = line.strip("\n")
-                if len(message) > 0:
-                    g = Gcode({"message": message, "prot": "Eth"})
-                    self.printer.processor.enqueue(g)
+        self.hub.add_reader(self.s.fileno(), self.accept)
 
-    def send_message(self, message):
-        """Send a message"""
-        #logging.debug("Eth: "+str(message))
-        if message[-1] != "\n":
-            message += "\n"
+    def accept(self, fd):
+        """ Called by the hub when a host connects. Only one host at a
+        time, the next one waits in the backlog until this one is done. """
         try:
-            if self.client:
-                self.client.send(message)
-        except socket.error, (value, message):
-            logging.error("Ethernet " + message)
+            self.client, self.address = self.s.accept()
+        except socket.error:
+            return
+        logging.info("Ethernet connection accepted")
+        self.hub.remove(fd)
+        self.client.setblocking(0)
+        self.reader.partial = ""
+        self.rd = self.wr = self.client.fileno()
+        self.hub.add_reader(self.rd, self.get_message)
 
-    def read_line(self):
-        """read a line from a socket"""
-        chars = []
-        while self.running:
-            try:
-                char = self.client.recv(1)
-            except socket.error, (value, message):
-                logging.error("Ethernet " + message)
-                char = ""
-            if char == "":
-                logging.warning("Ethernet: Connection reset by peer.")
-                self.client.close()
-                break
-            chars.append(char)
-            if char == "\n":
-                return "".join(chars)
+    def get_message(self, fd):
+        """ Called by the hub when there is something to read """
+        if not self.read(fd):
+            logging.warning("Ethernet: Connection reset by peer.")
+            self.disconnect()
+            self.hub.add_reader(self.s.fileno(), self.accept)
+
+    def disconnect(self):
+        client = self.client
+        if client is None:
+            return
+        self.client = None
+        self.wr = None
+        self.hub.remove(self.rd)
+        self.rd = None
+        try:
+            client.shutdown(socket.SHUT_RDWR)
+        except socket.error:
+            pass
+        client.close()
 
     def close(self):
-        """Stop receiving messages"""
-        self.running = False
-        if self.client is not None:
-            self.client.shutdown(socket.SHUT_RDWR)
-            self.client.close()
-        self.s.shutdown(socket.SHUT_RDWR)
+        """ Stop receiving messages """
+        self.disconnect()
+        self.hub.remove(self.s.fileno())
         self.s.close()
-        self.t.join()
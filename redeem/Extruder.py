@@ -25,6 +25,9 @@ import time
 import logging
 import numpy as np
 from Alarm import Alarm
+from RingBuffer import RingBuffer, RunningExtremes
+
+log = logging.getLogger("redeem.heater")
 
 class Heater(object):
     """
@@ -48,6 +51,8 @@ class Heater(object):
         self.ok_range = 4.0
         self.prefix = ""
         self.sleep = 0.1                 # Time to sleep between measurements
+        self.stable_seconds = 10         # Window for the running temperature max/min
+        self.open_loop_power = None      # Fixed power, bypasses the controller (autotune)
 
         self.min_temp_enabled   = False  # Temperature error limit 
         self.min_temp           = 0      # If temperature falls below this point from the target, disable. 
@@ -64,7 +69,9 @@ class Heater(object):
 
     def get_temperature(self):
         """ get the temperature of the thermistor"""
-        return np.average(self.temperatures[-self.avg:])
+        if len(self.temperatures) == 0:
+            return self.current_temp
+        return self.temperatures.average()
 
     def get_target_temperature(self):
         """ get the temperature of the thermistor"""
@@ -80,11 +87,19 @@ class Heater(object):
 
     def is_temperature_stable(self, seconds=10):
         """ Returns true if the temperature has been stable for n seconds """
-        if len(self.temperatures) < int(seconds/self.sleep):
+        n = int(seconds/self.sleep)
+        if len(self.temperatures) < n:
             return False
-        if max(self.temperatures[-int(seconds/self.sleep):]) > (self.target_temp + self.ok_range):
+        if n == self.extremes.window:
+            max_temp = self.extremes.max()
+            min_temp = self.extremes.min()
+        else:
+            history = self.temperatures.get(n)
+            max_temp = history.max()
+            min_temp = history.min()
+        if max_temp > (self.target_temp + self.ok_range):
             return False
-        if min(self.temperatures[-int(seconds/self.sleep):]) < (self.target_temp - self.ok_range):
+        if min_temp < (self.target_temp - self.ok_range):
             return False
         return True
 
@@ -96,7 +111,7 @@ class Heater(object):
     def enable_min_temp(self):
         """ Enable minimum temperature alarm """
         self.min_temp_enabled = True
-        logging.info("Min temp alarm enabled at {} for {}".format(self.min_temp, self.name))
+        log.info("Min temp alarm enabled at %s for %s", self.min_temp, self.name)
     
     def disable(self):
         """ Stops the heater and the PID controller """
@@ -105,7 +120,7 @@ class Heater(object):
         self.mosfet.set_power(0.0)
         # Wait for PID to stop
         self.t.join()
-        logging.debug("Heater {} disabled".format(self.name))
+        log.debug("Heater %s disabled", self.name)
         self.mosfet.set_power(0.0)
         self.last_error = 0.0
         self.error_integral = 0.0
@@ -115,11 +130,13 @@ class Heater(object):
         """ Start the PID controller """
         self.avg = max(int(1.0/self.sleep), 3)
         self.error = 0
-        self.errors = [0]*self.avg
+        self.errors = RingBuffer(self.avg, self.avg)
         self.average = 0
-        self.averages = [0]*self.avg
+        self.prev_average = 0
         self.prev_time = self.current_time = time.time()
-        self.temperatures = []  
+        # Keep only this much history
+        self.temperatures = RingBuffer(max(int(60/self.sleep), self.avg), self.avg)
+        self.extremes = RunningExtremes(int(self.stable_seconds/self.sleep))
         self.enabled = True
         self.t = Thread(target=self.keep_temperature, name=self.name)
         self.t.start()
@@ -130,16 +147,16 @@ class Heater(object):
             while self.enabled:
                 self.current_temp = self.thermistor.get_temperature()
                 self.temperatures.append(self.current_temp)
-                self.temperatures[:-max(int(60/self.sleep), self.avg)] = [] # Keep only this much history
+                self.extremes.append(self.current_temp)
 
                 self.error = self.target_temp-self.current_temp
                 self.errors.append(self.error)
-                self.errors.pop(0)
-                self.average = sum(self.errors)/self.avg
-                self.averages.append(self.average)
-                self.averages.pop(0)
+                self.prev_average = self.average
+                self.average = self.errors.sum/self.avg
 
-                if self.onoff_control:
+                if self.open_loop_power is not None:
+                    power = self.open_loop_power
+                elif self.onoff_control:
                     if self.error > 1.0:
                         power = 1.0
                     else:
@@ -175,7 +192,7 @@ class Heater(object):
 
     def get_error_derivative(self):
         """ Get the derivative of the error term """
-        return (self.average-self.averages[-2])/self.sleep		# Calculate the diff
+        return (self.average-self.prev_average)/self.sleep		# Calculate the diff
 
     def get_error_integral(self):
         """ Calculate and return the error integral """
@@ -187,30 +204,31 @@ class Heater(object):
         Sound the alarm if something is wrong """
         if len(self.temperatures) < 2:
             return
-        temp_delta = self.temperatures[-1]-self.temperatures[-2]
+        temp_delta = self.temperatures.last(1)-self.temperatures.last(2)
         # Check that temperature is not rising too quickly
         if temp_delta > self.max_temp_rise:
             a = Alarm(Alarm.HEATER_RISING_FAST, 
-                "Temperature rising too quickly ({}) for {}".format(temp_delta, self.name))
+                "Temperature rising too quickly ({}) for {}".format(temp_delta, self.name),
+                source=self.name)
         # Check that temperature is not falling too quickly
         if temp_delta < -self.max_temp_fall:
             a = Alarm(Alarm.HEATER_FALLING_FAST, 
-                "Temperature falling too quickly ({}) for {}".format(temp_delta, self.name))
+                "Temperature falling too quickly ({}) for {}".format(temp_delta, self.name),
+                source=self.name)
         # Check that temperature has not fallen below a certain setpoint from target
         if self.min_temp_enabled and self.current_temp < (self.target_temp - self.min_temp):
             a = Alarm(Alarm.HEATER_TOO_COLD, 
                 "Temperature below min set point ({}) for {}".format(self.min_temp, self.name), 
-                "Alarm: Heater {}".format(self.name))
+                "Alarm: Heater {}".format(self.name), source=self.name)
         # Check if the temperature has gone beyond the max value
         if self.current_temp > self.max_temp:
             a = Alarm(Alarm.HEATER_TOO_HOT, 
-                "Temperature beyond max ({}) for {}".format(self.max_temp, self.name))                
+                "Temperature beyond max ({}) for {}".format(self.max_temp, self.name),
+                source=self.name)
         # Check the time diff, only warn if something is off.     
         if self.time_diff > 2:
-            logging.warning("Heater time update large: " +
-                            self.name + " temp: " +
-                            str(self.current_temp) + " time delta: " +
-                            str(self.current_time-self.prev_time))
+            log.warning("Heater time update large: %s temp: %s time delta: %s",
+                        self.name, self.current_temp, self.current_time-self.prev_time)
 
 
 
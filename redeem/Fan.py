@@ -27,6 +27,8 @@ import subprocess
 from PWM import PWM
 import logging
 
+log = logging.getLogger("redeem.io")
+
 class Fan(PWM):
 
     def __init__(self, channel):
@@ -42,7 +44,7 @@ class Fan(PWM):
     def ramp_to(self, value, delay=0.01):
         ''' Set the fan/light value to the given value, in degree, with the given speed in deg / sec '''
         for w in xrange(int(self.value*255.0), int(value*255.0), (1 if value>=self.value else -1)):
-            logging.debug("Fan value: "+str(w))
+            log.debug("Fan value: %d", w)
             self.set_value(w/255.0)
             time.sleep(delay)
 
@@ -59,7 +59,7 @@ class FilamentSensor:
             self.current_pos = self.sensor.get_distance()
             self.error_pos = self.current_pos-self.ideal_pos
             if self.printer and self.printer.path_planner:
-                self.ideal_pos = self.printer.path_planner.get_extruder_pos(self.ext_nr)
+                self.ideal_pos = self.printer.path_planner.get_executed_extruder_pos(self.ext_nr)
             #logging.debug("Set: {}, Measured: {}, Error : {}, alarm: {}".format(
             #    self.ideal_pos, self.current_pos, self.error_pos, self.alarm_level))
             if abs(self.error_pos) >= self.alarm_level: 
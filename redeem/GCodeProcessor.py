@@ -25,12 +25,14 @@ import inspect
 import logging
 import re
 import importlib
-from threading import Event
+from threading import Event, Lock
 from gcodes import GCodeCommand
 try:
     from Gcode import Gcode
+    from Latency import clock
 except ImportError:
     from redeem.Gcode import Gcode
+    from redeem.Latency import clock
 
 
 class GCodeProcessor:
@@ -38,6 +40,7 @@ class GCodeProcessor:
         self.printer = printer
 
         self.gcodes = {}
+        self.realtime_lock = Lock()
         try:
             module = __import__("gcodes", locals(), globals())
         except ImportError: 
@@ -83,6 +86,29 @@ class GCodeProcessor:
 
         return self.gcodes[val].is_buffered()
 
+    def is_realtime(self, gcode):
+        val = gcode.code()
+        if not val in self.gcodes or gcode.is_info_command():
+            return False
+
+        return self.gcodes[val].is_realtime()
+
+    def is_move(self, gcode):
+        """ A plain G0 or G1, that can be added with other moves """
+        val = gcode.code()
+        if val not in ("G0", "G1") or not val in self.gcodes or gcode.is_info_command():
+            return False
+
+        return hasattr(self.gcodes[val], "make_path")
+
+    def make_path(self, gcode):
+        """ The path of a move, see is_move """
+        try:
+            return self.gcodes[gcode.code()].make_path(gcode)
+        except Exception, e:
+            logging.error("Error while executing "+gcode.code()+": "+str(e))
+        return None
+
     def is_sync(self, gcode):
         val = gcode.code()
         if not val in self.gcodes:
@@ -127,13 +153,39 @@ class GCodeProcessor:
             logging.error("Error while executing "+gcode.code()+": "+str(e))
         return gcode
 
-    def enqueue(self, gcode):
-        if self.printer.processor.is_buffered(gcode):     
+    def execute_realtime(self, gcode):
+        """ Execute and reply to a real-time G-code in the thread that
+        received it, so it does not wait behind the queued commands.
+        One at a time, if several channels send them. """
+        received = clock()
+        with self.realtime_lock:
+            started = clock()
+            gcode.enqueued = received
+            self.execute(gcode)
+            executed = clock()
+            self.printer.reply(gcode)
+            self.printer.latency.record(gcode, started, executed, clock())
+
+    def enqueue(self, gcode, block=True):
+        """ Execute a real-time G-code, or queue it. With block False,
+        returns False instead of waiting if the queue is full. """
+        latency = self.printer.latency
+        if self.is_realtime(gcode):
+            self.execute_realtime(gcode)
+        elif self.printer.processor.is_buffered(gcode):     
+            if not block and self.printer.commands.full():
+                return False
+            latency.enqueued(gcode, "commands", self.printer.commands)
             self.printer.commands.put(gcode)              
             if self.printer.processor.is_sync(gcode):     
+                latency.queued("sync_commands", self.printer.sync_commands)
                 self.printer.sync_commands.put(gcode)    # Yes, it goes into both queues!
         else:                                         
+            if not block and self.printer.unbuffered_commands.full():
+                return False
+            latency.enqueued(gcode, "unbuffered_commands", self.printer.unbuffered_commands)
             self.printer.unbuffered_commands.put(gcode)  
+        return True
         
 
     def get_long_description(self, gcode):
@@ -0,0 +1,171 @@
+"""
+Kinematics: how a position of the effector (X, Y, Z, and the extruders
+and other axes that follow) turns into stepper positions and back.
+
+Each implementation works on one position (MAX_AXES values) or on a
+batch of them, one row per position, so a whole split move can be
+transformed with a single call. Only the first three columns are
+touched, the rest pass straight through.
+
+Path picks the implementation for Path.axis_config when it changes,
+see Path.set_axis_config. Plugins can add their own with register().
+
+Author: Elias Bakken
+email: elias(dot)bakken(at)gmail(dot)com
+Website: http://www.thing-printer.com
+License: GNU GPL v3: http://www.gnu.org/copyleft/gpl.html
+
+ Redeem is free software: you can redistribute it and/or modify
+ it under the terms of the GNU General Public License as published by
+ the Free Software Foundation, either version 3 of the License, or
+ (at your option) any later version.
+
+ Redeem is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU General Public License for more details.
+
+ You should have received a copy of the GNU General Public License
+ along with Redeem.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import numpy as np
+
+from Delta import Delta
+
+
+class Kinematics(object):
+    """ The base class is the identity """
+
+    name = "Cartesian"
+    # A linear transform also applies to a vector between two positions,
+    # so a move can be transformed without knowing where it starts
+    linear = True
+    # Nothing to do at all
+    identity = True
+
+    def inverse(self, positions):
+        """ Stepper positions for the effector positions """
+        return np.array(positions, dtype=np.float64)
+
+    def forward(self, positions):
+        """ Effector positions for the stepper positions """
+        return np.array(positions, dtype=np.float64)
+
+
+class Cartesian(Kinematics):
+    pass
+
+
+class MatrixKinematics(Kinematics):
+    """ X and Y of the steppers are a 2x2 matrix times X and Y """
+
+    linear = True
+    identity = False
+    matrix = np.identity(2)
+
+    def __init__(self):
+        self.to_steppers = np.asarray(self.matrix, dtype=np.float64)
+        self.to_effector = np.linalg.inv(self.to_steppers)
+
+    def inverse(self, positions):
+        out = np.array(positions, dtype=np.float64)
+        out[..., :2] = np.dot(out[..., :2], self.to_steppers.T)
+        return out
+
+    def forward(self, positions):
+        out = np.array(positions, dtype=np.float64)
+        out[..., :2] = np.dot(out[..., :2], self.to_effector.T)
+        return out
+
+
+class HBelt(MatrixKinematics):
+    name = "H-belt"
+    matrix = np.linalg.inv(np.array([[-0.5, 0.5], [-0.5, -0.5]]))
+
+
+class CoreXY(MatrixKinematics):
+    """ A - motor X (top right), B - motor Y (top left),
+    home located in bottom right corner """
+    name = "CoreXY"
+    matrix = np.array([[1.0, 1.0], [1.0, -1.0]])
+
+
+class DeltaKinematics(Kinematics):
+    """ The carriage heights of columns A, B and C, using the
+    geometry of the Delta class as it is when called """
+
+    name = "Delta"
+    linear = False
+    identity = False
+
+    @staticmethod
+    def columns():
+        return np.array([[Delta.Avx, Delta.Avy], [Delta.Bvx, Delta.Bvy], [Delta.Cvx, Delta.Cvy]])
+
+    def inverse(self, positions):
+        out = np.array(positions, dtype=np.float64)
+        if out.ndim == 1:
+            # The scalar version is faster for one position
+            out[:3] = Delta.inverse_kinematics2(out[0], out[1], out[2])
+            return out
+        cols = self.columns()
+        dx = out[..., 0, None] - cols[:, 0]
+        dy = out[..., 1, None] - cols[:, 1]
+        out[..., :3] = out[..., 2, None] + np.sqrt(Delta.L**2 - dx**2 - dy**2) + Delta.Hez
+        return out
+
+    def forward(self, positions):
+        """ Trilateration, as in Delta.forward_kinematics """
+        out = np.array(positions, dtype=np.float64)
+        if out.ndim == 1:
+            out[:3] = Delta.forward_kinematics2(out[0], out[1], out[2])
+            out[2] -= Delta.Hez
+            return out
+        cols = self.columns()
+        shape = out.shape[:-1] + (3,)
+        p1 = np.empty(shape)
+        p1[..., :2] = cols[0]
+        p1[..., 2] = out[..., 0]
+        p12 = np.empty(shape)
+        p12[..., :2] = cols[1] - cols[0]
+        p12[..., 2] = out[..., 1] - out[..., 0]
+        p13 = np.empty(shape)
+        p13[..., :2] = cols[2] - cols[0]
+        p13[..., 2] = out[..., 2] - out[..., 0]
+
+        d = np.sqrt((p12**2).sum(axis=-1))
+        ex = p12/d[..., None]
+        i = (ex*p13).sum(axis=-1)
+        ey = p13 - i[..., None]*ex
+        ey /= np.sqrt((ey**2).sum(axis=-1))[..., None]
+        ez = np.cross(ex, ey)
+        j = (ey*p13).sum(axis=-1)
+
+        x = d/2
+        y = ((i**2 + j**2)/2 - i*x)/j
+        z = np.sqrt(Delta.L**2 - x**2 - y**2)
+        out[..., :3] = p1 + x[..., None]*ex + y[..., None]*ey - z[..., None]*ez
+        out[..., 2] -= Delta.Hez
+        return out
+
+
+# axis_config -> class
+KINEMATICS = {
+    0: Cartesian,
+    1: HBelt,
+    2: CoreXY,
+    3: DeltaKinematics,
+}
+
+
+def register(axis_config, cls):
+    """ Make axis_config (M270 S, [Geometry] axis_config) use the
+    kinematics class cls. For plugins, before the config is used. """
+    KINEMATICS[axis_config] = cls
+
+
+def get(axis_config):
+    if axis_config not in KINEMATICS:
+        raise ValueError("No kinematics for axis_config {}".format(axis_config))
+    return KINEMATICS[axis_config]()
@@ -0,0 +1,177 @@
+"""
+Latency instrumentation for the command path. For every G-code the
+time spent waiting in a queue, executing and replying is put in fixed
+bucket histograms, per G-code and per channel, along with the depth of
+the queue it was put in. Recording is three bisects and a few increments,
+so it can stay on while printing. The numbers are reported by M882 and on
+the "latency" telemetry topic (M155 L1).
+
+Author: Elias Bakken
+email: elias(dot)bakken(at)gmail(dot)com
+Website: http://www.thing-printer.com
+License: GNU GPL v3: http://www.gnu.org/copyleft/gpl.html
+
+ Redeem is free software: you can redistribute it and/or modify
+ it under the terms of the GNU General Public License as published by
+ the Free Software Foundation, either version 3 of the License, or
+ (at your option) any later version.
+
+ Redeem is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU General Public License for more details.
+
+ You should have received a copy of the GNU General Public License
+ along with Redeem.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from bisect import bisect_left
+import timeit
+
+try:
+    from Telemetry import Telemetry
+except ImportError:
+    from redeem.Telemetry import Telemetry
+
+# Upper bucket edges in seconds, 1-2-5 steps from 10 us to 10 s.
+# Anything slower goes in a last, open ended bucket.
+TIME_EDGES = [m*10**e for e in range(-5, 1) for m in (1, 2, 5)] + [10]
+
+# Upper bucket edges for queue depths
+DEPTH_EDGES = [0, 1, 2, 3, 4, 5, 6, 8, 10, 15, 20, 50, 100]
+
+clock = timeit.default_timer
+
+
+def _percentile(edges, counts, p):
+    """ Upper edge of the bucket holding the p-th percentile.
+    The open ended bucket reports the largest edge. """
+    n = sum(counts)
+    if n == 0:
+        return 0
+    rank = p/100.0*n
+    seen = 0
+    for i, count in enumerate(counts):
+        seen += count
+        if seen >= rank and count:
+            return edges[min(i, len(edges) - 1)]
+    return edges[-1]
+
+
+class Histogram(object):
+    """ Counts of values in fixed buckets """
+
+    __slots__ = ("edges", "counts")
+
+    def __init__(self, edges):
+        self.edges = edges
+        self.counts = [0]*(len(edges) + 1)
+
+    def add(self, value):
+        self.counts[bisect_left(self.edges, value)] += 1
+
+    def percentile(self, p):
+        return _percentile(self.edges, self.counts, p)
+
+    def __len__(self):
+        return sum(self.counts)
+
+
+# The wait, execute and reply histograms of a G-code or channel share
+# one flat list of counts, so recording is three index increments.
+BUCKETS = len(TIME_EDGES) + 1
+WAIT, EXECUTE, REPLY = 0, BUCKETS, 2*BUCKETS
+
+
+class Latency:
+
+    QUEUES = ("commands", "unbuffered_commands", "sync_commands")
+
+    def __init__(self, printer, enabled=True):
+        self.printer = printer
+        self.printer.latency = self
+        self.enabled = enabled
+        self.reset()
+        telemetry = getattr(printer, "telemetry", None)
+        if telemetry is not None:
+            telemetry.add_provider(Telemetry.LATENCY, self.summary)
+
+    def reset(self):
+        self.by_code = {}       # G-code -> counts
+        self.by_prot = {}       # channel -> counts
+        self.depths = dict((name, Histogram(DEPTH_EDGES)) for name in Latency.QUEUES)
+
+    def enqueued(self, gcode, queue_name, queue):
+        """ Stamp a G-code as it is put in a queue """
+        if self.enabled:
+            gcode.enqueued = clock()
+            self.depths[queue_name].add(queue.qsize())
+
+    def queued(self, queue_name, queue):
+        """ Record the depth of a queue, without stamping """
+        if self.enabled:
+            self.depths[queue_name].add(queue.qsize())
+
+    def record(self, gcode, dequeued, executed, replied):
+        """ Add the timings of a G-code that has been replied to """
+        if not self.enabled:
+            return
+        enqueued = getattr(gcode, "enqueued", dequeued)
+        wait = bisect_left(TIME_EDGES, dequeued - enqueued)
+        execute = bisect_left(TIME_EDGES, executed - dequeued) + EXECUTE
+        reply = bisect_left(TIME_EDGES, replied - executed) + REPLY
+        counts = self.by_code.get(gcode.gcode)
+        if counts is None:
+            counts = self.by_code[gcode.gcode] = [0]*(3*BUCKETS)
+        counts[wait] += 1
+        counts[execute] += 1
+        counts[reply] += 1
+        counts = self.by_prot.get(gcode.prot)
+        if counts is None:
+            counts = self.by_prot[gcode.prot] = [0]*(3*BUCKETS)
+        counts[wait] += 1
+        counts[execute] += 1
+        counts[reply] += 1
+
+    @staticmethod
+    def percentile(counts, which, p):
+        """ p-th percentile in seconds of WAIT, EXECUTE or REPLY """
+        return _percentile(TIME_EDGES, counts[which:which + BUCKETS], p)
+
+    @staticmethod
+    def _format_times(name, counts):
+        def us(which, p):
+            return int(round(Latency.percentile(counts, which, p)*1e6))
+        return "{} n:{} wait:{}/{} exec:{}/{} reply:{}/{}".format(
+            name, sum(counts[:BUCKETS]),
+            us(WAIT, 50), us(WAIT, 99),
+            us(EXECUTE, 50), us(EXECUTE, 99),
+            us(REPLY, 50), us(REPLY, 99))
+
+    def report(self):
+        """ Lines with p50/p99 in us (bucket upper edges) per G-code
+        and channel, and p50/p99 of each queue depth """
+        lines = []
+        for code, counts in sorted(self.by_code.items()):
+            lines.append(self._format_times(code, counts))
+        for prot, counts in sorted(self.by_prot.items()):
+            lines.append(self._format_times("channel " + prot, counts))
+        for name in Latency.QUEUES:
+            depth = self.depths[name]
+            lines.append("queue {} n:{} depth:{}/{}".format(
+                name, len(depth), depth.percentile(50), depth.percentile(99)))
+        return lines
+
+    def summary(self):
+        """ One line for the telemetry topic: p99 wait/execute time
+        in us per channel and p99 depth per queue """
+        if not self.enabled:
+            return None
+        parts = []
+        for prot, counts in sorted(self.by_prot.items()):
+            parts.append("{}:{}/{}".format(
+                prot, int(round(Latency.percentile(counts, WAIT, 99)*1e6)),
+                int(round(Latency.percentile(counts, EXECUTE, 99)*1e6))))
+        for name in Latency.QUEUES:
+            parts.append("{}:{}".format(name, self.depths[name].percentile(99)))
+        return "Latency: " + " ".join(parts)
@@ -0,0 +1,158 @@
+"""
+Non-blocking logging. The handlers that write to the console and the
+log file are slow when the SD card is busy, so the root logger only gets
+a QueueHandler. It puts records in a queue and a writer thread passes
+them on to the real handlers. A G-code thread that logs never waits for
+the disk. If the queue is full the record is dropped and counted.
+
+The hot paths log through the subsystem loggers below. Their levels are
+set with loglevel_<subsystem> in the [System] section.
+
+Author: Elias Bakken
+email: elias(dot)bakken(at)gmail(dot)com
+Website: http://www.thing-printer.com
+License: GNU GPL v3: http://www.gnu.org/copyleft/gpl.html
+
+ Redeem is free software: you can redistribute it and/or modify
+ it under the terms of the GNU General Public License as published by
+ the Free Software Foundation, either version 3 of the License, or
+ (at your option) any later version.
+
+ Redeem is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU General Public License for more details.
+
+ You should have received a copy of the GNU General Public License
+ along with Redeem.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from threading import Thread
+import logging
+import Queue
+
+# Subsystem -> logger name, as passed to logging.getLogger
+SUBSYSTEMS = {
+    "command": "redeem.command",    # Command loops and G-code execution
+    "motion": "redeem.motion",      # Path, PathPlanner
+    "heater": "redeem.heater",      # Heater control loops
+    "io": "redeem.io",              # Fans and servos
+}
+
+
+class QueueHandler(logging.Handler):
+    """ Put records in a queue instead of writing them """
+
+    def __init__(self, queue):
+        logging.Handler.__init__(self)
+        self.queue = queue
+        self.dropped = 0
+
+    def prepare(self, record):
+        """ Merge the arguments into the message, the way the
+        caller sees them now. Arguments can be mutable (numpy
+        arrays, dicts) and change before the writer gets to them. """
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def emit(self, record):
+        try:
+            self.queue.put_nowait(self.prepare(record))
+        except Queue.Full:
+            self.dropped += 1
+        except Exception:
+            self.handleError(record)
+
+
+class LogWriter:
+    """ Thread that hands queued records to the real handlers """
+
+    def __init__(self, size=1000):
+        self.queue = Queue.Queue(size)
+        self.handler = QueueHandler(self.queue)
+        self.handlers = []
+        self.reported_drops = 0
+        self.logger = None
+        self.moved = []
+        self.running = False
+        self.t = None
+
+    def install(self, logger=None):
+        """ Move the handlers of the logger (default root) behind the queue """
+        self.logger = logger or logging.getLogger()
+        self.moved = list(self.logger.handlers)
+        for handler in self.moved:
+            self.logger.removeHandler(handler)
+            self.handlers.append(handler)
+        self.logger.addHandler(self.handler)
+
+    def add_handler(self, handler):
+        self.handlers.append(handler)
+
+    def start(self):
+        self.running = True
+        self.t = Thread(target=self._run, name="LogWriter")
+        self.t.daemon = True
+        self.t.start()
+
+    def stop(self):
+        """ Write what is left in the queue, give the logger
+        its handlers back and close the ones that were added """
+        if not self.running:
+            return
+        self.running = False
+        self.t.join()
+        if self.logger is not None:
+            self.logger.removeHandler(self.handler)
+            for handler in self.moved:
+                self.logger.addHandler(handler)
+        self._drain()
+        for handler in self.handlers:
+            if handler not in self.moved:
+                handler.close()
+
+    def _handle(self, record):
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def _drain(self):
+        while True:
+            try:
+                self._handle(self.queue.get_nowait())
+            except Queue.Empty:
+                return
+
+    def _run(self):
+        while self.running:
+            try:
+                record = self.queue.get(block=True, timeout=0.5)
+            except Queue.Empty:
+                continue
+            try:
+                self._handle(record)
+                dropped = self.handler.dropped
+                if dropped != self.reported_drops:
+                    self._handle(logging.makeLogRecord({
+                        "name": "redeem", "levelno": logging.WARNING,
+                        "levelname": "WARNING",
+                        "msg": "Log queue full, {} records dropped".format(
+                            dropped - self.reported_drops)}))
+                    self.reported_drops = dropped
+            except Exception:
+                pass
+
+
+def set_levels(config):
+    """ Set the subsystem levels from loglevel_<subsystem> in [System].
+    An empty value leaves the subsystem at the root level. """
+    for subsystem, name in SUBSYSTEMS.iteritems():
+        option = "loglevel_" + subsystem
+        if config.has_option("System", option) and config.get("System", option).strip():
+            logging.getLogger(name).setLevel(config.getint("System", option))
+        else:
+            logging.getLogger(name).setLevel(logging.NOTSET)
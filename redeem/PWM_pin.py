@@ -24,10 +24,14 @@ License: GNU GPL v3: http://www.gnu.org/copyleft/gpl.html
 import time
 import subprocess
 import os
+import logging
 
 """ 
 """
 class PWM_pin:
+
+    sysfs = "/sys/class/pwm"    # Root of the PWM chips, moved by the simulator
+
     def __init__(self, pin, frequency, duty_cycle): 
         if pin == "P9_14":
             self.chip = 0
@@ -44,9 +48,9 @@ class PWM_pin:
         self.set_enabled()
         
     def export_chip(self, chip, channel):
-        self.base = "/sys/class/pwm/pwmchip"+str(chip)+"/pwm"+str(channel)
+        self.base = PWM_pin.sysfs+"/pwmchip"+str(chip)+"/pwm"+str(channel)
         if not os.path.exists(self.base):
-            with open("/sys/class/pwm/pwmchip"+str(self.chip)+"/export", "w") as f:
+            with open(PWM_pin.sysfs+"/pwmchip"+str(self.chip)+"/export", "w") as f:
                 f.write(str(self.channel))
             if not os.path.exists(self.base):
                 logging.warning("Unable to export PWM pin")
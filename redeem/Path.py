@@ -23,10 +23,12 @@ License: GNU GPL v3: http://www.gnu.org/copyleft/gpl.html
 
 import numpy as np
 
-from Delta import Delta
 from BedCompensation import BedCompensation
+import Kinematics
 import logging
 
+log = logging.getLogger("redeem.motion")
+
 class Path:
     AXES = "XYZEHABC"
     MAX_AXES = 8
@@ -48,6 +50,7 @@ class Path:
     slaves                 = {key: "" for key in AXES}
 
     axes_zipped = ["X", "Y", "Z", "E", "H", "A", "B", "C"]
+    AXIS_INDEX = dict((axis, index) for index, axis in enumerate(AXES))
 
     AXIS_CONFIG_XY = 0
     AXIS_CONFIG_H_BELT = 1
@@ -64,32 +67,75 @@ class Path:
     # Numpy array type used throughout    
     DTYPE = np.float64
 
-    # Precalculate the H-belt matrix
-    matrix_H = np.matrix('-0.5 0.5; -0.5 -0.5')
-    matrix_H_inv = np.linalg.inv(matrix_H)
-
-    # Precalculate the CoreXY matrix
-    # A - motor X (top right), B - motor Y (top left)
-    # home located in bottom right corner    
-    matrix_XY = np.matrix('1.0 1.0; 1.0 -1.0')
-    matrix_XY_inv = np.linalg.inv(matrix_XY)
-
-    # Unlevel bed compensation. 
-    matrix_bed_comp     = np.identity(3)
+    # Unlevel bed compensation. Set with set_bed_matrix()
+    matrix_bed_comp     = np.matrix(np.identity(3))
     matrix_bed_comp_inv = np.linalg.inv(matrix_bed_comp)
+    bed_matrix_identity = True
+
+    # Mesh bed compensation (a BedMesh), applied after the matrix
+    bed_mesh = None
 
-    # Default config is normal cartesian XY
+    # Default config is normal cartesian XY. Set with set_axis_config()
     axis_config = AXIS_CONFIG_XY 
+    kinematics = Kinematics.Cartesian()
     
     # By default, do not check for slaves
     has_slaves = False
+    has_backlash = False
+
+    # Index maps for the per move post-processing, see update_axis_maps()
+    tool_index = 3
+    slave_dst = np.zeros(0, dtype=int)
+    slave_src = np.zeros(0, dtype=int)
 
     @staticmethod
     def add_slave(master, slave):
         ''' Make an axis copy the movement of another. 
         the slave will get the same position as the axis'''
         Path.slaves[master] = slave
-        Path.has_slaves = True
+        Path.update_axis_maps()
+
+    @staticmethod
+    def set_axis_config(axis_config):
+        """ Switch the coordinate system and the kinematics with it """
+        Path.kinematics = Kinematics.get(axis_config)
+        Path.axis_config = axis_config
+
+    @staticmethod
+    def set_bed_matrix(mat):
+        """ Set the bed compensation matrix """
+        Path.matrix_bed_comp = np.matrix(mat)
+        Path.matrix_bed_comp_inv = np.linalg.inv(Path.matrix_bed_comp)
+        Path.bed_matrix_identity = bool(np.array_equal(Path.matrix_bed_comp, np.identity(3)))
+
+    @staticmethod
+    def update_axis_maps():
+        """ Rebuild the slave index maps and the backlash flag. Call
+        after changing the slaves or the backlash compensation. """
+        pairs = [(Path.axis_to_index(slave), Path.axis_to_index(master))
+                 for slave, master in Path.slaves.iteritems() if master]
+        Path.slave_dst = np.array([dst for dst, _ in pairs], dtype=int)
+        Path.slave_src = np.array([src for _, src in pairs], dtype=int)
+        Path.has_slaves = len(pairs) > 0
+        Path.backlash_compensation = np.array(Path.backlash_compensation, dtype=Path.DTYPE)
+        Path.has_backlash = bool(np.any(Path.backlash_compensation))
+
+    @staticmethod
+    def set_tool(index):
+        """ Make the E moves go to the axis with this index """
+        Path.tool_index = index
+
+    @staticmethod
+    def map_axes(positions):
+        """ Move the E position to the current tool and copy the masters
+        to their slaves. Works in place on one position or on a batch,
+        one row per position. """
+        if Path.tool_index != 3:
+            positions[..., Path.tool_index] = positions[..., 3]
+            positions[..., 3] = 0
+        if Path.has_slaves:
+            positions[..., Path.slave_dst] = positions[..., Path.slave_src]
+        return positions
     
     def __init__(self, axes, speed, accel, cancelable=False, use_bed_matrix=True, use_backlash_compensation=True, enable_soft_endstops=True):
         """ The axes of evil, the feed rate in m/s and ABS or REL """
@@ -113,6 +159,14 @@ class Path:
         self.delta = None
         self.compensation = None
         self.split_size = 0.001       
+        self.mesh_height = None       # Set when computed for a whole batch
+        self.mesh_splits = None
+        self.batched = False          # Tools and slaves are done by the batch
+        self.target_steppers = None   # Set when computed for a whole batch
+        self.start_steppers = None    # Stepper and effector positions,
+        self.end_steppers = None      # for kinematics that are not linear
+        self.start_effector = None
+        self.end_effector = None
 
     def is_G92(self):
         """ Special path, only set the global position on this """
@@ -131,47 +185,34 @@ class Path:
 
     def transform_vector(self, vec, cur_pos):
         """ Transform vector to whatever coordinate system is used """
-        ret_vec = np.copy(vec)
-        if Path.axis_config == Path.AXIS_CONFIG_H_BELT:
-            X = np.dot(Path.matrix_H_inv, vec[0:2])
-            ret_vec[:2] = X[0]
-        if Path.axis_config == Path.AXIS_CONFIG_CORE_XY:
-            X = np.dot(Path.matrix_XY, vec[0:2])
-            ret_vec[:2] = X[0]
-        if Path.axis_config == Path.AXIS_CONFIG_DELTA:
-            # Subtract the current column positions
-            if hasattr(self.prev, "end_ABC"):
-                self.start_ABC = self.prev.end_ABC
-            else:
-                self.start_ABC = Delta.inverse_kinematics2(cur_pos[0], cur_pos[1],
-                                                 cur_pos[2])
-            # Find the next column positions
-            self.end_ABC = Delta.inverse_kinematics2(cur_pos[0] + vec[0],
-                                               cur_pos[1] + vec[1],
-                                               cur_pos[2] + vec[2])
-            ret_vec[:3] = self.end_ABC - self.start_ABC
-        return ret_vec
+        kinematics = Path.kinematics
+        if kinematics.linear:
+            return kinematics.inverse(vec)
+        # Start from where the steppers ended on the last move
+        if self.prev is not None and self.prev.end_steppers is not None:
+            self.start_steppers = self.prev.end_steppers
+            self.start_effector = self.prev.end_effector
+        else:
+            self.start_steppers = kinematics.inverse(cur_pos)
+            self.start_effector = None
+        if self.target_steppers is not None:
+            end = self.target_steppers
+        else:
+            end = kinematics.inverse(cur_pos + vec)
+        return end - self.start_steppers
 
     def reverse_transform_vector(self, vec, cur_pos):
         """ Transform back from whatever """
+        kinematics = Path.kinematics
+        if kinematics.linear:
+            return kinematics.forward(vec)
+        # The steppers end where the rounded vector takes them
+        self.end_steppers = self.start_steppers + vec
+        self.end_effector = kinematics.forward(self.end_steppers[:3])
+        if self.start_effector is None:
+            self.start_effector = kinematics.forward(self.start_steppers[:3])
         ret_vec = np.copy(vec)
-        if Path.axis_config == Path.AXIS_CONFIG_H_BELT:
-            X = np.dot(Path.matrix_H, vec[0:2])
-            ret_vec[:2] = X[0]
-        if Path.axis_config == Path.AXIS_CONFIG_CORE_XY:
-            X = np.dot(Path.matrix_XY_inv, vec[0:2])
-            ret_vec[:2] = X[0]
-        if Path.axis_config == Path.AXIS_CONFIG_DELTA:
-            # Find the next column positions
-            self.end_ABC = self.start_ABC + vec[:3]
-
-            # We have the column translations and need to find what that
-            # represents in cartesian.
-            start_xyz = Delta.forward_kinematics2(self.start_ABC[0], self.start_ABC[1],
-                                                 self.start_ABC[2])
-            end_xyz = Delta.forward_kinematics2(self.end_ABC[0], self.end_ABC[1],
-                                               self.end_ABC[2])
-            ret_vec[:3] = end_xyz - start_xyz
+        ret_vec[:3] = self.end_effector - self.start_effector
         return ret_vec
 
     @staticmethod
@@ -180,41 +221,23 @@ class Path:
 
     def backlash_compensate(self):
         """ Apply compensation to the distance taken if the direction of the axis has changed. """
-        ret_vec = np.zeros(Path.MAX_AXES)
-        if self.use_backlash_compensation:
-            for index, d in enumerate(self.delta):
-                dirstate = np.sign(d)
-                #Compensate only if the direction has changed
-                if (dirstate != 0) and (dirstate != Path.backlash_state[index]):
-                    ret_vec[index] = dirstate * Path.backlash_compensation[index]
-                    # Save new backlash state
-                    Path.backlash_state[index] = dirstate
-
+        if not (self.use_backlash_compensation and Path.has_backlash):
+            return None
+        dirstate = np.sign(self.delta)
+        # Compensate only if the direction has changed
+        changed = (dirstate != 0) & (dirstate != Path.backlash_state)
+        if changed.any():
+            Path.backlash_state = np.where(changed, dirstate, Path.backlash_state)
+            ret_vec = np.where(changed, dirstate*Path.backlash_compensation, 0.0)
             if np.any(ret_vec):
                 self.compensation = ret_vec
+            return ret_vec
+        return None
 
-        return ret_vec
-
-    def handle_tools(self):
-        """ If tool is != E, move the vectors to the right position """
-        if Path.printer.current_tool is not "E":
-            tool = Path.printer.current_tool
-            index = Path.axis_to_index(tool)
-            self.start_pos[index] = self.start_pos[3]
-            self.start_pos[3] = 0
-            self.stepper_end_pos[index] = self.stepper_end_pos[3]
-            self.stepper_end_pos[3] = 0
-
-    def handle_slaves(self):
-        # If slave mode is enabled, copy position now. 
-        if Path.has_slaves:
-            for slave in Path.slaves:
-                master = Path.slaves[slave]
-                if master:
-                    s_i = Path.axis_to_index(slave)
-                    m_i = Path.axis_to_index(master)
-                    self.start_pos[s_i] = self.start_pos[m_i]
-                    self.stepper_end_pos[s_i] = self.stepper_end_pos[m_i]
+    @staticmethod
+    def needs_axis_map():
+        """ True if the positions sent to the planner need map_axes """
+        return Path.tool_index != 3 or Path.has_slaves
 
     def needs_splitting(self):
         #return False
@@ -224,14 +247,24 @@ class Path:
         if self.movement == Path.G2 or self.movement == Path.G3:
             return True
 
-        return (Path.axis_config == Path.AXIS_CONFIG_DELTA 
-            and self.get_magnitude() > self.split_size 
-            and ("X" in self.axes or "Y" in self.axes))
+        if not ("X" in self.axes or "Y" in self.axes):
+            return False
+
+        if Path.axis_config == Path.AXIS_CONFIG_DELTA:
+            return self.get_magnitude() > self.split_size
+
+        # Follow the bed mesh where a straight line would be too far off
+        if Path.bed_mesh is not None and self.use_bed_matrix:
+            self.mesh_splits = Path.bed_mesh.split(
+                self.prev.ideal_end_pos, self.ideal_end_pos)
+            return len(self.mesh_splits) > 0
+
+        return False
 
     def get_magnitude(self):
         """ Returns the magnitde in XYZ dim """
         if not self.mag:
-            if self.rounded_vec == None:
+            if self.rounded_vec is None:
                 logging.error("Cannot get magnitude of vector without knowing its length")
             self.mag = np.linalg.norm(self.vec[:3])
         return self.mag
@@ -240,6 +273,8 @@ class Path:
         """ Returns split segments for delta or arcs """
         if self.movement == Path.G2 or self.movement == Path.G3:
             return self.get_arc_segments()
+        if Path.axis_config != Path.AXIS_CONFIG_DELTA and self.mesh_splits:
+            return self.get_mesh_segments()
         return self.get_delta_segments()
         
 
@@ -259,17 +294,48 @@ class Path:
                         num_segments
                         ) for i in xrange(Path.MAX_AXES)]) 
         vals = np.delete(vals, 0, axis=0)
-        vec_segments = [dict(zip(Path.axes_zipped, list(val))) for val in vals]
+        return self.make_segments(vals)
+
+    def get_mesh_segments(self):
+        """ Split the move where the bed mesh requires it """
+        t = np.concatenate((self.mesh_splits, [1.0]))
+        start = self.prev.ideal_end_pos
+        vals = start + np.outer(t, self.ideal_end_pos - start)
+        return self.make_segments(vals)
+
+    def make_segments(self, vals):
+        """ Make a chain of absolute paths through the points in vals,
+        one row of MAX_AXES values per segment end """
+        if Path.bed_mesh is not None and self.use_bed_matrix:
+            heights = Path.bed_mesh.height(vals[:, 0], vals[:, 1])
+        else:
+            heights = None
+        targets = None
+        if not Path.kinematics.linear:
+            # Where the steppers should go, for all segments in one call.
+            # The same steps as set_prev_common, on the whole batch.
+            levels = np.clip(vals, Path.soft_min, Path.soft_max)
+            if self.use_bed_matrix:
+                if not Path.bed_matrix_identity:
+                    levels[:, :3] = np.dot(levels[:, :3], np.asarray(Path.matrix_bed_comp).T)
+                if heights is not None:
+                    levels[:, 2] += heights
+            targets = Path.kinematics.inverse(levels)
+        if heights is not None:
+            heights = heights.tolist()
+        prev = self.prev
         path_segments = []
-
-        for index, segment in enumerate(vec_segments):
+        for index, val in enumerate(vals):
+            segment = dict(zip(Path.axes_zipped, list(val)))
             path = AbsolutePath(segment, self.speed, self.accel, self.cancelable, self.use_bed_matrix, False) #
-            if index is not 0:
-                path.set_prev(path_segments[-1])
-            else:
-                path.set_prev(self.prev)
+            path.batched = True
+            if heights is not None:
+                path.mesh_height = heights[index]
+            if targets is not None:
+                path.target_steppers = targets[index]
+            path.set_prev(prev)
             path_segments.append(path)
-
+            prev = path
         return path_segments
 
 
@@ -279,7 +345,7 @@ class Path:
         return x,y
 
     def inv_parametric_circle(self, x, xc, R):
-        t = np.arccos((x-xc)/R)
+        t = np.arccos(np.clip((x-xc)/R, -1.0, 1.0))
         return t
         
 
@@ -295,10 +361,6 @@ class Path:
         # Find radius
         R = np.sqrt(i**2 + j**2)
 
-        logging.info(start_point)
-        logging.info(end_point)
-        logging.info(R)
-
 
         # Find start and end points
         start_t = self.inv_parametric_circle(start_point[0], start_point[0]+i, R)
@@ -308,13 +370,12 @@ class Path:
 
 
         # TODO: test this, it is probably wrong. 
-        if self.movement == G2: 
+        if self.movement == Path.G2: 
             arc_T = np.linspace(start_t, end_t, num_segments)
         else:        
             arc_T = np.linspace(end_t, start_t, num_segments)
         X,Y = self.parametric_circle(arc_T, start_point[0]+i, start_point[1]+j, R)
-    
-        logging.info([X, Y])
+        log.debug("Arc from %s to %s, R %s, %d segments", start_point, end_point, R, num_segments)
         
         # Interpolate the remaining values
         vals = np.transpose([
@@ -328,24 +389,7 @@ class Path:
         for i, val in enumerate(vals):
             val[:2] = (X[i], Y[i])
         vals = np.delete(vals, 0, axis=0)
-
-        vec_segments = [dict(zip(Path.axes_zipped, list(val))) for val in vals]
-        path_segments = []
-
-        for index, segment in enumerate(vec_segments):
-            #print segment
-            path = AbsolutePath(segment, self.speed, self.accel, self.cancelable, self.use_bed_matrix, False) #
-            if index is not 0:
-                path.set_prev(path_segments[-1])
-            else:
-                path.set_prev(self.prev)
-            path_segments.append(path)
-
-        #for seg in path_segments:
-        #    logging.info(seg)
- 
-
-        return path_segments
+        return self.make_segments(vals)
 
 
     def set_prev_common(self, prev):
@@ -357,7 +401,13 @@ class Path:
         # Calculate the position to reach, with bed levelling    
         self.level_end_pos = np.copy(self.ideal_end_pos)
         if self.use_bed_matrix:    
-            self.level_end_pos[:3] = np.dot(Path.matrix_bed_comp, self.ideal_end_pos[:3])
+            if not Path.bed_matrix_identity:
+                self.level_end_pos[:3] = np.dot(Path.matrix_bed_comp, self.ideal_end_pos[:3])
+            if Path.bed_mesh is not None:
+                if self.mesh_height is None:
+                    self.mesh_height = Path.bed_mesh.height_at(
+                        self.ideal_end_pos[0], self.ideal_end_pos[1])
+                self.level_end_pos[2] += self.mesh_height
 
         # Update the vector to move us from where we are, 
         # to where we ideally want to be. 
@@ -365,10 +415,15 @@ class Path:
 
         # Compute stepper translation, 
         # yielding the discrete/rounded distance.
-        vec = self.transform_vector(self.vec, self.start_pos)
-        self.num_steps = np.round(np.abs(vec) * Path.steps_pr_meter)
-        self.delta = np.sign(vec) * self.num_steps / Path.steps_pr_meter
-        vec = self.reverse_transform_vector(self.delta, self.start_pos)
+        if Path.kinematics.identity:
+            self.num_steps = np.round(np.abs(self.vec) * Path.steps_pr_meter)
+            self.delta = np.sign(self.vec) * self.num_steps / Path.steps_pr_meter
+            vec = self.delta
+        else:
+            vec = self.transform_vector(self.vec, self.start_pos)
+            self.num_steps = np.round(np.abs(vec) * Path.steps_pr_meter)
+            self.delta = np.sign(vec) * self.num_steps / Path.steps_pr_meter
+            vec = self.reverse_transform_vector(self.delta, self.start_pos)
 
         # Vec now contains the actual distance we travelled. 
 
@@ -385,10 +440,11 @@ class Path:
         #logging.debug("Level pos: "+str(self.level_end_pos[:3]))
         #logging.debug("End   pos: "+str(self.end_pos[:3]))
 
-        self.handle_tools()
-
-        # Fix slave mode, if any
-        self.handle_slaves()
+        # Tools and slave mode, if any. Segments of a
+        # batch get this done for the whole batch at once.
+        if not self.batched and Path.needs_axis_map():
+            self.start_pos = Path.map_axes(np.copy(self.start_pos))
+            Path.map_axes(self.stepper_end_pos)
 
         if np.isnan(vec).any():
             self.end_pos = self.start_pos
@@ -418,8 +474,7 @@ class Path:
         #measure_points = {key: probe_points[key] - offsets[key] for key in probe_points.keys()}
 
         mat = BedCompensation.create_rotation_matrix(probe_points, probe_heights)
-        Path.matrix_bed_comp = mat
-        Path.matrix_bed_comp_inv = np.linalg.inv(Path.matrix_bed_comp)
+        Path.set_bed_matrix(mat)
 
 class AbsolutePath(Path):
     """ A path segment with absolute movement """
@@ -436,9 +491,9 @@ class AbsolutePath(Path):
         # Make the start, end and path vectors. 
         self.end_pos = np.copy(self.start_pos)
         self.ideal_end_pos = np.copy(prev.ideal_end_pos)
-        for index, axis in enumerate(Path.AXES):
-            if axis in self.axes:
-                self.ideal_end_pos[index] = self.axes[axis]
+        for axis, value in self.axes.iteritems():
+            if axis in Path.AXIS_INDEX:
+                self.ideal_end_pos[Path.AXIS_INDEX[axis]] = value
 
         self.set_prev_common(prev)
 
@@ -457,9 +512,9 @@ class RelativePath(Path):
 
         # Generate the vector
         vec = np.zeros(Path.MAX_AXES, dtype=Path.DTYPE)
-        for index, axis in enumerate(Path.AXES):
-            if axis in self.axes:
-                vec[index] = self.axes[axis]
+        for axis, value in self.axes.iteritems():
+            if axis in Path.AXIS_INDEX:
+                vec[Path.AXIS_INDEX[axis]] = value
 
         # Calculate the ideal end position. 
         # In an ideal world, this is where we want to go. 
@@ -486,9 +541,10 @@ class G92Path(Path):
             self.ideal_end_pos = np.copy(self.start_pos)
 
         self.end_pos = np.copy(self.start_pos)
-        for index, axis in enumerate(Path.AXES):
-            if axis in self.axes:
-                self.end_pos[index] = self.ideal_end_pos[index] = self.axes[axis]
+        for axis, value in self.axes.iteritems():
+            if axis in Path.AXIS_INDEX:
+                index = Path.AXIS_INDEX[axis]
+                self.end_pos[index] = self.ideal_end_pos[index] = value
         self.vec = np.zeros(Path.MAX_AXES)
         self.rounded_vec = self.vec
 
@@ -25,9 +25,13 @@ License: GNU GPL v3: http://www.gnu.org/copyleft/gpl.html
 """
 
 import logging
+import time
 from Path import Path, AbsolutePath, RelativePath, G92Path
 from Delta import Delta
+import Kinematics
 from Printer import Printer
+from PruInterface import PruInterface, MOVES_DONE_ADDRESS
+from PositionTracker import PositionTracker
 import numpy as np
 
 try:
@@ -39,6 +43,8 @@ except Exception, e:
                   "python setup.py install")
     raise e
 
+log = logging.getLogger("redeem.motion")
+
 
 class PathPlanner:
 
@@ -55,6 +61,10 @@ class PathPlanner:
         self.home_pos       = {"X": 0, "Y": 0, "Z": 0, "E": 0, "H": 0, "A": 0, "B": 0, "C": 0}
         self.prev   = G92Path({"X": 0, "Y": 0, "Z": 0, "E": 0, "H": 0, "A": 0, "B": 0, "C": 0}, 0)
         self.prev.set_prev(None)
+        self.recovery_time = None   # Of the last emergency stop, in seconds
+        self.homing_time = None     # Of the last G28, in seconds
+        self.homing_times = {}      # axis -> seconds until its end stop hit
+        self.tracker = PositionTracker(Path.MAX_AXES)
 
         if pru_firmware:
             self.__init_path_planner()
@@ -63,6 +73,8 @@ class PathPlanner:
 
     def __init_path_planner(self):
         self.native_planner = PathPlannerNative(int(self.printer.move_cache_size))
+        # The new planner numbers the moves from 0
+        self.tracker.reset(self.prev.end_pos)
 
         fw0 = self.pru_firmware.get_firmware(0)
         fw1 = self.pru_firmware.get_firmware(1)
@@ -71,6 +83,7 @@ class PathPlanner:
             return
 
         self.native_planner.initPRU(fw0, fw1)
+        self.native_planner.setMovesDoneOffset(MOVES_DONE_ADDRESS)
         self.native_planner.setAcceleration(tuple(Path.acceleration))
         self.native_planner.setAxisStepsPerMeter(tuple(Path.steps_pr_meter))
         self.native_planner.setMaxSpeeds(tuple(Path.max_speeds))	
@@ -103,6 +116,21 @@ class PathPlanner:
         """ Return the current position of this extruder """
         return self.prev.end_pos[3+ext_nr]
 
+    def get_executed_pos(self):
+        """ The position the PRU has got to, as a dict. That is the end
+        of the last move it has done, see PositionTracker. """
+        pos = self.tracker.position()
+        if pos is None:
+            return self.get_current_pos()
+        return dict(zip(Path.AXES[:Path.MAX_AXES], pos))
+
+    def get_executed_extruder_pos(self, ext_nr):
+        """ The position the PRU has got this extruder to """
+        pos = self.tracker.position()
+        if pos is None:
+            return self.get_extruder_pos(ext_nr)
+        return pos[3+ext_nr]
+
     def wait_until_done(self):
         """ Wait until the queue is empty """
         self.native_planner.waitUntilFinished()
@@ -126,13 +154,18 @@ class PathPlanner:
         """ Stop in emergency any moves. """
         # Note: This method has to be thread safe as it can be called from the
         # command thread directly or from the command queue thread
+        start = time.time()
         self.native_planner.suspend()
         for name, stepper in self.printer.steppers.iteritems():
             stepper.set_disabled(True)
 
-        #Create a new path planner to have everything clean when it restarts
-        self.native_planner.stopThread(True)
-        self.__init_path_planner()
+        # Drop the queued moves and start the PRU over. The firmware, the
+        # settings and the planner threads are kept, so it is ready for
+        # new moves as soon as this returns.
+        self.native_planner.flush()
+        self.recovery_time = time.time() - start
+        log.warning("Emergency stop, ready for moves again after %.1f ms",
+                    self.recovery_time*1000)
 
     def suspend(self):
         ''' Temporary pause of planner '''
@@ -142,26 +175,61 @@ class PathPlanner:
         ''' resume a paused planner '''
         self.native_planner.resume()
 
+    def _home_move(self, path, speeds, search=True):
+        """ Queue relative homing moves of the distances in path. In a
+        search each axis moves at its own speed and no further than its
+        distance: the moves end each time an axis has gone all the way,
+        and the next move goes on with the axes that have not. A move
+        that is not a search takes as long as the slowest axis needs. """
+        path = dict((a, d) for a, d in path.iteritems() if d != 0 and speeds[a] > 0)
+        if not path:
+            return
+        if not search:
+            speed, accel = self._home_speed(path, speeds)
+            self.add_path(RelativePath(path, speed, accel, True, False, True, False))
+            return
+        times = dict((a, abs(d)/speeds[a]) for a, d in path.iteritems())
+        done = 0.0
+        for end in sorted(set(times.itervalues())):
+            part = dict((a, np.sign(d)*speeds[a]*(end - done))
+                        for a, d in path.iteritems() if times[a] >= end)
+            speed, accel = self._home_speed(part, speeds)
+            self.add_path(RelativePath(part, speed, accel, True, False, True, False))
+            done = end
+
+    def _home_speed(self, path, speeds):
+        """ The speed and acceleration of a move of the distances in path
+        that takes as long as the slowest axis needs at its speed """
+        duration = max(abs(d)/speeds[a] for a, d in path.iteritems())
+        velocity = dict((a, abs(d)/duration) for a, d in path.iteritems() if d != 0)
+        speed = np.sqrt(sum(v**2 for v in velocity.itervalues()))
+        # The acceleration of each axis is its share of the move's
+        accel = min(self.printer.acceleration[Path.axis_to_index(a)]*speed/v
+                    for a, v in velocity.iteritems())
+        return speed, accel
+
     def _home_internal(self, axis):
-        """ Private method for homing a set or a single axis """
-        logging.debug("homing internal " + str(axis))
+        """ Private method for homing a set or a single axis.
+        The axes search, back off and search again together, each at
+        its own speed. """
+        log.debug("homing internal %s", axis)
             
         path_search = {}
         path_backoff = {}
         path_fine_search = {}
 
         path_center = {}
-        path_zero = {}
 
-        speed = Path.home_speed[0] # TODO: speed for each axis
-        accel = self.printer.acceleration[0] # TODO: accel for each axis
+        speeds = {}
+        fine_search_speeds = {}
 
         for a in axis:
             if not self.printer.steppers[a].has_endstop:
-                logging.debug("Skipping homing for " + str(a))
+                log.debug("Skipping homing for %s", a)
                 continue
-            logging.debug("Doing homing for " + str(a))
-            if Path.home_speed[Path.axis_to_index(a)] < 0:
+            log.debug("Doing homing for %s", a)
+            index = Path.axis_to_index(a)
+            if Path.home_speed[index] < 0:
                 # Search to positive ends
                 path_search[a] = self.travel_length[a]
                 path_center[a] = self.center_offset[a]
@@ -170,44 +238,64 @@ class PathPlanner:
                 path_search[a] = -self.travel_length[a]
                 path_center[a] = -self.center_offset[a]
 
-            backoff_length = -np.sign(path_search[a]) * Path.home_backoff_offset[Path.axis_to_index(a)]
+            backoff_length = -np.sign(path_search[a]) * Path.home_backoff_offset[index]
             path_backoff[a] = backoff_length;
             path_fine_search[a] = -backoff_length * 1.2;
             
-            speed = min(abs(speed), abs(Path.home_speed[Path.axis_to_index(a)]))
-            fine_search_speed =  min(abs(speed), abs(Path.home_backoff_speed[Path.axis_to_index(a)]))
-                    
-        logging.debug("Search: %s" % path_search)
-        logging.debug("Backoff to: %s" % path_backoff)
-        logging.debug("Fine search: %s" % path_fine_search)
-        logging.debug("Center: %s" % path_center)
+            speeds[a] = abs(Path.home_speed[index])
+            fine_search_speeds[a] = min(speeds[a], abs(Path.home_backoff_speed[index]))
+
+        log.debug("Search: %s", path_search)
+        log.debug("Backoff to: %s", path_backoff)
+        log.debug("Fine search: %s", path_fine_search)
+        log.debug("Center: %s", path_center)
+
+        # For the G92 paths and the delta conversion
+        speed = min(speeds.values()) if speeds else abs(Path.home_speed[0])
 
         # Move until endstop is hit
-        p = RelativePath(path_search, speed, accel, True, False, True, False)
-        self.add_path(p)
+        self._home_move(path_search, speeds)
         self.wait_until_done()
-        logging.debug("Coarse search done!")
 
         # Reset position to offset
-        p = G92Path(path_center, speed)
-        self.add_path(p)
-        self.wait_until_done()
+        self.add_path(G92Path(path_center))
 
         # Back off a bit
-        p = RelativePath(path_backoff, speed, accel, True, False, True, False)
-        self.add_path(p)
+        self._home_move(path_backoff, speeds, search=False)
 
         # Hit the endstop slowly
-        p = RelativePath(path_fine_search, fine_search_speed, accel, True, False, True, False)
-        self.add_path(p)
+        self._home_move(path_fine_search, fine_search_speeds)
         self.wait_until_done()
 
         # Reset (final) position to offset
-        p = G92Path(path_center, speed)
-        self.add_path(p)
+        self.add_path(G92Path(path_center))
 
         return path_center, speed
-        
+
+    def _home_groups(self, axis):
+        """ The sets of axes that can home at the same time. X and Y
+        share the motors on CoreXY and H-belt printers, so they home
+        one at a time, the other axes home along with X. """
+        if not isinstance(Path.kinematics, Kinematics.MatrixKinematics):
+            return [axis]
+        first = [a for a in axis if a != "Y"]
+        groups = [first] if first else []
+        if "Y" in axis:
+            groups.append(["Y"])
+        return groups
+
+    def _home_end_stops(self, axis):
+        """ The end stop that stops each axis when searching """
+        end_stops = {}
+        for a in axis:
+            direction = "pos" if Path.home_speed[Path.axis_to_index(a)] < 0 else "neg"
+            stop = "{}_{}".format(a.lower(), direction)
+            for name, end_stop in self.printer.end_stops.iteritems():
+                if stop in getattr(end_stop, "stops", ""):
+                    end_stops[a] = end_stop
+                    break
+        return end_stops
+
     def _go_to_home(self, axis):
         """
         go to the designated home position
@@ -216,15 +304,25 @@ class PathPlanner:
         """
         
         path_home = {}
+        distances = {}
+        speeds = {}
         
         speed = Path.home_speed[0]
         accel = self.printer.acceleration[0]
 
+        current = self.get_current_pos()
         for a in axis:
             path_home[a] = self.home_pos[a]
             speed = min(abs(speed), abs(Path.home_speed[Path.axis_to_index(a)]))
+            if Path.home_speed[Path.axis_to_index(a)] != 0:
+                distances[a] = path_home[a] - current[a]
+                speeds[a] = abs(Path.home_speed[Path.axis_to_index(a)])
+
+        # Each axis at up to its own speed, arriving together
+        if any(d != 0 for d in distances.itervalues()):
+            speed, accel = self._home_speed(distances, speeds)
             
-        logging.debug("Home: %s" % path_home)
+        log.debug("Home: %s", path_home)
             
         # Move to home position
         p = AbsolutePath(path_home, speed, accel, True, False, False, False)
@@ -241,21 +339,17 @@ class PathPlanner:
 
     def home(self, axis):
         """ Home the given axis using endstops (min) """
-        logging.debug("homing " + str(axis))
-
-        # Home axis for core X,Y and H-Belt independently to avoid hardware
-        # damages.
-        if Path.axis_config == Path.AXIS_CONFIG_CORE_XY or \
-                        Path.axis_config == Path.AXIS_CONFIG_H_BELT:
-            for a in axis:
-                self._home_internal(a)
+        log.debug("homing %s", axis)
+
+        start = time.time()
+
         # For delta, switch to cartesian when homing
-        elif Path.axis_config == Path.AXIS_CONFIG_DELTA:
+        if Path.axis_config == Path.AXIS_CONFIG_DELTA:
             if 0 < len({"X", "Y", "Z"}.intersection(set(axis))) < 3:
                 axis = list(set(axis).union({"X", "Y", "Z"}))	# Deltas must home all axes.
-            Path.axis_config = Path.AXIS_CONFIG_XY
+            Path.set_axis_config(Path.AXIS_CONFIG_XY)
             path_center, speed = self._home_internal(axis)
-            Path.axis_config = Path.AXIS_CONFIG_DELTA
+            Path.set_axis_config(Path.AXIS_CONFIG_DELTA)
 
             # homing was performed in cartesian mode
             # need to convert back to delta
@@ -271,10 +365,10 @@ class PathPlanner:
             
             p = G92Path(path, speed)
             self.add_path(p)
-            self.wait_until_done()
             
-        else: # AXIS_CONFIG_XY
-            self._home_internal(axis)
+        else:
+            for group in self._home_groups(axis):
+                self._home_internal(group)
             
         # go to the designated home position
         self._go_to_home(axis)
@@ -282,26 +376,48 @@ class PathPlanner:
         # Reset backlash compensation
         Path.backlash_reset()
 
-        logging.debug("homing done for " + str(axis))
+        # The time until the last end stop hit of each axis,
+        # the fine search, None if no hit was seen
+        end_stops = self._home_end_stops(axis)
+        self.homing_times = {}
+        for a in axis:
+            hit_time = getattr(end_stops.get(a), "hit_time", None)
+            if hit_time is not None and hit_time >= start:
+                self.homing_times[a] = hit_time - start
+            else:
+                self.homing_times[a] = None
+        self.homing_time = time.time() - start
+        log.info("Homing %s took %.1f s: %s", axis, self.homing_time, self.homing_times)
             
         return
 
+    @staticmethod
+    def probe_steps(length):
+        """ Whole Z steps to probe length meters down, and the
+        distance they make """
+        steps = np.ceil(length*Path.steps_pr_meter[2])
+        return steps, steps/Path.steps_pr_meter[2]
+
+    @staticmethod
+    def probe_move(dist):
+        """ Stepper space end of a move of dist meters along Z from
+        zeros, up if dist is positive, for probing """
+        # select end point based on the type of bot
+        if Path.axis_config == Path.AXIS_CONFIG_DELTA:
+            return (dist, dist, dist, 0.0, 0.0, 0.0, 0.0, 0.0)
+        # AXIS_CONFIG_XY, AXIS_CONFIG_H_BELT, AXIS_CONFIG_CORE_XY
+        return (0.0, 0.0, dist, 0.0, 0.0, 0.0, 0.0, 0.0)
+
     def probe(self, z, speed, accel):
         self.wait_until_done()
         # Move until endstop is hits
         self.printer.ensure_steppers_enabled()
         #push this new segment
         start = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
-        steps = np.ceil(z*Path.steps_pr_meter[2])
-        z_dist = steps/Path.steps_pr_meter[2]
-        
-        # select end point based on the type of bot
-        if Path.axis_config == Path.AXIS_CONFIG_DELTA:
-            end   = (-z_dist, -z_dist, -z_dist, 0.0, 0.0, 0.0, 0.0, 0.0)
-        else: # AXIS_CONFIG_XY, AXIS_CONFIG_H_BELT, AXIS_CONFIG_CORE_XY
-            end   = (0.0, 0.0, -z_dist, 0.0, 0.0, 0.0, 0.0, 0.0)
+        steps, z_dist = self.probe_steps(z)
+        end = self.probe_move(-z_dist)
         
-        logging.debug("Steps total: "+str(steps))
+        log.debug("Steps total: %s", steps)
    
         self.native_planner.queueMove(start,
                                   end, 
@@ -313,31 +429,15 @@ class PathPlanner:
         self.wait_until_done()
 
 
-        # TODO: Move this to PruInterface.py
-        import struct
-        import mmap
-        PRU_ICSS = 0x4A300000 
-        PRU_ICSS_LEN = 512*1024
-        RAM2_START = 0x00012000
-        with open("/dev/mem", "r+b") as f:	       
-            ddr_mem = mmap.mmap(f.fileno(), PRU_ICSS_LEN, offset=PRU_ICSS) 
-            shared = struct.unpack('LLLL', ddr_mem[RAM2_START:RAM2_START+16])
-            steps_remaining = shared[3]
-        logging.debug("Steps remaining : "+str(steps_remaining))
+        steps_remaining = PruInterface.get_steps_remaining()
+        log.debug("Steps remaining : %s", steps_remaining)
 
         # Calculate how many steps the Z axis moved
         steps -= steps_remaining
         z_dist = steps/Path.steps_pr_meter[2]
-        start = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
-        
-        # select end point based on the type of bot
-        if Path.axis_config == Path.AXIS_CONFIG_DELTA:
-            end   = (z_dist, z_dist, z_dist, 0.0, 0.0, 0.0, 0.0, 0.0)
-        else: # AXIS_CONFIG_XY, AXIS_CONFIG_H_BELT, AXIS_CONFIG_CORE_XY
-            end   = (0.0, 0.0, z_dist, 0.0, 0.0, 0.0, 0.0, 0.0)
         
         self.native_planner.queueMove(start,
-                                  end, 
+                                  self.probe_move(z_dist), 
                                   speed, 
                                   accel,
                                   True,
@@ -353,29 +453,26 @@ class PathPlanner:
 
         #logging.debug("Adding "+str(new))
         new.set_prev(self.prev)
-        if new.compensation:
+        if new.compensation is not None:
             # Apply a backlash compensation move
-            self.native_planner.queueMove(tuple(np.zeros(Path.MAX_AXES)),
-                                          tuple(new.compensation), new.speed, new.accel,
-                                          bool(new.cancelable),
-                                          False)
+            move_id = self.native_planner.queueMove(tuple(np.zeros(Path.MAX_AXES)),
+                                                    tuple(new.compensation), new.speed, new.accel,
+                                                    bool(new.cancelable),
+                                                    False)
+            self.tracker.add(move_id, [self.prev.end_pos])
 
         if new.needs_splitting():     
             path_batch = new.get_segments()
-            # Construct a batch
-            batch_array = np.zeros(shape=(len(path_batch)*2*Path.MAX_AXES), dtype=np.float64)     # Change this to reflect NUM_AXIS.
+            batch_array = self.make_batch(path_batch)
+            path = path_batch[-1]
 
-            for maj_index, path in enumerate(path_batch):
-                for subindex in range(Path.MAX_AXES):  # this needs to be NUM_AXIS
-                    batch_array[(maj_index * Path.MAX_AXES * 2) + subindex] = path.start_pos[subindex]
-                    batch_array[(maj_index * Path.MAX_AXES * 2) + Path.MAX_AXES + subindex] = path.stepper_end_pos[subindex]
-                
             self.prev = path
             self.prev.unlink()
 
             # Queue the entire batch at once.
             self.printer.ensure_steppers_enabled()
-            self.native_planner.queueBatchMove(batch_array, new.speed, new.accel, bool(new.cancelable), True)
+            move_id = self.native_planner.queueBatchMove(batch_array, new.speed, new.accel, bool(new.cancelable), True)
+            self.tracker.add(move_id, [segment.end_pos for segment in path_batch])
                 
             # Do not add the original segment
             new.unlink()
@@ -391,20 +488,93 @@ class PathPlanner:
             rel = bool(new.movement != Path.RELATIVE)
             #logging.debug("Queueing "+str(start)+" "+str(end)+" "+str(new.speed)+" "+str(new.accel)+" "+str(can)+" "+str(rel))
             
-            self.native_planner.queueMove(tuple(new.start_pos),
+            move_id = self.native_planner.queueMove(tuple(new.start_pos),
                                       tuple(new.stepper_end_pos), 
                                       new.speed, 
                                       new.accel,
                                       bool(new.cancelable),
                                       bool(new.movement != Path.RELATIVE))
+            self.tracker.add(move_id, [new.end_pos])
+        else:
+            self.tracker.rebase(new.end_pos)
 
         self.prev = new
         self.prev.unlink()  # We don't want to store the entire print
                             # in memory, so we keep only the last path.
 
+    def add_paths(self, paths):
+        """ Add a run of path segments, as add_path does one at a time.
+        The moves of consecutive paths with the same speed, acceleration
+        and flags go to the native planner with one queueBatchMove. """
+        if len(paths) == 1:
+            self.add_path(paths[0])
+            return
+        pending = []        # Start and end pairs, as make_batch makes them
+        pending_ends = []   # End positions of the moves in pending
+        pending_key = None  # (speed, accel, cancelable, optimize) of pending
+        for new in paths:
+            new.set_prev(self.prev)
+            if new.compensation is not None:
+                # The backlash compensation goes in between
+                self._queue_batch(pending, pending_ends, pending_key)
+                pending, pending_ends = [], []
+                move_id = self.native_planner.queueMove(tuple(np.zeros(Path.MAX_AXES)),
+                                                        tuple(new.compensation), new.speed, new.accel,
+                                                        bool(new.cancelable),
+                                                        False)
+                self.tracker.add(move_id, [self.prev.end_pos])
+            if new.needs_splitting():
+                path_batch = new.get_segments()
+                moves = self.make_batch(path_batch)
+                ends = [segment.end_pos for segment in path_batch]
+                key = (new.speed, new.accel, bool(new.cancelable), True)
+                new.unlink()
+                new = path_batch[-1]
+            elif not new.is_G92():
+                moves = np.hstack((new.start_pos, new.stepper_end_pos))
+                ends = [new.end_pos]
+                key = (new.speed, new.accel, bool(new.cancelable),
+                       bool(new.movement != Path.RELATIVE))
+            else:
+                # The moves before it are recorded in the old coordinates
+                self._queue_batch(pending, pending_ends, pending_key)
+                pending, pending_ends = [], []
+                self.tracker.rebase(new.end_pos)
+                moves = None
+            if moves is not None:
+                if key != pending_key:
+                    self._queue_batch(pending, pending_ends, pending_key)
+                    pending, pending_ends = [], []
+                    pending_key = key
+                pending.append(moves)
+                pending_ends.extend(ends)
+            self.prev = new
+            self.prev.unlink()
+        self._queue_batch(pending, pending_ends, pending_key)
+
+    def _queue_batch(self, pending, ends, key):
+        if not pending:
+            return
+        speed, accel, cancelable, optimize = key
+        self.printer.ensure_steppers_enabled()
+        move_id = self.native_planner.queueBatchMove(np.concatenate(pending).astype(np.float64),
+                                                     speed, accel, cancelable, optimize)
+        self.tracker.add(move_id, ends)
+
+    def make_batch(self, path_batch):
+        """ Pack the start and end positions of the segments into
+        the flat array queueBatchMove expects """
+        starts = np.array([path.start_pos for path in path_batch], dtype=np.float64)
+        ends = np.array([path.stepper_end_pos for path in path_batch], dtype=np.float64)
+        if Path.needs_axis_map():
+            Path.map_axes(starts)
+            Path.map_axes(ends)
+        return np.hstack((starts, ends)).ravel()
+
     def set_extruder(self, ext_nr):
         if ext_nr in range(Path.MAX_AXES-3):
-            logging.debug("Selecting "+str(ext_nr))
+            log.debug("Selecting %s", ext_nr)
+            Path.set_tool(3 + ext_nr)
             #Path.steps_pr_meter[3] = self.printer.steppers[
             #        Path.index_to_axis(ext_nr+3)
             #        ].get_steps_pr_meter()
@@ -22,17 +22,15 @@ License: GNU GPL v3: http://www.gnu.org/copyleft/gpl.html
  along with Redeem.  If not, see <http://www.gnu.org/licenses/>.
 """
 
-from threading import Thread
 from distutils.spawn import find_executable
-import select
 import logging
 import subprocess
 import time
 import os
-from Gcode import Gcode
+from CommHub import Channel, REOPEN_DELAY
 
 
-class Pipe:
+class Pipe(Channel):
 
     @staticmethod
     def check_tty0tty():
@@ -43,11 +41,12 @@ class Pipe:
         return (find_executable("socat") is not None)
 
     def __init__(self, printer, prot):
-        self.printer = printer
-        self.prot = prot
+        Channel.__init__(self, printer, prot)
 
         pipe_0 = "/dev/" + prot + "_0"
         pipe_1 = "/dev/" + prot + "_1"
+        self.path = pipe_0
+        self.closed = False
 
         # Ensure tty0tty is installed and available in the PATH
         if not Pipe.check_tty0tty() and not Pipe.check_socat():
@@ -67,43 +66,43 @@ class Pipe:
                                  stderr=subprocess.PIPE)
             while not os.path.exists(pipe_0):
                 time.sleep(0.1)
-        self.rd = open(pipe_0, "r")
-        self.wr = os.open(pipe_0, os.O_WRONLY)
+        self.open()
         logging.info("Pipe " + self.prot + " open. Use '" + pipe_1 + "' to "
                      "communicate with it")
 
-        self.running = True
-        self.t = Thread(target=self.get_message)
-        self.send_response = True
-        self.t.start()
-
-    def get_message(self):
-        """ Loop that gets messages and pushes them on the queue """
-        while self.running:
-            r, w, x = select.select([self.rd], [], [], 1.0)
-            if r:
-                try:
-                    message = self.rd.readline().rstrip()                
-                    if len(message) > 0:
-                        g = Gcode({"message": message, "prot": self.prot})
-                        self.printer.processor.enqueue(g)
-                except IOError:
-                    logging.warning("Could not read from pipe")
-
-    def send_message(self, message):
-        if self.send_response:
-            #logging.debug("Pipe: "+str(message))
-            if message[-1] != "\n":
-                message += "\n"
-                try:
-                    os.write(self.wr, message)
-                except OSError:
-                    logging.warning("Unable to write to file. Closing down?")
-
-
+    def open(self):
+        rd = os.open(self.path, os.O_RDONLY | os.O_NOCTTY | os.O_NONBLOCK)
+        try:
+            wr = os.open(self.path, os.O_WRONLY | os.O_NOCTTY | os.O_NONBLOCK)
+        except OSError:
+            os.close(rd)
+            raise
+        self.rd, self.wr = rd, wr
+        self.hub.add_reader(self.rd, self.get_message)
+
+    def reopen(self):
+        if self.closed:
+            return
+        try:
+            self.open()
+        except OSError:
+            self.hub.call_later(REOPEN_DELAY, self.reopen)
+
+    def get_message(self, fd):
+        """ Called by the hub when there is something to read """
+        if not self.read(fd):
+            # The front end closed its end, open it again for the next one
+            logging.warning("Could not read from pipe " + self.prot + ", reopening it")
+            self._close_fds()
+            self.hub.call_later(REOPEN_DELAY, self.reopen)
+
+    def _close_fds(self):
+        for fd in (self.rd, self.wr):
+            if fd is not None:
+                self.hub.remove(fd)
+                os.close(fd)
+        self.rd = self.wr = None
 
     def close(self):
-        self.running = False
-        self.t.join()
-        self.rd.close()
-        os.close(self.wr)
+        self.closed = True
+        self._close_fds()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+"""
+PositionTracker - where the steppers are now, as opposed to where the
+last queued move ends.
+
+The native planner numbers the moves it is given, and the PRU timer
+writes the number of the last move the PRU has done to the PRU shared
+RAM (see PruInterface.get_moves_done). The path planner records the
+number and the end position of each move it queues in a ring here, so
+the position the machine has got to is the end of the newest record
+that is done. That is a read of the shared RAM and a binary search, so
+it is cheap enough to ask for whenever it is needed.
+
+The position is at move granularity: in the middle of a move it is
+where that move started. The counter in the shared RAM is 32 bits, the
+move numbers are unwrapped against the newest record.
+
+Author: Elias Bakken
+email: elias(dot)bakken(at)gmail(dot)com
+Website: http://www.thing-printer.com
+License: GNU GPL v3: http://www.gnu.org/copyleft/gpl.html
+
+ Redeem is free software: you can redistribute it and/or modify
+ it under the terms of the GNU General Public License as published by
+ the Free Software Foundation, either version 3 of the License, or
+ (at your option) any later version.
+
+ Redeem is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU General Public License for more details.
+
+ You should have received a copy of the GNU General Public License
+ along with Redeem.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from threading import Lock
+import numpy as np
+
+from PruInterface import PruInterface
+
+MASK = 0xFFFFFFFF   # The counter in the shared RAM
+
+
+def unwrap(value, reference):
+    """ The number with the low 32 bits of value that is
+    closest to reference """
+    delta = (value - reference) & MASK
+    if delta > MASK >> 1:
+        delta -= MASK + 1
+    return reference + delta
+
+
+class PositionTracker:
+
+    def __init__(self, axes, size=4096, read_done=None):
+        self.axes = axes
+        self.size = size                  # Records
+        self.ids = np.zeros(size, dtype=np.int64)
+        self.ends = np.zeros((size, axes))
+        self.head = 0                     # Where the next record goes
+        self.count = 0
+        self.newest = 0                   # Move number of the newest record
+        self.read_done = read_done or PruInterface.get_moves_done
+        self.lock = Lock()
+
+    def reset(self, position, move_id=0):
+        """ Forget the moves, the machine is at position
+        and the moves are numbered from move_id """
+        with self.lock:
+            self.head = 0
+            self.count = 0
+            self._put(move_id, position)
+
+    def add(self, last_id, ends):
+        """ Record queued moves, one row of ends per move. last_id is the
+        number of the last one, as queueMove and queueBatchMove return it.
+        A single move with the number of the newest record replaces its
+        end, older moves are not recorded. """
+        if last_id is None:
+            return    # Not a native planner, see MoveRecorder
+        with self.lock:
+            last_id = unwrap(last_id, self.newest)
+            if len(ends) == 1:
+                if last_id == self.newest and self.count:
+                    self.ends[(self.head - 1) % self.size] = ends[0]
+                elif last_id > self.newest:
+                    self._put(last_id, ends[0])
+                return
+            ends = np.asarray(ends, dtype=np.float64)
+            n = min(len(ends), last_id - self.newest, self.size)
+            if n <= 0:
+                return
+            index = (self.head + np.arange(n)) % self.size
+            self.ids[index] = np.arange(last_id - n + 1, last_id + 1)
+            self.ends[index] = ends[:n]
+            self.head = (self.head + n) % self.size
+            self.count = min(self.count + n, self.size)
+            self.newest = last_id
+
+    def rebase(self, position):
+        """ The newest record ends at position (G92). The records before
+        it are moved the same way, so they stay in the new coordinates. """
+        with self.lock:
+            newest = (self.head - 1) % self.size
+            self.ends += np.asarray(position, dtype=np.float64) - self.ends[newest]
+
+    def position(self):
+        """ The end of the last move that is done, or None if nothing
+        is recorded. If that is older than the oldest record, the
+        oldest record is as close as it gets. """
+        done = self.read_done()
+        with self.lock:
+            if not self.count:
+                return None
+            done = unwrap(done, self.newest)
+            if done >= self.newest:
+                return self.ends[(self.head - 1) % self.size].copy()
+            oldest = (self.head - self.count) % self.size
+            if done < self.ids[oldest]:
+                return self.ends[oldest].copy()
+            # The last record that is done, in the order they were added
+            lo, hi = 0, self.count - 1
+            while lo < hi:
+                mid = (lo + hi + 1) // 2
+                if self.ids[(oldest + mid) % self.size] <= done:
+                    lo = mid
+                else:
+                    hi = mid - 1
+            return self.ends[(oldest + lo) % self.size].copy()
+
+    def _put(self, move_id, end):
+        self.ids[self.head] = move_id
+        self.ends[self.head] = end
+        self.head = (self.head + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+        self.newest = move_id
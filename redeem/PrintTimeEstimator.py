@@ -0,0 +1,360 @@
+"""
+Offline print time estimate. The moves the path planner would hand to
+the native planner are recorded (see MoveRecorder) and run through a
+model of the native planner: the speed and acceleration limits of
+calculateMove, the jerk limited junction speeds and the
+forward/backward passes of updateTrapezoids, limited to what fits in
+the move cache and in max_buffered_move_time.
+
+The passes are done on all the moves at once. With the squared speed
+u at each junction and A = 2*a*d for each move, the forward pass is
+u[j] = min(cap[j], u[j-1] + A[j-1]). That unrolls to a running minimum
+over prefix sums, which numpy does in one call, and the backward pass
+is the same thing reversed.
+
+The buffer model is a host that makes host_rate moves per second. The
+time buffered in the PRU grows by the length of each move, shrinks
+with the time the host takes per move and is capped by
+max_buffered_move_time and by what move_cache_size moves hold. Every
+step is a clipped shift, and clipped shifts compose into clipped
+shifts, so the buffer level after each move comes out of a prefix scan
+of log2(moves) numpy passes. After running empty the native planner
+waits for the buffer to fill before it starts. Moves queued after that
+while the level is below min_buffered_move_time are reported as
+starved.
+
+All lengths are in meters, all times in seconds.
+
+Author: Elias Bakken
+email: elias(dot)bakken(at)gmail(dot)com
+Website: http://www.thing-printer.com
+License: GNU GPL v3: http://www.gnu.org/copyleft/gpl.html
+
+ Redeem is free software: you can redistribute it and/or modify
+ it under the terms of the GNU General Public License as published by
+ the Free Software Foundation, either version 3 of the License, or
+ (at your option) any later version.
+
+ Redeem is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU General Public License for more details.
+
+ You should have received a copy of the GNU General Public License
+ along with Redeem.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from collections import namedtuple
+import numpy as np
+
+from Path import Path
+
+E_AXIS = 3
+
+Starvation = namedtuple("Starvation", ["time", "layer", "moves", "buffered"])
+
+
+class MoveRecorder:
+    """ Stands in for the native planner and records the queued moves.
+    Set layer before queueing to tag the moves. Anything that waits for
+    the planner to empty marks the next move as starting from a stop. """
+
+    def __init__(self, native=None):
+        self.native = native
+        self.layer = 0
+        self.starts = []
+        self.ends = []
+        self.speeds = []
+        self.layers = []
+        self.breaks = []
+        self._drained = True
+
+    def __getattr__(self, name):
+        # Setters and the like go to the planner that is replaced, if any
+        if self.native is None:
+            raise AttributeError(name)
+        return getattr(self.native, name)
+
+    def _add(self, pairs, speed):
+        n = len(pairs)
+        self.starts.append(pairs[:, 0])
+        self.ends.append(pairs[:, 1])
+        self.speeds.append(np.repeat(float(speed), n))
+        self.layers.append(np.repeat(self.layer, n))
+        drains = np.zeros(n, dtype=bool)
+        drains[0] = self._drained
+        self.breaks.append(drains)
+        self._drained = False
+
+    def queueMove(self, start, end, speed, accel, cancelable, optimize):
+        self._add(np.array([[start, end]], dtype=np.float64), speed)
+
+    def queueBatchMove(self, batch, speed, accel, cancelable, optimize):
+        pairs = np.asarray(batch, dtype=np.float64).reshape(-1, 2, Path.MAX_AXES)
+        if len(pairs):
+            self._add(pairs, speed)
+
+    def waitUntilFinished(self):
+        self._drained = True
+
+    def queueSyncEvent(self, isBlocking=True):
+        self._drained = True
+        return False
+
+    def moves(self):
+        """ (starts, ends, speeds, layers, breaks) as arrays """
+        if not self.starts:
+            empty = np.zeros((0, Path.MAX_AXES))
+            return empty, empty, np.zeros(0), np.zeros(0, dtype=int), np.zeros(0, dtype=bool)
+        return (np.concatenate(self.starts), np.concatenate(self.ends),
+                np.concatenate(self.speeds), np.concatenate(self.layers),
+                np.concatenate(self.breaks))
+
+
+class Estimate:
+    """ What estimate() found """
+
+    def __init__(self, times, layers, waits, starved, levels, host_rate):
+        self.times = times              # Per move
+        self.layers = layers            # Layer of each move
+        self.waits = waits              # Buffer fill waits of the native planner
+        self.starved = starved          # List of Starvation
+        self.levels = levels            # Buffered time when each move was queued
+        self.host_rate = host_rate
+        self.starts = np.concatenate(([0.0], np.cumsum(times)[:-1])) if len(times) else times
+
+    @property
+    def moves(self):
+        return len(self.times)
+
+    @property
+    def total(self):
+        return float(self.times.sum() + self.waits.sum())
+
+    def layer_times(self):
+        """ Time per layer, indexed by layer number """
+        if not self.moves:
+            return np.zeros(0)
+        return np.bincount(self.layers, weights=self.times + self.waits)
+
+    def moves_per_second(self, window=1.0):
+        """ Average and peak rate the moves are executed at. The peak is
+        the most moves started within one window. """
+        if not self.moves:
+            return 0.0, 0.0
+        motion = self.times.sum()
+        average = self.moves/motion if motion > 0 else 0.0
+        counts = np.searchsorted(self.starts, self.starts + window) - np.arange(self.moves)
+        return average, counts.max()/window
+
+
+class PrintTimeEstimator:
+
+    def __init__(self, acceleration, max_speeds, min_speeds, jerk, steps_pr_meter,
+                 move_cache_size=1024, min_buffered_move_time=0.1,
+                 max_buffered_move_time=1.0, print_move_buffer_wait=0.25):
+        self.acceleration = np.array(acceleration, dtype=np.float64)
+        self.max_speeds = np.array(max_speeds, dtype=np.float64)
+        self.min_speeds = np.array(min_speeds, dtype=np.float64)
+        self.jerk = float(jerk)
+        self.steps_pr_meter = np.array(steps_pr_meter, dtype=np.float64)
+        self.move_cache_size = int(move_cache_size)
+        self.min_buffered_move_time = min_buffered_move_time
+        self.max_buffered_move_time = max_buffered_move_time
+        self.print_move_buffer_wait = print_move_buffer_wait
+
+    @staticmethod
+    def from_printer(printer):
+        """ The settings Redeem gives the native planner """
+        return PrintTimeEstimator(
+            Path.acceleration, Path.max_speeds, Path.min_speeds, Path.jerks[0],
+            Path.steps_pr_meter, printer.move_cache_size,
+            printer.min_buffered_move_time/1000.0,
+            printer.max_buffered_move_time/1000.0,
+            printer.print_move_buffer_wait/1000.0)
+
+    def limits(self, starts, ends, speeds):
+        """ Per move, as in calculateMove: the length, the top speed, the
+        acceleration, the lowest speed and the axis speeds at top speed.
+        Moves without steps are dropped, the mask tells which are kept. """
+        spm = self.steps_pr_meter
+        steps = np.round(ends*spm) - np.round(starts*spm)
+        diff = steps/spm
+        moving = steps != 0
+        keep = moving.any(axis=1)
+        diff, moving, speeds = diff[keep], moving[keep], speeds[keep]
+
+        distance = np.sqrt((diff**2).sum(axis=1))
+        adiff = np.abs(diff)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # The slowest axis sets the time, and the acceleration
+            axis_time = np.where(moving, adiff/self.max_speeds, 0.0).max(axis=1)
+            duration = np.maximum(distance/np.maximum(speeds, 1e-12), axis_time)
+            full = distance/duration
+            accel = np.where(moving, self.acceleration*distance[:, None]/adiff, np.inf).min(axis=1)
+        low = np.minimum(np.where(moving, self.min_speeds, np.inf).min(axis=1), full)
+        velocity = diff/duration[:, None]
+        return keep, distance, full, accel, low, velocity, moving
+
+    def junctions(self, full, low, velocity, moving, breaks):
+        """ Highest squared speed at each junction, from the jerk limit.
+        Junction j is the start of move j, the last one is the end. """
+        n = len(full)
+        cap = np.empty(n + 1)
+        cap[0] = low[0]**2
+        cap[-1] = low[-1]**2
+        jerk = np.sqrt(((velocity[1:] - velocity[:-1])**2).sum(axis=1))
+        factor = np.where(jerk > self.jerk, self.jerk/np.maximum(jerk, 1e-12), 1.0)
+        cap[1:-1] = np.minimum(full[:-1]*factor, full[1:])**2
+
+        # A stop between extruder only moves and the rest, and where
+        # the planner ran empty
+        e_only = moving[:, E_AXIS] & (moving.sum(axis=1) == 1)
+        stop = (e_only[1:] != e_only[:-1]) | breaks[1:]
+        cap[1:-1][stop] = np.minimum(low[:-1], low[1:])[stop]**2
+        return cap
+
+    def lookahead(self, nominal, breaks):
+        """ Number of moves after each one that the planner sees: what
+        fits in the cache and in max_buffered_move_time, up to a stop """
+        n = len(nominal)
+        index = np.arange(n)
+        ends = np.cumsum(nominal)
+        seen = np.searchsorted(ends, ends + self.max_buffered_move_time, side="right") - index
+        seen = np.clip(seen, 1, self.move_cache_size)
+        # The planner cannot look past a point where it runs empty
+        stops = np.flatnonzero(breaks)
+        following = np.searchsorted(stops, index, side="right")
+        next_stop = np.append(stops, n)[following]
+        return np.minimum(index + seen, next_stop)
+
+    @staticmethod
+    def plan(cap, A, horizon, floor):
+        """ Squared junction speeds within cap that a move of length d can
+        reach with A = 2*a*d, both forward and backward. Each move must be
+        able to stop at the end of what the planner sees (horizon). """
+        S = np.concatenate(([0.0], np.cumsum(A)))
+        # Stop at the horizon: u[j] <= floor + sum of A[j:horizon[j]]
+        n = len(A)
+        u = cap.copy()
+        u[:n] = np.minimum(u[:n], floor[horizon - 1] + S[horizon] - S[:n])
+        # Backward: u[j] = min over k >= j of u[k] + S[k] - S[j]
+        u = np.minimum.accumulate((u + S)[::-1])[::-1] - S
+        # Forward: u[j] = min over k <= j of u[k] + S[j] - S[k]
+        u = np.minimum.accumulate(u - S) + S
+        return np.maximum(u, 0.0)
+
+    @staticmethod
+    def trapezoid(distance, full, accel, u0, u1):
+        """ Time for each move from speed sqrt(u0) to sqrt(u1) with the
+        top speed full, accelerating with accel """
+        v0 = np.sqrt(u0)
+        v1 = np.sqrt(u1)
+        peak2 = np.minimum((2*accel*distance + u0 + u1)/2, full**2)
+        peak = np.sqrt(np.maximum(peak2, np.maximum(u0, u1)))
+        ramps = (2*peak2 - u0 - u1)/(2*accel)
+        cruise = np.maximum(distance - ramps, 0.0)/full
+        return (peak - v0)/accel + (peak - v1)/accel + cruise
+
+    @staticmethod
+    def scan_buffer(shift, low, high):
+        """ Buffer level after each step, starting empty, where step k
+        does level = clip(level + shift[k], low[k], high[k]). Each
+        composition of steps is itself one clip, so this is a prefix
+        scan with log2(steps) vectorized passes. """
+        s, lo, hi = shift.copy(), low.copy(), high.copy()
+        offset = 1
+        while offset < len(s):
+            # Compose step i - offset (first) with step i (second)
+            s1, lo1, hi1 = s[:-offset], lo[:-offset], hi[:-offset]
+            s2, lo2, hi2 = s[offset:], lo[offset:], hi[offset:]
+            new_lo = np.clip(lo1 + s2, lo2, hi2)
+            new_hi = np.clip(hi1 + s2, lo2, hi2)
+            s = np.concatenate((s[:offset], s1 + s2))
+            lo = np.concatenate((lo[:offset], new_lo))
+            hi = np.concatenate((hi[:offset], new_hi))
+            offset *= 2
+        return np.clip(s, lo, hi)
+
+    def prefill(self, times, breaks):
+        """ The moves queued while the native planner waits for the buffer
+        to fill after running empty: up to a full cache, or
+        max_buffered_move_time, or the next stop """
+        n = len(times)
+        held = np.concatenate(([0.0], np.cumsum(times)))
+        stops = np.flatnonzero(breaks)
+        end = np.minimum(stops + self.move_cache_size, np.append(stops[1:], n))
+        end = np.minimum(end, np.searchsorted(held, held[stops] + self.max_buffered_move_time))
+        end = np.maximum(end, stops + 1)
+        edges = np.zeros(n + 1, dtype=int)
+        np.add.at(edges, stops, 1)
+        np.add.at(edges, end, -1)
+        return np.cumsum(edges[:-1]) > 0
+
+    def buffer(self, times, breaks, prefill, host_rate):
+        """ Time buffered in the PRU just before each move is queued,
+        for a host that makes host_rate moves per second. Nothing
+        runs while the buffer is filled up after a stop. """
+        n = len(times)
+        produce = np.where(prefill, 0.0, 1.0/host_rate)
+        # What the last move_cache_size moves hold
+        held = np.concatenate(([0.0], np.cumsum(times)))
+        first = np.maximum(np.arange(n) + 1 - self.move_cache_size, 0)
+        high = np.minimum(held[1:] - held[first], self.max_buffered_move_time)
+        high = np.maximum(high, times.clip(max=self.max_buffered_move_time))
+        low = np.minimum(times, high)
+        # The buffer is empty where the planner ran empty
+        low[breaks] = high[breaks]
+        after = self.scan_buffer(times - produce, low, high)
+        before = np.maximum(np.concatenate(([0.0], after[:-1])) - produce, 0.0)
+        before[breaks] = 0.0
+        return before
+
+    def estimate(self, starts, ends, speeds, layers, breaks, host_rate=None):
+        """ Estimate the recorded moves (see MoveRecorder.moves) """
+        keep, distance, full, accel, low, velocity, moving = self.limits(starts, ends, speeds)
+        layers, breaks = layers[keep], breaks[keep]
+        if not len(distance):
+            empty = np.zeros(0)
+            return Estimate(empty, layers, empty, [], empty, host_rate)
+        if not breaks[0]:
+            breaks = breaks.copy()
+            breaks[0] = True
+
+        cap = self.junctions(full, low, velocity, moving, breaks)
+        A = 2*accel*distance
+        horizon = self.lookahead(distance/full, breaks)
+        floor = np.append(low, low[-1])**2
+        u = self.plan(cap, A, horizon, floor)
+        u = np.maximum(u, np.minimum(np.append(low[0], low)**2, np.append(low, low[-1])**2))
+        times = self.trapezoid(distance, full, accel, u[:-1], u[1:])
+
+        # After running empty, the native planner waits for the buffer to
+        # fill up. The wait only times out if fewer moves than the cache
+        # holds come before the next stop.
+        waits = np.zeros(len(times))
+        stops = np.flatnonzero(breaks)
+        group = np.diff(np.append(stops, len(times)))
+        waits[stops[group < self.move_cache_size]] = self.print_move_buffer_wait
+
+        starved = []
+        levels = np.zeros(0)
+        if host_rate:
+            prefill = self.prefill(times, breaks)
+            levels = self.buffer(times, breaks, prefill, host_rate)
+            short = (levels < self.min_buffered_move_time) & ~prefill
+            starved = self._events(short, levels, times + waits, layers)
+        return Estimate(times, layers, waits, starved, levels, host_rate)
+
+    @staticmethod
+    def _events(short, levels, times, layers):
+        """ Runs of starved moves, as Starvation tuples """
+        if not short.any():
+            return []
+        edges = np.diff(np.concatenate(([0], short.astype(np.int8), [0])))
+        begins = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        clock = np.concatenate(([0.0], np.cumsum(times)))
+        lowest = np.minimum.reduceat(levels, begins)
+        return [Starvation(clock[b], int(layers[b]), e - b, level)
+                for b, e, level in zip(begins, ends, lowest)]
@@ -24,6 +24,7 @@ from Path import Path
 import numpy as np
 import logging
 from Delta import Delta
+from BedMesh import BedMesh
 
 class Printer:
     """ A command received from pronterface or whatever """
@@ -38,8 +39,12 @@ class Printer:
         self.cold_ends = []
         self.coolers = []
 
+        self.config_location = "/etc/redeem"  # Where the config files are
+
         self.comms = {}  # Communication channels
+        self.unix_sockets = []  # Listening sockets, their hosts are in comms
         self.path_planner = None
+        self.telemetry = None
 
         self.factor = 1.0
         self.extrude_factor = 1.0
@@ -92,7 +97,16 @@ class Printer:
 
     def send_message(self, prot, msg):
         """ Send a message back to host """
-        self.comms[prot].send_message(msg)
+        comm = self.comms.get(prot)
+        if comm is not None:  # The host may have disconnected
+            comm.send_message(msg)
+
+    def broadcast(self, name, msg):
+        """ Send a message to the channel name, and to
+        the hosts connected to the Unix socket by that name """
+        for prot, comm in self.comms.items():
+            if prot == name or prot.startswith(name + "#"):
+                comm.send_message(msg)
 
     def save_settings(self, filename):
         for name, stepper in self.steppers.iteritems():
@@ -110,6 +124,7 @@ class Printer:
             self.config.set('Heaters', 'pid_d_'+name, str(heater.D))
 
         self.save_bed_compensation_matrix()
+        self.save_bed_mesh()
 
         # Offsets
         for axis, offset in self.path_planner.center_offset.iteritems():
@@ -136,3 +151,32 @@ class Printer:
         if mat.replace('\t', '') != self.config.get('Geometry', 'bed_compensation_matrix'):
             self.config.set('Geometry', 'bed_compensation_matrix', mat)        
 
+    def make_bed_mesh(self, heights):
+        """ A BedMesh with the grid from the config and the given heights """
+        get = lambda option: self.config.getfloat('Geometry', option)
+        return BedMesh(get('bed_mesh_min_x'), get('bed_mesh_max_x'),
+                       get('bed_mesh_min_y'), get('bed_mesh_max_y'),
+                       heights, get('bed_mesh_tolerance'))
+
+    def bed_mesh_shape(self):
+        """ (points_x, points_y) of the grid in the config """
+        return (self.config.getint('Geometry', 'bed_mesh_points_x'),
+                self.config.getint('Geometry', 'bed_mesh_points_y'))
+
+    def load_bed_mesh(self):
+        """ The saved bed mesh, or None if there is none or it does
+        not match the grid in the config """
+        heights = BedMesh.parse_heights(self.config.get('Geometry', 'bed_mesh'))
+        if not heights:
+            return None
+        nx, ny = self.bed_mesh_shape()
+        if len(heights) != ny or any(len(row) != nx for row in heights):
+            logging.warning("The saved bed mesh is not {}x{} points, ignoring it".format(nx, ny))
+            return None
+        return self.make_bed_mesh(heights)
+
+    def save_bed_mesh(self):
+        mesh = "" if Path.bed_mesh is None else Path.bed_mesh.format_heights()
+        # Only update if they are different
+        if mesh != self.config.get('Geometry', 'bed_mesh'):
+            self.config.set('Geometry', 'bed_mesh', mesh)
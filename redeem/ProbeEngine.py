@@ -0,0 +1,150 @@
+"""
+Probing of many points in one go, for G29. The probe, lift, travel and
+next probe moves are queued back to back, and the planner is only
+waited on once per probe, to read how far the probe went before the
+endstop stopped it. Each point can be probed several times, samples too
+far from the median are thrown away and a point that does not agree
+with itself is probed again. A least squares plane through the probe
+distances is kept up to date as the points come in, G29 C makes the bed
+matrix from it.
+
+Author: Elias Bakken
+email: elias(dot)bakken(at)gmail(dot)com
+Website: http://www.thing-printer.com
+License: GNU GPL v3: http://www.gnu.org/copyleft/gpl.html
+
+ Redeem is free software: you can redistribute it and/or modify
+ it under the terms of the GNU General Public License as published by
+ the Free Software Foundation, either version 3 of the License, or
+ (at your option) any later version.
+
+ Redeem is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU General Public License for more details.
+
+ You should have received a copy of the GNU General Public License
+ along with Redeem.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import logging
+import numpy as np
+
+from Path import Path, AbsolutePath
+from PruInterface import PruInterface
+
+
+class PlaneFit:
+    """ Least squares fit of z = a + b*x + c*y, updated one point at a
+    time by keeping the sums of the normal equations """
+
+    def __init__(self):
+        self.A = np.zeros((3, 3))
+        self.r = np.zeros(3)
+        self.n = 0
+
+    def add(self, x, y, z):
+        v = np.array([1.0, x, y])
+        self.A += np.outer(v, v)
+        self.r += v*z
+        self.n += 1
+
+    def solve(self):
+        """ (a, b, c), or None until there are three points not on a line """
+        if self.n < 3 or abs(np.linalg.det(self.A)) < 1e-18:
+            return None
+        return np.linalg.solve(self.A, self.r)
+
+
+class ProbeError(Exception):
+    pass
+
+
+class ProbeEngine:
+
+    def __init__(self, printer):
+        self.printer = printer
+        self.plane = PlaneFit()
+
+    @staticmethod
+    def accept(samples, wanted, tolerance):
+        """ The median of the samples within tolerance of the median of
+        all, or None if fewer than half of the wanted samples agree """
+        if len(samples) < wanted:
+            return None
+        median = np.median(samples)
+        good = [s for s in samples if abs(s - median) <= tolerance]
+        if 2*len(good) < wanted + 1:
+            return None
+        return float(np.median(good))
+
+    def probe(self, points, report=None):
+        """ Probe the bed under the nozzle positions (x, y) in meters.
+        Start with the nozzle at the probing height above the bed. Returns
+        the distance the probe travelled at each point, in meters. """
+        probe = self.printer.config.snapshot.Probe
+        planner = self.printer.path_planner
+        native = planner.native_planner
+        zero = (0.0,)*Path.MAX_AXES
+        steps_total, length = planner.probe_steps(probe.length)
+        down = planner.probe_move(-length)
+        max_attempts = probe.samples + probe.retries
+        travel_speed = self.printer.feed_rate*self.printer.factor
+        travel_accel = self.printer.accel
+
+        self.plane = PlaneFit()
+        distances = [None]*len(points)
+        samples = []
+        attempts = 0
+        index = 0
+
+        def travel(i):
+            x, y = points[i]
+            path = AbsolutePath({"X": x + probe.offset_x, "Y": y + probe.offset_y},
+                                travel_speed, travel_accel, True, False, False, False)
+            planner.add_path(path)
+
+        planner.wait_until_done()
+        self.printer.ensure_steppers_enabled()
+        travel(0)
+        native.queueMove(zero, down, probe.speed, probe.accel, True, True)
+        while True:
+            # The one wait for this probe
+            planner.wait_until_done()
+            remaining = PruInterface.get_steps_remaining()
+            dist = (steps_total - remaining)/Path.steps_pr_meter[2]
+            attempts += 1
+            native.queueMove(zero, planner.probe_move(dist), probe.speed, probe.accel, True, False)
+            if remaining > 0:
+                samples.append(dist)
+            else:
+                logging.warning("Probe did not trigger at %s", points[index])
+
+            result = self.accept(samples, probe.samples, probe.tolerance)
+            if result is None and attempts < max_attempts:
+                # Probe the same point again, no travel needed
+                native.queueMove(zero, down, probe.speed, probe.accel, True, True)
+                continue
+            if result is None:
+                if not samples:
+                    planner.wait_until_done()
+                    raise ProbeError("Probe did not trigger at X:{} Y:{}".format(
+                        points[index][0]*1000, points[index][1]*1000))
+                result = float(np.median(samples))
+                logging.warning("Probe samples at %s disagree: %s", points[index], samples)
+
+            distances[index] = result
+            x, y = points[index]
+            self.plane.add(x, y, result)
+            if report:
+                report(index, x, y, result)
+
+            index += 1
+            if index == len(points):
+                planner.wait_until_done()
+                break
+            samples = []
+            attempts = 0
+            travel(index)
+            native.queueMove(zero, down, probe.speed, probe.accel, True, True)
+        return distances
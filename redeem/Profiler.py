@@ -0,0 +1,142 @@
+"""
+Sampling profiler for a running Redeem. Started and stopped with
+M880/M881, so a slow stretch of a print can be captured without
+restarting. A thread samples the stacks of all the other threads at a
+fixed rate and counts them. The result is written in the collapsed
+stack format ("thread;outer;inner count" per line), which flamegraph.pl
+and speedscope read directly.
+
+Author: Elias Bakken
+email: elias(dot)bakken(at)gmail(dot)com
+Website: http://www.thing-printer.com
+License: GNU GPL v3: http://www.gnu.org/copyleft/gpl.html
+
+ Redeem is free software: you can redistribute it and/or modify
+ it under the terms of the GNU General Public License as published by
+ the Free Software Foundation, either version 3 of the License, or
+ (at your option) any later version.
+
+ Redeem is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU General Public License for more details.
+
+ You should have received a copy of the GNU General Public License
+ along with Redeem.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from collections import defaultdict
+from threading import Thread, Lock
+import threading
+import logging
+import os
+import sys
+import time
+
+
+class Profiler:
+
+    def __init__(self, printer=None, directory="/tmp"):
+        self.printer = printer
+        if printer is not None:
+            printer.profiler = self
+        self.directory = directory
+        self.lock = Lock()
+        self.running = False
+        self.t = None
+        self.reset()
+
+    def reset(self):
+        self.stacks = defaultdict(int)  # collapsed stack -> samples
+        self.samples = 0
+        self.started = 0
+        self.deadline = None
+        self.filename = None
+
+    def start(self, duration=None, rate=200, filename=None):
+        """ Start sampling all threads, rate times a second. If a
+        duration is given, the profile is written when it expires """
+        with self.lock:
+            if self.running:
+                return False
+            self.reset()
+            self.interval = 1.0/rate
+            self.started = time.time()
+            if duration:
+                self.deadline = self.started + duration
+            if filename is None:
+                filename = os.path.join(
+                    self.directory,
+                    time.strftime("redeem-profile-%Y%m%d-%H%M%S.folded"))
+            self.filename = filename
+            self.running = True
+            self.t = Thread(target=self._run, name="Profiler")
+            self.t.daemon = True
+            self.t.start()
+        logging.info("Profiler started, writing to %s", filename)
+        return True
+
+    def stop(self):
+        """ Stop sampling, write the profile and return the file name """
+        with self.lock:
+            if not self.running:
+                return None
+            self.running = False
+            t = self.t
+        if t is not threading.current_thread():
+            t.join()
+        return self.write()
+
+    def is_running(self):
+        return self.running
+
+    def _run(self):
+        me = threading.current_thread().ident
+        while self.running:
+            names = dict((t.ident, t.name) for t in threading.enumerate())
+            for ident, frame in sys._current_frames().iteritems():
+                if ident != me:
+                    self.stacks[self._collapse(names.get(ident, str(ident)), frame)] += 1
+            self.samples += 1
+            if self.deadline and time.time() >= self.deadline:
+                self.stop()
+                return
+            time.sleep(self.interval)
+
+    @staticmethod
+    def _collapse(thread_name, frame):
+        """ "thread;outermost;...;innermost" for a frame """
+        parts = []
+        while frame is not None:
+            code = frame.f_code
+            parts.append("{} ({}:{})".format(
+                code.co_name, os.path.basename(code.co_filename), code.co_firstlineno))
+            frame = frame.f_back
+        parts.append(thread_name)
+        parts.reverse()
+        return ";".join(parts)
+
+    def write(self):
+        """ Write the collapsed stacks, the hottest first """
+        elapsed = time.time() - self.started
+        stacks = sorted(self.stacks.items(), key=lambda item: -item[1])
+        try:
+            with open(self.filename, "w") as f:
+                for stack, count in stacks:
+                    f.write("{} {}\n".format(stack, count))
+        except IOError, e:
+            logging.error("Profiler: unable to write %s: %s", self.filename, e)
+            return None
+        logging.info("Profiler: %d samples over %.1f s written to %s",
+                     self.samples, elapsed, self.filename)
+        return self.filename
+
+    def top(self, n=10):
+        """ The functions most often at the top of a stack, with
+        the fraction of the samples they were seen in """
+        leaves = defaultdict(int)
+        for stack, count in self.stacks.iteritems():
+            leaves[stack.rsplit(";", 1)[-1]] += count
+        total = float(sum(leaves.values())) or 1.0
+        hottest = sorted(leaves.items(), key=lambda item: -item[1])[:n]
+        return [(name, count/total) for name, count in hottest]
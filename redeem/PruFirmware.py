@@ -28,6 +28,7 @@ import logging
 import subprocess
 import shutil
 import re
+import hashlib
 from Path import Path
 
 class PruFirmware:
@@ -86,40 +87,35 @@ class PruFirmware:
                 'Go to the firmware directory and issue the `make` command.')
             raise RuntimeError('PASM compiler not found.')
 
+    def firmware_digest(self):
+        """ Hash of everything the binaries are built from: the generated
+        config.h and both firmware sources """
+        digest = hashlib.sha1()
+        for path in (self.make_config_file(), self.firmware_source_file0,
+                     self.firmware_source_file1):
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        return digest.hexdigest()
+
     def is_needing_firmware_compilation(self):
-        """ Returns True if the firmware needs recompilation """
-        config_mtime = self.config.timestamp()  # modif time of config file
-
-        ret0 = True
-        ret1 = True
-
-        if os.path.exists(self.binary_filename0):
-            # Check if we need to rebuild the firmware
-            fw_mtime = os.path.getmtime(
-                self.binary_filename0)  # modif time of firmware file
-            fw_src_mtime = os.path.getmtime(
-                self.firmware_source_file0)  # modif time of firmware source
-            if fw_mtime >= config_mtime and fw_mtime >= fw_src_mtime:
-                # already up to date
-                ret0 = False
-
-        if os.path.exists(self.binary_filename1):
-            #Check if we need to rebuild the firmware
-            fw_mtime = os.path.getmtime(
-                self.binary_filename1)  # modif time of firmware file
-            fw_src_mtime = os.path.getmtime(
-                self.firmware_source_file1)  # modif time of firmware source
-            if fw_mtime >= config_mtime and fw_mtime >= fw_src_mtime:
-                # already up to date
-                ret1 = False
-
-        return ret0 or ret1
+        """ Returns True if the firmware needs recompilation. The check is
+        based on content, not on modification times, so saving settings
+        that do not end up in the firmware does not trigger a rebuild """
+        digest = self.firmware_digest()
+        for binary in (self.binary_filename0, self.binary_filename1):
+            digest_file = os.path.splitext(binary)[0] + ".sha1"
+            if not os.path.exists(binary) or not os.path.exists(digest_file):
+                return True
+            with open(digest_file, "r") as f:
+                if f.read().strip() != digest:
+                    return True
+        return False
 
     def produce_firmware(self):
         if not self.is_needing_firmware_compilation():
             return True
 
-        config_file = self.make_config_file()
+        digest = self.firmware_digest()
 
         cmd0 = [self.compiler, '-b']
         cmd1 = [self.compiler, '-b']
@@ -155,6 +151,10 @@ class PruFirmware:
             logging.error('Command output:' + e.output)
             return False
 
+        for binary in (self.binary_filename_compiler0, self.binary_filename_compiler1):
+            with open(binary + ".sha1", "w") as f:
+                f.write(digest)
+
         return True
 
     def get_firmware(self, prunum=0):
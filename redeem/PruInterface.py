@@ -29,17 +29,47 @@ import mmap
 PRU_ICSS = 0x4A300000 
 PRU_ICSS_LEN = 512*1024
 SHARED_RAM_START = 0x00012000
+MOVES_DONE = 16     # Offset of the number of the last move done
+MOVES_DONE_ADDRESS = SHARED_RAM_START + MOVES_DONE  # In the PRU-ICSS, for PruTimer
 
 # 
 
 class PruInterface:
+
+    # The PRU memory, mapped from /dev/mem the first time it is needed and
+    # kept open. The simulator puts a bytearray of the same size here.
+    memory = None
+
+    @staticmethod
+    def get_memory():
+        if PruInterface.memory is None:
+            with open("/dev/mem", "r+b") as f:
+                PruInterface.memory = mmap.mmap(f.fileno(), PRU_ICSS_LEN, offset=PRU_ICSS)
+        return PruInterface.memory
+
     @staticmethod
     def get_shared_long(offset):
-        lon = [-1]
-        with open("/dev/mem", "r+b") as f:
-            ddr_mem = mmap.mmap(f.fileno(), PRU_ICSS_LEN, offset=PRU_ICSS)
-            lon = struct.unpack('L', ddr_mem[SHARED_RAM_START+offset:SHARED_RAM_START + offset + 4])
-        return lon[0]
+        """ Read a 32 bit value from the PRU shared RAM """
+        start = SHARED_RAM_START + offset
+        mem = PruInterface.get_memory()
+        return struct.unpack('<L', bytes(mem[start:start + 4]))[0]
+
+    @staticmethod
+    def set_shared_long(offset, value):
+        """ Write a 32 bit value to the PRU shared RAM """
+        start = SHARED_RAM_START + offset
+        PruInterface.get_memory()[start:start + 4] = struct.pack('<L', value)
+
+    @staticmethod
+    def get_steps_remaining():
+        """ Steps left of the last cancelled move """
+        return PruInterface.get_shared_long(12)
+
+    @staticmethod
+    def get_moves_done():
+        """ The number of the last move the PRU has done, as numbered by
+        the native planner (the low 32 bits). Written by PruTimer. """
+        return PruInterface.get_shared_long(MOVES_DONE)
 
     @staticmethod
     def get_ddr_long(offset):
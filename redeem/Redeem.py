@@ -30,6 +30,7 @@ import logging.handlers
 import os
 import os.path
 import signal
+import socket
 from threading import Thread
 from multiprocessing import JoinableQueue
 import Queue
@@ -42,12 +43,15 @@ from Thermistor import Thermistor
 from Fan import Fan
 from Servo import Servo
 from EndStop import EndStop
+from CommHub import CommHub
 from USB import USB
 from Pipe import Pipe
 from Ethernet import Ethernet
+from UnixSocket import UnixSocket
 from Extruder import Extruder, HBP
 from Cooler import Cooler
 from Path import Path
+import Kinematics
 from PathPlanner import PathPlanner
 from ColdEnd import ColdEnd
 from PruFirmware import PruFirmware
@@ -64,16 +68,25 @@ from Alarm import Alarm, AlarmExecutor
 from StepperWatchdog import StepperWatchdog
 from Key_pin import Key_pin, Key_pin_listener
 from Watchdog import Watchdog
+from Telemetry import Telemetry
+from Profiler import Profiler
+from Latency import Latency, clock
+from LogQueue import LogWriter, set_levels
+from temp_chart import load_charts
 
 # Global vars
 printer = None
+log = logging.getLogger("redeem.command")
 
 # Default logging level is set to debug
 logging.basicConfig(level=logging.DEBUG,
                     format='%(asctime)s %(name)-12s %(levelname)-8s %(message)s',
                     datefmt='%m-%d %H:%M')
 class Redeem:
-    def __init__(self):
+    def __init__(self, config_location="/etc/redeem", pru_firmware=None):
+        """ config_location is the directory with the config files and
+        temperature charts. The firmware is built from source unless a
+        ready pru_firmware is given (used by the simulator). """
         firmware_version = "1.1.8~Raw Deal"
         logging.info("Redeem initializing "+firmware_version)
 
@@ -82,25 +95,37 @@ class Redeem:
         Path.printer = printer
 
         printer.firmware_version = firmware_version
+        printer.config_location = config_location
 
         # check for config files
-        if not os.path.exists("/etc/redeem/default.cfg"):
-            logging.error("/etc/redeem/default.cfg does not exist, this file is required for operation")
+        default_file = os.path.join(config_location, "default.cfg")
+        local_file = os.path.join(config_location, "local.cfg")
+        if not os.path.exists(default_file):
+            logging.error(default_file + " does not exist, this file is required for operation")
             sys.exit() # maybe use something more graceful?
             
-        if not os.path.exists("/etc/redeem/local.cfg"):
-            logging.info("/etc/redeem/local.cfg does not exist, Creating one")
-            os.mknod("/etc/redeem/local.cfg")
+        if not os.path.exists(local_file):
+            logging.info(local_file + " does not exist, Creating one")
+            os.mknod(local_file)
     
         # Parse the config files.
         printer.config = CascadingConfigParser(
-            ['/etc/redeem/default.cfg', '/etc/redeem/printer.cfg',
-             '/etc/redeem/local.cfg'])
+            [default_file, os.path.join(config_location, "printer.cfg"), local_file])
+        printer.config.build_snapshot()
+
+        # Temperature charts live next to the config files
+        load_charts(config_location)
 
         # Get the revision and loglevel from the Config file
         level = self.printer.config.getint('System', 'loglevel')
         if level > 0:
             logging.getLogger().setLevel(level)
+        set_levels(self.printer.config)
+
+        # Log through a queue, so that writing to the SD card
+        # never holds up the threads that log
+        printer.log_writer = LogWriter()
+        printer.log_writer.install()
 
         # Set up additional logging, if present:        
         if self.printer.config.getboolean('System', 'log_to_file'):
@@ -108,9 +133,9 @@ class Redeem:
             formatter = '%(asctime)s %(name)-12s %(levelname)-8s %(message)s'
             printer.redeem_logging_handler = logging.handlers.RotatingFileHandler(logfile, maxBytes=2*1024*1024)
             printer.redeem_logging_handler.setFormatter(logging.Formatter(formatter))
-            printer.redeem_logging_handler.setLevel(level)
-            logging.getLogger().addHandler(printer.redeem_logging_handler)
+            printer.log_writer.add_handler(printer.redeem_logging_handler)
             logging.info("-- Logfile configured --")
+        printer.log_writer.start()
 
         # Find out which capes are connected
         self.printer.config.parse_capes()
@@ -136,7 +161,7 @@ class Redeem:
 
         # Test the alarm framework
         Alarm.printer = self.printer
-        Alarm.executor = AlarmExecutor()
+        Alarm.executor = AlarmExecutor(printer.config.getfloat('System', 'alarm_window'))
         alarm = Alarm(Alarm.ALARM_TEST, "Alarm framework operational")
 
         # Init the Watchdog timer
@@ -146,8 +171,10 @@ class Redeem:
         printer.enable = Enable("P9_41")
         printer.enable.set_disabled()
 
-        # Init the Paths
-        Path.axis_config = printer.config.getint('Geometry', 'axis_config')
+        # Init the Paths. Kinematics from plugins are set up after the plugins load.
+        axis_config = printer.config.getint('Geometry', 'axis_config')
+        if axis_config in Kinematics.KINEMATICS:
+            Path.set_axis_config(axis_config)
 
         # Init the end stops
         EndStop.inputdev = self.printer.config.get("Endstops", "inputdev")
@@ -390,14 +417,18 @@ class Redeem:
         # Make a queue of commands
         self.printer.commands = JoinableQueue(10)
 
+        # Runs of moves in it are added to the planner together
+        self.move_batch_size = printer.config.getint('Planner', 'move_batch_size')
+        self.move_batch_time = printer.config.getfloat('Planner', 'move_batch_time')/1000.0
+
         # Make a queue of commands that should not be buffered
         self.printer.sync_commands = JoinableQueue()
         self.printer.unbuffered_commands = JoinableQueue(10)
 
         # Bed compensation matrix
-        Path.matrix_bed_comp = printer.load_bed_compensation_matrix()
-        Path.matrix_bed_comp_inv = np.linalg.inv(Path.matrix_bed_comp)
+        Path.set_bed_matrix(printer.load_bed_compensation_matrix())
         logging.debug("Loaded bed compensation matrix: \n"+str(Path.matrix_bed_comp))
+        Path.bed_mesh = printer.load_bed_mesh()
 
         for axis in printer.steppers.keys():
             i = Path.axis_to_index(axis)
@@ -409,16 +440,19 @@ class Redeem:
             Path.home_backoff_offset[i] = printer.config.getfloat('Homing', 'home_backoff_offset_'+axis.lower())
             Path.steps_pr_meter[i] = printer.steppers[axis].get_steps_pr_meter()
             Path.backlash_compensation[i] = printer.config.getfloat('Steppers', 'backlash_'+axis.lower())
+        Path.update_axis_maps()
+        Path.set_tool(Path.axis_to_index(printer.current_tool))
 
         dirname = os.path.dirname(os.path.realpath(__file__))
 
         # Create the firmware compiler
-        pru_firmware = PruFirmware(
-            dirname + "/firmware/firmware_runtime.p",
-            dirname + "/firmware/firmware_runtime.bin",
-            dirname + "/firmware/firmware_endstops.p",
-            dirname + "/firmware/firmware_endstops.bin",
-            self.printer, "/usr/bin/pasm")
+        if pru_firmware is None:
+            pru_firmware = PruFirmware(
+                dirname + "/firmware/firmware_runtime.p",
+                dirname + "/firmware/firmware_runtime.bin",
+                dirname + "/firmware/firmware_endstops.p",
+                dirname + "/firmware/firmware_endstops.bin",
+                self.printer, "/usr/bin/pasm")
 
         
         printer.move_cache_size = printer.config.getfloat('Planner', 'move_cache_size')
@@ -428,6 +462,8 @@ class Redeem:
 
         self.printer.processor = GCodeProcessor(self.printer)
         self.printer.plugins = PluginsController(self.printer)
+        if Path.axis_config != axis_config:
+            Path.set_axis_config(axis_config)
 
         # Path planner
         travel_default = False
@@ -498,11 +534,35 @@ class Redeem:
         if printer.config.getboolean('Steppers', 'use_timeout'):
             printer.swd.start()
 
-        # Set up communication channels
+        # Pushed temperature, position and alarm reports (M155)
+        Telemetry(printer)
+
+        # Sampling profiler, started and stopped with M880/M881
+        Profiler(printer)
+
+        # Wait, execute and reply times of the G-codes (M882)
+        Latency(printer, printer.config.getboolean('System', 'latency_stats'))
+
+        # Set up communication channels, all served by one thread
+        CommHub(printer,
+                printer.config.getint('System', 'reply_queue_size'),
+                printer.config.get('System', 'reply_queue_overflow')).start()
         printer.comms["USB"] = USB(self.printer)
         printer.comms["Eth"] = Ethernet(self.printer)
 
-        if Pipe.check_tty0tty() or Pipe.check_socat():
+        if printer.config.getboolean('System', 'unix_sockets'):
+            directory = printer.config.get('System', 'unix_socket_dir')
+            for name in ("octoprint", "toggle", "testing", "testing_noret"):
+                try:
+                    # testing_noret does not send "ok"
+                    printer.unix_sockets.append(
+                        UnixSocket(printer, name, directory, name != "testing_noret"))
+                except (OSError, IOError, socket.error), e:
+                    logging.warning("Unable to open Unix socket %s in %s: %s", name, directory, e)
+
+        if not printer.config.getboolean('System', 'virtual_ttys'):
+            logging.info("Virtual tty pipes disabled")
+        elif Pipe.check_tty0tty() or Pipe.check_socat():
             printer.comms["octoprint"] = Pipe(printer, "octoprint")
             printer.comms["toggle"] = Pipe(printer, "toggle")
             printer.comms["testing"] = Pipe(printer, "testing")
@@ -533,6 +593,7 @@ class Redeem:
 
         Alarm.executor.start()
         Key_pin.listener.start()
+        self.printer.telemetry.start()
 
         if self.printer.config.getboolean('Watchdog', 'enable_watchdog'):
             self.printer.watchdog.start()
@@ -544,19 +605,64 @@ class Redeem:
 
     def loop(self, queue, name):
         """ When a new gcode comes in, execute it """
+        after_moves = None
         try:
             while self.running:
-                try:
-                    gcode = queue.get(block=True, timeout=1)
-                except Queue.Empty:
+                if after_moves is not None:
+                    gcode, after_moves = after_moves, None
+                else:
+                    try:
+                        gcode = queue.get(block=True, timeout=1)
+                    except Queue.Empty:
+                        continue
+                dequeued = clock()
+                if self.move_batch_size > 1 and self.printer.processor.is_move(gcode):
+                    after_moves = self._execute_moves(gcode, dequeued, queue)
                     continue
-                logging.debug("Executing "+gcode.code()+" from "+name + " " + gcode.message)
+                log.debug("Executing %s from %s %s", gcode.code(), name, gcode.message)
                 self._execute(gcode)
+                executed = clock()
                 self.printer.reply(gcode)
+                self.printer.latency.record(gcode, dequeued, executed, clock())
                 queue.task_done()
         except Exception:
             logging.exception("Exception in {} loop: ".format(name))
 
+    def _execute_moves(self, gcode, dequeued, queue):
+        """ Execute the move gcode and the moves queued right after it,
+        up to move_batch_size of them or for move_batch_time, as one
+        batch, then reply to each in order. Returns the G-code that
+        ended the run, if one was taken from the queue, else None. """
+        processor = self.printer.processor
+        deadline = dequeued + self.move_batch_time
+        moves = [(gcode, dequeued)]
+        paths = []
+        after_moves = None
+        while True:
+            path = processor.make_path(gcode)
+            if path is not None:
+                paths.append(path)
+            if len(moves) >= self.move_batch_size or clock() > deadline:
+                break
+            try:
+                gcode = queue.get(block=False)
+            except Queue.Empty:
+                break
+            if not processor.is_move(gcode):
+                after_moves = gcode
+                break
+            moves.append((gcode, clock()))
+        try:
+            self.printer.path_planner.add_paths(paths)
+        except Exception:
+            logging.exception("Exception adding {} moves".format(len(paths)))
+        executed = clock()
+        for gcode, dequeued in moves:
+            self.printer.reply(gcode)
+            self.printer.latency.record(gcode, dequeued, executed, clock())
+            queue.task_done()
+        return after_moves
+
     def eventloop(self, queue, name):
         """ When a new event comes in, execute the pending gcode """
         try:
@@ -568,7 +674,7 @@ class Redeem:
                     except Queue.Empty:
                         continue
                     self._synchronize(gcode)
-                    logging.info("Event handled for " + gcode.code() + " from " + name + " " + gcode.message)
+                    log.debug("Event handled for %s from %s %s", gcode.code(), name, gcode.message)
                     queue.task_done()
         except Exception:
             logging.exception("Exception in {} eventloop: ".format(name))
@@ -590,17 +696,23 @@ class Redeem:
             logging.debug("closing "+name)
             heater.disable()
 
-        for name, comm in self.printer.comms.iteritems():
+        for unix_socket in self.printer.unix_sockets:
+            unix_socket.close()
+        for name, comm in self.printer.comms.items():
             logging.debug("closing "+name)
             comm.close()
+        self.printer.comm_hub.stop()
         self.printer.enable.set_disabled()
         self.printer.swd.stop()
         Alarm.executor.stop()
         Key_pin.listener.stop()
+        self.printer.telemetry.stop()
+        self.printer.profiler.stop()
         self.printer.watchdog.stop()
         self.printer.enable.set_disabled()
 
         logging.info("Redeem exited")
+        self.printer.log_writer.stop()
 
     def _execute(self, g):
         """ Execute a G-code """
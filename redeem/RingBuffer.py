@@ -0,0 +1,132 @@
+"""
+Fixed size ring buffer for sampled values
+
+Author: Elias Bakken
+email: elias(dot)bakken(at)gmail(dot)com
+Website: http://www.thing-printer.com
+License: GNU GPL v3: http://www.gnu.org/copyleft/gpl.html
+
+ Redeem is free software: you can redistribute it and/or modify
+ it under the terms of the GNU General Public License as published by
+ the Free Software Foundation, either version 3 of the License, or
+ (at your option) any later version.
+
+ Redeem is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU General Public License for more details.
+
+ You should have received a copy of the GNU General Public License
+ along with Redeem.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import numpy as np
+from collections import deque
+
+
+class RingBuffer(object):
+    """
+    A circular buffer of floats backed by a preallocated numpy array.
+    Appending never allocates, the oldest sample is overwritten once
+    the buffer is full. If a window is given, a running sum of the
+    newest window samples is kept as well.
+    """
+
+    def __init__(self, size, window=None):
+        self.size = int(size)
+        self.window = min(int(window), self.size) if window else 0
+        self.data = np.zeros(self.size)
+        self.index = 0      # Next position to write
+        self.count = 0      # Number of valid samples
+        self.sum = 0.0      # Sum of the newest window samples
+
+    def append(self, value):
+        """ Add a sample, overwriting the oldest one if full """
+        if self.window:
+            # The sample leaving the window is still in the buffer
+            self.sum += value - self.data[self.index - self.window]
+        self.data[self.index] = value
+        self.index += 1
+        if self.index == self.size:
+            self.index = 0
+            if self.window:
+                # Get rid of accumulated rounding errors once per lap
+                self.sum = float(np.sum(self.data[-self.window:]))
+        if self.count < self.size:
+            self.count += 1
+
+    def average(self):
+        """ Average of the newest window samples (or fewer, if not full) """
+        n = min(self.count, self.window)
+        if n == 0:
+            return 0.0
+        return self.sum/n
+
+    def last(self, n=1):
+        """ Return the sample n steps back, last(1) is the newest """
+        return self.data[(self.index - n) % self.size]
+
+    def get(self, n=None):
+        """ Return the n newest samples (default all) as an array, oldest first """
+        if n is None or n > self.count:
+            n = self.count
+        start = self.index - n
+        if start >= 0:
+            return self.data[start:self.index].copy()
+        return np.concatenate((self.data[start:], self.data[:self.index]))
+
+    def clear(self):
+        """ Forget all samples """
+        self.data[:] = 0
+        self.index = 0
+        self.count = 0
+        self.sum = 0.0
+
+    def is_full(self):
+        return self.count == self.size
+
+    def __len__(self):
+        return self.count
+
+
+class RunningExtremes(object):
+    """
+    Max and min over the newest window samples, kept up to date with
+    monotonic queues so that both append and lookup are O(1) amortized.
+    The new sample is queued before the ones it replaces are removed,
+    so the queues are never empty for a thread calling max() or min().
+    """
+
+    def __init__(self, window):
+        self.window = int(window)
+        self.seq = 0
+        self.maxima = deque()   # (seq, value), values decreasing
+        self.minima = deque()   # (seq, value), values increasing
+
+    def append(self, value):
+        self.seq += 1
+        self.maxima.append((self.seq, value))
+        while len(self.maxima) > 1 and self.maxima[-2][1] <= value:
+            del self.maxima[-2]
+        self.minima.append((self.seq, value))
+        while len(self.minima) > 1 and self.minima[-2][1] >= value:
+            del self.minima[-2]
+        oldest = self.seq - self.window
+        if self.maxima[0][0] <= oldest:
+            self.maxima.popleft()
+        if self.minima[0][0] <= oldest:
+            self.minima.popleft()
+
+    def max(self):
+        return self.maxima[0][1]
+
+    def min(self):
+        return self.minima[0][1]
+
+    def clear(self):
+        self.seq = 0
+        self.maxima.clear()
+        self.minima.clear()
+
+    def __len__(self):
+        return min(self.seq, self.window)
@@ -30,6 +30,8 @@ import logging
 from PWM_pin import PWM_pin
 from ShiftRegister import ShiftRegister
 
+log = logging.getLogger("redeem.io")
+
 class Servo:
     def __init__(self, channel, pulse_width_min, pulse_width_max, angle_min, angle_max, init_angle, turnoff_timeout=0):
         """Define a new software controllable servo with adjustable speed control
@@ -106,7 +108,7 @@ class Servo:
         pulse_width = self.angle_to_pulse_width(angle)
         last_angle = self.last_angle
 
-        logging.debug("Updating angle from {} (pw={}) to {} (pw={}) ".format(last_angle, self.last_pulse_width, angle, pulse_width))
+        log.debug("Updating angle from %s (pw=%s) to %s (pw=%s)", last_angle, self.last_pulse_width, angle, pulse_width)
 
         if angle == last_angle:
             return
@@ -150,7 +152,7 @@ class Servo:
                 pass
 
             self.current_pulse_width = ev[0]
-            logging.debug("setting pulse width to "+str(self.current_pulse_width))
+            log.debug("setting pulse width to %s", self.current_pulse_width)
             self.pwm.set_value(self.current_pulse_width/self.pulse_length)
             self.lastCommandTime = time.time()
             time.sleep(ev[1])
@@ -35,10 +35,11 @@ if 'SPI' in globals():
     # Init the SPI for the serial to parallel
     try:
         spi = SPI(1, 1)
+        spi.bpw = 8
+        spi.mode = 0
     except:
-        pass
-    spi.bpw = 8
-    spi.mode = 0
+        logging.warning("Unable to open SPI 1.1")
+        spi = None
 else:
     logging.warning("Unable to set up SPI")
     spi = None
@@ -0,0 +1,640 @@
+#!/usr/bin/env python
+"""
+Simulated hardware for Redeem. Installs in-memory stand-ins for the
+BeagleBone and Replicape hardware (GPIO, SPI, I2C, evdev, PRU memory,
+sysfs PWM and the thermistor ADC) so the whole daemon can be started,
+fed G-codes and profiled on a plain Linux box.
+
+The heaters are driven by a simple thermal model: the duty cycle
+written to the fake PWM chip heats a thermal mass, and the resulting
+temperature is written back as a raw ADC value for the thermistor.
+
+    sim = Simulator()
+    r = sim.make_redeem()
+    r.start()
+    sim.send("G28")
+    ...
+    r.exit()
+    sim.close()
+
+Author: Elias Bakken
+email: elias(dot)bakken(at)gmail(dot)com
+Website: http://www.thing-printer.com
+License: GNU GPL v3: http://www.gnu.org/copyleft/gpl.html
+
+ Redeem is free software: you can redistribute it and/or modify
+ it under the terms of the GNU General Public License as published by
+ the Free Software Foundation, either version 3 of the License, or
+ (at your option) any later version.
+
+ Redeem is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU General Public License for more details.
+
+ You should have received a copy of the GNU General Public License
+ along with Redeem.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from threading import Thread, Event, Lock
+from collections import deque
+import ConfigParser
+import logging
+import os
+import select
+import shutil
+import struct
+import sys
+import tempfile
+import time
+import types
+import numpy as np
+
+from Gcode import Gcode
+from PruInterface import PruInterface, PRU_ICSS_LEN
+from PWM_pin import PWM_pin
+from temp_chart import temp_chart, load_charts
+
+
+class GPIO(object):
+    """ Adafruit_BBIO.GPIO, the pin levels are kept in a dict """
+    IN = 0
+    OUT = 1
+    LOW = 0
+    HIGH = 1
+    PUD_OFF = 0
+    RISING = 1
+    FALLING = 2
+    BOTH = 3
+
+    pins = {}
+
+    @staticmethod
+    def setup(pin, direction, pull_up_down=0, initial=0):
+        GPIO.pins[pin] = initial
+
+    @staticmethod
+    def output(pin, value):
+        GPIO.pins[pin] = value
+
+    @staticmethod
+    def input(pin):
+        return GPIO.pins.get(pin, 0)
+
+    @staticmethod
+    def cleanup():
+        GPIO.pins.clear()
+
+
+class SPI(object):
+    """ Adafruit_BBIO.SPI, remembers the last bytes written """
+
+    devices = {}
+
+    def __init__(self, bus, device):
+        self.bus = bus
+        self.device = device
+        self.bpw = 8
+        self.mode = 0
+        self.data = []
+        SPI.devices[(bus, device)] = self
+
+    def writebytes(self, data):
+        self.data = list(data)
+
+    def xfer2(self, data):
+        self.data = list(data)
+        return [0]*len(data)
+
+    def close(self):
+        pass
+
+
+class SMBus(object):
+    """ smbus.SMBus, with a register file for each I2C address """
+
+    registers = {}    # address -> bytearray, shared by all buses
+
+    def __init__(self, bus):
+        self.bus = bus
+
+    def _registers(self, address):
+        return SMBus.registers.setdefault(address, bytearray(256))
+
+    def write_byte_data(self, address, reg, value):
+        self._registers(address)[reg] = value & 0xFF
+
+    def write_i2c_block_data(self, address, reg, data):
+        self._registers(address)[reg:reg + len(data)] = bytearray(d & 0xFF for d in data)
+
+    def read_byte_data(self, address, reg):
+        return self._registers(address)[reg]
+
+    def read_i2c_block_data(self, address, reg, length):
+        return list(self._registers(address)[reg:reg + length])
+
+    @staticmethod
+    def pwm_duty(channel, address=0x70):
+        """ Duty cycle (0..1) of a channel on the PCA9685 PWM chip """
+        regs = SMBus.registers.get(address)
+        if regs is None:
+            return 0.0
+        base = 0x06 + 4*channel
+        return (regs[base + 2] | (regs[base + 3] << 8))/4095.0
+
+
+class ecodes(object):
+    """ evdev.ecodes """
+    EV_SYN = 0
+    EV_KEY = 1
+    EV_REL = 2
+    EV_ABS = 3
+
+
+class InputEvent(object):
+    """ evdev.InputEvent """
+    def __init__(self, type, code, value):
+        self.type = type
+        self.code = code
+        self.value = value
+        self.timestamp = time.time()
+
+
+class InputDevice(object):
+    """ evdev.InputDevice. Events pushed with inject() go to every
+    device opened on that path, a pipe makes the fd selectable. """
+
+    devices = []
+
+    def __init__(self, path):
+        self.path = path
+        self.fn = path
+        self.events = deque()
+        self.fd, self.wakeup = os.pipe()
+        self.closed = False
+        InputDevice.devices.append(self)
+
+    @staticmethod
+    def inject(path, type, code, value):
+        for dev in InputDevice.devices:
+            if dev.path == path:
+                dev.events.append(InputEvent(type, code, value))
+                os.write(dev.wakeup, "x")
+
+    def read(self):
+        os.read(self.fd, 4096)
+        events = []
+        while self.events:
+            events.append(self.events.popleft())
+        return events
+
+    def read_loop(self):
+        while not self.closed:
+            r, w, x = select.select([self.fd], [], [], 0.5)
+            if r:
+                for event in self.read():
+                    yield event
+            else:
+                # Lets the reader check if it should stop
+                yield InputEvent(ecodes.EV_SYN, 0, 0)
+
+    def close(self):
+        self.closed = True
+
+
+class PathPlannerNative(object):
+    """ The native path planner, without the PRUs. Moves are done as
+    soon as they are queued, the planner keeps count of them and of
+    the time they would have taken at the requested speed. As the
+    native planner, it numbers the moves and writes the number of the
+    last one done to the PRU memory, at the offset it is given.
+
+    If bed is set to a function of (x, y) that returns how far below
+    the nozzle the bed is, cancelable moves straight down on a
+    cartesian machine stop there, like a probe, and leave the steps
+    they did not make in the PRU memory. """
+
+    def __init__(self, cache_size):
+        self.cache_size = cache_size
+        self.position = np.zeros(8)     # In stepper space
+        self.moves = 0
+        self.move_time = 0.0
+        self.running = False
+        self.suspended = False
+        self.extruder = 0
+        self.sync_event = Event()
+        self.settings = {}
+        self.bed = None
+        self.moves_done_offset = None
+
+    def initPRU(self, firmware_stepper, firmware_endstops):
+        return True
+
+    def queueMove(self, start, end, speed, accel, cancelable, optimize):
+        delta = np.array(end) - np.array(start)
+        if (self.bed is not None and cancelable and delta[2] < 0
+                and not delta[:2].any()):
+            x, y, z = self.position[:3]
+            travel = min(-delta[2], max(self.bed(x, y), 0.0))
+            steps_pr_meter = self.settings.get("steps_pr_meter", [1]*8)[2]
+            PruInterface.set_shared_long(
+                12, int(round((-delta[2] - travel)*steps_pr_meter)))
+            delta[2] = -travel
+        self.position += delta
+        self.moves += 1
+        if speed > 0:
+            self.move_time += np.sqrt(np.dot(delta[:3], delta[:3]))/speed
+        return self._done()
+
+    def queueBatchMove(self, batch, speed, accel, cancelable, optimize):
+        pairs = np.asarray(batch).reshape(-1, 2, 8)
+        deltas = pairs[:, 1] - pairs[:, 0]
+        self.position += deltas.sum(axis=0)
+        self.moves += len(pairs)
+        if speed > 0:
+            self.move_time += np.sqrt((deltas[:, :3]**2).sum(axis=1)).sum()/speed
+        return self._done()
+
+    def _done(self):
+        # Where PruTimer writes it, not through the PruInterface offsets
+        offset = self.moves_done_offset
+        if offset is not None:
+            PruInterface.get_memory()[offset:offset + 4] = struct.pack(
+                '<L', self.moves & 0xFFFFFFFF)
+        return self.moves
+
+    def getMovesDone(self):
+        return self.moves
+
+    def setMovesDoneOffset(self, offset):
+        self.moves_done_offset = offset
+        self._done()
+
+    def queueSyncEvent(self, isBlocking=True):
+        # The move buffer is always empty
+        return False
+
+    def waitUntilSyncEvent(self):
+        if self.sync_event.wait(1.0):
+            return 1
+        return 0
+
+    def clearSyncEvent(self):
+        self.sync_event.clear()
+
+    def waitUntilFinished(self):
+        pass
+
+    def runThread(self):
+        self.running = True
+
+    def stopThread(self, join):
+        self.running = False
+
+    def suspend(self):
+        self.suspended = True
+
+    def resume(self):
+        self.suspended = False
+
+    def reset(self):
+        self.suspended = False
+
+    def flush(self):
+        self.suspended = False
+
+    def setExtruder(self, ext_nr):
+        self.extruder = ext_nr
+
+    def getExtruder(self):
+        return self.extruder
+
+    def _setter(name):
+        def set_value(self, value):
+            self.settings[name] = value
+        return set_value
+
+    setAcceleration = _setter("acceleration")
+    setPrintAcceleration = _setter("print_acceleration")
+    setTravelAcceleration = _setter("travel_acceleration")
+    setAxisStepsPerMeter = _setter("steps_pr_meter")
+    setMaxSpeeds = _setter("max_speeds")
+    setMinSpeeds = _setter("min_speeds")
+    setJerks = _setter("jerks")
+    setPrintMoveBufferWait = _setter("print_move_buffer_wait")
+    setMinBufferedMoveTime = _setter("min_buffered_move_time")
+    setMaxBufferedMoveTime = _setter("max_buffered_move_time")
+    del _setter
+
+
+class SimulatedFirmware(object):
+    """ Stands in for PruFirmware, there is nothing to compile """
+
+    def is_needing_firmware_compilation(self):
+        return False
+
+    def produce_firmware(self):
+        return True
+
+    def get_firmware(self, prunum=0):
+        return "firmware_runtime.bin" if prunum == 0 else "firmware_endstops.bin"
+
+
+class SimulatedChannel(object):
+    """ A comm channel that keeps what Redeem sends back """
+
+    def __init__(self, printer, prot, send_response=True, output=None):
+        self.printer = printer
+        self.prot = prot
+        self.send_response = send_response
+        self.output = output
+        self.messages = deque(maxlen=1000)
+
+    def send(self, message):
+        """ Queue a G-code as if it came in on this channel """
+        self.printer.processor.enqueue(Gcode({"message": message, "prot": self.prot}))
+
+    def send_message(self, message):
+        if not self.send_response:
+            return
+        self.messages.append(message)
+        if self.output:
+            self.output.write(message.rstrip("\n") + "\n")
+
+    def close(self):
+        pass
+
+
+class HeaterModel(object):
+    """ A heater block as one thermal mass that loses heat to the
+    air, with a dead time between the power and the thermistor """
+
+    def __init__(self, power, capacity, loss, delay, ambient=25.0):
+        self.power = power          # Heat at full duty cycle (W)
+        self.capacity = capacity    # Heat capacity (J/K)
+        self.loss = loss            # Loss to the surroundings (W/K)
+        self.delay = delay          # Dead time (s)
+        self.ambient = ambient
+        self.temperature = ambient
+        self.time = 0.0
+        self.duty = 0.0
+        self.pending = deque()      # (time, duty) not yet seen by the thermistor
+
+    def step(self, duty, dt):
+        """ Advance the model dt seconds with the given duty cycle """
+        self.time += dt
+        self.pending.append((self.time + self.delay, duty))
+        while self.pending and self.pending[0][0] <= self.time:
+            self.duty = self.pending.popleft()[1]
+        heat = self.duty*self.power - self.loss*(self.temperature - self.ambient)
+        self.temperature += heat*dt/self.capacity
+        return self.temperature
+
+
+class SimulatedHeater(object):
+    """ Connects a PWM channel, a heater model and an ADC file """
+
+    # Rough numbers for a 40 W hot end and a 150 W heated bed
+    HOT_END = {"power": 40.0, "capacity": 12.0, "loss": 0.15, "delay": 2.0}
+    BED = {"power": 150.0, "capacity": 700.0, "loss": 1.2, "delay": 5.0}
+
+    def __init__(self, name, channel, adc_file, chart, resistance, model):
+        self.name = name
+        self.channel = channel
+        self.adc_file = adc_file
+        self.resistance = resistance
+        self.model = model
+        table = np.array(temp_chart[chart]).transpose()
+        order = np.argsort(table[0])
+        self.temps = table[0][order]
+        self.resistances = table[1][order]
+        self.write_adc()
+
+    def step(self, dt):
+        self.model.step(SMBus.pwm_duty(self.channel), dt)
+        self.write_adc()
+
+    def write_adc(self):
+        """ Write the temperature as the raw value of the 12 bit, 1.8 V ADC,
+        the thermistor is the lower half of a divider with the series resistor """
+        res = np.interp(self.model.temperature, self.temps, self.resistances)
+        raw = int(round(4095.0*res/(res + self.resistance)))
+        tmp_file = self.adc_file + ".tmp"
+        with open(tmp_file, "w") as f:
+            f.write(str(raw) + "\n")
+        os.rename(tmp_file, self.adc_file)
+
+
+class ThermalModel(object):
+    """ Steps all the simulated heaters, either from a thread
+    following the clock or explicitly with step() """
+
+    def __init__(self, heaters, tick=0.05):
+        self.heaters = heaters
+        self.tick = tick
+        self.lock = Lock()
+        self.running = False
+
+    def step(self, seconds):
+        with self.lock:
+            for _ in xrange(max(1, int(round(seconds/self.tick)))):
+                for heater in self.heaters:
+                    heater.step(self.tick)
+
+    def start(self):
+        self.running = True
+        self.t = Thread(target=self._run, name="ThermalModel")
+        self.t.daemon = True
+        self.t.start()
+
+    def stop(self):
+        if self.running:
+            self.running = False
+            self.t.join()
+
+    def _run(self):
+        next_time = time.time()
+        while self.running:
+            self.step(self.tick)
+            next_time += self.tick
+            time.sleep(max(0.0, next_time - time.time()))
+
+
+def _find_data_dir(name):
+    """ The configs and data dirs, from the source tree or installed """
+    here = os.path.dirname(os.path.realpath(__file__))
+    for path in (os.path.join(here, "..", name),
+                 os.path.join(sys.prefix, "redeem", name),
+                 os.path.join(here, name)):
+        if os.path.isdir(path):
+            return os.path.realpath(path)
+    raise IOError("Unable to find the Redeem {} directory".format(name))
+
+
+def install():
+    """ Put the simulated hardware modules in place of the real ones.
+    Has to run before any of the hardware modules are imported. """
+    if "Adafruit_BBIO" in sys.modules and getattr(sys.modules["Adafruit_BBIO"], "simulated", False):
+        return
+
+    def module(name, **attributes):
+        m = types.ModuleType(name)
+        m.__dict__.update(attributes)
+        m.simulated = True
+        sys.modules[name] = m
+        return m
+
+    def public(cls):
+        return dict((k, getattr(cls, k)) for k in dir(cls) if not k.startswith("_"))
+
+    gpio = module("Adafruit_BBIO.GPIO", **public(GPIO))
+    spi = module("Adafruit_BBIO.SPI", SPI=SPI)
+    module("Adafruit_BBIO", GPIO=gpio, SPI=spi)
+    module("smbus", SMBus=SMBus)
+    codes = module("evdev.ecodes", **public(ecodes))
+    module("evdev", InputDevice=InputDevice, InputEvent=InputEvent, ecodes=codes)
+    # The planner is imported relative to the package
+    package = __name__.rpartition(".")[0]
+    for name in ("path_planner.PathPlannerNative", package + ".path_planner.PathPlannerNative"):
+        module(name.lstrip("."), PathPlannerNative=PathPlannerNative)
+
+
+class Simulator(object):
+    """ Sets up a config dir and the simulated hardware for one Redeem """
+
+    def __init__(self, printer_config=None, location=None, output=None):
+        """ printer_config is an optional printer.cfg, location the
+        directory to use for config files and device files (default
+        a new temporary directory) """
+        install()
+        self.own_location = location is None
+        self.location = location or tempfile.mkdtemp(prefix="redeem-sim-")
+        self.output = output
+        self.redeem = None
+        self.channels = {}
+
+        self._make_config(printer_config)
+        load_charts(self.location)
+
+        PruInterface.memory = bytearray(PRU_ICSS_LEN)
+        self._make_pwm_sysfs()
+
+        self.thermal = ThermalModel(self._make_heaters())
+        self.thermal.start()
+
+    def _make_config(self, printer_config):
+        """ Copy the configs and charts, local.cfg points Redeem at the simulated devices """
+        for chart in os.listdir(_find_data_dir("data")):
+            if chart.endswith(".cht"):
+                shutil.copy(os.path.join(_find_data_dir("data"), chart), self.location)
+        shutil.copy(os.path.join(_find_data_dir("configs"), "default.cfg"), self.location)
+        if printer_config:
+            shutil.copy(printer_config, os.path.join(self.location, "printer.cfg"))
+
+        for d in ("adc", "input"):
+            if not os.path.isdir(os.path.join(self.location, d)):
+                os.mkdir(os.path.join(self.location, d))
+
+        config = ConfigParser.SafeConfigParser()
+        config.read([os.path.join(self.location, f) for f in ("default.cfg", "printer.cfg")])
+        self.config = config
+
+        local = ConfigParser.SafeConfigParser()
+        for section in ("System", "Watchdog", "Endstops", "Heaters", "Rotary-encoders"):
+            local.add_section(section)
+        local.set("System", "log_to_file", "False")
+        local.set("System", "virtual_ttys", "False")
+        local.set("System", "unix_socket_dir", os.path.join(self.location, "run"))
+        local.set("Watchdog", "enable_watchdog", "False")
+        local.set("Endstops", "inputdev", os.path.join(self.location, "input", "event0"))
+        for option, value in config.items("Heaters"):
+            if option.startswith("path_adc_"):
+                local.set("Heaters", option, os.path.join(self.location, "adc", os.path.basename(value)))
+        for option, value in config.items("Rotary-encoders"):
+            if option.startswith("event-"):
+                local.set("Rotary-encoders", option, os.path.join(self.location, "input", os.path.basename(value)))
+        with open(os.path.join(self.location, "local.cfg"), "w") as f:
+            local.write(f)
+        self.local = local
+
+    def _make_pwm_sysfs(self):
+        PWM_pin.sysfs = os.path.join(self.location, "pwm")
+        for channel in (0, 1):
+            path = os.path.join(PWM_pin.sysfs, "pwmchip0", "pwm{}".format(channel))
+            if not os.path.isdir(path):
+                os.makedirs(path)
+        open(os.path.join(PWM_pin.sysfs, "pwmchip0", "export"), "w").close()
+
+    def _make_heaters(self):
+        heaters = []
+        for option, adc_file in self.local.items("Heaters"):
+            name = option[len("path_adc_"):].upper()
+            profile = SimulatedHeater.BED if name == "HBP" else SimulatedHeater.HOT_END
+            heaters.append(SimulatedHeater(
+                name,
+                self.config.getint("Heaters", "mosfet_" + name),
+                adc_file,
+                self.config.get("Heaters", "temp_chart_" + name),
+                self.config.getfloat("Heaters", "resistance_" + name),
+                HeaterModel(**profile)))
+        return heaters
+
+    def get_heater(self, name):
+        for heater in self.thermal.heaters:
+            if heater.name == name:
+                return heater
+        return None
+
+    def make_redeem(self):
+        """ Create a Redeem on the simulated hardware, with in-memory
+        channels in place of the octoprint, toggle and testing pipes """
+        try:
+            from Redeem import Redeem
+        except ImportError:
+            from redeem.Redeem import Redeem
+        self.redeem = Redeem(self.location, SimulatedFirmware())
+        printer = self.redeem.printer
+        for prot in ("octoprint", "toggle", "testing", "testing_noret"):
+            self.channels[prot] = SimulatedChannel(
+                printer, prot, prot != "testing_noret", self.output)
+            printer.comms[prot] = self.channels[prot]
+        return self.redeem
+
+    def send(self, message, prot="testing"):
+        """ Queue a G-code on one of the simulated channels """
+        self.channels[prot].send(message)
+
+    def set_endstop(self, name, hit):
+        """ Trigger or release an end stop (X1, Y1, Z1, X2, Y2, Z2) """
+        invert = self.config.getboolean("Endstops", "invert_" + name)
+        code = self.config.getint("Endstops", "keycode_" + name)
+        value = int(hit) if invert else int(not hit)
+        bit = 1 << ["X1", "Y1", "Z1", "X2", "Y2", "Z2"].index(name)
+        state = PruInterface.get_shared_long(0)
+        PruInterface.set_shared_long(0, state | bit if hit else state & ~bit)
+        InputDevice.inject(self.local.get("Endstops", "inputdev"), ecodes.EV_KEY, code, value)
+
+    def close(self):
+        """ Stop the thermal model and the input devices. Call
+        after Redeem.exit(), the end stop threads end here """
+        self.thermal.stop()
+        for dev in InputDevice.devices:
+            dev.close()
+        del InputDevice.devices[:]
+        if self.own_location:
+            shutil.rmtree(self.location, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    # Run Redeem on simulated hardware, G-codes are read from stdin
+    sim = Simulator(sys.argv[1] if len(sys.argv) > 1 else None, output=sys.stdout)
+    r = sim.make_redeem()
+    r.start()
+    try:
+        for line in iter(sys.stdin.readline, ""):
+            if line.strip():
+                sim.send(line.strip())
+    except KeyboardInterrupt:
+        pass
+    r.exit()
+    sim.close()
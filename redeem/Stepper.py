@@ -99,7 +99,7 @@ class Stepper(object):
         pass
 
     def fault_callback(self, key, event):
-        Alarm(Alarm.STEPPER_FAULT, "Stepper {}".format(self.name))
+        Alarm(Alarm.STEPPER_FAULT, "Stepper {}".format(self.name), source=self.name)
             
 
 
@@ -0,0 +1,166 @@
+"""
+Telemetry for Redeem. Hosts subscribe once and get temperature,
+position and alarm reports pushed to them, instead of polling with
+M105/M114 through the command queues.
+
+Author: Elias Bakken
+email: elias(dot)bakken(at)gmail(dot)com
+Website: http://www.thing-printer.com
+License: GNU GPL v3: http://www.gnu.org/copyleft/gpl.html
+
+ Redeem is free software: you can redistribute it and/or modify
+ it under the terms of the GNU General Public License as published by
+ the Free Software Foundation, either version 3 of the License, or
+ (at your option) any later version.
+
+ Redeem is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU General Public License for more details.
+
+ You should have received a copy of the GNU General Public License
+ along with Redeem.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from threading import Thread, Lock
+from collections import deque
+import logging
+import math
+import time
+
+
+class Subscription:
+    """ The topics and report rate a channel has asked for """
+
+    def __init__(self, topics, interval, on_change, events_seen):
+        self.topics = topics          # Ordered list of topic names
+        self.interval = interval      # Seconds between reports, 0 for none
+        self.on_change = on_change    # Also report as soon as something changes
+        self.next_time = 0
+        self.last_sent = {}
+        self.events_seen = events_seen  # Number of the last event sent
+
+
+class Telemetry:
+
+    TEMPERATURE = "temperature"
+    POSITION = "position"
+    ALARM = "alarm"
+    LATENCY = "latency"
+
+    # Topics that are reported once each time they occur, see add_event
+    EVENTS = (ALARM,)
+
+    def __init__(self, printer, tick=0.1):
+        self.printer = printer
+        self.printer.telemetry = self
+        self.tick = tick              # Resolution of the report loop
+        self.subscribers = {}         # prot -> Subscription
+        self.providers = {
+            Telemetry.TEMPERATURE: self.temperature_report,
+            Telemetry.POSITION: self.position_report
+        }
+        self.events = deque(maxlen=100)  # (number, topic, report), oldest first
+        self.event_count = 0
+        self.lock = Lock()
+        self.running = False
+
+    def subscribe(self, prot, topics, interval, on_change=False):
+        """ Register a channel for periodic and/or on change reports """
+        with self.lock:
+            # Only the events from now on are sent
+            self.subscribers[prot] = Subscription(topics, interval, on_change,
+                                                  self.event_count)
+        logging.info("Telemetry: %s subscribed to %s every %s s",
+                     prot, ", ".join(topics), interval)
+
+    def unsubscribe(self, prot):
+        with self.lock:
+            self.subscribers.pop(prot, None)
+
+    def add_provider(self, topic, provider):
+        """ Add a topic, provider is called with no arguments
+        and returns the report line (or None) """
+        self.providers[topic] = provider
+
+    def add_event(self, topic, report):
+        """ Send the report line once to the channels subscribed to topic """
+        with self.lock:
+            self.event_count += 1
+            self.events.append((self.event_count, topic, report))
+
+    def set_alarm(self, alarm):
+        """ Called by the alarm system for each alarm raised """
+        self.add_event(Telemetry.ALARM, "Alarm: " + alarm.message)
+
+    def temperature_report(self):
+        """ Temperatures in the format of the M105 answer, without the "ok" """
+        heaters = self.printer.heaters
+        current_tool = self.printer.current_tool
+        # Cura expects the temperature from the first
+        answer = "T:{0:.0f}".format(heaters[current_tool].get_temperature())
+        # Append heaters
+        for name, heater in heaters.iteritems():
+            answer += " {0}:{1:.0f}".format(heater.prefix, heater.get_temperature())
+        # Append the current tool power is using PID
+        if not heaters[current_tool].onoff_control:
+            answer += " @:" + str(math.floor(255*heaters[current_tool].mosfet.get_power()))
+        for c, cooler in enumerate(self.printer.cold_ends):
+            answer += " C{0}:{1:.0f}".format(c, cooler.get_temperature())
+        return answer
+
+    def position_report(self):
+        """ Position in the format of the M114 answer, without the "ok".
+        Where the head is, not where the queued moves end. """
+        return "C: " + ' '.join('%s:%s' % i for i in sorted(
+            self.printer.path_planner.get_executed_pos().iteritems()))
+
+    def start(self):
+        self.running = True
+        self.t = Thread(target=self._loop, name="Telemetry")
+        self.t.daemon = True
+        self.t.start()
+
+    def stop(self):
+        self.running = False
+        self.t.join()
+
+    def _loop(self):
+        while self.running:
+            try:
+                self._publish(time.time())
+            except Exception:
+                logging.exception("Exception in telemetry loop")
+            time.sleep(self.tick)
+
+    def _publish(self, now):
+        """ Send the new events, and build each report once per
+        tick and hand it to the subscribers that are due or want changes """
+        with self.lock:
+            subscribers = self.subscribers.items()
+            events = list(self.events)
+        if not subscribers:
+            return
+        reports = {}
+        for prot, sub in subscribers:
+            for number, topic, report in events:
+                if number > sub.events_seen and topic in sub.topics:
+                    self.printer.send_message(prot, report)
+            if events:
+                sub.events_seen = max(sub.events_seen, events[-1][0])
+            due = sub.interval > 0 and now >= sub.next_time
+            if not (due or sub.on_change):
+                continue
+            if due:
+                sub.next_time = now + sub.interval
+            for topic in sub.topics:
+                if topic in Telemetry.EVENTS:
+                    continue
+                if topic not in reports:
+                    reports[topic] = self.providers[topic]()
+                report = reports[topic]
+                if report is None:
+                    continue
+                if due or report != sub.last_sent.get(topic):
+                    sub.last_sent[topic] = report
+                    self.printer.send_message(prot, report)
@@ -57,7 +57,8 @@ class Thermistor:
                 res_val = self.voltage_to_resistance(voltage)  # Convert to resistance
                 ret = self.resistance_to_degrees(res_val) # Convert to degrees
         except IOError as e:
-            Alarm(Alarm.THERMISTOR_ERROR, "Unable to get ADC value ({0}): {1}".format(e.errno, e.strerror))
+            Alarm(Alarm.THERMISTOR_ERROR, "Unable to get ADC value ({0}): {1}".format(e.errno, e.strerror),
+                  source=self.name)
         finally:
             Thermistor.mutex.release()
         return ret
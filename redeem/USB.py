@@ -21,48 +21,53 @@ License: GNU GPL v3: http://www.gnu.org/copyleft/gpl.html
  along with Redeem.  If not, see <http://www.gnu.org/licenses/>.
 """
 
-from threading import Thread
-import select
 import logging
-from Gcode import Gcode
+import os
+from CommHub import Channel, REOPEN_DELAY
 
 
-class USB:
+class USB(Channel):
     def __init__(self, printer):
-        self.printer = printer
-        try:
-            self.tty = open("/dev/ttyGS0", "r+")
-        except IOError:
+        Channel.__init__(self, printer, "USB")
+        self.closed = False
+        if not self.open():
             logging.warning("USB gadget serial not available as /dev/ttyGS0")
-            return
-        self.running = True
+
+    def open(self):
+        """ Open the gadget serial and start reading from it """
+        try:
+            fd = os.open("/dev/ttyGS0", os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
+        except OSError:
+            return False
+        self.rd = self.wr = fd
+        # Do not enable sending messages until a
+        # message has been received
         self.send_response = False
-        self.t = Thread(target=self.get_message)
-        self.t.start()		
+        self.hub.add_reader(fd, self.get_message)
+        return True
+
+    def reopen(self):
+        if not self.closed and not self.open():
+            self.hub.call_later(REOPEN_DELAY, self.reopen)
 
-    def get_message(self):
-        """ Loop that gets messages and pushes them on the queue """
-        while self.running:
-            ret = select.select([self.tty], [], [], 1.0)
-            if ret[0] == [self.tty]:
-                message = self.tty.readline().strip("\n")
-                if len(message) > 0:
-                    g = Gcode({"message": message, "prot": "USB"})
-                    self.printer.processor.enqueue(g)
-                    # Do not enable sending messages until a 
-                    # message has been received
-                    self.send_response = True
+    def get_message(self, fd):
+        """ Called by the hub when there is something to read """
+        if not self.read(fd):
+            # The host closed the port or the cable was pulled
+            logging.warning("USB: lost /dev/ttyGS0, reopening it")
+            self.hub.remove(fd)
+            os.close(fd)
+            self.rd = self.wr = None
+            self.hub.call_later(REOPEN_DELAY, self.reopen)
 
-    def send_message(self, message):
-        """ Send a message """
-        if self.send_response:
-            if message[-1] != "\n":
-                message += "\n"
-            #logging.debug("USB: "+str(message))
-            self.tty.write(message)
+    def on_line(self, line):
+        Channel.on_line(self, line)
+        self.send_response = True
 
     def close(self):
         """ Stop receiving messages """
-        self.running = False
-        if hasattr(self, 't'):
-            self.t.join()
+        self.closed = True
+        if self.rd is not None:
+            self.hub.remove(self.rd)
+            os.close(self.rd)
+            self.rd = self.wr = None
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+"""
+UnixSocket - a Unix domain socket for OctoPrint, Toggle or other
+front ends on the same board, in place of the virtual tty pipes.
+
+The socket is a plain stream, so there is no pty in between and no
+socat or tty0tty to start. Each host that connects gets a channel of
+its own, named after the socket and a number ("octoprint#1"), so the
+replies to its G-codes go back to it and to no one else. Messages sent
+with Printer.broadcast() go to all the hosts on the socket.
+
+Author: Elias Bakken
+email: elias(dot)bakken(at)gmail(dot)com
+Website: http://www.thing-printer.com
+License: GNU GPL v3: http://www.gnu.org/copyleft/gpl.html
+
+ Redeem is free software: you can redistribute it and/or modify
+ it under the terms of the GNU General Public License as published by
+ the Free Software Foundation, either version 3 of the License, or
+ (at your option) any later version.
+
+ Redeem is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU General Public License for more details.
+
+ You should have received a copy of the GNU General Public License
+ along with Redeem.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import itertools
+import logging
+import os
+import socket
+from CommHub import Channel
+
+
+class UnixConnection(Channel):
+    """ One host connected to a UnixSocket """
+
+    def __init__(self, listener, sock, number):
+        Channel.__init__(self, listener.printer, "{}#{}".format(listener.name, number))
+        self.listener = listener
+        self.sock = sock
+        self.sock.setblocking(0)
+        self.send_response = listener.send_response
+        self.rd = self.wr = sock.fileno()
+
+    def get_message(self, fd):
+        """ Called by the hub when there is something to read """
+        if not self.read(fd):
+            logging.info("%s disconnected", self.prot)
+            self.close()
+
+    def close(self):
+        sock = self.sock
+        if sock is None:
+            return
+        self.sock = None
+        self.wr = None
+        self.printer.comms.pop(self.prot, None)
+        self.listener.connections.pop(self.prot, None)
+        if getattr(self.printer, "telemetry", None):
+            self.printer.telemetry.unsubscribe(self.prot)
+        self.hub.remove(self.rd)
+        self.hub.forget(self.prot)
+        sock.close()
+
+
+class UnixSocket:
+
+    def __init__(self, printer, name, directory, send_response=True):
+        self.printer = printer
+        self.name = name
+        self.send_response = send_response
+        self.hub = printer.comm_hub
+        self.connections = {}         # prot -> UnixConnection
+        self.numbers = itertools.count(1)
+
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        self.path = os.path.join(directory, name + ".sock")
+        if os.path.exists(self.path):
+            os.unlink(self.path)      # Left by a Redeem that did not exit
+        self.s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.s.bind(self.path)
+        os.chmod(self.path, 0o777)    # As the pipes, for the octo user
+        self.s.listen(5)
+        self.s.setblocking(0)
+        self.hub.add_reader(self.s.fileno(), self.accept)
+        logging.info("Unix socket " + self.path + " open")
+
+    def accept(self, fd):
+        """ Called by the hub when a host connects """
+        try:
+            sock, address = self.s.accept()
+        except socket.error:
+            return
+        connection = UnixConnection(self, sock, next(self.numbers))
+        self.connections[connection.prot] = connection
+        self.printer.comms[connection.prot] = connection
+        self.hub.add_reader(connection.rd, connection.get_message)
+        logging.info("%s connected", connection.prot)
+
+    def close(self):
+        for connection in self.connections.values():
+            connection.close()
+        self.hub.remove(self.s.fileno())
+        self.s.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
@@ -20,6 +20,14 @@ import logging
 class G0(GCodeCommand):
 
     def execute(self, g):
+        path = self.make_path(g)
+        if path is not None:
+            # Add the path. This blocks until the path planner has capacity
+            self.printer.path_planner.add_path(path)
+
+    def make_path(self, g):
+        """ The path of the move, without adding it. The buffered
+        loop uses this to add a run of moves at once. """
         if g.has_letter("F"):  # Get the feed rate
             # Convert from mm/min to SI unit m/s
             self.printer.feed_rate = float(g.get_value_by_letter("F"))
@@ -39,10 +47,8 @@ class G0(GCodeCommand):
             path = RelativePath(smds, self.printer.feed_rate * self.printer.factor, self.printer.accel)
         else:
             logging.error("invalid movement: " + str(self.printer.movement))
-            return
-    
-        # Add the path. This blocks until the path planner has capacity
-        self.printer.path_planner.add_path(path)
+            return None
+        return path
 
     def get_description(self):
         return "Control the printer head position as well as the currently " \
@@ -22,20 +22,35 @@ class G28(GCodeCommand):
         
         for i in range(g.num_tokens()):  # Run through all tokens
             axis = g.token_letter(i)                         
-            if self.printer.config.getboolean('Endstops',
-                                              'has_' + axis.lower()):
+            if getattr(self.printer.config.snapshot.Endstops,
+                       'has_' + axis.lower()):
                 axis_home.append(axis)     
 
-        self.printer.path_planner.wait_until_done()
-        self.printer.path_planner.home(axis_home)
+        path_planner = self.printer.path_planner
+        path_planner.wait_until_done()
+        path_planner.home(axis_home)
 
         logging.info("Homing done.")
-        self.printer.send_message(g.prot, "Homing done.")
+        times = ["{}: {:.1f} s".format(axis, seconds) for axis, seconds in
+                 sorted(path_planner.homing_times.iteritems()) if seconds is not None]
+        if times:
+            self.printer.send_message(g.prot, "Homing done. " + ", ".join(times))
+        else:
+            self.printer.send_message(g.prot, "Homing done.")
 
     def get_description(self):
         return "Move the steppers to their homing position (and find it as " \
                "well)"
 
+    def get_long_description(self):
+        return ("Home the given axes, or all axes that have an end stop. "
+                "The axes search, back off and search again at the same "
+                "time, each at its own home_speed and home_backoff_speed "
+                "and no further than its travel_length, "
+                "except X and Y on CoreXY and H-belt printers, which home "
+                "one at a time. The reply has the time from the start "
+                "until the last end stop hit of each axis.")
+
     def is_buffered(self):
         return True
 
@@ -10,32 +10,46 @@ License: CC BY-SA: http://creativecommons.org/licenses/by-sa/2.0/
 
 from GCodeCommand import GCodeCommand
 import logging
+import numpy as np
 try:
     from Gcode import Gcode
     from Path import Path
+    from ProbeEngine import ProbeEngine, ProbeError
+    from BedCompensation import BedCompensation
 except ImportError:
     from redeem.Gcode import Gcode
     from redeem.Path import Path
+    from redeem.ProbeEngine import ProbeEngine, ProbeError
+    from redeem.BedCompensation import BedCompensation
 
 class G29(GCodeCommand):
 
     def execute(self, g):
+        if g.has_letter("M"):
+            self.probe_mesh(g)
+            return
 
-        gcodes = self.printer.config.get("Macros", "G29").split("\n")
-        self.printer.path_planner.wait_until_done()
-        for gcode in gcodes:        
-            G = Gcode({"message": gcode, "prot": g.prot})
-            self.printer.processor.execute(G)
+        plane = None
+        if g.has_letter("C"):
+            plane = self.probe_continuous(g)
+            if plane is False:
+                return
+        else:
+            gcodes = self.printer.config.snapshot.Macros.G29
             self.printer.path_planner.wait_until_done()
+            for gcode in gcodes:
+                G = Gcode({"message": gcode, "prot": g.prot})
+                self.printer.processor.execute(G)
+                self.printer.path_planner.wait_until_done()
 
         logging.debug(self.printer.probe_heights)
 
-        # Remove the offset from the probed points        
+        # Remove the offset from the probed points
         if self.printer.probe_points[0]["X"] == 0 and self.printer.probe_points[0]["Y"] == 0:
-            # If the origin is located in the first probe point, remove that. 
+            # If the origin is located in the first probe point, remove that.
             self.printer.probe_heights -= self.printer.probe_heights[0]
         else:
-            # Else, remove the lowest. 
+            # Else, remove the lowest.
             self.printer.probe_heights -= min(self.printer.probe_heights)
 
         # Log the found heights
@@ -44,24 +58,86 @@ class G29(GCodeCommand):
         logging.info("Found heights: ")
         logging.info(self.printer.probe_points)
 
-        # Add 'S'=simulate To not update the bed matrix.  
+        # Add 'S'=simulate To not update the bed matrix.
         if not g.has_letter("S"):
             # Update the bed compensation matrix
-            Path.update_autolevel_matrix(self.printer.probe_points, self.printer.probe_heights)
+            if plane is not None:
+                Path.set_bed_matrix(BedCompensation.create_matrix_from_plane(plane))
+            else:
+                Path.update_autolevel_matrix(self.printer.probe_points, self.printer.probe_heights)
             logging.debug("New Bed level matrix: ")
             logging.debug(Path.matrix_bed_comp)
 
+    def run_engine(self, g, engine, points):
+        """ Undock the probe, probe the points (x, y in meters) in one
+        go and dock it again. Returns the distances, or None on failure """
+        def report(index, x, y, dist):
+            self.printer.send_message(g.prot,
+                "Found Z probe height {} at (X, Y) = ({}, {})".format(dist, x*1000, y*1000))
+
+        self.printer.processor.execute(Gcode({"message": "G32", "prot": g.prot}))
+        try:
+            return engine.probe(points, report)
+        except ProbeError, e:
+            logging.error("G29: %s", e)
+            self.printer.send_message(g.prot, "Probing failed: {}".format(e))
+            return None
+        finally:
+            self.printer.processor.execute(Gcode({"message": "G31", "prot": g.prot}))
+
+    def probe_continuous(self, g):
+        """ Probe the M557 points without the G29 macro. Returns the
+        plane fitted to the distances as they came in, None if they are
+        on a line, or False on failure. """
+        points = [(p["X"]/1000.0, p["Y"]/1000.0) for p in self.printer.probe_points]
+        engine = ProbeEngine(self.printer)
+        distances = self.run_engine(g, engine, points)
+        if distances is None:
+            return False
+        self.printer.probe_heights = np.array(distances)
+        return engine.plane.solve()
+
+    def probe_mesh(self, g):
+        """ Probe the grid from the config and make it the bed mesh """
+        nx, ny = self.printer.bed_mesh_shape()
+        mesh = self.printer.make_bed_mesh(np.zeros((ny, nx)))
+        grid = mesh.points()
+        distances = self.run_engine(g, ProbeEngine(self.printer), [(x, y) for _, _, x, y in grid])
+        if distances is None:
+            return
+
+        # A longer probe distance means a lower bed. Heights are relative
+        # to the point nearest the origin, where Z is usually set.
+        heights = np.zeros((ny, nx))
+        for (i, j, _, _), dist in zip(grid, distances):
+            heights[j, i] = -dist
+        origin = min(grid, key=lambda p: p[2]**2 + p[3]**2)
+        heights -= heights[origin[1], origin[0]]
+        self.printer.send_message(g.prot, "Bed mesh (mm), one row per Y:")
+        for row in heights:
+            self.printer.send_message(g.prot, " ".join("{:.3f}".format(h*1000) for h in row))
+
+        if not g.has_letter("S"):
+            Path.bed_mesh = self.printer.make_bed_mesh(heights)
+
     def get_description(self):
         return "Probe the bed at specified points"
 
     def get_long_description(self):
         return ("Probe the bed at specified points and "
                 "update the bed compensation matrix based "
-                "on the found points. Add 'S' to NOT update the bed matrix.")
+                "on the found points. Add 'S' to NOT update the bed matrix. "
+                "With 'C', the points set with M557 are probed in one "
+                "continuous run instead of running the G29 macro: "
+                "home and move to the probing height first. "
+                "With 'M', the bed_mesh grid in the [Geometry] section "
+                "is probed the same way and used for mesh bed compensation. "
+                "Use M500 to save the mesh and M561 to clear it. "
+                "[Probe] samples, retries and tolerance set how often "
+                "each point is probed.")
 
     def is_buffered(self):
         return True
 
     def get_test_gcodes(self):
         return ["G29"]
-
@@ -33,27 +33,29 @@ class G30(GCodeCommand):
         if g.has_letter("Z"): # Override Z
             point["Z"] = float(g.get_value_by_letter("Z"))        
 
+        probe = self.printer.config.snapshot.Probe
+
         # Get probe length, if present, else use 1 cm. 
         if g.has_letter("D"):
             probe_length = float(g.get_value_by_letter("D"))
         else:
-            probe_length = self.printer.config.getfloat('Probe', 'length')
+            probe_length = probe.length
 
         # Get probe speed. If not preset, use printers curent speed. 
         if g.has_letter("F"):
             probe_speed = float(g.get_value_by_letter("F")) / 60000.0
         else:
-            probe_speed = self.printer.config.getfloat('Probe', 'length')
+            probe_speed = probe.speed
         
         # Get acceleration. If not present, use value from config.        
         if g.has_letter("A"):
             probe_accel = float(g.get_value_by_letter("A"))
         else:
-            probe_accel = self.printer.config.getfloat('Probe', 'accel')
+            probe_accel = probe.accel
         
         # Find the Probe offset
-        offset_x = self.printer.config.getfloat('Probe', 'offset_x')*1000
-        offset_y = self.printer.config.getfloat('Probe', 'offset_y')*1000
+        offset_x = probe.offset_x*1000
+        offset_y = probe.offset_y*1000
 
         # Move to the position
         G0 = Gcode({"message": "G0 X{} Y{} Z{}".format(point["X"]+offset_x, point["Y"]+offset_y, point["Z"]), "prot": g.prot})    
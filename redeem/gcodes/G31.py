@@ -18,7 +18,7 @@ except ImportError:
 class G31(GCodeCommand):
 
     def execute(self, g):
-        gcodes = self.printer.config.get("Macros", "G31").split("\n")
+        gcodes = self.printer.config.snapshot.Macros.G31
         self.printer.path_planner.wait_until_done()
         for gcode in gcodes:        
             G = Gcode({"message": gcode, "prot": g.prot})
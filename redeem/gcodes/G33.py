@@ -0,0 +1,130 @@
+"""
+GCode G33
+Delta auto calibration
+
+Author: Elias Bakken
+email: elias(dot)bakken(at)gmail dot com
+Website: http://www.thing-printer.com
+License: CC BY-SA: http://creativecommons.org/licenses/by-sa/2.0/
+"""
+
+from GCodeCommand import GCodeCommand
+import logging
+try:
+    from Gcode import Gcode
+    from Path import Path
+    from Delta import Delta
+    from DeltaCalibration import DeltaCalibration, pattern
+    from ProbeEngine import ProbeEngine, ProbeError
+except ImportError:
+    from redeem.Gcode import Gcode
+    from redeem.Path import Path
+    from redeem.Delta import Delta
+    from redeem.DeltaCalibration import DeltaCalibration, pattern
+    from redeem.ProbeEngine import ProbeEngine, ProbeError
+
+
+class G33(GCodeCommand):
+
+    def execute(self, g):
+        if Path.axis_config != Path.AXIS_CONFIG_DELTA:
+            g.set_answer("ok G33 is only for delta printers")
+            return
+
+        config = self.printer.config.snapshot.Delta
+        factors = g.get_int_by_letter("F", config.calibration_factors)
+        count = g.get_int_by_letter("P", config.calibration_points)
+        if g.has_letter("R"):
+            radius = g.get_float_by_letter("R", 0)/1000.0
+        else:
+            radius = config.calibration_radius
+
+        try:
+            calibration = DeltaCalibration(factors)
+        except ValueError, e:
+            g.set_answer("ok {}".format(e))
+            return
+        if count <= factors:
+            g.set_answer("ok {} factors need more than {} points".format(factors, factors))
+            return
+        points = pattern(radius, count)
+
+        planner = self.printer.path_planner
+        planner.wait_until_done()
+        z = planner.get_current_pos()["Z"]
+        probe = self.printer.config.snapshot.Probe
+
+        def report(index, x, y, dist):
+            self.printer.send_message(g.prot,
+                "Found Z probe height {} at (X, Y) = ({}, {})".format(dist, x*1000, y*1000))
+
+        self.printer.processor.execute(Gcode({"message": "G32", "prot": g.prot}))
+        try:
+            distances = ProbeEngine(self.printer).probe(points, report)
+        except ProbeError, e:
+            logging.error("G33: %s", e)
+            g.set_answer("ok Probing failed: {}".format(e))
+            return
+        finally:
+            self.printer.processor.execute(Gcode({"message": "G31", "prot": g.prot}))
+
+        # Where the effector was, as far as the printer knows, when the probe triggered
+        probed = [(x + probe.offset_x, y + probe.offset_y, z - dist)
+                  for (x, y), dist in zip(points, distances)]
+        try:
+            geometry = calibration.solve(probed)
+        except ValueError, e:
+            g.set_answer("ok {}".format(e))
+            return
+
+        self.printer.send_message(g.prot,
+            "Deviation before: {:.3f} mm, after: {:.3f} mm, {} iterations".format(
+                calibration.rms_before*1000, calibration.rms_after*1000, calibration.iterations))
+        for name in calibration.names:
+            self.printer.send_message(g.prot, "{} = {:.3f} mm".format(name, geometry[name]*1000))
+
+        if g.has_letter("S"):
+            return
+        self.apply(geometry, calibration.names)
+        g.set_answer("ok Delta calibration applied, use M500 to save it")
+
+    def apply(self, geometry, names):
+        """ Set the fitted Delta attributes and endstop offsets """
+        planner = self.printer.path_planner
+        for name in names:
+            if name.startswith("endstop_"):
+                axis = name[-1]
+                # The offset is where the carriage is set to when homed,
+                # negated when homing towards the negative end.
+                if Path.home_speed[Path.axis_to_index(axis)] < 0:
+                    planner.center_offset[axis] += geometry[name]
+                else:
+                    planner.center_offset[axis] -= geometry[name]
+            else:
+                setattr(Delta, name, geometry[name])
+        Delta.recalculate()
+
+    def get_description(self):
+        return "Delta auto calibration"
+
+    def get_long_description(self):
+        return ("Probe the bed on a pattern of points and fit the delta "
+                "geometry to them with least squares. "
+                "Home, clear the bed compensation (M561) and move to the "
+                "probing height first. "
+                "F sets the number of factors: 3 (endstop offsets), "
+                "4 (and the radius), 6 (and the tangential errors of "
+                "columns A and B), 7 (and the rod length) or 9 (and the "
+                "radial errors of columns A and B). "
+                "P sets the number of points and R the radius of the "
+                "pattern in mm. The defaults are calibration_factors, "
+                "calibration_points and calibration_radius in the "
+                "[Delta] section. "
+                "The new geometry is applied, and M666 offsets updated, "
+                "unless 'S' is given. Use M500 to save it.")
+
+    def is_buffered(self):
+        return True
+
+    def get_test_gcodes(self):
+        return ["G33 S"]
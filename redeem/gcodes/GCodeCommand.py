@@ -33,6 +33,12 @@ class GCodeCommand(object):
         false to be executed immediately """
         return False
 
+    def is_realtime(self):
+        """ Return true if the command is executed by the thread that
+        receives it, ahead of the commands in the queues. Only for
+        short commands that must not wait, like an emergency stop. """
+        return False
+
     def is_sync(self):
         """ Return true if the command requires realtime synchronization with command execution """
         return False
@@ -21,3 +21,6 @@ class M112(GCodeCommand):
 
     def is_buffered(self):
         return False
+
+    def is_realtime(self):
+        return True
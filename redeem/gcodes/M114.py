@@ -13,8 +13,7 @@ from GCodeCommand import GCodeCommand
 
 class M114(GCodeCommand):
     def execute(self, g):
-        g.set_answer("ok C: " + ' '.join('%s:%s' % i for i in sorted(
-                self.printer.path_planner.get_current_pos().iteritems())))
+        g.set_answer("ok " + self.printer.telemetry.position_report())
 
     def get_description(self):
         return "Get current printer head position"
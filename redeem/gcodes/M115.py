@@ -20,7 +20,7 @@ class M115(GCodeCommand):
         firmware_name = "Redeem"
         firmware_version = self.printer.firmware_version
         firmware_url = "http%3A//wiki.thing-printer.com/index.php?title=Redeem"
-        machine_type = self.printer.config.get('System', 'machine_type')
+        machine_type = self.printer.config.snapshot.System.machine_type
         extruder_count = Path.NUM_AXES - 3
         g.set_answer(
             "ok " \
@@ -15,7 +15,7 @@ class M117(GCodeCommand):
     def execute(self, g):
         # This G-code can be used directly
         text = g.message.strip("M117 ")
-        self.printer.comms["toggle"].send_message(text)
+        self.printer.broadcast("toggle", text)
 
     def get_description(self):
         return "Send a message to a connected display"
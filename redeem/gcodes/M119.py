@@ -33,7 +33,7 @@ class M119(GCodeCommand):
             self.printer.config.set('Endstops', 'invert_'+es, str(val))
 
             # Save the config file. 
-            self.printer.config.save('/etc/redeem/local.cfg')
+            self.printer.config.save(self.printer.config_location+'/local.cfg')
 
             # Recompile the firmware
             self.printer.path_planner.pru_firmware.produce_firmware()
@@ -0,0 +1,51 @@
+"""
+GCode M155
+Automatic reports
+
+Author: Elias Bakken
+email: elias.bakken(at)gmail(dot)com
+Website: http://www.thing-printer.com
+License: CC BY-SA: http://creativecommons.org/licenses/by-sa/2.0/
+"""
+
+from GCodeCommand import GCodeCommand
+try:
+    from Telemetry import Telemetry
+except ImportError:
+    from redeem.Telemetry import Telemetry
+
+
+class M155(GCodeCommand):
+
+    def execute(self, g):
+        interval = g.get_float_by_letter("S", 1.0)
+        on_change = g.get_int_by_letter("C", 0) == 1
+        telemetry = self.printer.telemetry
+        if interval <= 0 and not on_change:
+            telemetry.unsubscribe(g.prot)
+            return
+
+        topics = [Telemetry.TEMPERATURE]
+        if g.get_int_by_letter("P", 0) == 1:
+            topics.append(Telemetry.POSITION)
+        if g.get_int_by_letter("A", 0) == 1:
+            topics.append(Telemetry.ALARM)
+        if g.get_int_by_letter("L", 0) == 1:
+            topics.append(Telemetry.LATENCY)
+        telemetry.subscribe(g.prot, topics, max(interval, 0), on_change)
+
+    def get_description(self):
+        return "Automatically report temperatures, position and alarms"
+
+    def get_long_description(self):
+        return ("Subscribe this channel to reports pushed by Redeem, "
+                "instead of polling with M105 and M114. "
+                "S sets the interval in seconds, S0 stops the reports. "
+                "Temperatures are always reported, in the M105 format. "
+                "P1 adds the position in the M114 format, "
+                "A1 adds alarms (only sent when they occur). "
+                "L1 adds the command latencies and queue depths (see M882). "
+                "C1 also sends a report as soon as a value changes.")
+
+    def get_test_gcodes(self):
+        return ["M155 S1 P1 A1", "M155 S0"]
@@ -22,6 +22,9 @@ class M24(GCodeCommand):
     def is_buffered(self):
         return False
 
+    def is_realtime(self):
+        return True
+
 
 class M25(GCodeCommand):
 
@@ -33,3 +36,6 @@ class M25(GCodeCommand):
 
     def is_buffered(self):
         return False
+
+    def is_realtime(self):
+        return True
@@ -13,8 +13,10 @@ License: CC BY-SA: http://creativecommons.org/licenses/by-sa/2.0/
 from GCodeCommand import GCodeCommand
 try:
     from Path import Path
+    import Kinematics
 except ImportError:
     from redeem.Path import Path
+    from redeem import Kinematics
 
 import logging
 
@@ -24,13 +26,16 @@ class M270(GCodeCommand):
     def execute(self, g):
         if g.has_letter("S"):
             axis_config = int(g.get_value_by_letter("S"))
-            if axis_config in [0, 1, 2, 3]:
-                Path.axis_config = axis_config
+            if axis_config in Kinematics.KINEMATICS:
+                Path.set_axis_config(axis_config)
                 logging.info("Coordinate system set to " + str(axis_config))
+            else:
+                g.set_answer("ok Unknown coordinate system {}".format(axis_config))
 
     def get_long_description(self):
         return ("Set coordinate system. Parameter S set the type, which is "
-                "0 = Cartesian, 1 = H-belt, 2 = CoreXY, 3 = Delta")
+                "0 = Cartesian, 1 = H-belt, 2 = CoreXY, 3 = Delta. "
+                "Plugins can add more.")
 
     def get_description(self):
         return "Set coordinate system"
@@ -40,13 +40,27 @@ class M303(GCodeCommand):
         if g.has_letter("C"):
             cycles = int(g.get_value_by_letter("C"))
         else:
-            cycles = 3
-        
+            cycles = 8
+
         tuner = Autotune(heater, temp, cycles, g, self.printer)
+        if g.has_letter("T"):
+            tuner.tolerance = float(g.get_value_by_letter("T"))
+        if g.has_letter("O") and int(g.get_value_by_letter("O")) == 1:
+            tuner.method = Autotune.STEP_RESPONSE
+            if g.has_letter("P"):
+                tuner.step_power = float(g.get_value_by_letter("P"))
         tuner.run()
-        logging.info("Max temp: {}, Min temp: {}, Ku: {}, Pu: {}".format(tuner.max_temp, tuner.min_temp, tuner.Ku, tuner.Pu))
+
+        if not tuner.converged and not tuner.peaks:
+            self.printer.send_message(g.prot, "PID tuning failed, PID values not changed")
+            return
+        if tuner.method == Autotune.STEP_RESPONSE:
+            logging.info("K: {}, tau: {}, theta: {}".format(tuner.K, tuner.tau, tuner.theta))
+            self.printer.send_message(g.prot, "K: {}, tau: {}, theta: {}".format(tuner.K, tuner.tau, tuner.theta))
+        else:
+            logging.info("Max temp: {}, Min temp: {}, Ku: {}, Pu: {}".format(tuner.max_temp, tuner.min_temp, tuner.Ku, tuner.Pu))
+            self.printer.send_message(g.prot,"Max temp: {}, Min temp: {}, Ku: {}, Pu: {}".format(tuner.max_temp, tuner.min_temp, tuner.Ku, tuner.Pu))
         logging.info("P: {}, I: {}, D: {}".format(heater.P, heater.I, heater.D))
-        self.printer.send_message(g.prot,"Max temp: {}, Min temp: {}, Ku: {}, Pu: {}".format(tuner.max_temp, tuner.min_temp, tuner.Ku, tuner.Pu))
         self.printer.send_message(g.prot, "P: {}, I: {}, D: {}".format(heater.P, heater.I, heater.D))
 
     def is_buffered(self):
@@ -66,5 +80,11 @@ class M303(GCodeCommand):
             "E<0 or 1> overrides the extruder. Use E-1 for heated bed. "
             "Default is the 'E' extruder."
             "S overrides the temperature to calibrate for. Default is 100. "
-            "C overrides the number of cycles to run. Default is 3")
+            "C sets the maximum number of cycles to run. Default is 8, "
+            "tuning stops as soon as the last two oscillations agree. "
+            "T sets the agreement tolerance in deg. C. Default is 0.5. "
+            "O1 runs an open loop step response instead and fits "
+            "a first order plus dead time model to it. The step stops "
+            "when the temperature reaches S. P sets the step power "
+            "(0..1). Default is 0.3")
 
@@ -15,7 +15,7 @@ import logging
 class M500(GCodeCommand):
 
     def execute(self, g):
-        self.printer.save_settings('/etc/redeem/local.cfg')
+        self.printer.save_settings(self.printer.config_location+'/local.cfg')
 
     def get_description(self):
         return ("Store parameters to file")
@@ -21,11 +21,11 @@ except ImportError:
 class M561(GCodeCommand):
 
     def execute(self, g):
-        Path.matrix_bed_comp = np.identity(3)
-        Path.matrix_bed_comp_inv = np.linalg.inv(Path.matrix_bed_comp)
+        Path.set_bed_matrix(np.identity(3))
+        Path.bed_mesh = None
 
     def get_description(self):
-        return "Reset bed level matrix to identity"
+        return "Reset bed level matrix to identity and clear the bed mesh"
     
     def get_long_description(self):
         return ("This cancels any bed-plane fitting as the result of probing"
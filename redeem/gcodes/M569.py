@@ -34,7 +34,7 @@ class M569(GCodeCommand):
 
 
         # Save the config file. 
-        self.printer.config.save('/etc/redeem/local.cfg')
+        self.printer.config.save(self.printer.config_location+'/local.cfg')
 
         self.printer.path_planner.wait_until_done()
 
@@ -37,7 +37,7 @@ class M574(GCodeCommand):
             self.printer.config.set('Endstops', 'end_stop_'+es+'_stops', config)
 
             # Save the config file. 
-            self.printer.config.save('/etc/redeem/local.cfg')
+            self.printer.config.save(self.printer.config_location+'/local.cfg')
 
             # Recompile the firmware
             self.printer.path_planner.pru_firmware.produce_firmware()
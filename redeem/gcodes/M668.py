@@ -28,6 +28,7 @@ class M668(GCodeCommand):
             if g.has_letter(axis):
                 Path.backlash_compensation[index] = float(g.get_value_by_letter(axis))/1000.0 # Convert to meters.
                 logging.info("Backlash compensation for axis " + str(axis) + " changed to " + str(Path.backlash_compensation[index]))
+        Path.update_axis_maps()
 
     def get_description(self):
         return "Adjust backlash compensation for each named axis"
@@ -0,0 +1,63 @@
+"""
+GCode M880 and M881
+Start / stop the sampling profiler
+
+Author: Elias Bakken
+email: elias.bakken(at)gmail(dot)com
+Website: http://www.thing-printer.com
+License: CC BY-SA: http://creativecommons.org/licenses/by-sa/2.0/
+"""
+
+from GCodeCommand import GCodeCommand
+
+
+class M880(GCodeCommand):
+
+    def execute(self, g):
+        duration = g.get_float_by_letter("S", 0)
+        rate = g.get_int_by_letter("F", 200)
+        filename = g.get_value_by_letter("P") if g.has_letter_value("P") else None
+        profiler = self.printer.profiler
+        if not profiler.start(duration, max(rate, 1), filename):
+            g.set_answer("ok Profiler already running, writing to " + profiler.filename)
+            return
+        g.set_answer("ok Profiling to " + profiler.filename)
+
+    def get_description(self):
+        return "Start the sampling profiler"
+
+    def get_long_description(self):
+        return ("Sample the stacks of all Redeem threads until M881 is sent. "
+                "S sets a time limit in seconds, after which the profile "
+                "is written by itself. F is the sample rate in Hz (default 200). "
+                "P sets the output file (default /tmp/redeem-profile-<time>.folded). "
+                "The file has one collapsed stack per line, "
+                "for flamegraph.pl or speedscope.")
+
+    def get_test_gcodes(self):
+        return ["M880 S1 F100"]
+
+
+class M881(GCodeCommand):
+
+    def execute(self, g):
+        profiler = self.printer.profiler
+        filename = profiler.stop()
+        if filename is None:
+            g.set_answer("ok Profiler not running")
+            return
+        for name, fraction in profiler.top(5):
+            self.printer.send_message(g.prot, "{:5.1f}% {}".format(fraction*100, name))
+        g.set_answer("ok Profile written to {} ({} samples)".format(
+            filename, profiler.samples))
+
+    def get_description(self):
+        return "Stop the sampling profiler and write the profile"
+
+    def get_long_description(self):
+        return ("Stop the profiler started with M880 and write the profile. "
+                "The reply has the file name and the functions "
+                "seen most often at the top of a stack.")
+
+    def get_test_gcodes(self):
+        return ["M881"]
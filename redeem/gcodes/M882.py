@@ -0,0 +1,47 @@
+"""
+GCode M882
+Report command latencies and queue depths
+
+Author: Elias Bakken
+email: elias.bakken(at)gmail(dot)com
+Website: http://www.thing-printer.com
+License: CC BY-SA: http://creativecommons.org/licenses/by-sa/2.0/
+"""
+
+from GCodeCommand import GCodeCommand
+
+
+class M882(GCodeCommand):
+
+    def execute(self, g):
+        latency = self.printer.latency
+        if g.has_letter("S"):
+            latency.enabled = g.get_int_by_letter("S", 1) == 1
+        if not latency.enabled:
+            g.set_answer("ok Latency stats disabled")
+            return
+        for line in latency.report():
+            self.printer.send_message(g.prot, line)
+        if g.get_int_by_letter("R", 0) == 1:
+            latency.reset()
+
+    def get_description(self):
+        return "Report command latencies and queue depths"
+
+    def get_long_description(self):
+        return ("Report, per G-code and per channel, the number of commands "
+                "and the p50/p99 of the time spent waiting in the queue, "
+                "executing and sending the reply, in microseconds. "
+                "For real-time commands, as M112, the wait is for "
+                "other real-time commands only. "
+                "Then the p50/p99 depth of each command queue, "
+                "as it was when a command was put in it. "
+                "The values are the upper edges of the histogram buckets. "
+                "R1 resets the histograms after the report. "
+                "S0 disables and S1 enables the recording.")
+
+    def is_buffered(self):
+        return False
+
+    def get_test_gcodes(self):
+        return ["M882", "M882 R1"]
@@ -0,0 +1,36 @@
+"""
+GCode M883
+Report the reply queues of the channels
+
+Author: Elias Bakken
+email: elias.bakken(at)gmail(dot)com
+Website: http://www.thing-printer.com
+License: CC BY-SA: http://creativecommons.org/licenses/by-sa/2.0/
+"""
+
+from GCodeCommand import GCodeCommand
+
+
+class M883(GCodeCommand):
+
+    def execute(self, g):
+        for line in self.printer.comm_hub.report():
+            self.printer.send_message(g.prot, line)
+
+    def get_description(self):
+        return "Report the reply queues of the channels"
+
+    def get_long_description(self):
+        return ("Report, per channel, the number of messages queued for the "
+                "host and dropped because the queue was full, the messages "
+                "waiting now and the most that have been waiting, the "
+                "number of writes and bytes written, and write errors. "
+                "Channels without a host, as the simulated ones, are not "
+                "listed. The queue size and what is dropped are set with "
+                "reply_queue_size and reply_queue_overflow in [System].")
+
+    def is_buffered(self):
+        return False
+
+    def get_test_gcodes(self):
+        return ["M883"]
@@ -0,0 +1,41 @@
+"""
+GCode M884
+Report the alarm counters
+
+Author: Elias Bakken
+email: elias.bakken(at)gmail(dot)com
+Website: http://www.thing-printer.com
+License: CC BY-SA: http://creativecommons.org/licenses/by-sa/2.0/
+"""
+
+from GCodeCommand import GCodeCommand
+try:
+    from Alarm import Alarm
+except ImportError:
+    from redeem.Alarm import Alarm
+
+
+class M884(GCodeCommand):
+
+    def execute(self, g):
+        if Alarm.executor is None:
+            g.set_answer("ok No alarm executor")
+            return
+        self.printer.send_message(g.prot, Alarm.executor.report())
+
+    def get_description(self):
+        return "Report the alarm counters"
+
+    def get_long_description(self):
+        return ("Report the number of alarms raised, the number told to "
+                "the hosts, and the repeats that were not told because "
+                "the same alarm from the same heater or stepper was told "
+                "less than alarm_window seconds ago, in [System]. Then the "
+                "p50, p99 and largest time from finding an error to having "
+                "the heaters off, in microseconds.")
+
+    def is_buffered(self):
+        return False
+
+    def get_test_gcodes(self):
+        return ["M884"]
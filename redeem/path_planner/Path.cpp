@@ -42,6 +42,7 @@
     }
     speed = 0;
     accel = 0;
+    moveId = 0;
     fullSpeed = 0;
     invFullSpeed = 0;
     accelerationDistance2 = 0;
@@ -78,6 +79,7 @@
         speeds[axis] = path.speeds[axis];
     }
     speed = path.speed;
+    moveId = path.moveId;
     fullSpeed = path.fullSpeed;
     invFullSpeed = path.invFullSpeed;
     accelerationDistance2 = path.accelerationDistance2;
@@ -252,6 +252,8 @@ public:
 	FLOAT_T startPos[NUM_AXES];
 	FLOAT_T endPos[NUM_AXES];
 
+	unsigned long moveId; // Number of the move, as returned by queueBatchMove
+
 
 	Path();
 	Path(const Path& path);
@@ -97,6 +97,7 @@ PathPlanner::PathPlanner(unsigned int cacheSize) {
 	recomputeParameters();
 	linesCount = 0;
 	linesTicksCount = 0;
+	movesQueued = 0;
 	stop = false;
 }
 
@@ -138,7 +139,7 @@ void PathPlanner::clearSyncEvent(){
 	PyEval_RestoreThread(_save);
 }
 
-void PathPlanner::queueBatchMove(FLOAT_T* batchData, int batchSize, FLOAT_T speed, FLOAT_T accel, bool cancelable, bool optimize /* = true */) {
+unsigned long PathPlanner::queueBatchMove(FLOAT_T* batchData, int batchSize, FLOAT_T speed, FLOAT_T accel, bool cancelable, bool optimize /* = true */) {
     FLOAT_T axis_diff[NUM_AXES];        // Axis movement in m
 	PyThreadState *_save; 
 	_save = PyEval_SaveThread();
@@ -166,7 +167,7 @@ void PathPlanner::queueBatchMove(FLOAT_T* batchData, int batchSize, FLOAT_T spee
 		if(stop){
 		    PyEval_RestoreThread(_save);
 			LOG( "Stopped/aborted/Cancelled while waiting for free move command space. linesCount: " << linesCount << std::endl);
-		    return;
+		    return movesQueued;
 		}
 
 		Path *p = &lines[linesWritePos];
@@ -183,6 +184,9 @@ void PathPlanner::queueBatchMove(FLOAT_T* batchData, int batchSize, FLOAT_T spee
 		p->setCancelable(cancelable);
 		p->setWaitMS(optimize ? printMoveBufferWait : 0);
 		p->dir = 0;		
+		// Numbered before a move without steps is skipped, so the
+		// numbers match the rows of the batches
+		p->moveId = ++movesQueued;
 
 		//Find direction
 		for(int axis=0; axis < NUM_AXES; axis++){
@@ -204,6 +208,16 @@ void PathPlanner::queueBatchMove(FLOAT_T* batchData, int batchSize, FLOAT_T spee
 		
 		if(p->isNoMove()){
 			LOG( "Warning: no move path" << std::endl);
+			// Done with the move before it
+			if(linesQueued) {
+				unsigned int previous = linesWritePos;
+				previousPlannerIndex(previous);
+				lines[previous].moveId = p->moveId;
+				if((segment_index + 1) == numSegments)
+					commitLines(linesQueued, linesTicksQueued);
+			} else {
+				markMoveDone(p->moveId);
+			}
 			continue; // No steps included
 		}
 
@@ -246,26 +260,43 @@ void PathPlanner::queueBatchMove(FLOAT_T* batchData, int batchSize, FLOAT_T spee
 		if((linesCacheRemaining == 0) || 
             ((segment_index + 1) == numSegments) || 
             linesTicksRemaining <= 0){
-			{
-                std::lock_guard<std::mutex> lk(line_mutex);
-                linesCount += linesQueued;
-                linesTicksCount += linesTicksQueued;
-			}
-			linesQueued = 0;
-            linesTicksQueued = 0;
-			lineAvailable.notify_all();
+			commitLines(linesQueued, linesTicksQueued);
 		}
 		//LOG( "Line finished (" << linesQueued << " lines ready)." << std::endl);
 	}
 	//LOG( "End batch queuing move command" << std::endl);
 	PyEval_RestoreThread(_save);
+	return movesQueued;
+}
+
+void PathPlanner::commitLines(unsigned int &linesQueued, long &linesTicksQueued) {
+	{
+		std::lock_guard<std::mutex> lk(line_mutex);
+		linesCount += linesQueued;
+		linesTicksCount += linesTicksQueued;
+	}
+	linesQueued = 0;
+	linesTicksQueued = 0;
+	lineAvailable.notify_all();
 }
 
-void PathPlanner::queueMove(FLOAT_T startPos[NUM_AXES],FLOAT_T endPos[NUM_AXES], FLOAT_T speed, FLOAT_T accel, bool cancelable, bool optimize) {
+void PathPlanner::markMoveDone(unsigned long moveId) {
+	std::lock_guard<std::mutex> lk(line_mutex);
+	if(linesCount) {
+		// Done with the last line, see run()
+		unsigned int last = linesWritePos;
+		previousPlannerIndex(last);
+		lines[last].moveId = moveId;
+	} else {
+		pru.markMoveDone(moveId);
+	}
+}
+
+unsigned long PathPlanner::queueMove(FLOAT_T startPos[NUM_AXES],FLOAT_T endPos[NUM_AXES], FLOAT_T speed, FLOAT_T accel, bool cancelable, bool optimize) {
 	FLOAT_T temp[NUM_AXES * 2];
 	memcpy(temp, startPos, sizeof(FLOAT_T)*NUM_AXES);
 	memcpy(&temp[NUM_AXES], endPos, sizeof(FLOAT_T)*NUM_AXES);	
-	queueBatchMove( temp, NUM_AXES*2, speed, accel, cancelable, optimize);
+	return queueBatchMove( temp, NUM_AXES*2, speed, accel, cancelable, optimize);
 }
 
 FLOAT_T PathPlanner::safeSpeed(Path* p){
@@ -615,6 +646,27 @@ void PathPlanner::reset() {
 	pru.reset();
 }
 
+void PathPlanner::flush() {
+    Py_BEGIN_ALLOW_THREADS
+	{
+		// The PRU is reset with the lines locked, so the run thread sees
+		// either the old lines and the old reset count, or neither
+		std::unique_lock<std::mutex> lk(line_mutex);
+		// Start the new lines clear of the one the run thread may be working on
+		unsigned int pos = linesWritePos;
+		if(pos == linesPos)
+			nextPlannerIndex(pos);
+		linesPos = pos;
+		linesWritePos = pos;
+		linesCount = 0;
+		linesTicksCount = 0;
+		pru.reset();
+		pru.setMovesDone(movesQueued);
+	}
+	lineAvailable.notify_all();
+    Py_END_ALLOW_THREADS
+}
+
 void PathPlanner::run() {
 	bool waitUntilFilledUp = true;
 	
@@ -622,6 +674,7 @@ void PathPlanner::run() {
 		std::unique_lock<std::mutex> lk(line_mutex);		
 		lineAvailable.wait(lk, [this]{return linesCount>0 || stop;});		
 		Path* cur = &lines[linesPos];
+		unsigned long resets = pru.getResets();
 		
 		// If the buffer is half or more empty and the line to print is an optimized one, 
         // wait for 500 ms again so that we can get some other path in the path planner buffer, 
@@ -770,10 +823,24 @@ void PathPlanner::run() {
 		
 		LOG( "Sending " << std::dec << linesPos << ", Start speed=" << cur->startSpeed << ", end speed="<<cur->endSpeed << ", nb steps = " << cur->stepsRemaining << std::endl);
 		
-		pru.push_block((uint8_t*)cur->commands.data(), sizeof(SteppersCommand)*cur->stepsRemaining, sizeof(SteppersCommand), linesPos, cur->timeInTicks);
+		unsigned long moveId;
+		{
+			std::lock_guard<std::mutex> guard(line_mutex);
+			moveId = cur->moveId;
+		}
+		pru.push_block((uint8_t*)cur->commands.data(), sizeof(SteppersCommand)*cur->stepsRemaining, sizeof(SteppersCommand), linesPos, cur->timeInTicks, resets, moveId);
 		//LOG( "Done sending with " << std::dec << linesPos << std::endl);
 		
-		removeCurrentLine();
+		{
+			// After a flush, the line is gone already
+			std::lock_guard<std::mutex> guard(line_mutex);
+			if(resets == pru.getResets()) {
+				// Moves without steps queued while it was pushed are done with it
+				if(cur->moveId != moveId)
+					pru.markMoveDone(cur->moveId);
+				removeCurrentLine();
+			}
+		}
 		lineAvailable.notify_all();
 	}
 }
@@ -58,6 +58,7 @@ private:
 	FLOAT_T axisStepsPerM[NUM_AXES];
 
 	std::atomic_uint_fast32_t linesPos; // Position for executing line movement
+	unsigned long movesQueued; // Number of the last move queued
 	std::atomic_uint_fast32_t linesWritePos; // Position where we write the next cached line move
 	std::atomic_uint_fast32_t linesCount;      ///< Number of lines cached 0 = nothing to do.
     std::atomic<long> linesTicksCount;
@@ -86,6 +87,12 @@ private:
         --linesCount;
     }
 
+	// Hand the lines queued to the run() thread
+	void commitLines(unsigned int &linesQueued, long &linesTicksQueued);
+
+	// A move without steps is done with the last line queued, or with the PRU if there is none
+	void markMoveDone(unsigned long moveId);
+
     inline bool isLinesBufferFilled(){
         return linesTicksCount >= (F_CPU/1000)*maxBufferedMoveTime;
     }
@@ -161,8 +168,9 @@ public:
 	 * @param speed The feedrate (aka speed) of the move in m/s
      * @param cancelable flags the move as cancelable.
      * @param optimize Wait for additional commands to fill the buffer, to optimize speed.
+	 * @return The number of the move, see getMovesDone
 	 */
-	void queueMove(FLOAT_T startPos[NUM_AXES], FLOAT_T endPos[NUM_AXES], FLOAT_T speed, FLOAT_T accel, bool cancelable, bool optimize=true );
+	unsigned long queueMove(FLOAT_T startPos[NUM_AXES], FLOAT_T endPos[NUM_AXES], FLOAT_T speed, FLOAT_T accel, bool cancelable, bool optimize=true );
 
 	/**
 	 * @brief Queue a batch of line moves for execution
@@ -176,8 +184,28 @@ public:
 	 * @param segments Block of FLOAT_T* line segments with startPos, endPos, and speed, for each segment
 	 * @param cancelable flags the entire group of moves as cancelable.
 	 * @param optimize Waits upto PRINT_MOVE_BUFFER_WAIT to perform speed optimization on an entire group of moves.
+	 * @return The number of the last move of the batch. The moves are numbered from 1,
+	 * one number per move queued, also for the moves that do not make a step.
 	 */
-	void queueBatchMove(FLOAT_T* batchData, int batchSize, FLOAT_T speed, FLOAT_T accel, bool cancelable, bool optimize=true);
+	unsigned long queueBatchMove(FLOAT_T* batchData, int batchSize, FLOAT_T speed, FLOAT_T accel, bool cancelable, bool optimize=true);
+
+	/**
+	 * @brief The number of the last move the PRU has done
+	 * @details Also published in the PRU shared RAM, for PruInterface.get_moves_done.
+	 * The moves dropped by flush() count as done.
+	 */
+	unsigned long getMovesDone() {
+		return pru.getMovesDone();
+	}
+
+	/**
+	 * @brief Set where the number of the last move done is published
+	 * @details The offset is in the PRU-ICSS, as PruInterface reads it, and in the PRU shared RAM.
+	 * Call it before runThread.
+	 */
+	void setMovesDoneOffset(unsigned long offset) {
+		pru.setMovesDoneOffset(offset);
+	}
 	
 	/**
 	 * @brief Run the path planner thread
@@ -305,6 +333,14 @@ public:
 
 	void reset();
 	
+	/**
+	 * @brief Drop all the queued moves and reset the PRU
+	 * @details Drop the moves in the path planner and in the PRU, and start the PRU over with an empty
+	 * command buffer. The firmware, the settings and the threads are kept, so moves can be queued again
+	 * right away. The PRU runs again afterwards, even if it was suspended.
+	 */
+	void flush();
+	
 	virtual ~PathPlanner();
 
 };
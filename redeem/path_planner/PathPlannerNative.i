@@ -136,8 +136,10 @@ public:
 	bool queueSyncEvent(bool isBlocking = true);
     int waitUntilSyncEvent();
     void clearSyncEvent();
-    void queueMove(FLOAT_T startPos[NUM_AXES], FLOAT_T endPos[NUM_AXES], FLOAT_T speed, FLOAT_T accel, bool cancelable, bool optimize);
-	void queueBatchMove(FLOAT_T* batchData, int batchSize, FLOAT_T speed, FLOAT_T accel, bool cancelable, bool optimize);
+    unsigned long queueMove(FLOAT_T startPos[NUM_AXES], FLOAT_T endPos[NUM_AXES], FLOAT_T speed, FLOAT_T accel, bool cancelable, bool optimize);
+	unsigned long queueBatchMove(FLOAT_T* batchData, int batchSize, FLOAT_T speed, FLOAT_T accel, bool cancelable, bool optimize);
+	unsigned long getMovesDone();
+	void setMovesDoneOffset(unsigned long offset);
     void runThread();
     void stopThread(bool join);
     void waitUntilFinished();
@@ -152,6 +154,7 @@ public:
     void suspend();
     void resume();
     void reset();
+    void flush();
     virtual ~PathPlanner();
 
 };
@@ -42,6 +42,10 @@
 
 #define DDR_MAGIC			0xbabe7175
 
+// Where prussdrv_map_prumem(PRUSS0_SHARED_DATARAM) maps, in the PRU-ICSS
+#define PRU_SHARED_DATARAM_OFFSET	0x10000
+#define PRU_SHARED_DATARAM_SIZE		(12*1024)
+
 PruTimer::PruTimer() {
 	ddr_mem = 0;
 	mem_fd=-1;
@@ -50,6 +54,11 @@ PruTimer::PruTimer() {
 	totalQueuedMovesTime = 0;
 	ddr_mem_used = 0;
 	stop = false;
+	resets = 0;
+	movesDone = 0;
+	sharedRam = 0;
+	movesDoneOffset = 0;
+	sharedMovesDone = 0;
 }
 
 bool PruTimer::initPRU(const std::string &firmware_stepper, const std::string &firmware_endstops) {
@@ -164,6 +173,14 @@ bool PruTimer::initPRU(const std::string &firmware_stepper, const std::string &f
 	ddr_mem_end = ddr_mem+ddr_size-8;
 	pru_control = (uint32_t*)(ddr_mem+ddr_size-8);
 	
+	void* sharedRamMap = NULL;
+	if(prussdrv_map_prumem(PRUSS0_SHARED_DATARAM, &sharedRamMap) == 0) {
+		sharedRam = (uint8_t*)sharedRamMap;
+		setMovesDoneOffset(movesDoneOffset);
+	} else {
+		LOG( "[WARNING] Unable to map the PRU shared RAM, the moves done are not published" << std::endl);
+	}
+	
 	initalizePRURegisters();
 	
 	//bzero(ddr_mem, ddr_size);
@@ -195,10 +212,38 @@ bool PruTimer::initPRU(const std::string &firmware_stepper, const std::string &f
 	blocksID = std::queue<BlockDef>();
 	currentNbEvents = 0;
 	totalQueuedMovesTime = 0;
+	setMovesDone(0);
 	
 	return true;
 }
 
+void PruTimer::setMovesDone(unsigned long moveId) {
+	movesDone = moveId;
+	if(sharedMovesDone)
+		*sharedMovesDone = (uint32_t)moveId;
+}
+
+void PruTimer::setMovesDoneOffset(unsigned long offset) {
+	movesDoneOffset = offset;
+	if(!sharedRam || !offset)
+		return;
+	if(offset < PRU_SHARED_DATARAM_OFFSET || offset+4 > PRU_SHARED_DATARAM_OFFSET+PRU_SHARED_DATARAM_SIZE) {
+		LOG( "[WARNING] Offset 0x" << std::hex << offset << std::dec << " is not in the PRU shared RAM, the moves done are not published" << std::endl);
+		sharedMovesDone = 0;
+		return;
+	}
+	sharedMovesDone = (uint32_t*)(sharedRam+offset-PRU_SHARED_DATARAM_OFFSET);
+	*sharedMovesDone = (uint32_t)movesDone;
+}
+
+void PruTimer::markMoveDone(unsigned long moveId) {
+	std::lock_guard<std::mutex> lk(mutex_memory);
+	if(blocksID.empty())
+		setMovesDone(moveId);
+	else
+		blocksID.back().moveId = moveId;
+}
+
 void PruTimer::initalizePRURegisters() {
 	*((uint32_t*)ddr_write_location)=0; //So that the PRU waits
 	*ddr_nr_events = 0;
@@ -223,9 +268,14 @@ PruTimer::~PruTimer() {
 void PruTimer::reset() {
 	std::unique_lock<std::mutex> lk(mutex_memory);
 	
+	if(!ddr_mem)
+		return;
+	
 	prussdrv_pru_disable(0);
 	prussdrv_pru_disable(1);
 	
+	// Start over at the beginning of the DDR, where the PRU starts reading
+	ddr_write_location = ddr_mem;
 	initalizePRURegisters();
 	
 	/* Execute firmwares on PRU */
@@ -246,6 +296,10 @@ void PruTimer::reset() {
 	currentNbEvents = 0;
 	
 	blocksID = std::queue<BlockDef>();
+	resets++;
+	
+	// Wake up the path planner if it waits for room in the DDR
+	blockAvailable.notify_all();
 }
 
 void PruTimer::runThread() {
@@ -302,7 +356,7 @@ unit - stepSize in bytes.
 pathID - linespos. 
 totalTime - time it takes to complete the current block, in ticks. 
 */
-void PruTimer::push_block(uint8_t* blockMemory, size_t blockLen, unsigned int unit, unsigned int pathID, unsigned long totalTime) {
+void PruTimer::push_block(uint8_t* blockMemory, size_t blockLen, unsigned int unit, unsigned int pathID, unsigned long totalTime, unsigned long resetCount, unsigned long moveId) {
 	
 	if(!ddr_write_location) 
         return;
@@ -330,6 +384,9 @@ void PruTimer::push_block(uint8_t* blockMemory, size_t blockLen, unsigned int un
 		
 		size_t currentBlockSize;
 		
+		// The move is done when its last block is
+		unsigned long blockMoveId = i+1<nbBlocks ? 0 : moveId;
+		
 		if(i+1<nbBlocks) {
 			currentBlockSize = blockSize;
 		} else {
@@ -344,7 +401,8 @@ void PruTimer::push_block(uint8_t* blockMemory, size_t blockLen, unsigned int un
 			std::unique_lock<std::mutex> lk(mutex_memory);
 			blockAvailable.wait(lk, [this,currentBlockSize]{ return ddr_size-ddr_mem_used-8>=currentBlockSize+12 || stop; });
 			
-			if(!ddr_mem || stop) return;
+			// A reset since the block was made drops it
+			if(!ddr_mem || stop || resetCount != resets) return;
 			
 			
 			//Copy at the right location
@@ -393,7 +451,7 @@ void PruTimer::push_block(uint8_t* blockMemory, size_t blockLen, unsigned int un
 				
 				assert(maxSize>0);
 				unsigned long t = currentBlockSize-maxSize > 0 ? totalTime/2 : totalTime;
-				blocksID.emplace(maxSize+4,t); //FIXME: TotalTime is not /2 but doesn't it to be precise to make it work...
+				blocksID.emplace(maxSize+4,t,currentBlockSize-maxSize > 0 ? 0 : blockMoveId); //FIXME: TotalTime is not /2 but doesn't it to be precise to make it work...
 				
 				ddr_mem_used+=maxSize+4;
 				totalQueuedMovesTime += t;
@@ -456,7 +514,7 @@ void PruTimer::push_block(uint8_t* blockMemory, size_t blockLen, unsigned int un
 					assert(remainingSize == (remainingSize/unit)*unit);
 
 					
-					blocksID.emplace(remainingSize+4,totalTime-t); //FIXME: TotalTime is not /2 but doesn't it to be precise to make it work...
+					blocksID.emplace(remainingSize+4,totalTime-t,blockMoveId); //FIXME: TotalTime is not /2 but doesn't it to be precise to make it work...
 					
 					ddr_mem_used+=remainingSize+4;
 					totalQueuedMovesTime += totalTime-t;
@@ -501,7 +559,7 @@ void PruTimer::push_block(uint8_t* blockMemory, size_t blockLen, unsigned int un
 				
 				
 			} else {
-				blocksID.emplace(currentBlockSize+4,totalTime); //FIXME: TotalTime is not /2 but doesn't it to be precise to make it work...
+				blocksID.emplace(currentBlockSize+4,totalTime,blockMoveId); //FIXME: TotalTime is not /2 but doesn't it to be precise to make it work...
 				ddr_mem_used+=currentBlockSize+4;
 				totalQueuedMovesTime += totalTime;
 				//First copy the data
@@ -594,6 +652,8 @@ void PruTimer::run() {
 				BlockDef & front = blocksID.front();
 				ddr_mem_used-=front.size;
 				totalQueuedMovesTime -=front.totalTime;
+				if(front.moveId)
+					setMovesDone(front.moveId);
 				assert(ddr_mem_used<ddr_size);
 //				LOG( "Block of size " << std::dec << front.size << " and time " << front.totalTime << " done." << std::endl);
 				blocksID.pop();
@@ -16,6 +16,7 @@
 #include <string.h>
 #include <strings.h>
 #include <condition_variable>
+#include <atomic>
 #include "Logger.h"
 
 //#define DEMO_PRU
@@ -26,7 +27,8 @@ class PruTimer {
 	public:
 		unsigned long size;
 		unsigned long totalTime;
-		BlockDef(unsigned long size, unsigned long totalTime) : size(size),totalTime(totalTime) {}
+		unsigned long moveId; // Set on the last block of a move, 0 otherwise
+		BlockDef(unsigned long size, unsigned long totalTime, unsigned long moveId=0) : size(size),totalTime(totalTime),moveId(moveId) {}
 	};
 	
 	std::string firmwareStepper, firmwareEndstop;
@@ -55,6 +57,13 @@ class PruTimer {
 	std::thread runningThread;
 	bool stop;
 	
+	std::atomic_ulong resets; // Number of reset() calls, blocks pushed from before one are dropped
+	
+	std::atomic_ulong movesDone; // Number of the last move done
+	uint8_t* sharedRam; // The PRU shared RAM, mapped
+	unsigned long movesDoneOffset; // Where Python reads the moves done, in the PRU-ICSS
+	uint32_t* sharedMovesDone; // movesDone again, at movesDoneOffset
+	
 #ifdef DEMO_PRU
 	uint8_t *currentReadingAddress;
 #endif
@@ -92,7 +101,24 @@ public:
 	
 	void reset();
 	
-	void push_block(uint8_t* blockMemory, size_t blockLen, unsigned int unit, unsigned int pathID, unsigned long totalTime);
+	unsigned long getResets() {
+		return resets;
+	}
+	
+	unsigned long getMovesDone() {
+		return movesDone;
+	}
+	
+	void setMovesDone(unsigned long moveId);
+	
+	// Where PruInterface reads the moves done, as an offset in the PRU-ICSS.
+	// Set it before the run threads are started.
+	void setMovesDoneOffset(unsigned long offset);
+	
+	// The move is done with the last block queued, or now if there is none
+	void markMoveDone(unsigned long moveId);
+	
+	void push_block(uint8_t* blockMemory, size_t blockLen, unsigned int unit, unsigned int pathID, unsigned long totalTime, unsigned long resetCount, unsigned long moveId=0);
 };
 
 #endif /* defined(__PathPlanner__PruTimer__) */
@@ -1,16 +1,24 @@
 
 import glob
 import logging
+import os
 
 # Charts for different thermistors.
 temp_chart = {}
+loaded_from = set()
 
-# get a list 
-files = glob.glob("/etc/redeem/*.cht")
 
-if not files:
-    logging.warning("no temperature charts found in /etc/redeem/")
-else:
-    # load all temperature charts
+def load_charts(location="/etc/redeem"):
+    """ Load all the temperature charts (*.cht) found in location """
+    location = os.path.realpath(location)
+    if location in loaded_from:
+        return
+    loaded_from.add(location)
+    files = glob.glob(os.path.join(location, "*.cht"))
+    if not files:
+        logging.warning("no temperature charts found in "+location)
     for f in files:
-        execfile(f)
\ No newline at end of file
+        execfile(f, {"temp_chart": temp_chart})
+
+
+load_charts()
@@ -0,0 +1,772 @@
+from redeem.Simulator import Simulator
+
+import time
+
+
+def wait_for(condition, timeout=10):
+    end = time.time() + timeout
+    while time.time() < end:
+        try:
+            if condition():
+                return True
+        except RuntimeError:
+            pass    # The messages changed while looking at them
+        time.sleep(0.1)
+    return False
+
+
+def test_simulated_gcodes():
+    sim = Simulator()
+    r = sim.make_redeem()
+    r.start()
+    testing = sim.channels["testing"]
+    for line in ["G28", "G1 X10 Y10 F3000", "M400", "M114"]:
+        sim.send(line)
+    assert wait_for(lambda: any(m.startswith("ok C:") for m in testing.messages))
+    assert r.printer.path_planner.native_planner.moves > 0
+    sim.set_endstop("X1", True)
+    assert wait_for(lambda: r.printer.end_stops["X1"].hit)
+    r.exit()
+    sim.close()
+
+
+def test_simulated_heater():
+    sim = Simulator()
+    r = sim.make_redeem()
+    r.start()
+    heater = r.printer.heaters["E"]
+    start = heater.get_temperature()
+    sim.send("M104 S200")
+    assert wait_for(lambda: heater.get_temperature() > start + 10)
+    r.exit()
+    sim.close()
+
+
+def test_profiler(tmpdir):
+    sim = Simulator()
+    r = sim.make_redeem()
+    r.start()
+    testing = sim.channels["testing"]
+    filename = str(tmpdir.join("profile.folded"))
+    sim.send("M880 F500 P" + filename)
+    sim.send("G1 X20 Y20 F3000")
+    sim.send("M881")
+    assert wait_for(lambda: any("Profile written" in m for m in testing.messages))
+    lines = open(filename).read().splitlines()
+    assert lines
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    r.exit()
+    sim.close()
+
+
+def test_latency_report():
+    sim = Simulator()
+    r = sim.make_redeem()
+    r.start()
+    testing = sim.channels["testing"]
+    sim.send("G1 X10 F3000")
+    sim.send("M105")
+    assert wait_for(lambda: len(testing.messages) >= 2)
+    sim.send("M882")
+    assert wait_for(lambda: any(m.startswith("queue sync_commands") for m in testing.messages))
+    assert any(m.startswith("G1 n:1 ") for m in testing.messages)
+    assert any(m.startswith("channel testing ") for m in testing.messages)
+    r.exit()
+    sim.close()
+
+
+def test_realtime_commands():
+    sim = Simulator()
+    r = sim.make_redeem()
+    r.start()
+    testing = sim.channels["testing"]
+    planner = r.printer.path_planner.native_planner
+    try:
+        sim.send("G4 P1000")
+        # Done by the time send() returns, ahead of the dwell
+        sim.send("M25")
+        assert planner.suspended
+        assert list(testing.messages) == ["ok"]
+        sim.send("M24")
+        assert not planner.suspended
+        assert wait_for(lambda: len(testing.messages) == 3)
+        counts = r.printer.latency.by_code["M25"]
+        assert sum(counts) == 3
+    finally:
+        r.exit()
+        sim.close()
+
+
+def test_emergency_recovery():
+    sim = Simulator()
+    r = sim.make_redeem()
+    r.start()
+    testing = sim.channels["testing"]
+    path_planner = r.printer.path_planner
+    planner = path_planner.native_planner
+    try:
+        sim.send("M112")
+        assert path_planner.recovery_time is not None
+        assert not planner.suspended
+        # Moves are taken again without a restart of the planner
+        assert path_planner.native_planner is planner
+        moves = planner.moves
+        sim.send("G1 X10 F3000")
+        sim.send("M400")
+        assert wait_for(lambda: len(testing.messages) >= 3)
+        assert planner.moves > moves
+    finally:
+        r.exit()
+        sim.close()
+
+
+def test_alarms():
+    from redeem.Alarm import Alarm
+    sim = Simulator()
+    r = sim.make_redeem()
+    r.start()
+    testing = sim.channels["testing"]
+    heater = r.printer.heaters["E"]
+    try:
+        sim.send("M104 S200")
+        assert wait_for(lambda: heater.mosfet.get_power() > 0)
+        for i in range(5):
+            Alarm(Alarm.HEATER_TOO_HOT, "Too hot", source="E")
+        # Off before the alarm is told, and told once
+        assert heater.extruder_error
+        assert heater.mosfet.get_power() == 0
+        assert wait_for(lambda: "Alarm: Too hot" in testing.messages)
+        assert list(testing.messages).count("Alarm: Too hot") == 1
+        executor = Alarm.executor
+        assert executor.coalesced == 4
+        assert len(executor.latency) == 5
+        sim.send("M884")
+        assert wait_for(lambda: any(m.startswith("Alarms: ") for m in testing.messages))
+    finally:
+        r.exit()
+        sim.close()
+
+
+def test_parallel_homing():
+    import numpy as np
+    from redeem.Path import Path
+    sim = Simulator()
+    r = sim.make_redeem()
+    r.start()
+    path_planner = r.printer.path_planner
+    native = path_planner.native_planner
+    moves = []
+    queue_move = native.queueMove
+
+    def record(start, end, speed, accel, cancelable, optimize):
+        moves.append((np.array(end) - np.array(start), speed))
+        return queue_move(start, end, speed, accel, cancelable, optimize)
+    native.queueMove = record
+    home_speed = list(Path.home_speed)
+    travel = path_planner.travel_length
+    try:
+        Path.home_speed[:3] = [0.1, 0.05, 0.02]
+        travel_length = dict(travel)
+        travel.update(X=0.2, Y=0.2, Z=0.3)
+        sim.send("G28 X0 Y0 Z0")
+        assert wait_for(lambda: any(m.startswith("Homing done") for m in
+                                    sim.channels["testing"].messages))
+        # The search starts with each axis at its own home speed
+        delta, speed = moves[0]
+        duration = np.linalg.norm(delta)/speed
+        assert np.allclose(-delta[:3]/duration, [0.1, 0.05, 0.02])
+        # X gets to the end of its travel first and stops there,
+        # then Y, and Z goes on alone
+        search = np.array([d[:3] for d, _ in moves[:3]])
+        assert np.allclose(-search.sum(axis=0), [0.2, 0.2, 0.3])
+        assert np.allclose(search[1:, 0], 0) and np.allclose(search[2, 1], 0)
+        assert set(path_planner.homing_times) == set(["X", "Y", "Z"])
+
+        # X and Y share the motors on CoreXY
+        Path.set_axis_config(Path.AXIS_CONFIG_CORE_XY)
+        assert path_planner._home_groups(["X", "Y", "Z"]) == [["X", "Z"], ["Y"]]
+    finally:
+        Path.home_speed[:] = home_speed
+        travel.update(travel_length)
+        Path.set_axis_config(Path.AXIS_CONFIG_XY)
+        r.exit()
+        sim.close()
+
+
+def test_move_batches():
+    import Queue
+    from redeem.Gcode import Gcode
+    from redeem.Latency import clock
+    sim = Simulator()
+    r = sim.make_redeem()
+    r.start()
+    testing = sim.channels["testing"]
+    path_planner = r.printer.path_planner
+    native = path_planner.native_planner
+    batches = []
+    queue_batch_move = native.queueBatchMove
+
+    def record(batch, speed, accel, cancelable, optimize):
+        batches.append(len(batch)/16)
+        return queue_batch_move(batch, speed, accel, cancelable, optimize)
+    native.queueBatchMove = record
+    r.move_batch_time = 10.0
+    try:
+        sim.send("M400")
+        assert wait_for(lambda: len(testing.messages) == 1)
+        queue = Queue.Queue()
+        lines = ["G1 X{} Y{} F3000".format(i, i) for i in range(1, 6)]
+        lines += ["G1 X10 F6000", "M114"]
+        for line in lines:
+            queue.put(Gcode({"message": line, "prot": "testing"}))
+        after = r._execute_moves(queue.get(), clock(), queue)
+        assert after.code() == "M114"
+        # Two speeds, so two calls for the six moves
+        assert batches == [5, 1]
+        assert list(testing.messages)[1:] == ["ok"]*6
+        assert abs(path_planner.get_current_pos()["X"] - 0.01) < 1e-9
+        assert abs(path_planner.get_current_pos()["Y"] - 0.005) < 1e-9
+    finally:
+        r.exit()
+        sim.close()
+
+
+
+def test_position_tracker():
+    import numpy as np
+    from redeem.Gcode import Gcode
+    from redeem.PositionTracker import PositionTracker
+    from redeem.PruInterface import PruInterface, MOVES_DONE
+    sim = Simulator()
+    r = sim.make_redeem()
+    r.start()
+    path_planner = r.printer.path_planner
+    try:
+        for line in ["G92 X0 Y0 E0", "G1 X10 F3000", "G1 X20 E1", "G92 X100"]:
+            r.printer.processor.execute(Gcode({"message": line, "prot": "testing"}))
+        # The native planner writes the count where PruInterface reads it,
+        # at the offset it is given, in the 12 KB shared RAM the PRU timer maps
+        native = path_planner.native_planner
+        assert 0x10000 <= native.moves_done_offset <= 0x13000 - 4
+        done = PruInterface.get_moves_done()
+        assert done == native.getMovesDone() > 0
+        assert abs(path_planner.get_executed_pos()["X"] - 0.1) < 1e-9
+        # The PRU is still doing the second move
+        PruInterface.set_shared_long(MOVES_DONE, done - 1)
+        assert abs(path_planner.get_executed_pos()["X"] - 0.09) < 1e-9
+        assert path_planner.get_executed_extruder_pos(0) == 0.0
+        assert abs(path_planner.get_current_pos()["X"] - 0.1) < 1e-9
+        assert "X:0.09" in r.printer.telemetry.position_report()
+    finally:
+        r.exit()
+        sim.close()
+
+    # A counter of 32 bits that wraps, and a ring of 4 records
+    counter = [0]
+    tracker = PositionTracker(2, size=4, read_done=lambda: counter[0] & 0xFFFFFFFF)
+    tracker.reset([0.0, 0.0], 0xFFFFFFFE)
+    tracker.add(0xFFFFFFFF, [[1.0, 0.0]])
+    tracker.add(2, np.array([[2.0, 0.0], [3.0, 0.0], [4.0, 0.0]]))
+    counter[0] = 0x100000000
+    assert list(tracker.position()) == [2.0, 0.0]
+    counter[0] = 0x100000002
+    assert list(tracker.position()) == [4.0, 0.0]
+    # The same move again replaces the newest end
+    tracker.add(2, [[5.0, 0.0]])
+    assert list(tracker.position()) == [5.0, 0.0]
+    # The first record is gone, the oldest one left is the closest
+    counter[0] = 0xFFFFFFFE
+    assert list(tracker.position()) == [1.0, 0.0]
+    assert PositionTracker(2).position() is None
+
+
+def test_bed_mesh():
+    from redeem.BedMesh import BedMesh
+    from redeem.Path import Path
+    sim = Simulator()
+    r = sim.make_redeem()
+    r.start()
+    planner = r.printer.path_planner.native_planner
+    Path.bed_mesh = BedMesh(0, 0.2, 0, 0.2, [[0, 0.0001, 0],
+                                             [0.0001, 0.0002, 0.0001],
+                                             [0, 0.0001, 0]])
+    assert abs(Path.bed_mesh.height_at(0.1, 0.1) - 0.0002) < 1e-12
+    try:
+        sim.send("G1 X0 Y100 F3000")
+        sim.send("M400")
+        assert wait_for(lambda: len(sim.channels["testing"].messages) >= 2)
+        moves = planner.moves
+        # Crosses the ridge in the middle, so it is split in two
+        sim.send("G1 X200 Y100")
+        sim.send("M400")
+        assert wait_for(lambda: len(sim.channels["testing"].messages) >= 4)
+        assert planner.moves == moves + 2
+        assert abs(planner.position[2] - 0.0001) < 1e-5
+    finally:
+        Path.bed_mesh = None
+        r.exit()
+        sim.close()
+
+    # One twisted cell, the height is quadratic along the diagonal
+    import numpy as np
+    mesh = BedMesh(0, 0.2, 0, 0.2, [[0, 0], [0, 0.0004]])
+    t = np.concatenate(([0.0], mesh.split((0, 0), (0.2, 0.2)), [1.0]))
+    assert len(t) > 2
+    s = np.linspace(0, 1, 1001)
+    lines = np.interp(s, t, mesh.height(0.2*t, 0.2*t))
+    assert np.abs(mesh.height(0.2*s, 0.2*s) - lines).max() <= mesh.tolerance
+    # Along an edge it is straight
+    assert mesh.split((0, 0), (0.2, 0)) == []
+
+
+def test_tools_and_backlash():
+    from redeem.Path import Path
+    sim = Simulator()
+    r = sim.make_redeem()
+    r.start()
+    planner = r.printer.path_planner.native_planner
+    testing = sim.channels["testing"]
+    try:
+        # T0, T1 and M668 are not buffered, so wait for each reply
+        for count, line in enumerate(["G92 X0 E0", "T1", "G1 E1 F600", "M400", "T0",
+                                      "M668 X0.1", "G1 X10", "G1 X5", "M400"]):
+            sim.send(line)
+            assert wait_for(lambda: len(testing.messages) > count)
+        # The E move went to H
+        assert abs(planner.position[4] - 0.001) < 1e-6
+        assert abs(planner.position[3]) < 1e-9
+        # A compensation move before each move, one of 0.1 mm in each direction
+        assert abs(planner.position[0] - 0.005) < 1e-6
+        assert planner.moves == 5
+    finally:
+        Path.backlash_compensation[0] = 0
+        Path.update_axis_maps()
+        Path.set_tool(3)
+        r.exit()
+        sim.close()
+
+
+def test_probe_mesh():
+    from redeem.Path import Path
+    sim = Simulator()
+    r = sim.make_redeem()
+    r.start()
+    testing = sim.channels["testing"]
+    planner = r.printer.path_planner.native_planner
+    # 3 mm below the nozzle, 0.1 mm lower towards +X
+    planner.bed = lambda x, y: 0.003 + 0.0005*x
+    try:
+        sim.send("G29 M")
+        assert wait_for(lambda: any(m.startswith("Bed mesh") for m in testing.messages))
+        assert wait_for(lambda: Path.bed_mesh is not None)
+        heights = Path.bed_mesh.heights
+        assert heights.shape == (3, 3)
+        assert abs(heights[0, 2] - heights[0, 0] + 0.0005*0.18) < 1e-5
+    finally:
+        Path.bed_mesh = None
+        r.exit()
+        sim.close()
+
+
+def test_probe_plane():
+    import copy
+    import numpy as np
+    from redeem.BedCompensation import BedCompensation
+    from redeem.Path import Path
+    sim = Simulator()
+    r = sim.make_redeem()
+    r.start()
+    testing = sim.channels["testing"]
+    planner = r.printer.path_planner.native_planner
+    planner.bed = lambda x, y: 0.003 + 0.01*x - 0.02*y
+    try:
+        sim.send("M557 P0 X10 Y10")
+        sim.send("M557 P1 X100 Y10")
+        sim.send("M557 P2 X100 Y100")
+        sim.send("M557 P3 X10 Y100")
+        sim.send("G29 C")
+        sim.send("M400")
+        assert wait_for(lambda: len([m for m in testing.messages if m.startswith("ok")]) >= 6)
+        # The plane fitted as the points came in gives the same matrix
+        # as the least squares fit of the points at the end
+        points = copy.deepcopy(r.printer.probe_points)
+        expected = BedCompensation.create_rotation_matrix(points, r.printer.probe_heights)
+        assert np.allclose(Path.matrix_bed_comp, expected)
+        assert not Path.bed_matrix_identity
+    finally:
+        Path.set_bed_matrix(np.identity(3))
+        r.exit()
+        sim.close()
+
+
+def test_delta_calibration():
+    import numpy as np
+    from redeem.DeltaCalibration import (DeltaCalibration, current_geometry,
+                                         inverse, residuals, pattern)
+    believed = current_geometry()
+    believed.update(L=0.322, r=0.175, Hez=0.0)
+    true = dict(believed)
+    true.update(endstop_X=0.0012, endstop_Y=-0.0007, endstop_Z=0.0003,
+                r=0.1765, A_tangential=0.0004, B_tangential=-0.0003, L=0.3235)
+    # Where a probe stops, when the printer believes one geometry
+    # and has another: bisect for the Z that is on the bed.
+    probed = []
+    for x, y in pattern(0.08, 16):
+        low, high = -0.02, 0.02
+        for _ in range(60):
+            z = (low + high)/2
+            if residuals(true, inverse(believed, np.array([[x, y, z]])))[0] > 0:
+                high = z
+            else:
+                low = z
+        probed.append((x, y, z))
+    calibration = DeltaCalibration(7, believed)
+    fitted = calibration.solve(probed)
+    assert calibration.rms_before > 0.0005
+    assert calibration.rms_after < 1e-8
+    for name in calibration.names:
+        assert abs(fitted[name] - true[name]) < 1e-6
+
+
+def test_comm_hub():
+    import socket
+    sim = Simulator()
+    r = sim.make_redeem()
+    r.start()
+    eth = r.printer.comms["Eth"]
+    client = socket.create_connection(("127.0.0.1", eth.port), timeout=5)
+    try:
+        # A line in two parts, and two lines in one
+        client.sendall("M11")
+        time.sleep(0.1)
+        client.sendall("4\nM105\r\n")
+        replies = ""
+        while replies.count("\n") < 2:
+            replies += client.recv(4096)
+        lines = replies.splitlines()
+        assert lines[0].startswith("ok C:")
+        assert lines[1].startswith("ok T:")
+        # The next host is served when this one leaves
+        client.close()
+        client = socket.create_connection(("127.0.0.1", eth.port), timeout=5)
+        client.sendall("M114\n")
+        assert client.recv(4096).startswith("ok C:")
+    finally:
+        client.close()
+        r.exit()
+        sim.close()
+    assert not r.printer.comm_hub.t.is_alive()
+
+
+def test_unix_socket():
+    import os
+    import socket
+
+    def connect(name):
+        s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        s.connect(os.path.join(sim.location, "run", name + ".sock"))
+        s.settimeout(5)
+        return s
+
+    sim = Simulator()
+    r = sim.make_redeem()
+    r.start()
+    first, second = connect("octoprint"), connect("octoprint")
+    toggle, noret = connect("toggle"), connect("testing_noret")
+    try:
+        noret.sendall("M114\n")
+        first.sendall("M114\n")
+        second.sendall("M105\n")
+        # Each host gets the replies to its own G-codes
+        assert first.recv(4096).startswith("ok C:")
+        assert second.recv(4096).startswith("ok T:")
+        # Messages for the display go to all hosts on the toggle socket
+        first.sendall("M117 Hello\n")
+        assert toggle.recv(4096).startswith("Hello")
+        assert first.recv(4096).startswith("ok")
+        noret.settimeout(0.2)
+        try:
+            assert noret.recv(4096) == ""
+        except socket.timeout:
+            pass
+        second.close()
+        assert wait_for(lambda: "octoprint#2" not in r.printer.comms)
+    finally:
+        for s in (first, second, toggle, noret):
+            s.close()
+        r.exit()
+        sim.close()
+
+
+def test_hub_backlog():
+    import os
+    import socket
+
+    def connect(name):
+        s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        s.connect(os.path.join(sim.location, "run", name + ".sock"))
+        s.settimeout(10)
+        return s
+
+    sim = Simulator()
+    r = sim.make_redeem()
+    r.start()
+    streaming, other = connect("octoprint"), connect("octoprint")
+    try:
+        # More than the command queue holds, behind a long dwell
+        streaming.sendall("G4 P2000\n" + "G4 P1\n"*30)
+        hub = r.printer.comm_hub
+        assert wait_for(lambda: hub.backlogged)
+        # The hub still reads the other host, and real-time
+        # G-codes do not wait for the queue
+        start = time.time()
+        other.sendall("M25\n")
+        assert other.recv(4096) == "ok\n"
+        assert time.time() - start < 1.0
+        other.sendall("M24\n")
+        assert other.recv(4096) == "ok\n"
+        replies = ""
+        while replies.count("ok") < 31:
+            replies += streaming.recv(4096)
+        assert not hub.backlogged
+    finally:
+        streaming.close()
+        other.close()
+        r.exit()
+        sim.close()
+
+
+def test_reply_queue():
+    import os
+    import socket
+    from redeem.CommHub import WriteQueue
+    queue = WriteQueue("test", 2, "drop_oldest")
+    for message in ["T:1\n", "ok\n", "T:2\n", "ok\n", "T:3\n"]:
+        queue.put(message)
+    assert queue.take() == "ok\nok\n"
+    assert queue.dropped == 3
+
+    sim = Simulator()
+    r = sim.make_redeem()
+    r.start()
+    host = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    host.connect(os.path.join(sim.location, "run", "testing.sock"))
+    try:
+        assert wait_for(lambda: "testing#1" in r.printer.comms)
+        # A host that does not read does not hold up the sender
+        start = time.time()
+        for i in range(3000):
+            r.printer.send_message("testing#1", "T:{} ".format(i) + "x"*1000)
+        r.printer.send_message("testing#1", "ok done")
+        assert time.time() - start < 2.0
+        queue = r.printer.comm_hub.queues["testing#1"]
+        assert queue.dropped > 0
+        data = ""
+        host.settimeout(5)
+        while not data.endswith("ok done\n"):
+            data += host.recv(65536)
+        assert data.count("\n") + queue.dropped == 3001
+        sim.send("M883")
+        report = "testing#1: {} queued, {} dropped".format(3001 - queue.dropped, queue.dropped)
+        assert wait_for(lambda: any(m.startswith(report)
+                                    for m in sim.channels["testing"].messages))
+    finally:
+        host.close()
+        r.exit()
+        sim.close()
+
+
+def test_kinematics():
+    import numpy as np
+    from redeem import Kinematics
+    from redeem.Delta import Delta
+    Delta.L, Delta.r, Delta.Hez = 0.322, 0.175, 0.01
+    Delta.recalculate()
+    delta = Kinematics.get(3)
+    points = np.zeros((5, 8))
+    points[:, :3] = np.random.RandomState(1).uniform(-0.08, 0.08, (5, 3))
+    points[:, 3] = 0.5
+    carriages = delta.inverse(points)
+    for point, carriage in zip(points, carriages):
+        assert np.allclose(carriage[:3], Delta.inverse_kinematics2(*point[:3]))
+        assert np.allclose(delta.forward(carriage)[:3] + [0, 0, Delta.Hez],
+                           Delta.forward_kinematics2(*carriage[:3]))
+    assert np.allclose(delta.forward(carriages), points)
+    assert np.all(carriages[:, 3] == 0.5)
+
+    core = Kinematics.get(2)
+    assert np.allclose(core.inverse([0.01, 0.02, 0, 0, 0, 0, 0, 0])[:2], [0.03, -0.01])
+    assert np.allclose(core.forward(core.inverse(points)), points)
+    assert Kinematics.get(0).identity and not core.identity
+
+
+def test_print_time_estimate():
+    import numpy as np
+    from redeem.PrintTimeEstimator import PrintTimeEstimator
+    estimator = PrintTimeEstimator([0.5]*8, [0.2]*8, [0.0]*8, 0.01, [50000.0]*8,
+                                   1024, 0.1, 1.0, 0.25)
+    # 100 mm at 0.1 m/s with 0.5 m/s^2: 0.2 s up, 0.8 s cruising, 0.2 s down
+    start, end = np.zeros((1, 8)), np.zeros((1, 8))
+    end[0, 0] = 0.1
+    result = estimator.estimate(start, end, np.array([0.1]),
+                                np.array([0]), np.array([False]))
+    assert abs(result.times[0] - 1.2) < 1e-9
+
+    # 5000 moves of 2 ms in a line, made at 300 per second: the buffer
+    # is filled with 1 s of moves and then runs dry
+    n = 5000
+    start = np.zeros((n, 8))
+    start[:, 0] = np.arange(n)*0.0001
+    end = start.copy()
+    end[:, 0] += 0.0001
+    layers = np.arange(n)//1000
+    result = estimator.estimate(start, end, np.repeat(0.05, n), layers,
+                                np.zeros(n, dtype=bool), host_rate=300)
+    # 0.05 s extra for each of the ramps up and down
+    assert abs(result.total - (n*0.002 + 0.1)) < 1e-6
+    assert len(result.layer_times()) == 5
+    assert len(result.starved) == 1
+    assert result.starved[0].layer == 1
+    assert 400 < result.moves_per_second()[0] < 500
+
+
+def test_autotune_fit():
+    import numpy as np
+    from redeem.Autotune import Autotune
+
+    class Heater:
+        name = "E"
+        sleep = 0.1
+    tune = Autotune(Heater())
+    rand = np.random.RandomState(0)
+    t = np.arange(0, 300, tune.sleep)
+    step = 25 + 200*0.3*(1 - np.exp(-np.maximum(t - 8.0, 0)/60.0))
+    K, tau, theta = tune.fit_fopdt(t, step + rand.normal(0, 0.1, t.size), 0.3)
+    assert abs(K - 200) < 5
+    assert abs(tau - 60) < 3
+    assert abs(theta - 8) < 1.5
+
+    # A noisy peak is found where the smoothed curve has it
+    t = np.arange(0, 60, tune.sleep)
+    temps = 200 + 5*np.sin(2*np.pi*t/60) + rand.normal(0, 0.3, t.size)
+    tune.start_time = 0
+    for now, temp in zip(t, temps):
+        tune.times.append(now)
+        tune.temps.append(temp)
+    peak_time, peak = tune._extreme(len(temps), True)
+    assert abs(peak_time - 15) < 2
+    assert abs(peak - 205) < 0.5
+
+
+def test_running_extremes():
+    import numpy as np
+    from redeem.RingBuffer import RingBuffer, RunningExtremes
+    values = np.random.RandomState(1).normal(0, 1, 500)
+    extremes = RunningExtremes(20)
+    buf = RingBuffer(100, 20)
+    for i, value in enumerate(values):
+        extremes.append(value)
+        buf.append(value)
+        window = values[max(0, i - 19):i + 1]
+        assert extremes.max() == window.max()
+        assert extremes.min() == window.min()
+        assert abs(buf.average() - window.mean()) < 1e-9
+    assert len(extremes) == 20
+
+
+def test_telemetry_events():
+    from redeem.Telemetry import Telemetry
+
+    class Alarm:
+        message = "Thermistor error"
+
+    class Printer:
+        sent = []
+
+        def send_message(self, prot, message):
+            self.sent.append((prot, message))
+    printer = Printer()
+    telemetry = Telemetry(printer)
+    telemetry.add_provider("value", lambda: "V:1")
+    telemetry.set_alarm(Alarm())
+    # An alarm from before the subscription is not sent
+    telemetry.subscribe("testing", ["value", Telemetry.ALARM], 1.0)
+    telemetry._publish(0.0)
+    assert printer.sent == [("testing", "V:1")]
+    # The same alarm twice is sent twice, and once only
+    telemetry.set_alarm(Alarm())
+    telemetry.set_alarm(Alarm())
+    telemetry._publish(0.5)
+    telemetry._publish(0.6)
+    assert printer.sent[1:] == [("testing", "Alarm: Thermistor error")]*2
+
+
+def test_config_snapshot():
+    import os
+    import pytest
+    from redeem.CascadingConfigParser import CascadingConfigParser
+    default = os.path.join(os.path.dirname(__file__), "configs", "default.cfg")
+    config = CascadingConfigParser([default])
+    snapshot = config.build_snapshot()
+    assert snapshot.Probe.speed == config.getfloat("Probe", "speed")
+    assert isinstance(snapshot.Endstops.has_x, bool)
+    assert isinstance(snapshot.Macros.G29, tuple)
+    with pytest.raises(AttributeError):
+        snapshot.Probe.speed = 1.0
+    config.set("Probe", "samples", "many")
+    with pytest.raises(ValueError) as e:
+        config.build_snapshot()
+    assert "[Probe] samples" in str(e.value)
+
+
+def test_config_save(tmpdir):
+    import ConfigParser
+    from redeem.CascadingConfigParser import CascadingConfigParser
+    printer_cfg = tmpdir.join("printer.cfg")
+    printer_cfg.write("[Probe]\nspeed = 0.05\nlength = 0.01\n")
+    local_cfg = tmpdir.join("local.cfg")
+    local_cfg.write("[Cold-ends]\nadd_fan_0_to_M109 = True\n")
+    config = CascadingConfigParser([str(printer_cfg), str(local_cfg)])
+    config.build_snapshot = lambda: None    # Not a complete config
+    config.set("Probe", "length", "0.01")   # Unchanged, not saved
+    config.set("Probe", "speed", "0.1")
+    inode = local_cfg.stat().ino
+    config.save(str(local_cfg))
+    saved = ConfigParser.SafeConfigParser()
+    saved.read(str(local_cfg))
+    assert saved.get("Probe", "speed") == "0.1"
+    assert not saved.has_option("Probe", "length")
+    assert saved.get("Cold-ends", "add_fan_0_to_M109") == "True"
+    # Written to a temp file that replaced local.cfg
+    assert local_cfg.stat().ino != inode
+    assert sorted(p.basename for p in tmpdir.listdir()) == ["local.cfg", "printer.cfg"]
+    assert not config.dirty
+
+
+def test_log_queue():
+    import logging
+    import Queue
+    from redeem.LogQueue import QueueHandler
+    queue = Queue.Queue(2)
+    logger = logging.getLogger("test_log_queue")
+    logger.propagate = False
+    handler = QueueHandler(queue)
+    logger.addHandler(handler)
+    try:
+        position = {"X": 1}
+        logger.warning("At %s", position)
+        position["X"] = 2   # Changed before the record is written
+        try:
+            1/0
+        except ZeroDivisionError:
+            logger.exception("Failed")
+        logger.warning("Dropped")
+    finally:
+        logger.removeHandler(handler)
+    record = queue.get()
+    assert record.getMessage() == "At {'X': 1}"
+    assert record.args is None
+    record = queue.get()
+    assert "ZeroDivisionError" in record.exc_text
+    assert record.exc_info is None
+    assert handler.dropped == 1
@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+"""
+Benchmark of the motion pipeline, run on the simulated hardware.
+
+Each G-code file in tools/benchmark is fed through a simulated Redeem,
+and the time is measured per call for these stages:
+
+  parse          Gcode() from a line
+  dispatch       looking up the handler, is_buffered/is_sync
+  end_to_end     parse and execute, through the path planner
+  path           Path construction (set_prev, includes kinematics)
+  kinematics     transform_vector and reverse_transform_vector
+  delta_segments splitting delta moves
+  arc_segments   splitting G2/G3 moves
+  batch          packing segments for queueBatchMove
+  recovery       M112, from the emergency stop until moves are accepted
+
+The first three are timed without instrumentation. The others come from
+a second run with timed wrappers, so they nest (a delta move records
+one delta_segments call and one path call per segment). The file
+header picks the printer config, e.g. "; config: kossel_mini.cfg".
+
+    python tools/benchmark.py --save baseline.json
+    python tools/benchmark.py --compare baseline.json --threshold 0.15
+
+With --compare the exit status is 1 if any stage has a median latency
+or a throughput that is worse than the baseline by more than the threshold.
+
+Author: Elias Bakken
+License: GNU GPL v3: http://www.gnu.org/copyleft/gpl.html
+"""
+
+import argparse
+import glob
+import json
+import logging
+import os
+import sys
+import timeit
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.realpath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+
+from redeem.Simulator import Simulator, install
+install()   # Before the hardware modules are imported
+from redeem.Gcode import Gcode
+from redeem.Path import Path, AbsolutePath, RelativePath
+from redeem.PathPlanner import PathPlanner
+
+timer = timeit.default_timer
+
+STAGES = ["parse", "dispatch", "end_to_end", "path", "kinematics",
+          "delta_segments", "arc_segments", "batch", "recovery"]
+
+# Emergency stops timed per file
+RECOVERIES = 10
+
+# (class, method, stage) timed in the instrumented run
+INSTRUMENTED = [
+    (AbsolutePath, "set_prev", "path"),
+    (RelativePath, "set_prev", "path"),
+    (Path, "transform_vector", "kinematics"),
+    (Path, "reverse_transform_vector", "kinematics"),
+    (Path, "get_delta_segments", "delta_segments"),
+    (Path, "get_arc_segments", "arc_segments"),
+    (PathPlanner, "make_batch", "batch"),
+]
+
+
+def read_gcode(filename):
+    """ Return the config named in the header and the G-code lines """
+    config = None
+    lines = []
+    with open(filename) as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith("; config:"):
+                name = line.split(":", 1)[1].strip()
+                if name != "default":
+                    config = os.path.join(HERE, "..", "configs", name)
+            elif line and not line.startswith(";"):
+                lines.append(line)
+    return config, lines
+
+
+def timed(method, samples):
+    def wrapper(*args, **kwargs):
+        start = timer()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            samples.append(timer() - start)
+    return wrapper
+
+
+def run_plain(printer, lines, samples):
+    processor = printer.processor
+    for line in lines:
+        start = timer()
+        g = Gcode({"message": line, "prot": "testing"})
+        parsed = timer()
+        processor.is_buffered(g)
+        processor.is_sync(g)
+        processor.gcodes.get(g.code())
+        dispatched = timer()
+        processor.execute(g)
+        done = timer()
+        samples["parse"].append(parsed - start)
+        samples["dispatch"].append(dispatched - parsed)
+        samples["end_to_end"].append((parsed - start) + (done - dispatched))
+
+
+def run_instrumented(printer, lines, samples):
+    originals = []
+    for cls, name, stage in INSTRUMENTED:
+        method = cls.__dict__[name]
+        originals.append((cls, name, method))
+        setattr(cls, name, timed(method, samples[stage]))
+    try:
+        for line in lines:
+            printer.processor.execute(Gcode({"message": line, "prot": "testing"}))
+    finally:
+        for cls, name, method in originals:
+            setattr(cls, name, method)
+
+
+def run_recovery(printer, samples):
+    """ M112 and the move after it, timed up to where the move is queued """
+    m112 = Gcode({"message": "M112", "prot": "testing"})
+    move = Gcode({"message": "G1 X0.1", "prot": "testing"})
+    for _ in range(RECOVERIES):
+        start = timer()
+        printer.processor.execute(m112)
+        printer.processor.execute(move)
+        samples.append(timer() - start)
+
+
+def summarize(samples):
+    if not samples:
+        return None
+    a = np.array(samples)
+    total = float(a.sum())
+    p50, p90, p99 = np.percentile(a, [50, 90, 99])*1e6
+    return {
+        "count": len(a),
+        "total": total,
+        "throughput": len(a)/total if total > 0 else 0.0,
+        "p50": p50,
+        "p90": p90,
+        "p99": p99
+    }
+
+
+def bench_file(filename, repeat, loglevel):
+    config, lines = read_gcode(filename)
+    samples = dict((stage, []) for stage in STAGES)
+    sim = Simulator(config)
+    r = sim.make_redeem()
+    r.start()
+    logging.getLogger().setLevel(loglevel)
+    try:
+        for _ in range(repeat):
+            run_plain(r.printer, lines, samples)
+        for _ in range(repeat):
+            run_instrumented(r.printer, lines, samples)
+        run_recovery(r.printer, samples["recovery"])
+    finally:
+        r.exit()
+        sim.close()
+    results = {}
+    for stage in STAGES:
+        summary = summarize(samples[stage])
+        if summary:
+            results[stage] = summary
+    return results
+
+
+def compare(results, baseline, threshold):
+    """ Return a list of (file, stage, what, old, new) that regressed """
+    regressions = []
+    for name, stages in sorted(results.items()):
+        for stage, now in sorted(stages.items()):
+            old = baseline.get(name, {}).get(stage)
+            if old is None:
+                continue
+            if now["p50"] > old["p50"]*(1.0 + threshold):
+                regressions.append((name, stage, "p50", old["p50"], now["p50"]))
+            if now["throughput"] < old["throughput"]/(1.0 + threshold):
+                regressions.append((name, stage, "throughput", old["throughput"], now["throughput"]))
+    return regressions
+
+
+def print_results(results):
+    print "{:<16} {:<15} {:>8} {:>12} {:>10} {:>10} {:>10}".format(
+        "file", "stage", "count", "calls/s", "p50 us", "p90 us", "p99 us")
+    for name, stages in sorted(results.items()):
+        for stage in STAGES:
+            if stage in stages:
+                s = stages[stage]
+                print "{:<16} {:<15} {:>8} {:>12.0f} {:>10.1f} {:>10.1f} {:>10.1f}".format(
+                    name, stage, s["count"], s["throughput"], s["p50"], s["p90"], s["p99"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Redeem motion pipeline")
+    parser.add_argument("files", nargs="*",
+                        help="G-code files (default: the files in tools/benchmark)")
+    parser.add_argument("--repeat", type=int, default=1, help="Times to run each file")
+    parser.add_argument("--save", help="Write the results as a JSON baseline")
+    parser.add_argument("--compare", help="Compare with a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="Allowed slowdown before flagging a regression (0.15 = 15%%)")
+    parser.add_argument("--loglevel", type=int, default=logging.WARNING)
+    args = parser.parse_args()
+
+    files = args.files or sorted(glob.glob(os.path.join(HERE, "benchmark", "*.gcode")))
+    results = {}
+    for filename in files:
+        name = os.path.splitext(os.path.basename(filename))[0]
+        results[name] = bench_file(filename, args.repeat, args.loglevel)
+
+    print_results(results)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print "Saved baseline to " + args.save
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for name, stage, what, old, new in regressions:
+            print "REGRESSION {} {} {}: {:.1f} -> {:.1f}".format(name, stage, what, old, new)
+        if regressions:
+            sys.exit(1)
+        print "No regressions over {:.0%}".format(args.threshold)
+
+
+if __name__ == '__main__':
+    main()
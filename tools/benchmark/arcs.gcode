@@ -0,0 +1,112 @@
+; Arcs: G2/G3 outlines with straight connections
+; config: default
+G21
+G90
+M82
+M104 S0
+M140 S0
+G28
+G92 E0
+M106 S255
+G1 F9000
+G1 Z0.300 F6000
+G0 X40.000 Y60.000 F9000
+G2 X49.330 Y62.500 I5.000 J0 E0.43197 F1800
+G1 X51.330 Y62.500 E0.49797
+G0 X52.000 Y60.000 F9000
+G3 X61.330 Y62.500 I5.000 J0 E0.92994 F1800
+G1 X63.330 Y62.500 E0.99594
+G0 X64.000 Y60.000 F9000
+G2 X71.500 Y64.330 I5.000 J0 E1.34151 F1800
+G1 X73.500 Y64.330 E1.40751
+G0 X76.000 Y60.000 F9000
+G3 X84.536 Y63.536 I5.000 J0 E1.79629 F1800
+G1 X86.536 Y63.536 E1.86229
+G0 X88.000 Y60.000 F9000
+G2 X96.536 Y63.536 I5.000 J0 E2.25106 F1800
+G1 X98.536 Y63.536 E2.31706
+G0 X100.000 Y60.000 F9000
+G3 X108.536 Y63.536 I5.000 J0 E2.70583 F1800
+G1 X110.536 Y63.536 E2.77183
+G0 X112.000 Y60.000 F9000
+G2 X121.330 Y62.500 I5.000 J0 E3.20380 F1800
+G1 X123.330 Y62.500 E3.26980
+G0 X124.000 Y60.000 F9000
+G3 X126.500 Y64.330 I5.000 J0 E3.44259 F1800
+G1 X128.500 Y64.330 E3.50859
+G0 X136.000 Y60.000 F9000
+G2 X145.330 Y62.500 I5.000 J0 E3.94056 F1800
+G1 X147.330 Y62.500 E4.00656
+G0 X148.000 Y60.000 F9000
+G3 X150.500 Y64.330 I5.000 J0 E4.17934 F1800
+G1 X152.500 Y64.330 E4.24534
+G92 E0
+G1 Z0.500 F6000
+G0 X40.000 Y60.000 F9000
+G2 X45.000 Y65.000 I5.000 J0 E0.25918 F1800
+G1 X47.000 Y65.000 E0.32518
+G0 X52.000 Y60.000 F9000
+G3 X61.330 Y62.500 I5.000 J0 E0.75715 F1800
+G1 X63.330 Y62.500 E0.82315
+G0 X64.000 Y60.000 F9000
+G2 X73.330 Y62.500 I5.000 J0 E1.25512 F1800
+G1 X75.330 Y62.500 E1.32112
+G0 X76.000 Y60.000 F9000
+G3 X85.330 Y62.500 I5.000 J0 E1.75309 F1800
+G1 X87.330 Y62.500 E1.81909
+G0 X88.000 Y60.000 F9000
+G2 X96.536 Y63.536 I5.000 J0 E2.20786 F1800
+G1 X98.536 Y63.536 E2.27386
+G0 X100.000 Y60.000 F9000
+G3 X108.536 Y63.536 I5.000 J0 E2.66263 F1800
+G1 X110.536 Y63.536 E2.72863
+G0 X112.000 Y60.000 F9000
+G2 X114.500 Y64.330 I5.000 J0 E2.90142 F1800
+G1 X116.500 Y64.330 E2.96742
+G0 X124.000 Y60.000 F9000
+G3 X126.500 Y64.330 I5.000 J0 E3.14021 F1800
+G1 X128.500 Y64.330 E3.20621
+G0 X136.000 Y60.000 F9000
+G2 X145.330 Y62.500 I5.000 J0 E3.63818 F1800
+G1 X147.330 Y62.500 E3.70418
+G0 X148.000 Y60.000 F9000
+G3 X150.500 Y64.330 I5.000 J0 E3.87696 F1800
+G1 X152.500 Y64.330 E3.94296
+G92 E0
+G1 Z0.700 F6000
+G0 X40.000 Y60.000 F9000
+G2 X48.536 Y63.536 I5.000 J0 E0.38877 F1800
+G1 X50.536 Y63.536 E0.45477
+G0 X52.000 Y60.000 F9000
+G3 X54.500 Y64.330 I5.000 J0 E0.62756 F1800
+G1 X56.500 Y64.330 E0.69356
+G0 X64.000 Y60.000 F9000
+G2 X69.000 Y65.000 I5.000 J0 E0.95274 F1800
+G1 X71.000 Y65.000 E1.01874
+G0 X76.000 Y60.000 F9000
+G3 X84.536 Y63.536 I5.000 J0 E1.40751 F1800
+G1 X86.536 Y63.536 E1.47351
+G0 X88.000 Y60.000 F9000
+G2 X93.000 Y65.000 I5.000 J0 E1.73269 F1800
+G1 X95.000 Y65.000 E1.79869
+G0 X100.000 Y60.000 F9000
+G3 X102.500 Y64.330 I5.000 J0 E1.97148 F1800
+G1 X104.500 Y64.330 E2.03748
+G0 X112.000 Y60.000 F9000
+G2 X119.500 Y64.330 I5.000 J0 E2.38306 F1800
+G1 X121.500 Y64.330 E2.44906
+G0 X124.000 Y60.000 F9000
+G3 X133.330 Y62.500 I5.000 J0 E2.88103 F1800
+G1 X135.330 Y62.500 E2.94703
+G0 X136.000 Y60.000 F9000
+G2 X144.536 Y63.536 I5.000 J0 E3.33580 F1800
+G1 X146.536 Y63.536 E3.40180
+G0 X148.000 Y60.000 F9000
+G3 X153.000 Y65.000 I5.000 J0 E3.66098 F1800
+G1 X155.000 Y65.000 E3.72698
+G92 E0
+M104 S0
+M140 S0
+M107
+G28 X0 Y0
+M84
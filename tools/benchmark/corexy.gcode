@@ -0,0 +1,1432 @@
+; CoreXY: perimeters and infill
+; config: maxcorexy.cfg
+G21
+G90
+M82
+M104 S0
+M140 S0
+G28
+G92 E0
+M106 S255
+G1 F9000
+G1 Z0.300 F6000
+G0 X130.000 Y100.000 F9000
+G1 E1.00000 F2400
+G1 X129.836 Y102.509 E1.10367 F1800
+G1 X129.344 Y104.990 E1.20735 F1800
+G1 X128.532 Y107.416 E1.31102 F1800
+G1 X127.406 Y109.762 E1.41469 F1800
+G1 X125.981 Y112.000 E1.51836 F1800
+G1 X124.271 Y114.107 E1.62204 F1800
+G1 X122.294 Y116.059 E1.72571 F1800
+G1 X120.074 Y117.835 E1.82938 F1800
+G1 X117.634 Y119.416 E1.93305 F1800
+G1 X115.000 Y120.785 E2.03673 F1800
+G1 X112.202 Y121.925 E2.14040 F1800
+G1 X109.271 Y122.825 E2.24407 F1800
+G1 X106.237 Y123.476 E2.34774 F1800
+G1 X103.136 Y123.869 E2.45142 F1800
+G1 X100.000 Y124.000 E2.55509 F1800
+G1 X96.864 Y123.869 E2.65876 F1800
+G1 X93.763 Y123.476 E2.76243 F1800
+G1 X90.729 Y122.825 E2.86611 F1800
+G1 X87.798 Y121.925 E2.96978 F1800
+G1 X85.000 Y120.785 E3.07345 F1800
+G1 X82.366 Y119.416 E3.17712 F1800
+G1 X79.926 Y117.835 E3.28080 F1800
+G1 X77.706 Y116.059 E3.38447 F1800
+G1 X75.729 Y114.107 E3.48814 F1800
+G1 X74.019 Y112.000 E3.59181 F1800
+G1 X72.594 Y109.762 E3.69549 F1800
+G1 X71.468 Y107.416 E3.79916 F1800
+G1 X70.656 Y104.990 E3.90283 F1800
+G1 X70.164 Y102.509 E4.00650 F1800
+G1 X70.000 Y100.000 E4.11018 F1800
+G1 X70.164 Y97.491 E4.21385 F1800
+G1 X70.656 Y95.010 E4.31752 F1800
+G1 X71.468 Y92.584 E4.42119 F1800
+G1 X72.594 Y90.238 E4.52487 F1800
+G1 X74.019 Y88.000 E4.62854 F1800
+G1 X75.729 Y85.893 E4.73221 F1800
+G1 X77.706 Y83.941 E4.83588 F1800
+G1 X79.926 Y82.165 E4.93956 F1800
+G1 X82.366 Y80.584 E5.04323 F1800
+G1 X85.000 Y79.215 E5.14690 F1800
+G1 X87.798 Y78.075 E5.25057 F1800
+G1 X90.729 Y77.175 E5.35425 F1800
+G1 X93.763 Y76.524 E5.45792 F1800
+G1 X96.864 Y76.131 E5.56159 F1800
+G1 X100.000 Y76.000 E5.66527 F1800
+G1 X103.136 Y76.131 E5.76894 F1800
+G1 X106.237 Y76.524 E5.87261 F1800
+G1 X109.271 Y77.175 E5.97628 F1800
+G1 X112.202 Y78.075 E6.07996 F1800
+G1 X115.000 Y79.215 E6.18363 F1800
+G1 X117.634 Y80.584 E6.28730 F1800
+G1 X120.074 Y82.165 E6.39097 F1800
+G1 X122.294 Y83.941 E6.49465 F1800
+G1 X124.271 Y85.893 E6.59832 F1800
+G1 X125.981 Y88.000 E6.70199 F1800
+G1 X127.406 Y90.238 E6.80566 F1800
+G1 X128.532 Y92.584 E6.90934 F1800
+G1 X129.344 Y95.010 E7.01301 F1800
+G1 X129.836 Y97.491 E7.11668 F1800
+G1 X130.000 Y100.000 E7.22035 F1800
+G1 E6.22035 F2400
+G0 X129.550 Y100.000 F9000
+G1 E7.22035 F2400
+G1 X129.388 Y102.471 E7.32247 F1800
+G1 X128.904 Y104.915 E7.42459 F1800
+G1 X128.104 Y107.305 E7.52671 F1800
+G1 X126.995 Y109.615 E7.62882 F1800
+G1 X125.591 Y111.820 E7.73094 F1800
+G1 X123.906 Y113.895 E7.83306 F1800
+G1 X121.960 Y115.818 E7.93518 F1800
+G1 X119.773 Y117.568 E8.03729 F1800
+G1 X117.369 Y119.125 E8.13941 F1800
+G1 X114.775 Y120.473 E8.24153 F1800
+G1 X112.019 Y121.596 E8.34365 F1800
+G1 X109.131 Y122.483 E8.44576 F1800
+G1 X106.144 Y123.123 E8.54788 F1800
+G1 X103.089 Y123.510 E8.65000 F1800
+G1 X100.000 Y123.640 E8.75212 F1800
+G1 X96.911 Y123.510 E8.85423 F1800
+G1 X93.856 Y123.123 E8.95635 F1800
+G1 X90.869 Y122.483 E9.05847 F1800
+G1 X87.981 Y121.596 E9.16059 F1800
+G1 X85.225 Y120.473 E9.26270 F1800
+G1 X82.631 Y119.125 E9.36482 F1800
+G1 X80.227 Y117.568 E9.46694 F1800
+G1 X78.040 Y115.818 E9.56906 F1800
+G1 X76.094 Y113.895 E9.67117 F1800
+G1 X74.409 Y111.820 E9.77329 F1800
+G1 X73.005 Y109.615 E9.87541 F1800
+G1 X71.896 Y107.305 E9.97753 F1800
+G1 X71.096 Y104.915 E10.07964 F1800
+G1 X70.612 Y102.471 E10.18176 F1800
+G1 X70.450 Y100.000 E10.28388 F1800
+G1 X70.612 Y97.529 E10.38599 F1800
+G1 X71.096 Y95.085 E10.48811 F1800
+G1 X71.896 Y92.695 E10.59023 F1800
+G1 X73.005 Y90.385 E10.69235 F1800
+G1 X74.409 Y88.180 E10.79446 F1800
+G1 X76.094 Y86.105 E10.89658 F1800
+G1 X78.040 Y84.182 E10.99870 F1800
+G1 X80.227 Y82.432 E11.10082 F1800
+G1 X82.631 Y80.875 E11.20293 F1800
+G1 X85.225 Y79.527 E11.30505 F1800
+G1 X87.981 Y78.404 E11.40717 F1800
+G1 X90.869 Y77.517 E11.50929 F1800
+G1 X93.856 Y76.877 E11.61140 F1800
+G1 X96.911 Y76.490 E11.71352 F1800
+G1 X100.000 Y76.360 E11.81564 F1800
+G1 X103.089 Y76.490 E11.91776 F1800
+G1 X106.144 Y76.877 E12.01987 F1800
+G1 X109.131 Y77.517 E12.12199 F1800
+G1 X112.019 Y78.404 E12.22411 F1800
+G1 X114.775 Y79.527 E12.32623 F1800
+G1 X117.369 Y80.875 E12.42834 F1800
+G1 X119.773 Y82.432 E12.53046 F1800
+G1 X121.960 Y84.182 E12.63258 F1800
+G1 X123.906 Y86.105 E12.73470 F1800
+G1 X125.591 Y88.180 E12.83681 F1800
+G1 X126.995 Y90.385 E12.93893 F1800
+G1 X128.104 Y92.695 E13.04105 F1800
+G1 X128.904 Y95.085 E13.14317 F1800
+G1 X129.388 Y97.529 E13.24528 F1800
+G1 X129.550 Y100.000 E13.34740 F1800
+G1 E12.34740 F2400
+G0 X82.000 Y82.000 F9000
+G1 E13.34740 F2400
+G1 X118.000 Y82.000 E14.53540 F3000
+G1 X118.000 Y83.600 E14.58820
+G1 X82.000 Y83.600 E15.77620 F3000
+G1 X82.000 Y85.200 E15.82900
+G1 X118.000 Y85.200 E17.01700 F3000
+G1 X118.000 Y86.800 E17.06980
+G1 X82.000 Y86.800 E18.25780 F3000
+G1 X82.000 Y88.400 E18.31060
+G1 X118.000 Y88.400 E19.49860 F3000
+G1 X118.000 Y90.000 E19.55140
+G1 X82.000 Y90.000 E20.73940 F3000
+G1 X82.000 Y91.600 E20.79220
+G1 X118.000 Y91.600 E21.98020 F3000
+G1 X118.000 Y93.200 E22.03300
+G1 X82.000 Y93.200 E23.22100 F3000
+G1 X82.000 Y94.800 E23.27380
+G1 X118.000 Y94.800 E24.46180 F3000
+G1 X118.000 Y96.400 E24.51460
+G1 X82.000 Y96.400 E25.70260 F3000
+G1 X82.000 Y98.000 E25.75540
+G1 X118.000 Y98.000 E26.94340 F3000
+G1 X118.000 Y99.600 E26.99620
+G1 X82.000 Y99.600 E28.18420 F3000
+G1 X82.000 Y101.200 E28.23700
+G1 X118.000 Y101.200 E29.42500 F3000
+G1 X118.000 Y102.800 E29.47780
+G1 X82.000 Y102.800 E30.66580 F3000
+G1 X82.000 Y104.400 E30.71860
+G1 X118.000 Y104.400 E31.90660 F3000
+G1 X118.000 Y106.000 E31.95940
+G1 X82.000 Y106.000 E33.14740 F3000
+G1 X82.000 Y107.600 E33.20020
+G1 X118.000 Y107.600 E34.38820 F3000
+G1 X118.000 Y109.200 E34.44100
+G1 X82.000 Y109.200 E35.62900 F3000
+G1 X82.000 Y110.800 E35.68180
+G1 X118.000 Y110.800 E36.86980 F3000
+G1 X118.000 Y112.400 E36.92260
+G1 X82.000 Y112.400 E38.11060 F3000
+G1 X82.000 Y114.000 E38.16340
+G1 X118.000 Y114.000 E39.35140 F3000
+G1 X118.000 Y115.600 E39.40420
+G1 X82.000 Y115.600 E40.59220 F3000
+G1 X82.000 Y117.200 E40.64500
+G1 X118.000 Y117.200 E41.83300 F3000
+G1 X118.000 Y118.800 E41.88580
+G1 E40.88580 F2400
+G92 E0
+G1 Z0.500 F6000
+G0 X130.000 Y100.000 F9000
+G1 E1.00000 F2400
+G1 X129.836 Y102.509 E1.10367 F1800
+G1 X129.344 Y104.990 E1.20735 F1800
+G1 X128.532 Y107.416 E1.31102 F1800
+G1 X127.406 Y109.762 E1.41469 F1800
+G1 X125.981 Y112.000 E1.51836 F1800
+G1 X124.271 Y114.107 E1.62204 F1800
+G1 X122.294 Y116.059 E1.72571 F1800
+G1 X120.074 Y117.835 E1.82938 F1800
+G1 X117.634 Y119.416 E1.93305 F1800
+G1 X115.000 Y120.785 E2.03673 F1800
+G1 X112.202 Y121.925 E2.14040 F1800
+G1 X109.271 Y122.825 E2.24407 F1800
+G1 X106.237 Y123.476 E2.34774 F1800
+G1 X103.136 Y123.869 E2.45142 F1800
+G1 X100.000 Y124.000 E2.55509 F1800
+G1 X96.864 Y123.869 E2.65876 F1800
+G1 X93.763 Y123.476 E2.76243 F1800
+G1 X90.729 Y122.825 E2.86611 F1800
+G1 X87.798 Y121.925 E2.96978 F1800
+G1 X85.000 Y120.785 E3.07345 F1800
+G1 X82.366 Y119.416 E3.17712 F1800
+G1 X79.926 Y117.835 E3.28080 F1800
+G1 X77.706 Y116.059 E3.38447 F1800
+G1 X75.729 Y114.107 E3.48814 F1800
+G1 X74.019 Y112.000 E3.59181 F1800
+G1 X72.594 Y109.762 E3.69549 F1800
+G1 X71.468 Y107.416 E3.79916 F1800
+G1 X70.656 Y104.990 E3.90283 F1800
+G1 X70.164 Y102.509 E4.00650 F1800
+G1 X70.000 Y100.000 E4.11018 F1800
+G1 X70.164 Y97.491 E4.21385 F1800
+G1 X70.656 Y95.010 E4.31752 F1800
+G1 X71.468 Y92.584 E4.42119 F1800
+G1 X72.594 Y90.238 E4.52487 F1800
+G1 X74.019 Y88.000 E4.62854 F1800
+G1 X75.729 Y85.893 E4.73221 F1800
+G1 X77.706 Y83.941 E4.83588 F1800
+G1 X79.926 Y82.165 E4.93956 F1800
+G1 X82.366 Y80.584 E5.04323 F1800
+G1 X85.000 Y79.215 E5.14690 F1800
+G1 X87.798 Y78.075 E5.25057 F1800
+G1 X90.729 Y77.175 E5.35425 F1800
+G1 X93.763 Y76.524 E5.45792 F1800
+G1 X96.864 Y76.131 E5.56159 F1800
+G1 X100.000 Y76.000 E5.66527 F1800
+G1 X103.136 Y76.131 E5.76894 F1800
+G1 X106.237 Y76.524 E5.87261 F1800
+G1 X109.271 Y77.175 E5.97628 F1800
+G1 X112.202 Y78.075 E6.07996 F1800
+G1 X115.000 Y79.215 E6.18363 F1800
+G1 X117.634 Y80.584 E6.28730 F1800
+G1 X120.074 Y82.165 E6.39097 F1800
+G1 X122.294 Y83.941 E6.49465 F1800
+G1 X124.271 Y85.893 E6.59832 F1800
+G1 X125.981 Y88.000 E6.70199 F1800
+G1 X127.406 Y90.238 E6.80566 F1800
+G1 X128.532 Y92.584 E6.90934 F1800
+G1 X129.344 Y95.010 E7.01301 F1800
+G1 X129.836 Y97.491 E7.11668 F1800
+G1 X130.000 Y100.000 E7.22035 F1800
+G1 E6.22035 F2400
+G0 X129.550 Y100.000 F9000
+G1 E7.22035 F2400
+G1 X129.388 Y102.471 E7.32247 F1800
+G1 X128.904 Y104.915 E7.42459 F1800
+G1 X128.104 Y107.305 E7.52671 F1800
+G1 X126.995 Y109.615 E7.62882 F1800
+G1 X125.591 Y111.820 E7.73094 F1800
+G1 X123.906 Y113.895 E7.83306 F1800
+G1 X121.960 Y115.818 E7.93518 F1800
+G1 X119.773 Y117.568 E8.03729 F1800
+G1 X117.369 Y119.125 E8.13941 F1800
+G1 X114.775 Y120.473 E8.24153 F1800
+G1 X112.019 Y121.596 E8.34365 F1800
+G1 X109.131 Y122.483 E8.44576 F1800
+G1 X106.144 Y123.123 E8.54788 F1800
+G1 X103.089 Y123.510 E8.65000 F1800
+G1 X100.000 Y123.640 E8.75212 F1800
+G1 X96.911 Y123.510 E8.85423 F1800
+G1 X93.856 Y123.123 E8.95635 F1800
+G1 X90.869 Y122.483 E9.05847 F1800
+G1 X87.981 Y121.596 E9.16059 F1800
+G1 X85.225 Y120.473 E9.26270 F1800
+G1 X82.631 Y119.125 E9.36482 F1800
+G1 X80.227 Y117.568 E9.46694 F1800
+G1 X78.040 Y115.818 E9.56906 F1800
+G1 X76.094 Y113.895 E9.67117 F1800
+G1 X74.409 Y111.820 E9.77329 F1800
+G1 X73.005 Y109.615 E9.87541 F1800
+G1 X71.896 Y107.305 E9.97753 F1800
+G1 X71.096 Y104.915 E10.07964 F1800
+G1 X70.612 Y102.471 E10.18176 F1800
+G1 X70.450 Y100.000 E10.28388 F1800
+G1 X70.612 Y97.529 E10.38599 F1800
+G1 X71.096 Y95.085 E10.48811 F1800
+G1 X71.896 Y92.695 E10.59023 F1800
+G1 X73.005 Y90.385 E10.69235 F1800
+G1 X74.409 Y88.180 E10.79446 F1800
+G1 X76.094 Y86.105 E10.89658 F1800
+G1 X78.040 Y84.182 E10.99870 F1800
+G1 X80.227 Y82.432 E11.10082 F1800
+G1 X82.631 Y80.875 E11.20293 F1800
+G1 X85.225 Y79.527 E11.30505 F1800
+G1 X87.981 Y78.404 E11.40717 F1800
+G1 X90.869 Y77.517 E11.50929 F1800
+G1 X93.856 Y76.877 E11.61140 F1800
+G1 X96.911 Y76.490 E11.71352 F1800
+G1 X100.000 Y76.360 E11.81564 F1800
+G1 X103.089 Y76.490 E11.91776 F1800
+G1 X106.144 Y76.877 E12.01987 F1800
+G1 X109.131 Y77.517 E12.12199 F1800
+G1 X112.019 Y78.404 E12.22411 F1800
+G1 X114.775 Y79.527 E12.32623 F1800
+G1 X117.369 Y80.875 E12.42834 F1800
+G1 X119.773 Y82.432 E12.53046 F1800
+G1 X121.960 Y84.182 E12.63258 F1800
+G1 X123.906 Y86.105 E12.73470 F1800
+G1 X125.591 Y88.180 E12.83681 F1800
+G1 X126.995 Y90.385 E12.93893 F1800
+G1 X128.104 Y92.695 E13.04105 F1800
+G1 X128.904 Y95.085 E13.14317 F1800
+G1 X129.388 Y97.529 E13.24528 F1800
+G1 X129.550 Y100.000 E13.34740 F1800
+G1 E12.34740 F2400
+G0 X82.000 Y82.000 F9000
+G1 E13.34740 F2400
+G1 X118.000 Y82.000 E14.53540 F3000
+G1 X118.000 Y83.600 E14.58820
+G1 X82.000 Y83.600 E15.77620 F3000
+G1 X82.000 Y85.200 E15.82900
+G1 X118.000 Y85.200 E17.01700 F3000
+G1 X118.000 Y86.800 E17.06980
+G1 X82.000 Y86.800 E18.25780 F3000
+G1 X82.000 Y88.400 E18.31060
+G1 X118.000 Y88.400 E19.49860 F3000
+G1 X118.000 Y90.000 E19.55140
+G1 X82.000 Y90.000 E20.73940 F3000
+G1 X82.000 Y91.600 E20.79220
+G1 X118.000 Y91.600 E21.98020 F3000
+G1 X118.000 Y93.200 E22.03300
+G1 X82.000 Y93.200 E23.22100 F3000
+G1 X82.000 Y94.800 E23.27380
+G1 X118.000 Y94.800 E24.46180 F3000
+G1 X118.000 Y96.400 E24.51460
+G1 X82.000 Y96.400 E25.70260 F3000
+G1 X82.000 Y98.000 E25.75540
+G1 X118.000 Y98.000 E26.94340 F3000
+G1 X118.000 Y99.600 E26.99620
+G1 X82.000 Y99.600 E28.18420 F3000
+G1 X82.000 Y101.200 E28.23700
+G1 X118.000 Y101.200 E29.42500 F3000
+G1 X118.000 Y102.800 E29.47780
+G1 X82.000 Y102.800 E30.66580 F3000
+G1 X82.000 Y104.400 E30.71860
+G1 X118.000 Y104.400 E31.90660 F3000
+G1 X118.000 Y106.000 E31.95940
+G1 X82.000 Y106.000 E33.14740 F3000
+G1 X82.000 Y107.600 E33.20020
+G1 X118.000 Y107.600 E34.38820 F3000
+G1 X118.000 Y109.200 E34.44100
+G1 X82.000 Y109.200 E35.62900 F3000
+G1 X82.000 Y110.800 E35.68180
+G1 X118.000 Y110.800 E36.86980 F3000
+G1 X118.000 Y112.400 E36.92260
+G1 X82.000 Y112.400 E38.11060 F3000
+G1 X82.000 Y114.000 E38.16340
+G1 X118.000 Y114.000 E39.35140 F3000
+G1 X118.000 Y115.600 E39.40420
+G1 X82.000 Y115.600 E40.59220 F3000
+G1 X82.000 Y117.200 E40.64500
+G1 X118.000 Y117.200 E41.83300 F3000
+G1 X118.000 Y118.800 E41.88580
+G1 E40.88580 F2400
+G92 E0
+G1 Z0.700 F6000
+G0 X130.000 Y100.000 F9000
+G1 E1.00000 F2400
+G1 X129.836 Y102.509 E1.10367 F1800
+G1 X129.344 Y104.990 E1.20735 F1800
+G1 X128.532 Y107.416 E1.31102 F1800
+G1 X127.406 Y109.762 E1.41469 F1800
+G1 X125.981 Y112.000 E1.51836 F1800
+G1 X124.271 Y114.107 E1.62204 F1800
+G1 X122.294 Y116.059 E1.72571 F1800
+G1 X120.074 Y117.835 E1.82938 F1800
+G1 X117.634 Y119.416 E1.93305 F1800
+G1 X115.000 Y120.785 E2.03673 F1800
+G1 X112.202 Y121.925 E2.14040 F1800
+G1 X109.271 Y122.825 E2.24407 F1800
+G1 X106.237 Y123.476 E2.34774 F1800
+G1 X103.136 Y123.869 E2.45142 F1800
+G1 X100.000 Y124.000 E2.55509 F1800
+G1 X96.864 Y123.869 E2.65876 F1800
+G1 X93.763 Y123.476 E2.76243 F1800
+G1 X90.729 Y122.825 E2.86611 F1800
+G1 X87.798 Y121.925 E2.96978 F1800
+G1 X85.000 Y120.785 E3.07345 F1800
+G1 X82.366 Y119.416 E3.17712 F1800
+G1 X79.926 Y117.835 E3.28080 F1800
+G1 X77.706 Y116.059 E3.38447 F1800
+G1 X75.729 Y114.107 E3.48814 F1800
+G1 X74.019 Y112.000 E3.59181 F1800
+G1 X72.594 Y109.762 E3.69549 F1800
+G1 X71.468 Y107.416 E3.79916 F1800
+G1 X70.656 Y104.990 E3.90283 F1800
+G1 X70.164 Y102.509 E4.00650 F1800
+G1 X70.000 Y100.000 E4.11018 F1800
+G1 X70.164 Y97.491 E4.21385 F1800
+G1 X70.656 Y95.010 E4.31752 F1800
+G1 X71.468 Y92.584 E4.42119 F1800
+G1 X72.594 Y90.238 E4.52487 F1800
+G1 X74.019 Y88.000 E4.62854 F1800
+G1 X75.729 Y85.893 E4.73221 F1800
+G1 X77.706 Y83.941 E4.83588 F1800
+G1 X79.926 Y82.165 E4.93956 F1800
+G1 X82.366 Y80.584 E5.04323 F1800
+G1 X85.000 Y79.215 E5.14690 F1800
+G1 X87.798 Y78.075 E5.25057 F1800
+G1 X90.729 Y77.175 E5.35425 F1800
+G1 X93.763 Y76.524 E5.45792 F1800
+G1 X96.864 Y76.131 E5.56159 F1800
+G1 X100.000 Y76.000 E5.66527 F1800
+G1 X103.136 Y76.131 E5.76894 F1800
+G1 X106.237 Y76.524 E5.87261 F1800
+G1 X109.271 Y77.175 E5.97628 F1800
+G1 X112.202 Y78.075 E6.07996 F1800
+G1 X115.000 Y79.215 E6.18363 F1800
+G1 X117.634 Y80.584 E6.28730 F1800
+G1 X120.074 Y82.165 E6.39097 F1800
+G1 X122.294 Y83.941 E6.49465 F1800
+G1 X124.271 Y85.893 E6.59832 F1800
+G1 X125.981 Y88.000 E6.70199 F1800
+G1 X127.406 Y90.238 E6.80566 F1800
+G1 X128.532 Y92.584 E6.90934 F1800
+G1 X129.344 Y95.010 E7.01301 F1800
+G1 X129.836 Y97.491 E7.11668 F1800
+G1 X130.000 Y100.000 E7.22035 F1800
+G1 E6.22035 F2400
+G0 X129.550 Y100.000 F9000
+G1 E7.22035 F2400
+G1 X129.388 Y102.471 E7.32247 F1800
+G1 X128.904 Y104.915 E7.42459 F1800
+G1 X128.104 Y107.305 E7.52671 F1800
+G1 X126.995 Y109.615 E7.62882 F1800
+G1 X125.591 Y111.820 E7.73094 F1800
+G1 X123.906 Y113.895 E7.83306 F1800
+G1 X121.960 Y115.818 E7.93518 F1800
+G1 X119.773 Y117.568 E8.03729 F1800
+G1 X117.369 Y119.125 E8.13941 F1800
+G1 X114.775 Y120.473 E8.24153 F1800
+G1 X112.019 Y121.596 E8.34365 F1800
+G1 X109.131 Y122.483 E8.44576 F1800
+G1 X106.144 Y123.123 E8.54788 F1800
+G1 X103.089 Y123.510 E8.65000 F1800
+G1 X100.000 Y123.640 E8.75212 F1800
+G1 X96.911 Y123.510 E8.85423 F1800
+G1 X93.856 Y123.123 E8.95635 F1800
+G1 X90.869 Y122.483 E9.05847 F1800
+G1 X87.981 Y121.596 E9.16059 F1800
+G1 X85.225 Y120.473 E9.26270 F1800
+G1 X82.631 Y119.125 E9.36482 F1800
+G1 X80.227 Y117.568 E9.46694 F1800
+G1 X78.040 Y115.818 E9.56906 F1800
+G1 X76.094 Y113.895 E9.67117 F1800
+G1 X74.409 Y111.820 E9.77329 F1800
+G1 X73.005 Y109.615 E9.87541 F1800
+G1 X71.896 Y107.305 E9.97753 F1800
+G1 X71.096 Y104.915 E10.07964 F1800
+G1 X70.612 Y102.471 E10.18176 F1800
+G1 X70.450 Y100.000 E10.28388 F1800
+G1 X70.612 Y97.529 E10.38599 F1800
+G1 X71.096 Y95.085 E10.48811 F1800
+G1 X71.896 Y92.695 E10.59023 F1800
+G1 X73.005 Y90.385 E10.69235 F1800
+G1 X74.409 Y88.180 E10.79446 F1800
+G1 X76.094 Y86.105 E10.89658 F1800
+G1 X78.040 Y84.182 E10.99870 F1800
+G1 X80.227 Y82.432 E11.10082 F1800
+G1 X82.631 Y80.875 E11.20293 F1800
+G1 X85.225 Y79.527 E11.30505 F1800
+G1 X87.981 Y78.404 E11.40717 F1800
+G1 X90.869 Y77.517 E11.50929 F1800
+G1 X93.856 Y76.877 E11.61140 F1800
+G1 X96.911 Y76.490 E11.71352 F1800
+G1 X100.000 Y76.360 E11.81564 F1800
+G1 X103.089 Y76.490 E11.91776 F1800
+G1 X106.144 Y76.877 E12.01987 F1800
+G1 X109.131 Y77.517 E12.12199 F1800
+G1 X112.019 Y78.404 E12.22411 F1800
+G1 X114.775 Y79.527 E12.32623 F1800
+G1 X117.369 Y80.875 E12.42834 F1800
+G1 X119.773 Y82.432 E12.53046 F1800
+G1 X121.960 Y84.182 E12.63258 F1800
+G1 X123.906 Y86.105 E12.73470 F1800
+G1 X125.591 Y88.180 E12.83681 F1800
+G1 X126.995 Y90.385 E12.93893 F1800
+G1 X128.104 Y92.695 E13.04105 F1800
+G1 X128.904 Y95.085 E13.14317 F1800
+G1 X129.388 Y97.529 E13.24528 F1800
+G1 X129.550 Y100.000 E13.34740 F1800
+G1 E12.34740 F2400
+G0 X82.000 Y82.000 F9000
+G1 E13.34740 F2400
+G1 X118.000 Y82.000 E14.53540 F3000
+G1 X118.000 Y83.600 E14.58820
+G1 X82.000 Y83.600 E15.77620 F3000
+G1 X82.000 Y85.200 E15.82900
+G1 X118.000 Y85.200 E17.01700 F3000
+G1 X118.000 Y86.800 E17.06980
+G1 X82.000 Y86.800 E18.25780 F3000
+G1 X82.000 Y88.400 E18.31060
+G1 X118.000 Y88.400 E19.49860 F3000
+G1 X118.000 Y90.000 E19.55140
+G1 X82.000 Y90.000 E20.73940 F3000
+G1 X82.000 Y91.600 E20.79220
+G1 X118.000 Y91.600 E21.98020 F3000
+G1 X118.000 Y93.200 E22.03300
+G1 X82.000 Y93.200 E23.22100 F3000
+G1 X82.000 Y94.800 E23.27380
+G1 X118.000 Y94.800 E24.46180 F3000
+G1 X118.000 Y96.400 E24.51460
+G1 X82.000 Y96.400 E25.70260 F3000
+G1 X82.000 Y98.000 E25.75540
+G1 X118.000 Y98.000 E26.94340 F3000
+G1 X118.000 Y99.600 E26.99620
+G1 X82.000 Y99.600 E28.18420 F3000
+G1 X82.000 Y101.200 E28.23700
+G1 X118.000 Y101.200 E29.42500 F3000
+G1 X118.000 Y102.800 E29.47780
+G1 X82.000 Y102.800 E30.66580 F3000
+G1 X82.000 Y104.400 E30.71860
+G1 X118.000 Y104.400 E31.90660 F3000
+G1 X118.000 Y106.000 E31.95940
+G1 X82.000 Y106.000 E33.14740 F3000
+G1 X82.000 Y107.600 E33.20020
+G1 X118.000 Y107.600 E34.38820 F3000
+G1 X118.000 Y109.200 E34.44100
+G1 X82.000 Y109.200 E35.62900 F3000
+G1 X82.000 Y110.800 E35.68180
+G1 X118.000 Y110.800 E36.86980 F3000
+G1 X118.000 Y112.400 E36.92260
+G1 X82.000 Y112.400 E38.11060 F3000
+G1 X82.000 Y114.000 E38.16340
+G1 X118.000 Y114.000 E39.35140 F3000
+G1 X118.000 Y115.600 E39.40420
+G1 X82.000 Y115.600 E40.59220 F3000
+G1 X82.000 Y117.200 E40.64500
+G1 X118.000 Y117.200 E41.83300 F3000
+G1 X118.000 Y118.800 E41.88580
+G1 E40.88580 F2400
+G92 E0
+G1 Z0.900 F6000
+G0 X130.000 Y100.000 F9000
+G1 E1.00000 F2400
+G1 X129.836 Y102.509 E1.10367 F1800
+G1 X129.344 Y104.990 E1.20735 F1800
+G1 X128.532 Y107.416 E1.31102 F1800
+G1 X127.406 Y109.762 E1.41469 F1800
+G1 X125.981 Y112.000 E1.51836 F1800
+G1 X124.271 Y114.107 E1.62204 F1800
+G1 X122.294 Y116.059 E1.72571 F1800
+G1 X120.074 Y117.835 E1.82938 F1800
+G1 X117.634 Y119.416 E1.93305 F1800
+G1 X115.000 Y120.785 E2.03673 F1800
+G1 X112.202 Y121.925 E2.14040 F1800
+G1 X109.271 Y122.825 E2.24407 F1800
+G1 X106.237 Y123.476 E2.34774 F1800
+G1 X103.136 Y123.869 E2.45142 F1800
+G1 X100.000 Y124.000 E2.55509 F1800
+G1 X96.864 Y123.869 E2.65876 F1800
+G1 X93.763 Y123.476 E2.76243 F1800
+G1 X90.729 Y122.825 E2.86611 F1800
+G1 X87.798 Y121.925 E2.96978 F1800
+G1 X85.000 Y120.785 E3.07345 F1800
+G1 X82.366 Y119.416 E3.17712 F1800
+G1 X79.926 Y117.835 E3.28080 F1800
+G1 X77.706 Y116.059 E3.38447 F1800
+G1 X75.729 Y114.107 E3.48814 F1800
+G1 X74.019 Y112.000 E3.59181 F1800
+G1 X72.594 Y109.762 E3.69549 F1800
+G1 X71.468 Y107.416 E3.79916 F1800
+G1 X70.656 Y104.990 E3.90283 F1800
+G1 X70.164 Y102.509 E4.00650 F1800
+G1 X70.000 Y100.000 E4.11018 F1800
+G1 X70.164 Y97.491 E4.21385 F1800
+G1 X70.656 Y95.010 E4.31752 F1800
+G1 X71.468 Y92.584 E4.42119 F1800
+G1 X72.594 Y90.238 E4.52487 F1800
+G1 X74.019 Y88.000 E4.62854 F1800
+G1 X75.729 Y85.893 E4.73221 F1800
+G1 X77.706 Y83.941 E4.83588 F1800
+G1 X79.926 Y82.165 E4.93956 F1800
+G1 X82.366 Y80.584 E5.04323 F1800
+G1 X85.000 Y79.215 E5.14690 F1800
+G1 X87.798 Y78.075 E5.25057 F1800
+G1 X90.729 Y77.175 E5.35425 F1800
+G1 X93.763 Y76.524 E5.45792 F1800
+G1 X96.864 Y76.131 E5.56159 F1800
+G1 X100.000 Y76.000 E5.66527 F1800
+G1 X103.136 Y76.131 E5.76894 F1800
+G1 X106.237 Y76.524 E5.87261 F1800
+G1 X109.271 Y77.175 E5.97628 F1800
+G1 X112.202 Y78.075 E6.07996 F1800
+G1 X115.000 Y79.215 E6.18363 F1800
+G1 X117.634 Y80.584 E6.28730 F1800
+G1 X120.074 Y82.165 E6.39097 F1800
+G1 X122.294 Y83.941 E6.49465 F1800
+G1 X124.271 Y85.893 E6.59832 F1800
+G1 X125.981 Y88.000 E6.70199 F1800
+G1 X127.406 Y90.238 E6.80566 F1800
+G1 X128.532 Y92.584 E6.90934 F1800
+G1 X129.344 Y95.010 E7.01301 F1800
+G1 X129.836 Y97.491 E7.11668 F1800
+G1 X130.000 Y100.000 E7.22035 F1800
+G1 E6.22035 F2400
+G0 X129.550 Y100.000 F9000
+G1 E7.22035 F2400
+G1 X129.388 Y102.471 E7.32247 F1800
+G1 X128.904 Y104.915 E7.42459 F1800
+G1 X128.104 Y107.305 E7.52671 F1800
+G1 X126.995 Y109.615 E7.62882 F1800
+G1 X125.591 Y111.820 E7.73094 F1800
+G1 X123.906 Y113.895 E7.83306 F1800
+G1 X121.960 Y115.818 E7.93518 F1800
+G1 X119.773 Y117.568 E8.03729 F1800
+G1 X117.369 Y119.125 E8.13941 F1800
+G1 X114.775 Y120.473 E8.24153 F1800
+G1 X112.019 Y121.596 E8.34365 F1800
+G1 X109.131 Y122.483 E8.44576 F1800
+G1 X106.144 Y123.123 E8.54788 F1800
+G1 X103.089 Y123.510 E8.65000 F1800
+G1 X100.000 Y123.640 E8.75212 F1800
+G1 X96.911 Y123.510 E8.85423 F1800
+G1 X93.856 Y123.123 E8.95635 F1800
+G1 X90.869 Y122.483 E9.05847 F1800
+G1 X87.981 Y121.596 E9.16059 F1800
+G1 X85.225 Y120.473 E9.26270 F1800
+G1 X82.631 Y119.125 E9.36482 F1800
+G1 X80.227 Y117.568 E9.46694 F1800
+G1 X78.040 Y115.818 E9.56906 F1800
+G1 X76.094 Y113.895 E9.67117 F1800
+G1 X74.409 Y111.820 E9.77329 F1800
+G1 X73.005 Y109.615 E9.87541 F1800
+G1 X71.896 Y107.305 E9.97753 F1800
+G1 X71.096 Y104.915 E10.07964 F1800
+G1 X70.612 Y102.471 E10.18176 F1800
+G1 X70.450 Y100.000 E10.28388 F1800
+G1 X70.612 Y97.529 E10.38599 F1800
+G1 X71.096 Y95.085 E10.48811 F1800
+G1 X71.896 Y92.695 E10.59023 F1800
+G1 X73.005 Y90.385 E10.69235 F1800
+G1 X74.409 Y88.180 E10.79446 F1800
+G1 X76.094 Y86.105 E10.89658 F1800
+G1 X78.040 Y84.182 E10.99870 F1800
+G1 X80.227 Y82.432 E11.10082 F1800
+G1 X82.631 Y80.875 E11.20293 F1800
+G1 X85.225 Y79.527 E11.30505 F1800
+G1 X87.981 Y78.404 E11.40717 F1800
+G1 X90.869 Y77.517 E11.50929 F1800
+G1 X93.856 Y76.877 E11.61140 F1800
+G1 X96.911 Y76.490 E11.71352 F1800
+G1 X100.000 Y76.360 E11.81564 F1800
+G1 X103.089 Y76.490 E11.91776 F1800
+G1 X106.144 Y76.877 E12.01987 F1800
+G1 X109.131 Y77.517 E12.12199 F1800
+G1 X112.019 Y78.404 E12.22411 F1800
+G1 X114.775 Y79.527 E12.32623 F1800
+G1 X117.369 Y80.875 E12.42834 F1800
+G1 X119.773 Y82.432 E12.53046 F1800
+G1 X121.960 Y84.182 E12.63258 F1800
+G1 X123.906 Y86.105 E12.73470 F1800
+G1 X125.591 Y88.180 E12.83681 F1800
+G1 X126.995 Y90.385 E12.93893 F1800
+G1 X128.104 Y92.695 E13.04105 F1800
+G1 X128.904 Y95.085 E13.14317 F1800
+G1 X129.388 Y97.529 E13.24528 F1800
+G1 X129.550 Y100.000 E13.34740 F1800
+G1 E12.34740 F2400
+G0 X82.000 Y82.000 F9000
+G1 E13.34740 F2400
+G1 X118.000 Y82.000 E14.53540 F3000
+G1 X118.000 Y83.600 E14.58820
+G1 X82.000 Y83.600 E15.77620 F3000
+G1 X82.000 Y85.200 E15.82900
+G1 X118.000 Y85.200 E17.01700 F3000
+G1 X118.000 Y86.800 E17.06980
+G1 X82.000 Y86.800 E18.25780 F3000
+G1 X82.000 Y88.400 E18.31060
+G1 X118.000 Y88.400 E19.49860 F3000
+G1 X118.000 Y90.000 E19.55140
+G1 X82.000 Y90.000 E20.73940 F3000
+G1 X82.000 Y91.600 E20.79220
+G1 X118.000 Y91.600 E21.98020 F3000
+G1 X118.000 Y93.200 E22.03300
+G1 X82.000 Y93.200 E23.22100 F3000
+G1 X82.000 Y94.800 E23.27380
+G1 X118.000 Y94.800 E24.46180 F3000
+G1 X118.000 Y96.400 E24.51460
+G1 X82.000 Y96.400 E25.70260 F3000
+G1 X82.000 Y98.000 E25.75540
+G1 X118.000 Y98.000 E26.94340 F3000
+G1 X118.000 Y99.600 E26.99620
+G1 X82.000 Y99.600 E28.18420 F3000
+G1 X82.000 Y101.200 E28.23700
+G1 X118.000 Y101.200 E29.42500 F3000
+G1 X118.000 Y102.800 E29.47780
+G1 X82.000 Y102.800 E30.66580 F3000
+G1 X82.000 Y104.400 E30.71860
+G1 X118.000 Y104.400 E31.90660 F3000
+G1 X118.000 Y106.000 E31.95940
+G1 X82.000 Y106.000 E33.14740 F3000
+G1 X82.000 Y107.600 E33.20020
+G1 X118.000 Y107.600 E34.38820 F3000
+G1 X118.000 Y109.200 E34.44100
+G1 X82.000 Y109.200 E35.62900 F3000
+G1 X82.000 Y110.800 E35.68180
+G1 X118.000 Y110.800 E36.86980 F3000
+G1 X118.000 Y112.400 E36.92260
+G1 X82.000 Y112.400 E38.11060 F3000
+G1 X82.000 Y114.000 E38.16340
+G1 X118.000 Y114.000 E39.35140 F3000
+G1 X118.000 Y115.600 E39.40420
+G1 X82.000 Y115.600 E40.59220 F3000
+G1 X82.000 Y117.200 E40.64500
+G1 X118.000 Y117.200 E41.83300 F3000
+G1 X118.000 Y118.800 E41.88580
+G1 E40.88580 F2400
+G92 E0
+G1 Z1.100 F6000
+G0 X130.000 Y100.000 F9000
+G1 E1.00000 F2400
+G1 X129.836 Y102.509 E1.10367 F1800
+G1 X129.344 Y104.990 E1.20735 F1800
+G1 X128.532 Y107.416 E1.31102 F1800
+G1 X127.406 Y109.762 E1.41469 F1800
+G1 X125.981 Y112.000 E1.51836 F1800
+G1 X124.271 Y114.107 E1.62204 F1800
+G1 X122.294 Y116.059 E1.72571 F1800
+G1 X120.074 Y117.835 E1.82938 F1800
+G1 X117.634 Y119.416 E1.93305 F1800
+G1 X115.000 Y120.785 E2.03673 F1800
+G1 X112.202 Y121.925 E2.14040 F1800
+G1 X109.271 Y122.825 E2.24407 F1800
+G1 X106.237 Y123.476 E2.34774 F1800
+G1 X103.136 Y123.869 E2.45142 F1800
+G1 X100.000 Y124.000 E2.55509 F1800
+G1 X96.864 Y123.869 E2.65876 F1800
+G1 X93.763 Y123.476 E2.76243 F1800
+G1 X90.729 Y122.825 E2.86611 F1800
+G1 X87.798 Y121.925 E2.96978 F1800
+G1 X85.000 Y120.785 E3.07345 F1800
+G1 X82.366 Y119.416 E3.17712 F1800
+G1 X79.926 Y117.835 E3.28080 F1800
+G1 X77.706 Y116.059 E3.38447 F1800
+G1 X75.729 Y114.107 E3.48814 F1800
+G1 X74.019 Y112.000 E3.59181 F1800
+G1 X72.594 Y109.762 E3.69549 F1800
+G1 X71.468 Y107.416 E3.79916 F1800
+G1 X70.656 Y104.990 E3.90283 F1800
+G1 X70.164 Y102.509 E4.00650 F1800
+G1 X70.000 Y100.000 E4.11018 F1800
+G1 X70.164 Y97.491 E4.21385 F1800
+G1 X70.656 Y95.010 E4.31752 F1800
+G1 X71.468 Y92.584 E4.42119 F1800
+G1 X72.594 Y90.238 E4.52487 F1800
+G1 X74.019 Y88.000 E4.62854 F1800
+G1 X75.729 Y85.893 E4.73221 F1800
+G1 X77.706 Y83.941 E4.83588 F1800
+G1 X79.926 Y82.165 E4.93956 F1800
+G1 X82.366 Y80.584 E5.04323 F1800
+G1 X85.000 Y79.215 E5.14690 F1800
+G1 X87.798 Y78.075 E5.25057 F1800
+G1 X90.729 Y77.175 E5.35425 F1800
+G1 X93.763 Y76.524 E5.45792 F1800
+G1 X96.864 Y76.131 E5.56159 F1800
+G1 X100.000 Y76.000 E5.66527 F1800
+G1 X103.136 Y76.131 E5.76894 F1800
+G1 X106.237 Y76.524 E5.87261 F1800
+G1 X109.271 Y77.175 E5.97628 F1800
+G1 X112.202 Y78.075 E6.07996 F1800
+G1 X115.000 Y79.215 E6.18363 F1800
+G1 X117.634 Y80.584 E6.28730 F1800
+G1 X120.074 Y82.165 E6.39097 F1800
+G1 X122.294 Y83.941 E6.49465 F1800
+G1 X124.271 Y85.893 E6.59832 F1800
+G1 X125.981 Y88.000 E6.70199 F1800
+G1 X127.406 Y90.238 E6.80566 F1800
+G1 X128.532 Y92.584 E6.90934 F1800
+G1 X129.344 Y95.010 E7.01301 F1800
+G1 X129.836 Y97.491 E7.11668 F1800
+G1 X130.000 Y100.000 E7.22035 F1800
+G1 E6.22035 F2400
+G0 X129.550 Y100.000 F9000
+G1 E7.22035 F2400
+G1 X129.388 Y102.471 E7.32247 F1800
+G1 X128.904 Y104.915 E7.42459 F1800
+G1 X128.104 Y107.305 E7.52671 F1800
+G1 X126.995 Y109.615 E7.62882 F1800
+G1 X125.591 Y111.820 E7.73094 F1800
+G1 X123.906 Y113.895 E7.83306 F1800
+G1 X121.960 Y115.818 E7.93518 F1800
+G1 X119.773 Y117.568 E8.03729 F1800
+G1 X117.369 Y119.125 E8.13941 F1800
+G1 X114.775 Y120.473 E8.24153 F1800
+G1 X112.019 Y121.596 E8.34365 F1800
+G1 X109.131 Y122.483 E8.44576 F1800
+G1 X106.144 Y123.123 E8.54788 F1800
+G1 X103.089 Y123.510 E8.65000 F1800
+G1 X100.000 Y123.640 E8.75212 F1800
+G1 X96.911 Y123.510 E8.85423 F1800
+G1 X93.856 Y123.123 E8.95635 F1800
+G1 X90.869 Y122.483 E9.05847 F1800
+G1 X87.981 Y121.596 E9.16059 F1800
+G1 X85.225 Y120.473 E9.26270 F1800
+G1 X82.631 Y119.125 E9.36482 F1800
+G1 X80.227 Y117.568 E9.46694 F1800
+G1 X78.040 Y115.818 E9.56906 F1800
+G1 X76.094 Y113.895 E9.67117 F1800
+G1 X74.409 Y111.820 E9.77329 F1800
+G1 X73.005 Y109.615 E9.87541 F1800
+G1 X71.896 Y107.305 E9.97753 F1800
+G1 X71.096 Y104.915 E10.07964 F1800
+G1 X70.612 Y102.471 E10.18176 F1800
+G1 X70.450 Y100.000 E10.28388 F1800
+G1 X70.612 Y97.529 E10.38599 F1800
+G1 X71.096 Y95.085 E10.48811 F1800
+G1 X71.896 Y92.695 E10.59023 F1800
+G1 X73.005 Y90.385 E10.69235 F1800
+G1 X74.409 Y88.180 E10.79446 F1800
+G1 X76.094 Y86.105 E10.89658 F1800
+G1 X78.040 Y84.182 E10.99870 F1800
+G1 X80.227 Y82.432 E11.10082 F1800
+G1 X82.631 Y80.875 E11.20293 F1800
+G1 X85.225 Y79.527 E11.30505 F1800
+G1 X87.981 Y78.404 E11.40717 F1800
+G1 X90.869 Y77.517 E11.50929 F1800
+G1 X93.856 Y76.877 E11.61140 F1800
+G1 X96.911 Y76.490 E11.71352 F1800
+G1 X100.000 Y76.360 E11.81564 F1800
+G1 X103.089 Y76.490 E11.91776 F1800
+G1 X106.144 Y76.877 E12.01987 F1800
+G1 X109.131 Y77.517 E12.12199 F1800
+G1 X112.019 Y78.404 E12.22411 F1800
+G1 X114.775 Y79.527 E12.32623 F1800
+G1 X117.369 Y80.875 E12.42834 F1800
+G1 X119.773 Y82.432 E12.53046 F1800
+G1 X121.960 Y84.182 E12.63258 F1800
+G1 X123.906 Y86.105 E12.73470 F1800
+G1 X125.591 Y88.180 E12.83681 F1800
+G1 X126.995 Y90.385 E12.93893 F1800
+G1 X128.104 Y92.695 E13.04105 F1800
+G1 X128.904 Y95.085 E13.14317 F1800
+G1 X129.388 Y97.529 E13.24528 F1800
+G1 X129.550 Y100.000 E13.34740 F1800
+G1 E12.34740 F2400
+G0 X82.000 Y82.000 F9000
+G1 E13.34740 F2400
+G1 X118.000 Y82.000 E14.53540 F3000
+G1 X118.000 Y83.600 E14.58820
+G1 X82.000 Y83.600 E15.77620 F3000
+G1 X82.000 Y85.200 E15.82900
+G1 X118.000 Y85.200 E17.01700 F3000
+G1 X118.000 Y86.800 E17.06980
+G1 X82.000 Y86.800 E18.25780 F3000
+G1 X82.000 Y88.400 E18.31060
+G1 X118.000 Y88.400 E19.49860 F3000
+G1 X118.000 Y90.000 E19.55140
+G1 X82.000 Y90.000 E20.73940 F3000
+G1 X82.000 Y91.600 E20.79220
+G1 X118.000 Y91.600 E21.98020 F3000
+G1 X118.000 Y93.200 E22.03300
+G1 X82.000 Y93.200 E23.22100 F3000
+G1 X82.000 Y94.800 E23.27380
+G1 X118.000 Y94.800 E24.46180 F3000
+G1 X118.000 Y96.400 E24.51460
+G1 X82.000 Y96.400 E25.70260 F3000
+G1 X82.000 Y98.000 E25.75540
+G1 X118.000 Y98.000 E26.94340 F3000
+G1 X118.000 Y99.600 E26.99620
+G1 X82.000 Y99.600 E28.18420 F3000
+G1 X82.000 Y101.200 E28.23700
+G1 X118.000 Y101.200 E29.42500 F3000
+G1 X118.000 Y102.800 E29.47780
+G1 X82.000 Y102.800 E30.66580 F3000
+G1 X82.000 Y104.400 E30.71860
+G1 X118.000 Y104.400 E31.90660 F3000
+G1 X118.000 Y106.000 E31.95940
+G1 X82.000 Y106.000 E33.14740 F3000
+G1 X82.000 Y107.600 E33.20020
+G1 X118.000 Y107.600 E34.38820 F3000
+G1 X118.000 Y109.200 E34.44100
+G1 X82.000 Y109.200 E35.62900 F3000
+G1 X82.000 Y110.800 E35.68180
+G1 X118.000 Y110.800 E36.86980 F3000
+G1 X118.000 Y112.400 E36.92260
+G1 X82.000 Y112.400 E38.11060 F3000
+G1 X82.000 Y114.000 E38.16340
+G1 X118.000 Y114.000 E39.35140 F3000
+G1 X118.000 Y115.600 E39.40420
+G1 X82.000 Y115.600 E40.59220 F3000
+G1 X82.000 Y117.200 E40.64500
+G1 X118.000 Y117.200 E41.83300 F3000
+G1 X118.000 Y118.800 E41.88580
+G1 E40.88580 F2400
+G92 E0
+G1 Z1.300 F6000
+G0 X130.000 Y100.000 F9000
+G1 E1.00000 F2400
+G1 X129.836 Y102.509 E1.10367 F1800
+G1 X129.344 Y104.990 E1.20735 F1800
+G1 X128.532 Y107.416 E1.31102 F1800
+G1 X127.406 Y109.762 E1.41469 F1800
+G1 X125.981 Y112.000 E1.51836 F1800
+G1 X124.271 Y114.107 E1.62204 F1800
+G1 X122.294 Y116.059 E1.72571 F1800
+G1 X120.074 Y117.835 E1.82938 F1800
+G1 X117.634 Y119.416 E1.93305 F1800
+G1 X115.000 Y120.785 E2.03673 F1800
+G1 X112.202 Y121.925 E2.14040 F1800
+G1 X109.271 Y122.825 E2.24407 F1800
+G1 X106.237 Y123.476 E2.34774 F1800
+G1 X103.136 Y123.869 E2.45142 F1800
+G1 X100.000 Y124.000 E2.55509 F1800
+G1 X96.864 Y123.869 E2.65876 F1800
+G1 X93.763 Y123.476 E2.76243 F1800
+G1 X90.729 Y122.825 E2.86611 F1800
+G1 X87.798 Y121.925 E2.96978 F1800
+G1 X85.000 Y120.785 E3.07345 F1800
+G1 X82.366 Y119.416 E3.17712 F1800
+G1 X79.926 Y117.835 E3.28080 F1800
+G1 X77.706 Y116.059 E3.38447 F1800
+G1 X75.729 Y114.107 E3.48814 F1800
+G1 X74.019 Y112.000 E3.59181 F1800
+G1 X72.594 Y109.762 E3.69549 F1800
+G1 X71.468 Y107.416 E3.79916 F1800
+G1 X70.656 Y104.990 E3.90283 F1800
+G1 X70.164 Y102.509 E4.00650 F1800
+G1 X70.000 Y100.000 E4.11018 F1800
+G1 X70.164 Y97.491 E4.21385 F1800
+G1 X70.656 Y95.010 E4.31752 F1800
+G1 X71.468 Y92.584 E4.42119 F1800
+G1 X72.594 Y90.238 E4.52487 F1800
+G1 X74.019 Y88.000 E4.62854 F1800
+G1 X75.729 Y85.893 E4.73221 F1800
+G1 X77.706 Y83.941 E4.83588 F1800
+G1 X79.926 Y82.165 E4.93956 F1800
+G1 X82.366 Y80.584 E5.04323 F1800
+G1 X85.000 Y79.215 E5.14690 F1800
+G1 X87.798 Y78.075 E5.25057 F1800
+G1 X90.729 Y77.175 E5.35425 F1800
+G1 X93.763 Y76.524 E5.45792 F1800
+G1 X96.864 Y76.131 E5.56159 F1800
+G1 X100.000 Y76.000 E5.66527 F1800
+G1 X103.136 Y76.131 E5.76894 F1800
+G1 X106.237 Y76.524 E5.87261 F1800
+G1 X109.271 Y77.175 E5.97628 F1800
+G1 X112.202 Y78.075 E6.07996 F1800
+G1 X115.000 Y79.215 E6.18363 F1800
+G1 X117.634 Y80.584 E6.28730 F1800
+G1 X120.074 Y82.165 E6.39097 F1800
+G1 X122.294 Y83.941 E6.49465 F1800
+G1 X124.271 Y85.893 E6.59832 F1800
+G1 X125.981 Y88.000 E6.70199 F1800
+G1 X127.406 Y90.238 E6.80566 F1800
+G1 X128.532 Y92.584 E6.90934 F1800
+G1 X129.344 Y95.010 E7.01301 F1800
+G1 X129.836 Y97.491 E7.11668 F1800
+G1 X130.000 Y100.000 E7.22035 F1800
+G1 E6.22035 F2400
+G0 X129.550 Y100.000 F9000
+G1 E7.22035 F2400
+G1 X129.388 Y102.471 E7.32247 F1800
+G1 X128.904 Y104.915 E7.42459 F1800
+G1 X128.104 Y107.305 E7.52671 F1800
+G1 X126.995 Y109.615 E7.62882 F1800
+G1 X125.591 Y111.820 E7.73094 F1800
+G1 X123.906 Y113.895 E7.83306 F1800
+G1 X121.960 Y115.818 E7.93518 F1800
+G1 X119.773 Y117.568 E8.03729 F1800
+G1 X117.369 Y119.125 E8.13941 F1800
+G1 X114.775 Y120.473 E8.24153 F1800
+G1 X112.019 Y121.596 E8.34365 F1800
+G1 X109.131 Y122.483 E8.44576 F1800
+G1 X106.144 Y123.123 E8.54788 F1800
+G1 X103.089 Y123.510 E8.65000 F1800
+G1 X100.000 Y123.640 E8.75212 F1800
+G1 X96.911 Y123.510 E8.85423 F1800
+G1 X93.856 Y123.123 E8.95635 F1800
+G1 X90.869 Y122.483 E9.05847 F1800
+G1 X87.981 Y121.596 E9.16059 F1800
+G1 X85.225 Y120.473 E9.26270 F1800
+G1 X82.631 Y119.125 E9.36482 F1800
+G1 X80.227 Y117.568 E9.46694 F1800
+G1 X78.040 Y115.818 E9.56906 F1800
+G1 X76.094 Y113.895 E9.67117 F1800
+G1 X74.409 Y111.820 E9.77329 F1800
+G1 X73.005 Y109.615 E9.87541 F1800
+G1 X71.896 Y107.305 E9.97753 F1800
+G1 X71.096 Y104.915 E10.07964 F1800
+G1 X70.612 Y102.471 E10.18176 F1800
+G1 X70.450 Y100.000 E10.28388 F1800
+G1 X70.612 Y97.529 E10.38599 F1800
+G1 X71.096 Y95.085 E10.48811 F1800
+G1 X71.896 Y92.695 E10.59023 F1800
+G1 X73.005 Y90.385 E10.69235 F1800
+G1 X74.409 Y88.180 E10.79446 F1800
+G1 X76.094 Y86.105 E10.89658 F1800
+G1 X78.040 Y84.182 E10.99870 F1800
+G1 X80.227 Y82.432 E11.10082 F1800
+G1 X82.631 Y80.875 E11.20293 F1800
+G1 X85.225 Y79.527 E11.30505 F1800
+G1 X87.981 Y78.404 E11.40717 F1800
+G1 X90.869 Y77.517 E11.50929 F1800
+G1 X93.856 Y76.877 E11.61140 F1800
+G1 X96.911 Y76.490 E11.71352 F1800
+G1 X100.000 Y76.360 E11.81564 F1800
+G1 X103.089 Y76.490 E11.91776 F1800
+G1 X106.144 Y76.877 E12.01987 F1800
+G1 X109.131 Y77.517 E12.12199 F1800
+G1 X112.019 Y78.404 E12.22411 F1800
+G1 X114.775 Y79.527 E12.32623 F1800
+G1 X117.369 Y80.875 E12.42834 F1800
+G1 X119.773 Y82.432 E12.53046 F1800
+G1 X121.960 Y84.182 E12.63258 F1800
+G1 X123.906 Y86.105 E12.73470 F1800
+G1 X125.591 Y88.180 E12.83681 F1800
+G1 X126.995 Y90.385 E12.93893 F1800
+G1 X128.104 Y92.695 E13.04105 F1800
+G1 X128.904 Y95.085 E13.14317 F1800
+G1 X129.388 Y97.529 E13.24528 F1800
+G1 X129.550 Y100.000 E13.34740 F1800
+G1 E12.34740 F2400
+G0 X82.000 Y82.000 F9000
+G1 E13.34740 F2400
+G1 X118.000 Y82.000 E14.53540 F3000
+G1 X118.000 Y83.600 E14.58820
+G1 X82.000 Y83.600 E15.77620 F3000
+G1 X82.000 Y85.200 E15.82900
+G1 X118.000 Y85.200 E17.01700 F3000
+G1 X118.000 Y86.800 E17.06980
+G1 X82.000 Y86.800 E18.25780 F3000
+G1 X82.000 Y88.400 E18.31060
+G1 X118.000 Y88.400 E19.49860 F3000
+G1 X118.000 Y90.000 E19.55140
+G1 X82.000 Y90.000 E20.73940 F3000
+G1 X82.000 Y91.600 E20.79220
+G1 X118.000 Y91.600 E21.98020 F3000
+G1 X118.000 Y93.200 E22.03300
+G1 X82.000 Y93.200 E23.22100 F3000
+G1 X82.000 Y94.800 E23.27380
+G1 X118.000 Y94.800 E24.46180 F3000
+G1 X118.000 Y96.400 E24.51460
+G1 X82.000 Y96.400 E25.70260 F3000
+G1 X82.000 Y98.000 E25.75540
+G1 X118.000 Y98.000 E26.94340 F3000
+G1 X118.000 Y99.600 E26.99620
+G1 X82.000 Y99.600 E28.18420 F3000
+G1 X82.000 Y101.200 E28.23700
+G1 X118.000 Y101.200 E29.42500 F3000
+G1 X118.000 Y102.800 E29.47780
+G1 X82.000 Y102.800 E30.66580 F3000
+G1 X82.000 Y104.400 E30.71860
+G1 X118.000 Y104.400 E31.90660 F3000
+G1 X118.000 Y106.000 E31.95940
+G1 X82.000 Y106.000 E33.14740 F3000
+G1 X82.000 Y107.600 E33.20020
+G1 X118.000 Y107.600 E34.38820 F3000
+G1 X118.000 Y109.200 E34.44100
+G1 X82.000 Y109.200 E35.62900 F3000
+G1 X82.000 Y110.800 E35.68180
+G1 X118.000 Y110.800 E36.86980 F3000
+G1 X118.000 Y112.400 E36.92260
+G1 X82.000 Y112.400 E38.11060 F3000
+G1 X82.000 Y114.000 E38.16340
+G1 X118.000 Y114.000 E39.35140 F3000
+G1 X118.000 Y115.600 E39.40420
+G1 X82.000 Y115.600 E40.59220 F3000
+G1 X82.000 Y117.200 E40.64500
+G1 X118.000 Y117.200 E41.83300 F3000
+G1 X118.000 Y118.800 E41.88580
+G1 E40.88580 F2400
+G92 E0
+G1 Z1.500 F6000
+G0 X130.000 Y100.000 F9000
+G1 E1.00000 F2400
+G1 X129.836 Y102.509 E1.10367 F1800
+G1 X129.344 Y104.990 E1.20735 F1800
+G1 X128.532 Y107.416 E1.31102 F1800
+G1 X127.406 Y109.762 E1.41469 F1800
+G1 X125.981 Y112.000 E1.51836 F1800
+G1 X124.271 Y114.107 E1.62204 F1800
+G1 X122.294 Y116.059 E1.72571 F1800
+G1 X120.074 Y117.835 E1.82938 F1800
+G1 X117.634 Y119.416 E1.93305 F1800
+G1 X115.000 Y120.785 E2.03673 F1800
+G1 X112.202 Y121.925 E2.14040 F1800
+G1 X109.271 Y122.825 E2.24407 F1800
+G1 X106.237 Y123.476 E2.34774 F1800
+G1 X103.136 Y123.869 E2.45142 F1800
+G1 X100.000 Y124.000 E2.55509 F1800
+G1 X96.864 Y123.869 E2.65876 F1800
+G1 X93.763 Y123.476 E2.76243 F1800
+G1 X90.729 Y122.825 E2.86611 F1800
+G1 X87.798 Y121.925 E2.96978 F1800
+G1 X85.000 Y120.785 E3.07345 F1800
+G1 X82.366 Y119.416 E3.17712 F1800
+G1 X79.926 Y117.835 E3.28080 F1800
+G1 X77.706 Y116.059 E3.38447 F1800
+G1 X75.729 Y114.107 E3.48814 F1800
+G1 X74.019 Y112.000 E3.59181 F1800
+G1 X72.594 Y109.762 E3.69549 F1800
+G1 X71.468 Y107.416 E3.79916 F1800
+G1 X70.656 Y104.990 E3.90283 F1800
+G1 X70.164 Y102.509 E4.00650 F1800
+G1 X70.000 Y100.000 E4.11018 F1800
+G1 X70.164 Y97.491 E4.21385 F1800
+G1 X70.656 Y95.010 E4.31752 F1800
+G1 X71.468 Y92.584 E4.42119 F1800
+G1 X72.594 Y90.238 E4.52487 F1800
+G1 X74.019 Y88.000 E4.62854 F1800
+G1 X75.729 Y85.893 E4.73221 F1800
+G1 X77.706 Y83.941 E4.83588 F1800
+G1 X79.926 Y82.165 E4.93956 F1800
+G1 X82.366 Y80.584 E5.04323 F1800
+G1 X85.000 Y79.215 E5.14690 F1800
+G1 X87.798 Y78.075 E5.25057 F1800
+G1 X90.729 Y77.175 E5.35425 F1800
+G1 X93.763 Y76.524 E5.45792 F1800
+G1 X96.864 Y76.131 E5.56159 F1800
+G1 X100.000 Y76.000 E5.66527 F1800
+G1 X103.136 Y76.131 E5.76894 F1800
+G1 X106.237 Y76.524 E5.87261 F1800
+G1 X109.271 Y77.175 E5.97628 F1800
+G1 X112.202 Y78.075 E6.07996 F1800
+G1 X115.000 Y79.215 E6.18363 F1800
+G1 X117.634 Y80.584 E6.28730 F1800
+G1 X120.074 Y82.165 E6.39097 F1800
+G1 X122.294 Y83.941 E6.49465 F1800
+G1 X124.271 Y85.893 E6.59832 F1800
+G1 X125.981 Y88.000 E6.70199 F1800
+G1 X127.406 Y90.238 E6.80566 F1800
+G1 X128.532 Y92.584 E6.90934 F1800
+G1 X129.344 Y95.010 E7.01301 F1800
+G1 X129.836 Y97.491 E7.11668 F1800
+G1 X130.000 Y100.000 E7.22035 F1800
+G1 E6.22035 F2400
+G0 X129.550 Y100.000 F9000
+G1 E7.22035 F2400
+G1 X129.388 Y102.471 E7.32247 F1800
+G1 X128.904 Y104.915 E7.42459 F1800
+G1 X128.104 Y107.305 E7.52671 F1800
+G1 X126.995 Y109.615 E7.62882 F1800
+G1 X125.591 Y111.820 E7.73094 F1800
+G1 X123.906 Y113.895 E7.83306 F1800
+G1 X121.960 Y115.818 E7.93518 F1800
+G1 X119.773 Y117.568 E8.03729 F1800
+G1 X117.369 Y119.125 E8.13941 F1800
+G1 X114.775 Y120.473 E8.24153 F1800
+G1 X112.019 Y121.596 E8.34365 F1800
+G1 X109.131 Y122.483 E8.44576 F1800
+G1 X106.144 Y123.123 E8.54788 F1800
+G1 X103.089 Y123.510 E8.65000 F1800
+G1 X100.000 Y123.640 E8.75212 F1800
+G1 X96.911 Y123.510 E8.85423 F1800
+G1 X93.856 Y123.123 E8.95635 F1800
+G1 X90.869 Y122.483 E9.05847 F1800
+G1 X87.981 Y121.596 E9.16059 F1800
+G1 X85.225 Y120.473 E9.26270 F1800
+G1 X82.631 Y119.125 E9.36482 F1800
+G1 X80.227 Y117.568 E9.46694 F1800
+G1 X78.040 Y115.818 E9.56906 F1800
+G1 X76.094 Y113.895 E9.67117 F1800
+G1 X74.409 Y111.820 E9.77329 F1800
+G1 X73.005 Y109.615 E9.87541 F1800
+G1 X71.896 Y107.305 E9.97753 F1800
+G1 X71.096 Y104.915 E10.07964 F1800
+G1 X70.612 Y102.471 E10.18176 F1800
+G1 X70.450 Y100.000 E10.28388 F1800
+G1 X70.612 Y97.529 E10.38599 F1800
+G1 X71.096 Y95.085 E10.48811 F1800
+G1 X71.896 Y92.695 E10.59023 F1800
+G1 X73.005 Y90.385 E10.69235 F1800
+G1 X74.409 Y88.180 E10.79446 F1800
+G1 X76.094 Y86.105 E10.89658 F1800
+G1 X78.040 Y84.182 E10.99870 F1800
+G1 X80.227 Y82.432 E11.10082 F1800
+G1 X82.631 Y80.875 E11.20293 F1800
+G1 X85.225 Y79.527 E11.30505 F1800
+G1 X87.981 Y78.404 E11.40717 F1800
+G1 X90.869 Y77.517 E11.50929 F1800
+G1 X93.856 Y76.877 E11.61140 F1800
+G1 X96.911 Y76.490 E11.71352 F1800
+G1 X100.000 Y76.360 E11.81564 F1800
+G1 X103.089 Y76.490 E11.91776 F1800
+G1 X106.144 Y76.877 E12.01987 F1800
+G1 X109.131 Y77.517 E12.12199 F1800
+G1 X112.019 Y78.404 E12.22411 F1800
+G1 X114.775 Y79.527 E12.32623 F1800
+G1 X117.369 Y80.875 E12.42834 F1800
+G1 X119.773 Y82.432 E12.53046 F1800
+G1 X121.960 Y84.182 E12.63258 F1800
+G1 X123.906 Y86.105 E12.73470 F1800
+G1 X125.591 Y88.180 E12.83681 F1800
+G1 X126.995 Y90.385 E12.93893 F1800
+G1 X128.104 Y92.695 E13.04105 F1800
+G1 X128.904 Y95.085 E13.14317 F1800
+G1 X129.388 Y97.529 E13.24528 F1800
+G1 X129.550 Y100.000 E13.34740 F1800
+G1 E12.34740 F2400
+G0 X82.000 Y82.000 F9000
+G1 E13.34740 F2400
+G1 X118.000 Y82.000 E14.53540 F3000
+G1 X118.000 Y83.600 E14.58820
+G1 X82.000 Y83.600 E15.77620 F3000
+G1 X82.000 Y85.200 E15.82900
+G1 X118.000 Y85.200 E17.01700 F3000
+G1 X118.000 Y86.800 E17.06980
+G1 X82.000 Y86.800 E18.25780 F3000
+G1 X82.000 Y88.400 E18.31060
+G1 X118.000 Y88.400 E19.49860 F3000
+G1 X118.000 Y90.000 E19.55140
+G1 X82.000 Y90.000 E20.73940 F3000
+G1 X82.000 Y91.600 E20.79220
+G1 X118.000 Y91.600 E21.98020 F3000
+G1 X118.000 Y93.200 E22.03300
+G1 X82.000 Y93.200 E23.22100 F3000
+G1 X82.000 Y94.800 E23.27380
+G1 X118.000 Y94.800 E24.46180 F3000
+G1 X118.000 Y96.400 E24.51460
+G1 X82.000 Y96.400 E25.70260 F3000
+G1 X82.000 Y98.000 E25.75540
+G1 X118.000 Y98.000 E26.94340 F3000
+G1 X118.000 Y99.600 E26.99620
+G1 X82.000 Y99.600 E28.18420 F3000
+G1 X82.000 Y101.200 E28.23700
+G1 X118.000 Y101.200 E29.42500 F3000
+G1 X118.000 Y102.800 E29.47780
+G1 X82.000 Y102.800 E30.66580 F3000
+G1 X82.000 Y104.400 E30.71860
+G1 X118.000 Y104.400 E31.90660 F3000
+G1 X118.000 Y106.000 E31.95940
+G1 X82.000 Y106.000 E33.14740 F3000
+G1 X82.000 Y107.600 E33.20020
+G1 X118.000 Y107.600 E34.38820 F3000
+G1 X118.000 Y109.200 E34.44100
+G1 X82.000 Y109.200 E35.62900 F3000
+G1 X82.000 Y110.800 E35.68180
+G1 X118.000 Y110.800 E36.86980 F3000
+G1 X118.000 Y112.400 E36.92260
+G1 X82.000 Y112.400 E38.11060 F3000
+G1 X82.000 Y114.000 E38.16340
+G1 X118.000 Y114.000 E39.35140 F3000
+G1 X118.000 Y115.600 E39.40420
+G1 X82.000 Y115.600 E40.59220 F3000
+G1 X82.000 Y117.200 E40.64500
+G1 X118.000 Y117.200 E41.83300 F3000
+G1 X118.000 Y118.800 E41.88580
+G1 E40.88580 F2400
+G92 E0
+G1 Z1.700 F6000
+G0 X130.000 Y100.000 F9000
+G1 E1.00000 F2400
+G1 X129.836 Y102.509 E1.10367 F1800
+G1 X129.344 Y104.990 E1.20735 F1800
+G1 X128.532 Y107.416 E1.31102 F1800
+G1 X127.406 Y109.762 E1.41469 F1800
+G1 X125.981 Y112.000 E1.51836 F1800
+G1 X124.271 Y114.107 E1.62204 F1800
+G1 X122.294 Y116.059 E1.72571 F1800
+G1 X120.074 Y117.835 E1.82938 F1800
+G1 X117.634 Y119.416 E1.93305 F1800
+G1 X115.000 Y120.785 E2.03673 F1800
+G1 X112.202 Y121.925 E2.14040 F1800
+G1 X109.271 Y122.825 E2.24407 F1800
+G1 X106.237 Y123.476 E2.34774 F1800
+G1 X103.136 Y123.869 E2.45142 F1800
+G1 X100.000 Y124.000 E2.55509 F1800
+G1 X96.864 Y123.869 E2.65876 F1800
+G1 X93.763 Y123.476 E2.76243 F1800
+G1 X90.729 Y122.825 E2.86611 F1800
+G1 X87.798 Y121.925 E2.96978 F1800
+G1 X85.000 Y120.785 E3.07345 F1800
+G1 X82.366 Y119.416 E3.17712 F1800
+G1 X79.926 Y117.835 E3.28080 F1800
+G1 X77.706 Y116.059 E3.38447 F1800
+G1 X75.729 Y114.107 E3.48814 F1800
+G1 X74.019 Y112.000 E3.59181 F1800
+G1 X72.594 Y109.762 E3.69549 F1800
+G1 X71.468 Y107.416 E3.79916 F1800
+G1 X70.656 Y104.990 E3.90283 F1800
+G1 X70.164 Y102.509 E4.00650 F1800
+G1 X70.000 Y100.000 E4.11018 F1800
+G1 X70.164 Y97.491 E4.21385 F1800
+G1 X70.656 Y95.010 E4.31752 F1800
+G1 X71.468 Y92.584 E4.42119 F1800
+G1 X72.594 Y90.238 E4.52487 F1800
+G1 X74.019 Y88.000 E4.62854 F1800
+G1 X75.729 Y85.893 E4.73221 F1800
+G1 X77.706 Y83.941 E4.83588 F1800
+G1 X79.926 Y82.165 E4.93956 F1800
+G1 X82.366 Y80.584 E5.04323 F1800
+G1 X85.000 Y79.215 E5.14690 F1800
+G1 X87.798 Y78.075 E5.25057 F1800
+G1 X90.729 Y77.175 E5.35425 F1800
+G1 X93.763 Y76.524 E5.45792 F1800
+G1 X96.864 Y76.131 E5.56159 F1800
+G1 X100.000 Y76.000 E5.66527 F1800
+G1 X103.136 Y76.131 E5.76894 F1800
+G1 X106.237 Y76.524 E5.87261 F1800
+G1 X109.271 Y77.175 E5.97628 F1800
+G1 X112.202 Y78.075 E6.07996 F1800
+G1 X115.000 Y79.215 E6.18363 F1800
+G1 X117.634 Y80.584 E6.28730 F1800
+G1 X120.074 Y82.165 E6.39097 F1800
+G1 X122.294 Y83.941 E6.49465 F1800
+G1 X124.271 Y85.893 E6.59832 F1800
+G1 X125.981 Y88.000 E6.70199 F1800
+G1 X127.406 Y90.238 E6.80566 F1800
+G1 X128.532 Y92.584 E6.90934 F1800
+G1 X129.344 Y95.010 E7.01301 F1800
+G1 X129.836 Y97.491 E7.11668 F1800
+G1 X130.000 Y100.000 E7.22035 F1800
+G1 E6.22035 F2400
+G0 X129.550 Y100.000 F9000
+G1 E7.22035 F2400
+G1 X129.388 Y102.471 E7.32247 F1800
+G1 X128.904 Y104.915 E7.42459 F1800
+G1 X128.104 Y107.305 E7.52671 F1800
+G1 X126.995 Y109.615 E7.62882 F1800
+G1 X125.591 Y111.820 E7.73094 F1800
+G1 X123.906 Y113.895 E7.83306 F1800
+G1 X121.960 Y115.818 E7.93518 F1800
+G1 X119.773 Y117.568 E8.03729 F1800
+G1 X117.369 Y119.125 E8.13941 F1800
+G1 X114.775 Y120.473 E8.24153 F1800
+G1 X112.019 Y121.596 E8.34365 F1800
+G1 X109.131 Y122.483 E8.44576 F1800
+G1 X106.144 Y123.123 E8.54788 F1800
+G1 X103.089 Y123.510 E8.65000 F1800
+G1 X100.000 Y123.640 E8.75212 F1800
+G1 X96.911 Y123.510 E8.85423 F1800
+G1 X93.856 Y123.123 E8.95635 F1800
+G1 X90.869 Y122.483 E9.05847 F1800
+G1 X87.981 Y121.596 E9.16059 F1800
+G1 X85.225 Y120.473 E9.26270 F1800
+G1 X82.631 Y119.125 E9.36482 F1800
+G1 X80.227 Y117.568 E9.46694 F1800
+G1 X78.040 Y115.818 E9.56906 F1800
+G1 X76.094 Y113.895 E9.67117 F1800
+G1 X74.409 Y111.820 E9.77329 F1800
+G1 X73.005 Y109.615 E9.87541 F1800
+G1 X71.896 Y107.305 E9.97753 F1800
+G1 X71.096 Y104.915 E10.07964 F1800
+G1 X70.612 Y102.471 E10.18176 F1800
+G1 X70.450 Y100.000 E10.28388 F1800
+G1 X70.612 Y97.529 E10.38599 F1800
+G1 X71.096 Y95.085 E10.48811 F1800
+G1 X71.896 Y92.695 E10.59023 F1800
+G1 X73.005 Y90.385 E10.69235 F1800
+G1 X74.409 Y88.180 E10.79446 F1800
+G1 X76.094 Y86.105 E10.89658 F1800
+G1 X78.040 Y84.182 E10.99870 F1800
+G1 X80.227 Y82.432 E11.10082 F1800
+G1 X82.631 Y80.875 E11.20293 F1800
+G1 X85.225 Y79.527 E11.30505 F1800
+G1 X87.981 Y78.404 E11.40717 F1800
+G1 X90.869 Y77.517 E11.50929 F1800
+G1 X93.856 Y76.877 E11.61140 F1800
+G1 X96.911 Y76.490 E11.71352 F1800
+G1 X100.000 Y76.360 E11.81564 F1800
+G1 X103.089 Y76.490 E11.91776 F1800
+G1 X106.144 Y76.877 E12.01987 F1800
+G1 X109.131 Y77.517 E12.12199 F1800
+G1 X112.019 Y78.404 E12.22411 F1800
+G1 X114.775 Y79.527 E12.32623 F1800
+G1 X117.369 Y80.875 E12.42834 F1800
+G1 X119.773 Y82.432 E12.53046 F1800
+G1 X121.960 Y84.182 E12.63258 F1800
+G1 X123.906 Y86.105 E12.73470 F1800
+G1 X125.591 Y88.180 E12.83681 F1800
+G1 X126.995 Y90.385 E12.93893 F1800
+G1 X128.104 Y92.695 E13.04105 F1800
+G1 X128.904 Y95.085 E13.14317 F1800
+G1 X129.388 Y97.529 E13.24528 F1800
+G1 X129.550 Y100.000 E13.34740 F1800
+G1 E12.34740 F2400
+G0 X82.000 Y82.000 F9000
+G1 E13.34740 F2400
+G1 X118.000 Y82.000 E14.53540 F3000
+G1 X118.000 Y83.600 E14.58820
+G1 X82.000 Y83.600 E15.77620 F3000
+G1 X82.000 Y85.200 E15.82900
+G1 X118.000 Y85.200 E17.01700 F3000
+G1 X118.000 Y86.800 E17.06980
+G1 X82.000 Y86.800 E18.25780 F3000
+G1 X82.000 Y88.400 E18.31060
+G1 X118.000 Y88.400 E19.49860 F3000
+G1 X118.000 Y90.000 E19.55140
+G1 X82.000 Y90.000 E20.73940 F3000
+G1 X82.000 Y91.600 E20.79220
+G1 X118.000 Y91.600 E21.98020 F3000
+G1 X118.000 Y93.200 E22.03300
+G1 X82.000 Y93.200 E23.22100 F3000
+G1 X82.000 Y94.800 E23.27380
+G1 X118.000 Y94.800 E24.46180 F3000
+G1 X118.000 Y96.400 E24.51460
+G1 X82.000 Y96.400 E25.70260 F3000
+G1 X82.000 Y98.000 E25.75540
+G1 X118.000 Y98.000 E26.94340 F3000
+G1 X118.000 Y99.600 E26.99620
+G1 X82.000 Y99.600 E28.18420 F3000
+G1 X82.000 Y101.200 E28.23700
+G1 X118.000 Y101.200 E29.42500 F3000
+G1 X118.000 Y102.800 E29.47780
+G1 X82.000 Y102.800 E30.66580 F3000
+G1 X82.000 Y104.400 E30.71860
+G1 X118.000 Y104.400 E31.90660 F3000
+G1 X118.000 Y106.000 E31.95940
+G1 X82.000 Y106.000 E33.14740 F3000
+G1 X82.000 Y107.600 E33.20020
+G1 X118.000 Y107.600 E34.38820 F3000
+G1 X118.000 Y109.200 E34.44100
+G1 X82.000 Y109.200 E35.62900 F3000
+G1 X82.000 Y110.800 E35.68180
+G1 X118.000 Y110.800 E36.86980 F3000
+G1 X118.000 Y112.400 E36.92260
+G1 X82.000 Y112.400 E38.11060 F3000
+G1 X82.000 Y114.000 E38.16340
+G1 X118.000 Y114.000 E39.35140 F3000
+G1 X118.000 Y115.600 E39.40420
+G1 X82.000 Y115.600 E40.59220 F3000
+G1 X82.000 Y117.200 E40.64500
+G1 X118.000 Y117.200 E41.83300 F3000
+G1 X118.000 Y118.800 E41.88580
+G1 E40.88580 F2400
+G92 E0
+M104 S0
+M140 S0
+M107
+G28 X0 Y0
+M84
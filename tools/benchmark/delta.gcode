@@ -0,0 +1,668 @@
+; Delta: perimeters and infill, centered on the origin
+; config: kossel_mini.cfg
+G21
+G90
+M82
+M104 S0
+M140 S0
+G28
+G92 E0
+M106 S255
+G1 F9000
+G1 Z0.300 F6000
+G0 X20.000 Y0.000 F9000
+G1 E1.00000 F2400
+G1 X19.890 Y1.672 E1.06912 F1800
+G1 X19.563 Y3.327 E1.13823 F1800
+G1 X19.021 Y4.944 E1.20735 F1800
+G1 X18.271 Y6.508 E1.27646 F1800
+G1 X17.321 Y8.000 E1.34558 F1800
+G1 X16.180 Y9.405 E1.41469 F1800
+G1 X14.863 Y10.706 E1.48381 F1800
+G1 X13.383 Y11.890 E1.55292 F1800
+G1 X11.756 Y12.944 E1.62204 F1800
+G1 X10.000 Y13.856 E1.69115 F1800
+G1 X8.135 Y14.617 E1.76027 F1800
+G1 X6.180 Y15.217 E1.82938 F1800
+G1 X4.158 Y15.650 E1.89850 F1800
+G1 X2.091 Y15.912 E1.96761 F1800
+G1 X0.000 Y16.000 E2.03673 F1800
+G1 X-2.091 Y15.912 E2.10584 F1800
+G1 X-4.158 Y15.650 E2.17496 F1800
+G1 X-6.180 Y15.217 E2.24407 F1800
+G1 X-8.135 Y14.617 E2.31319 F1800
+G1 X-10.000 Y13.856 E2.38230 F1800
+G1 X-11.756 Y12.944 E2.45142 F1800
+G1 X-13.383 Y11.890 E2.52053 F1800
+G1 X-14.863 Y10.706 E2.58965 F1800
+G1 X-16.180 Y9.405 E2.65876 F1800
+G1 X-17.321 Y8.000 E2.72788 F1800
+G1 X-18.271 Y6.508 E2.79699 F1800
+G1 X-19.021 Y4.944 E2.86611 F1800
+G1 X-19.563 Y3.327 E2.93522 F1800
+G1 X-19.890 Y1.672 E3.00434 F1800
+G1 X-20.000 Y0.000 E3.07345 F1800
+G1 X-19.890 Y-1.672 E3.14257 F1800
+G1 X-19.563 Y-3.327 E3.21168 F1800
+G1 X-19.021 Y-4.944 E3.28080 F1800
+G1 X-18.271 Y-6.508 E3.34991 F1800
+G1 X-17.321 Y-8.000 E3.41903 F1800
+G1 X-16.180 Y-9.405 E3.48814 F1800
+G1 X-14.863 Y-10.706 E3.55726 F1800
+G1 X-13.383 Y-11.890 E3.62637 F1800
+G1 X-11.756 Y-12.944 E3.69549 F1800
+G1 X-10.000 Y-13.856 E3.76460 F1800
+G1 X-8.135 Y-14.617 E3.83372 F1800
+G1 X-6.180 Y-15.217 E3.90283 F1800
+G1 X-4.158 Y-15.650 E3.97195 F1800
+G1 X-2.091 Y-15.912 E4.04106 F1800
+G1 X-0.000 Y-16.000 E4.11018 F1800
+G1 X2.091 Y-15.912 E4.17929 F1800
+G1 X4.158 Y-15.650 E4.24841 F1800
+G1 X6.180 Y-15.217 E4.31752 F1800
+G1 X8.135 Y-14.617 E4.38664 F1800
+G1 X10.000 Y-13.856 E4.45575 F1800
+G1 X11.756 Y-12.944 E4.52487 F1800
+G1 X13.383 Y-11.890 E4.59398 F1800
+G1 X14.863 Y-10.706 E4.66310 F1800
+G1 X16.180 Y-9.405 E4.73221 F1800
+G1 X17.321 Y-8.000 E4.80133 F1800
+G1 X18.271 Y-6.508 E4.87044 F1800
+G1 X19.021 Y-4.944 E4.93956 F1800
+G1 X19.563 Y-3.327 E5.00867 F1800
+G1 X19.890 Y-1.672 E5.07779 F1800
+G1 X20.000 Y-0.000 E5.14690 F1800
+G1 E4.14690 F2400
+G0 X19.550 Y0.000 F9000
+G1 E5.14690 F2400
+G1 X19.443 Y1.635 E5.21446 F1800
+G1 X19.123 Y3.252 E5.28202 F1800
+G1 X18.593 Y4.833 E5.34958 F1800
+G1 X17.860 Y6.361 E5.41714 F1800
+G1 X16.931 Y7.820 E5.48470 F1800
+G1 X15.816 Y9.193 E5.55226 F1800
+G1 X14.528 Y10.465 E5.61982 F1800
+G1 X13.082 Y11.623 E5.68738 F1800
+G1 X11.491 Y12.653 E5.75494 F1800
+G1 X9.775 Y13.545 E5.82250 F1800
+G1 X7.952 Y14.288 E5.89006 F1800
+G1 X6.041 Y14.875 E5.95762 F1800
+G1 X4.065 Y15.298 E6.02518 F1800
+G1 X2.044 Y15.554 E6.09274 F1800
+G1 X0.000 Y15.640 E6.16030 F1800
+G1 X-2.044 Y15.554 E6.22786 F1800
+G1 X-4.065 Y15.298 E6.29542 F1800
+G1 X-6.041 Y14.875 E6.36298 F1800
+G1 X-7.952 Y14.288 E6.43054 F1800
+G1 X-9.775 Y13.545 E6.49810 F1800
+G1 X-11.491 Y12.653 E6.56566 F1800
+G1 X-13.082 Y11.623 E6.63322 F1800
+G1 X-14.528 Y10.465 E6.70078 F1800
+G1 X-15.816 Y9.193 E6.76834 F1800
+G1 X-16.931 Y7.820 E6.83590 F1800
+G1 X-17.860 Y6.361 E6.90346 F1800
+G1 X-18.593 Y4.833 E6.97102 F1800
+G1 X-19.123 Y3.252 E7.03858 F1800
+G1 X-19.443 Y1.635 E7.10614 F1800
+G1 X-19.550 Y0.000 E7.17370 F1800
+G1 X-19.443 Y-1.635 E7.24126 F1800
+G1 X-19.123 Y-3.252 E7.30882 F1800
+G1 X-18.593 Y-4.833 E7.37638 F1800
+G1 X-17.860 Y-6.361 E7.44394 F1800
+G1 X-16.931 Y-7.820 E7.51150 F1800
+G1 X-15.816 Y-9.193 E7.57906 F1800
+G1 X-14.528 Y-10.465 E7.64662 F1800
+G1 X-13.082 Y-11.623 E7.71418 F1800
+G1 X-11.491 Y-12.653 E7.78174 F1800
+G1 X-9.775 Y-13.545 E7.84930 F1800
+G1 X-7.952 Y-14.288 E7.91686 F1800
+G1 X-6.041 Y-14.875 E7.98442 F1800
+G1 X-4.065 Y-15.298 E8.05198 F1800
+G1 X-2.044 Y-15.554 E8.11954 F1800
+G1 X-0.000 Y-15.640 E8.18710 F1800
+G1 X2.044 Y-15.554 E8.25466 F1800
+G1 X4.065 Y-15.298 E8.32222 F1800
+G1 X6.041 Y-14.875 E8.38978 F1800
+G1 X7.952 Y-14.288 E8.45734 F1800
+G1 X9.775 Y-13.545 E8.52490 F1800
+G1 X11.491 Y-12.653 E8.59246 F1800
+G1 X13.082 Y-11.623 E8.66002 F1800
+G1 X14.528 Y-10.465 E8.72758 F1800
+G1 X15.816 Y-9.193 E8.79514 F1800
+G1 X16.931 Y-7.820 E8.86270 F1800
+G1 X17.860 Y-6.361 E8.93026 F1800
+G1 X18.593 Y-4.833 E8.99782 F1800
+G1 X19.123 Y-3.252 E9.06538 F1800
+G1 X19.443 Y-1.635 E9.13294 F1800
+G1 X19.550 Y-0.000 E9.20050 F1800
+G1 E8.20050 F2400
+G0 X-12.000 Y-12.000 F9000
+G1 E9.20050 F2400
+G1 X12.000 Y-12.000 E9.99250 F3000
+G1 X12.000 Y-10.400 E10.04530
+G1 X-12.000 Y-10.400 E10.83730 F3000
+G1 X-12.000 Y-8.800 E10.89010
+G1 X12.000 Y-8.800 E11.68210 F3000
+G1 X12.000 Y-7.200 E11.73490
+G1 X-12.000 Y-7.200 E12.52690 F3000
+G1 X-12.000 Y-5.600 E12.57970
+G1 X12.000 Y-5.600 E13.37170 F3000
+G1 X12.000 Y-4.000 E13.42450
+G1 X-12.000 Y-4.000 E14.21650 F3000
+G1 X-12.000 Y-2.400 E14.26930
+G1 X12.000 Y-2.400 E15.06130 F3000
+G1 X12.000 Y-0.800 E15.11410
+G1 X-12.000 Y-0.800 E15.90610 F3000
+G1 X-12.000 Y0.800 E15.95890
+G1 X12.000 Y0.800 E16.75090 F3000
+G1 X12.000 Y2.400 E16.80370
+G1 X-12.000 Y2.400 E17.59570 F3000
+G1 X-12.000 Y4.000 E17.64850
+G1 X12.000 Y4.000 E18.44050 F3000
+G1 X12.000 Y5.600 E18.49330
+G1 X-12.000 Y5.600 E19.28530 F3000
+G1 X-12.000 Y7.200 E19.33810
+G1 X12.000 Y7.200 E20.13010 F3000
+G1 X12.000 Y8.800 E20.18290
+G1 X-12.000 Y8.800 E20.97490 F3000
+G1 X-12.000 Y10.400 E21.02770
+G1 X12.000 Y10.400 E21.81970 F3000
+G1 X12.000 Y12.000 E21.87250
+G1 X-12.000 Y12.000 E22.66450 F3000
+G1 X-12.000 Y13.600 E22.71730
+G1 E21.71730 F2400
+G92 E0
+G1 Z0.500 F6000
+G0 X20.000 Y0.000 F9000
+G1 E1.00000 F2400
+G1 X19.890 Y1.672 E1.06912 F1800
+G1 X19.563 Y3.327 E1.13823 F1800
+G1 X19.021 Y4.944 E1.20735 F1800
+G1 X18.271 Y6.508 E1.27646 F1800
+G1 X17.321 Y8.000 E1.34558 F1800
+G1 X16.180 Y9.405 E1.41469 F1800
+G1 X14.863 Y10.706 E1.48381 F1800
+G1 X13.383 Y11.890 E1.55292 F1800
+G1 X11.756 Y12.944 E1.62204 F1800
+G1 X10.000 Y13.856 E1.69115 F1800
+G1 X8.135 Y14.617 E1.76027 F1800
+G1 X6.180 Y15.217 E1.82938 F1800
+G1 X4.158 Y15.650 E1.89850 F1800
+G1 X2.091 Y15.912 E1.96761 F1800
+G1 X0.000 Y16.000 E2.03673 F1800
+G1 X-2.091 Y15.912 E2.10584 F1800
+G1 X-4.158 Y15.650 E2.17496 F1800
+G1 X-6.180 Y15.217 E2.24407 F1800
+G1 X-8.135 Y14.617 E2.31319 F1800
+G1 X-10.000 Y13.856 E2.38230 F1800
+G1 X-11.756 Y12.944 E2.45142 F1800
+G1 X-13.383 Y11.890 E2.52053 F1800
+G1 X-14.863 Y10.706 E2.58965 F1800
+G1 X-16.180 Y9.405 E2.65876 F1800
+G1 X-17.321 Y8.000 E2.72788 F1800
+G1 X-18.271 Y6.508 E2.79699 F1800
+G1 X-19.021 Y4.944 E2.86611 F1800
+G1 X-19.563 Y3.327 E2.93522 F1800
+G1 X-19.890 Y1.672 E3.00434 F1800
+G1 X-20.000 Y0.000 E3.07345 F1800
+G1 X-19.890 Y-1.672 E3.14257 F1800
+G1 X-19.563 Y-3.327 E3.21168 F1800
+G1 X-19.021 Y-4.944 E3.28080 F1800
+G1 X-18.271 Y-6.508 E3.34991 F1800
+G1 X-17.321 Y-8.000 E3.41903 F1800
+G1 X-16.180 Y-9.405 E3.48814 F1800
+G1 X-14.863 Y-10.706 E3.55726 F1800
+G1 X-13.383 Y-11.890 E3.62637 F1800
+G1 X-11.756 Y-12.944 E3.69549 F1800
+G1 X-10.000 Y-13.856 E3.76460 F1800
+G1 X-8.135 Y-14.617 E3.83372 F1800
+G1 X-6.180 Y-15.217 E3.90283 F1800
+G1 X-4.158 Y-15.650 E3.97195 F1800
+G1 X-2.091 Y-15.912 E4.04106 F1800
+G1 X-0.000 Y-16.000 E4.11018 F1800
+G1 X2.091 Y-15.912 E4.17929 F1800
+G1 X4.158 Y-15.650 E4.24841 F1800
+G1 X6.180 Y-15.217 E4.31752 F1800
+G1 X8.135 Y-14.617 E4.38664 F1800
+G1 X10.000 Y-13.856 E4.45575 F1800
+G1 X11.756 Y-12.944 E4.52487 F1800
+G1 X13.383 Y-11.890 E4.59398 F1800
+G1 X14.863 Y-10.706 E4.66310 F1800
+G1 X16.180 Y-9.405 E4.73221 F1800
+G1 X17.321 Y-8.000 E4.80133 F1800
+G1 X18.271 Y-6.508 E4.87044 F1800
+G1 X19.021 Y-4.944 E4.93956 F1800
+G1 X19.563 Y-3.327 E5.00867 F1800
+G1 X19.890 Y-1.672 E5.07779 F1800
+G1 X20.000 Y-0.000 E5.14690 F1800
+G1 E4.14690 F2400
+G0 X19.550 Y0.000 F9000
+G1 E5.14690 F2400
+G1 X19.443 Y1.635 E5.21446 F1800
+G1 X19.123 Y3.252 E5.28202 F1800
+G1 X18.593 Y4.833 E5.34958 F1800
+G1 X17.860 Y6.361 E5.41714 F1800
+G1 X16.931 Y7.820 E5.48470 F1800
+G1 X15.816 Y9.193 E5.55226 F1800
+G1 X14.528 Y10.465 E5.61982 F1800
+G1 X13.082 Y11.623 E5.68738 F1800
+G1 X11.491 Y12.653 E5.75494 F1800
+G1 X9.775 Y13.545 E5.82250 F1800
+G1 X7.952 Y14.288 E5.89006 F1800
+G1 X6.041 Y14.875 E5.95762 F1800
+G1 X4.065 Y15.298 E6.02518 F1800
+G1 X2.044 Y15.554 E6.09274 F1800
+G1 X0.000 Y15.640 E6.16030 F1800
+G1 X-2.044 Y15.554 E6.22786 F1800
+G1 X-4.065 Y15.298 E6.29542 F1800
+G1 X-6.041 Y14.875 E6.36298 F1800
+G1 X-7.952 Y14.288 E6.43054 F1800
+G1 X-9.775 Y13.545 E6.49810 F1800
+G1 X-11.491 Y12.653 E6.56566 F1800
+G1 X-13.082 Y11.623 E6.63322 F1800
+G1 X-14.528 Y10.465 E6.70078 F1800
+G1 X-15.816 Y9.193 E6.76834 F1800
+G1 X-16.931 Y7.820 E6.83590 F1800
+G1 X-17.860 Y6.361 E6.90346 F1800
+G1 X-18.593 Y4.833 E6.97102 F1800
+G1 X-19.123 Y3.252 E7.03858 F1800
+G1 X-19.443 Y1.635 E7.10614 F1800
+G1 X-19.550 Y0.000 E7.17370 F1800
+G1 X-19.443 Y-1.635 E7.24126 F1800
+G1 X-19.123 Y-3.252 E7.30882 F1800
+G1 X-18.593 Y-4.833 E7.37638 F1800
+G1 X-17.860 Y-6.361 E7.44394 F1800
+G1 X-16.931 Y-7.820 E7.51150 F1800
+G1 X-15.816 Y-9.193 E7.57906 F1800
+G1 X-14.528 Y-10.465 E7.64662 F1800
+G1 X-13.082 Y-11.623 E7.71418 F1800
+G1 X-11.491 Y-12.653 E7.78174 F1800
+G1 X-9.775 Y-13.545 E7.84930 F1800
+G1 X-7.952 Y-14.288 E7.91686 F1800
+G1 X-6.041 Y-14.875 E7.98442 F1800
+G1 X-4.065 Y-15.298 E8.05198 F1800
+G1 X-2.044 Y-15.554 E8.11954 F1800
+G1 X-0.000 Y-15.640 E8.18710 F1800
+G1 X2.044 Y-15.554 E8.25466 F1800
+G1 X4.065 Y-15.298 E8.32222 F1800
+G1 X6.041 Y-14.875 E8.38978 F1800
+G1 X7.952 Y-14.288 E8.45734 F1800
+G1 X9.775 Y-13.545 E8.52490 F1800
+G1 X11.491 Y-12.653 E8.59246 F1800
+G1 X13.082 Y-11.623 E8.66002 F1800
+G1 X14.528 Y-10.465 E8.72758 F1800
+G1 X15.816 Y-9.193 E8.79514 F1800
+G1 X16.931 Y-7.820 E8.86270 F1800
+G1 X17.860 Y-6.361 E8.93026 F1800
+G1 X18.593 Y-4.833 E8.99782 F1800
+G1 X19.123 Y-3.252 E9.06538 F1800
+G1 X19.443 Y-1.635 E9.13294 F1800
+G1 X19.550 Y-0.000 E9.20050 F1800
+G1 E8.20050 F2400
+G0 X-12.000 Y-12.000 F9000
+G1 E9.20050 F2400
+G1 X12.000 Y-12.000 E9.99250 F3000
+G1 X12.000 Y-10.400 E10.04530
+G1 X-12.000 Y-10.400 E10.83730 F3000
+G1 X-12.000 Y-8.800 E10.89010
+G1 X12.000 Y-8.800 E11.68210 F3000
+G1 X12.000 Y-7.200 E11.73490
+G1 X-12.000 Y-7.200 E12.52690 F3000
+G1 X-12.000 Y-5.600 E12.57970
+G1 X12.000 Y-5.600 E13.37170 F3000
+G1 X12.000 Y-4.000 E13.42450
+G1 X-12.000 Y-4.000 E14.21650 F3000
+G1 X-12.000 Y-2.400 E14.26930
+G1 X12.000 Y-2.400 E15.06130 F3000
+G1 X12.000 Y-0.800 E15.11410
+G1 X-12.000 Y-0.800 E15.90610 F3000
+G1 X-12.000 Y0.800 E15.95890
+G1 X12.000 Y0.800 E16.75090 F3000
+G1 X12.000 Y2.400 E16.80370
+G1 X-12.000 Y2.400 E17.59570 F3000
+G1 X-12.000 Y4.000 E17.64850
+G1 X12.000 Y4.000 E18.44050 F3000
+G1 X12.000 Y5.600 E18.49330
+G1 X-12.000 Y5.600 E19.28530 F3000
+G1 X-12.000 Y7.200 E19.33810
+G1 X12.000 Y7.200 E20.13010 F3000
+G1 X12.000 Y8.800 E20.18290
+G1 X-12.000 Y8.800 E20.97490 F3000
+G1 X-12.000 Y10.400 E21.02770
+G1 X12.000 Y10.400 E21.81970 F3000
+G1 X12.000 Y12.000 E21.87250
+G1 X-12.000 Y12.000 E22.66450 F3000
+G1 X-12.000 Y13.600 E22.71730
+G1 E21.71730 F2400
+G92 E0
+G1 Z0.700 F6000
+G0 X20.000 Y0.000 F9000
+G1 E1.00000 F2400
+G1 X19.890 Y1.672 E1.06912 F1800
+G1 X19.563 Y3.327 E1.13823 F1800
+G1 X19.021 Y4.944 E1.20735 F1800
+G1 X18.271 Y6.508 E1.27646 F1800
+G1 X17.321 Y8.000 E1.34558 F1800
+G1 X16.180 Y9.405 E1.41469 F1800
+G1 X14.863 Y10.706 E1.48381 F1800
+G1 X13.383 Y11.890 E1.55292 F1800
+G1 X11.756 Y12.944 E1.62204 F1800
+G1 X10.000 Y13.856 E1.69115 F1800
+G1 X8.135 Y14.617 E1.76027 F1800
+G1 X6.180 Y15.217 E1.82938 F1800
+G1 X4.158 Y15.650 E1.89850 F1800
+G1 X2.091 Y15.912 E1.96761 F1800
+G1 X0.000 Y16.000 E2.03673 F1800
+G1 X-2.091 Y15.912 E2.10584 F1800
+G1 X-4.158 Y15.650 E2.17496 F1800
+G1 X-6.180 Y15.217 E2.24407 F1800
+G1 X-8.135 Y14.617 E2.31319 F1800
+G1 X-10.000 Y13.856 E2.38230 F1800
+G1 X-11.756 Y12.944 E2.45142 F1800
+G1 X-13.383 Y11.890 E2.52053 F1800
+G1 X-14.863 Y10.706 E2.58965 F1800
+G1 X-16.180 Y9.405 E2.65876 F1800
+G1 X-17.321 Y8.000 E2.72788 F1800
+G1 X-18.271 Y6.508 E2.79699 F1800
+G1 X-19.021 Y4.944 E2.86611 F1800
+G1 X-19.563 Y3.327 E2.93522 F1800
+G1 X-19.890 Y1.672 E3.00434 F1800
+G1 X-20.000 Y0.000 E3.07345 F1800
+G1 X-19.890 Y-1.672 E3.14257 F1800
+G1 X-19.563 Y-3.327 E3.21168 F1800
+G1 X-19.021 Y-4.944 E3.28080 F1800
+G1 X-18.271 Y-6.508 E3.34991 F1800
+G1 X-17.321 Y-8.000 E3.41903 F1800
+G1 X-16.180 Y-9.405 E3.48814 F1800
+G1 X-14.863 Y-10.706 E3.55726 F1800
+G1 X-13.383 Y-11.890 E3.62637 F1800
+G1 X-11.756 Y-12.944 E3.69549 F1800
+G1 X-10.000 Y-13.856 E3.76460 F1800
+G1 X-8.135 Y-14.617 E3.83372 F1800
+G1 X-6.180 Y-15.217 E3.90283 F1800
+G1 X-4.158 Y-15.650 E3.97195 F1800
+G1 X-2.091 Y-15.912 E4.04106 F1800
+G1 X-0.000 Y-16.000 E4.11018 F1800
+G1 X2.091 Y-15.912 E4.17929 F1800
+G1 X4.158 Y-15.650 E4.24841 F1800
+G1 X6.180 Y-15.217 E4.31752 F1800
+G1 X8.135 Y-14.617 E4.38664 F1800
+G1 X10.000 Y-13.856 E4.45575 F1800
+G1 X11.756 Y-12.944 E4.52487 F1800
+G1 X13.383 Y-11.890 E4.59398 F1800
+G1 X14.863 Y-10.706 E4.66310 F1800
+G1 X16.180 Y-9.405 E4.73221 F1800
+G1 X17.321 Y-8.000 E4.80133 F1800
+G1 X18.271 Y-6.508 E4.87044 F1800
+G1 X19.021 Y-4.944 E4.93956 F1800
+G1 X19.563 Y-3.327 E5.00867 F1800
+G1 X19.890 Y-1.672 E5.07779 F1800
+G1 X20.000 Y-0.000 E5.14690 F1800
+G1 E4.14690 F2400
+G0 X19.550 Y0.000 F9000
+G1 E5.14690 F2400
+G1 X19.443 Y1.635 E5.21446 F1800
+G1 X19.123 Y3.252 E5.28202 F1800
+G1 X18.593 Y4.833 E5.34958 F1800
+G1 X17.860 Y6.361 E5.41714 F1800
+G1 X16.931 Y7.820 E5.48470 F1800
+G1 X15.816 Y9.193 E5.55226 F1800
+G1 X14.528 Y10.465 E5.61982 F1800
+G1 X13.082 Y11.623 E5.68738 F1800
+G1 X11.491 Y12.653 E5.75494 F1800
+G1 X9.775 Y13.545 E5.82250 F1800
+G1 X7.952 Y14.288 E5.89006 F1800
+G1 X6.041 Y14.875 E5.95762 F1800
+G1 X4.065 Y15.298 E6.02518 F1800
+G1 X2.044 Y15.554 E6.09274 F1800
+G1 X0.000 Y15.640 E6.16030 F1800
+G1 X-2.044 Y15.554 E6.22786 F1800
+G1 X-4.065 Y15.298 E6.29542 F1800
+G1 X-6.041 Y14.875 E6.36298 F1800
+G1 X-7.952 Y14.288 E6.43054 F1800
+G1 X-9.775 Y13.545 E6.49810 F1800
+G1 X-11.491 Y12.653 E6.56566 F1800
+G1 X-13.082 Y11.623 E6.63322 F1800
+G1 X-14.528 Y10.465 E6.70078 F1800
+G1 X-15.816 Y9.193 E6.76834 F1800
+G1 X-16.931 Y7.820 E6.83590 F1800
+G1 X-17.860 Y6.361 E6.90346 F1800
+G1 X-18.593 Y4.833 E6.97102 F1800
+G1 X-19.123 Y3.252 E7.03858 F1800
+G1 X-19.443 Y1.635 E7.10614 F1800
+G1 X-19.550 Y0.000 E7.17370 F1800
+G1 X-19.443 Y-1.635 E7.24126 F1800
+G1 X-19.123 Y-3.252 E7.30882 F1800
+G1 X-18.593 Y-4.833 E7.37638 F1800
+G1 X-17.860 Y-6.361 E7.44394 F1800
+G1 X-16.931 Y-7.820 E7.51150 F1800
+G1 X-15.816 Y-9.193 E7.57906 F1800
+G1 X-14.528 Y-10.465 E7.64662 F1800
+G1 X-13.082 Y-11.623 E7.71418 F1800
+G1 X-11.491 Y-12.653 E7.78174 F1800
+G1 X-9.775 Y-13.545 E7.84930 F1800
+G1 X-7.952 Y-14.288 E7.91686 F1800
+G1 X-6.041 Y-14.875 E7.98442 F1800
+G1 X-4.065 Y-15.298 E8.05198 F1800
+G1 X-2.044 Y-15.554 E8.11954 F1800
+G1 X-0.000 Y-15.640 E8.18710 F1800
+G1 X2.044 Y-15.554 E8.25466 F1800
+G1 X4.065 Y-15.298 E8.32222 F1800
+G1 X6.041 Y-14.875 E8.38978 F1800
+G1 X7.952 Y-14.288 E8.45734 F1800
+G1 X9.775 Y-13.545 E8.52490 F1800
+G1 X11.491 Y-12.653 E8.59246 F1800
+G1 X13.082 Y-11.623 E8.66002 F1800
+G1 X14.528 Y-10.465 E8.72758 F1800
+G1 X15.816 Y-9.193 E8.79514 F1800
+G1 X16.931 Y-7.820 E8.86270 F1800
+G1 X17.860 Y-6.361 E8.93026 F1800
+G1 X18.593 Y-4.833 E8.99782 F1800
+G1 X19.123 Y-3.252 E9.06538 F1800
+G1 X19.443 Y-1.635 E9.13294 F1800
+G1 X19.550 Y-0.000 E9.20050 F1800
+G1 E8.20050 F2400
+G0 X-12.000 Y-12.000 F9000
+G1 E9.20050 F2400
+G1 X12.000 Y-12.000 E9.99250 F3000
+G1 X12.000 Y-10.400 E10.04530
+G1 X-12.000 Y-10.400 E10.83730 F3000
+G1 X-12.000 Y-8.800 E10.89010
+G1 X12.000 Y-8.800 E11.68210 F3000
+G1 X12.000 Y-7.200 E11.73490
+G1 X-12.000 Y-7.200 E12.52690 F3000
+G1 X-12.000 Y-5.600 E12.57970
+G1 X12.000 Y-5.600 E13.37170 F3000
+G1 X12.000 Y-4.000 E13.42450
+G1 X-12.000 Y-4.000 E14.21650 F3000
+G1 X-12.000 Y-2.400 E14.26930
+G1 X12.000 Y-2.400 E15.06130 F3000
+G1 X12.000 Y-0.800 E15.11410
+G1 X-12.000 Y-0.800 E15.90610 F3000
+G1 X-12.000 Y0.800 E15.95890
+G1 X12.000 Y0.800 E16.75090 F3000
+G1 X12.000 Y2.400 E16.80370
+G1 X-12.000 Y2.400 E17.59570 F3000
+G1 X-12.000 Y4.000 E17.64850
+G1 X12.000 Y4.000 E18.44050 F3000
+G1 X12.000 Y5.600 E18.49330
+G1 X-12.000 Y5.600 E19.28530 F3000
+G1 X-12.000 Y7.200 E19.33810
+G1 X12.000 Y7.200 E20.13010 F3000
+G1 X12.000 Y8.800 E20.18290
+G1 X-12.000 Y8.800 E20.97490 F3000
+G1 X-12.000 Y10.400 E21.02770
+G1 X12.000 Y10.400 E21.81970 F3000
+G1 X12.000 Y12.000 E21.87250
+G1 X-12.000 Y12.000 E22.66450 F3000
+G1 X-12.000 Y13.600 E22.71730
+G1 E21.71730 F2400
+G92 E0
+G1 Z0.900 F6000
+G0 X20.000 Y0.000 F9000
+G1 E1.00000 F2400
+G1 X19.890 Y1.672 E1.06912 F1800
+G1 X19.563 Y3.327 E1.13823 F1800
+G1 X19.021 Y4.944 E1.20735 F1800
+G1 X18.271 Y6.508 E1.27646 F1800
+G1 X17.321 Y8.000 E1.34558 F1800
+G1 X16.180 Y9.405 E1.41469 F1800
+G1 X14.863 Y10.706 E1.48381 F1800
+G1 X13.383 Y11.890 E1.55292 F1800
+G1 X11.756 Y12.944 E1.62204 F1800
+G1 X10.000 Y13.856 E1.69115 F1800
+G1 X8.135 Y14.617 E1.76027 F1800
+G1 X6.180 Y15.217 E1.82938 F1800
+G1 X4.158 Y15.650 E1.89850 F1800
+G1 X2.091 Y15.912 E1.96761 F1800
+G1 X0.000 Y16.000 E2.03673 F1800
+G1 X-2.091 Y15.912 E2.10584 F1800
+G1 X-4.158 Y15.650 E2.17496 F1800
+G1 X-6.180 Y15.217 E2.24407 F1800
+G1 X-8.135 Y14.617 E2.31319 F1800
+G1 X-10.000 Y13.856 E2.38230 F1800
+G1 X-11.756 Y12.944 E2.45142 F1800
+G1 X-13.383 Y11.890 E2.52053 F1800
+G1 X-14.863 Y10.706 E2.58965 F1800
+G1 X-16.180 Y9.405 E2.65876 F1800
+G1 X-17.321 Y8.000 E2.72788 F1800
+G1 X-18.271 Y6.508 E2.79699 F1800
+G1 X-19.021 Y4.944 E2.86611 F1800
+G1 X-19.563 Y3.327 E2.93522 F1800
+G1 X-19.890 Y1.672 E3.00434 F1800
+G1 X-20.000 Y0.000 E3.07345 F1800
+G1 X-19.890 Y-1.672 E3.14257 F1800
+G1 X-19.563 Y-3.327 E3.21168 F1800
+G1 X-19.021 Y-4.944 E3.28080 F1800
+G1 X-18.271 Y-6.508 E3.34991 F1800
+G1 X-17.321 Y-8.000 E3.41903 F1800
+G1 X-16.180 Y-9.405 E3.48814 F1800
+G1 X-14.863 Y-10.706 E3.55726 F1800
+G1 X-13.383 Y-11.890 E3.62637 F1800
+G1 X-11.756 Y-12.944 E3.69549 F1800
+G1 X-10.000 Y-13.856 E3.76460 F1800
+G1 X-8.135 Y-14.617 E3.83372 F1800
+G1 X-6.180 Y-15.217 E3.90283 F1800
+G1 X-4.158 Y-15.650 E3.97195 F1800
+G1 X-2.091 Y-15.912 E4.04106 F1800
+G1 X-0.000 Y-16.000 E4.11018 F1800
+G1 X2.091 Y-15.912 E4.17929 F1800
+G1 X4.158 Y-15.650 E4.24841 F1800
+G1 X6.180 Y-15.217 E4.31752 F1800
+G1 X8.135 Y-14.617 E4.38664 F1800
+G1 X10.000 Y-13.856 E4.45575 F1800
+G1 X11.756 Y-12.944 E4.52487 F1800
+G1 X13.383 Y-11.890 E4.59398 F1800
+G1 X14.863 Y-10.706 E4.66310 F1800
+G1 X16.180 Y-9.405 E4.73221 F1800
+G1 X17.321 Y-8.000 E4.80133 F1800
+G1 X18.271 Y-6.508 E4.87044 F1800
+G1 X19.021 Y-4.944 E4.93956 F1800
+G1 X19.563 Y-3.327 E5.00867 F1800
+G1 X19.890 Y-1.672 E5.07779 F1800
+G1 X20.000 Y-0.000 E5.14690 F1800
+G1 E4.14690 F2400
+G0 X19.550 Y0.000 F9000
+G1 E5.14690 F2400
+G1 X19.443 Y1.635 E5.21446 F1800
+G1 X19.123 Y3.252 E5.28202 F1800
+G1 X18.593 Y4.833 E5.34958 F1800
+G1 X17.860 Y6.361 E5.41714 F1800
+G1 X16.931 Y7.820 E5.48470 F1800
+G1 X15.816 Y9.193 E5.55226 F1800
+G1 X14.528 Y10.465 E5.61982 F1800
+G1 X13.082 Y11.623 E5.68738 F1800
+G1 X11.491 Y12.653 E5.75494 F1800
+G1 X9.775 Y13.545 E5.82250 F1800
+G1 X7.952 Y14.288 E5.89006 F1800
+G1 X6.041 Y14.875 E5.95762 F1800
+G1 X4.065 Y15.298 E6.02518 F1800
+G1 X2.044 Y15.554 E6.09274 F1800
+G1 X0.000 Y15.640 E6.16030 F1800
+G1 X-2.044 Y15.554 E6.22786 F1800
+G1 X-4.065 Y15.298 E6.29542 F1800
+G1 X-6.041 Y14.875 E6.36298 F1800
+G1 X-7.952 Y14.288 E6.43054 F1800
+G1 X-9.775 Y13.545 E6.49810 F1800
+G1 X-11.491 Y12.653 E6.56566 F1800
+G1 X-13.082 Y11.623 E6.63322 F1800
+G1 X-14.528 Y10.465 E6.70078 F1800
+G1 X-15.816 Y9.193 E6.76834 F1800
+G1 X-16.931 Y7.820 E6.83590 F1800
+G1 X-17.860 Y6.361 E6.90346 F1800
+G1 X-18.593 Y4.833 E6.97102 F1800
+G1 X-19.123 Y3.252 E7.03858 F1800
+G1 X-19.443 Y1.635 E7.10614 F1800
+G1 X-19.550 Y0.000 E7.17370 F1800
+G1 X-19.443 Y-1.635 E7.24126 F1800
+G1 X-19.123 Y-3.252 E7.30882 F1800
+G1 X-18.593 Y-4.833 E7.37638 F1800
+G1 X-17.860 Y-6.361 E7.44394 F1800
+G1 X-16.931 Y-7.820 E7.51150 F1800
+G1 X-15.816 Y-9.193 E7.57906 F1800
+G1 X-14.528 Y-10.465 E7.64662 F1800
+G1 X-13.082 Y-11.623 E7.71418 F1800
+G1 X-11.491 Y-12.653 E7.78174 F1800
+G1 X-9.775 Y-13.545 E7.84930 F1800
+G1 X-7.952 Y-14.288 E7.91686 F1800
+G1 X-6.041 Y-14.875 E7.98442 F1800
+G1 X-4.065 Y-15.298 E8.05198 F1800
+G1 X-2.044 Y-15.554 E8.11954 F1800
+G1 X-0.000 Y-15.640 E8.18710 F1800
+G1 X2.044 Y-15.554 E8.25466 F1800
+G1 X4.065 Y-15.298 E8.32222 F1800
+G1 X6.041 Y-14.875 E8.38978 F1800
+G1 X7.952 Y-14.288 E8.45734 F1800
+G1 X9.775 Y-13.545 E8.52490 F1800
+G1 X11.491 Y-12.653 E8.59246 F1800
+G1 X13.082 Y-11.623 E8.66002 F1800
+G1 X14.528 Y-10.465 E8.72758 F1800
+G1 X15.816 Y-9.193 E8.79514 F1800
+G1 X16.931 Y-7.820 E8.86270 F1800
+G1 X17.860 Y-6.361 E8.93026 F1800
+G1 X18.593 Y-4.833 E8.99782 F1800
+G1 X19.123 Y-3.252 E9.06538 F1800
+G1 X19.443 Y-1.635 E9.13294 F1800
+G1 X19.550 Y-0.000 E9.20050 F1800
+G1 E8.20050 F2400
+G0 X-12.000 Y-12.000 F9000
+G1 E9.20050 F2400
+G1 X12.000 Y-12.000 E9.99250 F3000
+G1 X12.000 Y-10.400 E10.04530
+G1 X-12.000 Y-10.400 E10.83730 F3000
+G1 X-12.000 Y-8.800 E10.89010
+G1 X12.000 Y-8.800 E11.68210 F3000
+G1 X12.000 Y-7.200 E11.73490
+G1 X-12.000 Y-7.200 E12.52690 F3000
+G1 X-12.000 Y-5.600 E12.57970
+G1 X12.000 Y-5.600 E13.37170 F3000
+G1 X12.000 Y-4.000 E13.42450
+G1 X-12.000 Y-4.000 E14.21650 F3000
+G1 X-12.000 Y-2.400 E14.26930
+G1 X12.000 Y-2.400 E15.06130 F3000
+G1 X12.000 Y-0.800 E15.11410
+G1 X-12.000 Y-0.800 E15.90610 F3000
+G1 X-12.000 Y0.800 E15.95890
+G1 X12.000 Y0.800 E16.75090 F3000
+G1 X12.000 Y2.400 E16.80370
+G1 X-12.000 Y2.400 E17.59570 F3000
+G1 X-12.000 Y4.000 E17.64850
+G1 X12.000 Y4.000 E18.44050 F3000
+G1 X12.000 Y5.600 E18.49330
+G1 X-12.000 Y5.600 E19.28530 F3000
+G1 X-12.000 Y7.200 E19.33810
+G1 X12.000 Y7.200 E20.13010 F3000
+G1 X12.000 Y8.800 E20.18290
+G1 X-12.000 Y8.800 E20.97490 F3000
+G1 X-12.000 Y10.400 E21.02770
+G1 X12.000 Y10.400 E21.81970 F3000
+G1 X12.000 Y12.000 E21.87250
+G1 X-12.000 Y12.000 E22.66450 F3000
+G1 X-12.000 Y13.600 E22.71730
+G1 E21.71730 F2400
+G92 E0
+M104 S0
+M140 S0
+M107
+G28 X0 Y0
+M84
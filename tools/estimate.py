@@ -0,0 +1,209 @@
+#!/usr/bin/env python
+"""
+Estimate how long a G-code file takes to print, and whether the
+native planner will run short of moves while printing it.
+
+The file is run through a simulated Redeem, so the G-codes are parsed,
+transformed and split into segments by the same code as when printing.
+The moves that would go to the native planner are recorded and run
+through the model in redeem/PrintTimeEstimator.py.
+
+    python tools/estimate.py --config kossel_mini.cfg part.gcode
+    python tools/estimate.py --host-rate 2000 --layers part.gcode
+
+Layers are taken from ";LAYER:" comments if there are any, and
+otherwise a layer starts each time Z goes higher than before. Heating
+and heater waits are skipped, G4 dwells are added to the time.
+
+The host rate is how many moves per second Redeem makes on the
+printer. Without --host-rate the rate measured here is used, which is
+faster than on a BeagleBone.
+
+Author: Elias Bakken
+License: GNU GPL v3: http://www.gnu.org/copyleft/gpl.html
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import timeit
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.realpath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+
+from redeem.Simulator import Simulator, install
+install()   # Before the hardware modules are imported
+from redeem.Gcode import Gcode
+from redeem.PrintTimeEstimator import PrintTimeEstimator, MoveRecorder
+
+# Heater waits would wait for the simulated heaters
+SKIPPED = set(["M104", "M109", "M116", "M140", "M190"])
+
+
+def read_gcode(filename):
+    """ The config named in the header, and a list of
+    (layer, line), with the layers from ";LAYER:" comments """
+    config = None
+    lines = []
+    layer = 0
+    marked = False
+    with open(filename) as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith("; config:"):
+                name = line.split(":", 1)[1].strip()
+                if name != "default":
+                    config = name
+            elif line.startswith(";LAYER:"):
+                marked = True
+                layer = int(line[7:].strip() or 0)
+            elif line and not line.startswith(";"):
+                lines.append((layer, line))
+    return config, lines, marked
+
+
+def dwell(g):
+    if g.has_letter("P"):
+        return float(g.get_value_by_letter("P"))/1000.0
+    if g.has_letter("S"):
+        return float(g.get_value_by_letter("S"))
+    return 0.0
+
+
+def record(printer, lines, marked):
+    """ Run the lines and return the recorder, the dwell time
+    per layer and the time it took """
+    planner = printer.path_planner
+    recorder = MoveRecorder(planner.native_planner)
+    planner.native_planner = recorder
+    dwells = {}
+    top = None
+    start = timeit.default_timer()
+    for layer, line in lines:
+        g = Gcode({"message": line, "prot": "testing"})
+        code = g.code()
+        if code in SKIPPED:
+            continue
+        if not marked:
+            z = planner.get_current_pos()["Z"]
+            if top is None or z > top + 1e-6:
+                if top is not None:
+                    recorder.layer += 1
+                top = z
+            layer = recorder.layer
+        else:
+            recorder.layer = layer
+        if code == "G4":
+            recorder.waitUntilFinished()
+            dwells[layer] = dwells.get(layer, 0.0) + dwell(g)
+            continue
+        printer.processor.execute(g)
+    elapsed = timeit.default_timer() - start
+    planner.native_planner = recorder.native
+    return recorder, dwells, elapsed
+
+
+def estimate_file(filename, config, host_rate):
+    header, lines, marked = read_gcode(filename)
+    config = config or header
+    if config:
+        config = os.path.join(HERE, "..", "configs", config)
+    sim = Simulator(config)
+    r = sim.make_redeem()
+    r.start()
+    try:
+        recorder, dwells, elapsed = record(r.printer, lines, marked)
+        estimator = PrintTimeEstimator.from_printer(r.printer)
+    finally:
+        r.exit()
+        sim.close()
+
+    starts, ends, speeds, layers, breaks = recorder.moves()
+    measured = len(starts)/elapsed if elapsed > 0 else 0.0
+    start = timeit.default_timer()
+    result = estimator.estimate(starts, ends, speeds, layers, breaks,
+                                host_rate or measured)
+    model_time = timeit.default_timer() - start
+
+    layer_times = list(result.layer_times())
+    for layer, seconds in dwells.iteritems():
+        while len(layer_times) <= layer:
+            layer_times.append(0.0)
+        layer_times[layer] += seconds
+    average, peak = result.moves_per_second()
+    return {
+        "file": filename,
+        "lines": len(lines),
+        "moves": result.moves,
+        "total": result.total + sum(dwells.values()),
+        "dwell": sum(dwells.values()),
+        "planner_waits": float(result.waits.sum()),
+        "layers": layer_times,
+        "moves_per_second": average,
+        "peak_moves_per_second": peak,
+        "host_rate": result.host_rate,
+        "measured_host_rate": measured,
+        "starved": [s._asdict() for s in result.starved],
+        "pipeline_seconds": elapsed,
+        "model_seconds": model_time,
+    }
+
+
+def hms(seconds):
+    m, s = divmod(int(round(seconds)), 60)
+    h, m = divmod(m, 60)
+    return "{}:{:02}:{:02}".format(h, m, s)
+
+
+def print_report(report, show_layers):
+    print "{}: {} lines, {} moves".format(report["file"], report["lines"], report["moves"])
+    print "  Print time:      {} ({:.1f} s, {:.1f} s dwell, {:.1f} s buffer waits)".format(
+        hms(report["total"]), report["total"], report["dwell"], report["planner_waits"])
+    print "  Moves/s:         {:.0f} average, {:.0f} peak".format(
+        report["moves_per_second"], report["peak_moves_per_second"])
+    print "  Host rate:       {:.0f} moves/s (measured here: {:.0f})".format(
+        report["host_rate"], report["measured_host_rate"])
+    print "  Layers:          {}".format(len(report["layers"]))
+    if show_layers:
+        for layer, seconds in enumerate(report["layers"]):
+            print "    {:>5} {:>10.1f} s".format(layer, seconds)
+    if report["starved"]:
+        print "  Buffer below min_buffered_move_time {} times:".format(len(report["starved"]))
+        for s in report["starved"][:20]:
+            print "    at {} layer {}: {} moves, down to {:.0f} ms".format(
+                hms(s["time"]), s["layer"], s["moves"], s["buffered"]*1000)
+    else:
+        print "  The move buffer never runs low"
+    print "  ({:.1f} s in the pipeline, {:.2f} s in the model)".format(
+        report["pipeline_seconds"], report["model_seconds"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Estimate the print time of G-code files")
+    parser.add_argument("files", nargs="+", help="G-code files")
+    parser.add_argument("--config", help="Printer config in configs/ (default: the file header)")
+    parser.add_argument("--host-rate", type=float,
+                        help="Moves per second Redeem makes (default: measured here)")
+    parser.add_argument("--layers", action="store_true", help="Print the time of each layer")
+    parser.add_argument("--json", help="Write the reports to this file")
+    parser.add_argument("--loglevel", type=int, default=logging.WARNING)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(args.loglevel)
+    reports = []
+    for filename in args.files:
+        report = estimate_file(filename, args.config, args.host_rate)
+        print_report(report, args.layers)
+        reports.append(report)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(reports, f, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()